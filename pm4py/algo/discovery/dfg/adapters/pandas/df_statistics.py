@@ -1,3 +1,5 @@
+from collections import Counter
+
 import pandas as pd
 
 
@@ -59,9 +61,11 @@ def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_
         df_successive_rows['caseDuration'] = (
                 df_successive_rows[timestamp_key + '_2'] - df_successive_rows[timestamp_key]).astype('timedelta64[s]')
         # groups couple of attributes (directly follows relation, we can measure the frequency and the performance)
-        directly_follows_grouping = df_successive_rows.groupby([activity_key, activity_key + '_2'])['caseDuration']
+        directly_follows_grouping = df_successive_rows.groupby([activity_key, activity_key + '_2'], observed=True)[
+            'caseDuration']
     else:
-        directly_follows_grouping = df_successive_rows.groupby([activity_key, activity_key + '_2'])
+        # observed=True avoids the (empty) groups of the unseen couples of categories on categorical columns
+        directly_follows_grouping = df_successive_rows.groupby([activity_key, activity_key + '_2'], observed=True)
         if all_columns:
             directly_follows_grouping = directly_follows_grouping[all_columns[0]]
 
@@ -82,3 +86,101 @@ def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_
 
     if measure == "both":
         return [dfg_frequency, dfg_performance]
+
+
+def get_dfg_graph_from_chunks(chunks, measure="frequency", activity_key="concept:name",
+                              case_id_glue="case:concept:name", timestamp_key="time:timestamp",
+                              perf_aggregation_key="mean"):
+    """
+    Get DFG graph from an iterable of Pandas dataframes (e.g. the chunks of a CSV file read by
+    csv_import_adapter.import_dataframe_chunks_from_path), consuming one chunk at a time.
+    Only the last event of each case is kept between a chunk and the following ones, so the events
+    of a case are expected to appear in chronological order across the chunks (e.g. in a CSV sorted by timestamp)
+
+    Parameters
+    -----------
+    chunks
+        Iterable of dataframes
+    measure
+        Measure to use (frequency/performance/both)
+    activity_key
+        Activity key to use in the grouping
+    case_id_glue
+        Case ID identifier
+    timestamp_key
+        Timestamp key
+    perf_aggregation_key
+        Performance aggregation key (mean, min, max, sum)
+
+    Returns
+    -----------
+    dfg
+        DFG in the chosen measure (may be only the frequency, only the performance, or both)
+    """
+    if perf_aggregation_key not in ["mean", "min", "max", "sum"]:
+        raise ValueError("aggregation not supported on chunks: " + str(perf_aggregation_key))
+
+    columns = [case_id_glue, activity_key]
+    if measure != "frequency":
+        columns.append(timestamp_key)
+    sort_columns = [case_id_glue, timestamp_key] if timestamp_key in columns else [case_id_glue]
+
+    dfg_frequency = Counter()
+    performance_statistics = {}
+    last_events = None
+
+    for chunk in chunks:
+        # categories change from chunk to chunk, hence the values are compared as objects
+        df_reduced = chunk[columns].astype({case_id_glue: object, activity_key: object})
+        if last_events is not None:
+            # the last event of the (already seen) cases precedes the events of the chunk
+            df_reduced = pd.concat([last_events[last_events[case_id_glue].isin(df_reduced[case_id_glue])],
+                                    df_reduced], ignore_index=True)
+        df_reduced = df_reduced.sort_values(sort_columns, kind="mergesort")
+        df_reduced_shifted = df_reduced.shift(-1)
+        df_reduced_shifted.columns = [str(col) + '_2' for col in df_reduced_shifted.columns]
+        df_successive_rows = pd.concat([df_reduced, df_reduced_shifted], axis=1)
+        df_successive_rows = df_successive_rows[
+            df_successive_rows[case_id_glue] == df_successive_rows[case_id_glue + '_2']]
+
+        if measure == "frequency" or measure == "both":
+            dfg_frequency.update(df_successive_rows.groupby([activity_key, activity_key + '_2']).size().to_dict())
+        if measure == "performance" or measure == "both":
+            df_successive_rows['caseDuration'] = (
+                    df_successive_rows[timestamp_key + '_2'] - df_successive_rows[timestamp_key]).astype(
+                'timedelta64[s]')
+            grouped = df_successive_rows.groupby([activity_key, activity_key + '_2'])['caseDuration'].agg(
+                ["sum", "count", "min", "max"])
+            for couple, stats in grouped.iterrows():
+                if couple in performance_statistics:
+                    previous = performance_statistics[couple]
+                    performance_statistics[couple] = [previous[0] + stats["sum"], previous[1] + stats["count"],
+                                                      min(previous[2], stats["min"]), max(previous[3], stats["max"])]
+                else:
+                    performance_statistics[couple] = [stats["sum"], stats["count"], stats["min"], stats["max"]]
+
+        tails = df_reduced.groupby(case_id_glue, sort=False).tail(1)
+        if last_events is None:
+            last_events = tails
+        else:
+            last_events = pd.concat([last_events[~last_events[case_id_glue].isin(tails[case_id_glue])], tails],
+                                    ignore_index=True)
+
+    dfg_performance = {}
+    for couple, stats in performance_statistics.items():
+        if perf_aggregation_key == "mean":
+            dfg_performance[couple] = stats[0] / stats[1]
+        elif perf_aggregation_key == "sum":
+            dfg_performance[couple] = stats[0]
+        elif perf_aggregation_key == "min":
+            dfg_performance[couple] = stats[2]
+        else:
+            dfg_performance[couple] = stats[3]
+
+    if measure == "frequency":
+        return dict(dfg_frequency)
+
+    if measure == "performance":
+        return dfg_performance
+
+    return [dict(dfg_frequency), dfg_performance]
@@ -33,7 +33,7 @@ def apply(log, parameters=None):
 
     parameters_variants = {constants.PARAMETER_CONSTANT_ACTIVITY_KEY: resource_key,
                            constants.PARAMETER_CONSTANT_ATTRIBUTE_KEY: resource_key}
-    variants_occ = {x: len(y) for x, y in variants_filter.get_variants(log, parameters=parameters_variants).items()}
+    variants_occ = variants_filter.get_variants_count(log, parameters=parameters_variants)
     variants_resources = list(variants_occ.keys())
     resources = [x.split(",") for x in variants_resources]
     flat_list = sorted(list(set([item for sublist in resources for item in sublist])))
@@ -1 +1,2 @@
-from pm4py.algo.filtering.common import end_activities, start_activities, filtering_constants, timestamp, attributes
+from pm4py.algo.filtering.common import end_activities, start_activities, filtering_constants, timestamp, attributes, \
+    filter_plan
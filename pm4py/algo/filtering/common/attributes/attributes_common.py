@@ -2,8 +2,8 @@ import json
 
 import numpy as np
 import pandas as pd
-from scipy.stats import gaussian_kde
 
+from pm4py.util import kde
 from pm4py.util.points_subset import pick_chosen_points_list
 
 
@@ -71,6 +71,7 @@ def get_kde_numeric_attribute(values, parameters=None):
     parameters
         Possible parameters of the algorithm, including:
             graph_points -> number of points to include in the graph
+            kde_binned, kde_grid_size, kde_pre_aggregation -> options of the estimation (see pm4py.util.kde)
 
 
     Returns
@@ -84,14 +85,15 @@ def get_kde_numeric_attribute(values, parameters=None):
         parameters = {}
 
     graph_points = parameters["graph_points"] if "graph_points" in parameters else 200
-    values = sorted(values)
-    density = gaussian_kde(values)
+    values = np.asarray(values, dtype=np.float64)
+    min_value = values.min()
+    max_value = values.max()
 
-    xs1 = list(np.linspace(min(values), max(values), graph_points / 2))
-    xs2 = list(np.geomspace(max(min(values), 0.000001), max(values), graph_points / 2))
+    xs1 = list(np.linspace(min_value, max_value, graph_points // 2))
+    xs2 = list(np.geomspace(max(min_value, 0.000001), max_value, graph_points // 2))
     xs = sorted(xs1 + xs2)
 
-    return [xs, list(density(xs))]
+    return [xs, list(kde.get_density(values, xs, parameters=parameters))]
 
 
 def get_kde_numeric_attribute_json(values, parameters=None):
@@ -132,6 +134,9 @@ def get_kde_date_attribute(values, parameters=None):
     parameters
         Possible parameters of the algorithm, including:
             graph_points -> number of points to include in the graph
+            points_to_sample -> number of values used by the estimation (default: 400 values, or all the values
+            when the binned estimation is used)
+            kde_binned, kde_grid_size, kde_pre_aggregation -> options of the estimation (see pm4py.util.kde)
 
 
     Returns
@@ -145,15 +150,22 @@ def get_kde_date_attribute(values, parameters=None):
         parameters = {}
 
     graph_points = parameters["graph_points"] if "graph_points" in parameters else 200
-    points_to_sample = parameters["points_to_sample"] if "points_to_sample" in parameters else 400
-    red_values = pick_chosen_points_list(points_to_sample, values)
-    int_values = sorted(
-        [x.replace(tzinfo=None).timestamp() for x in red_values])
-    density = gaussian_kde(int_values)
-    xs = np.linspace(min(int_values), max(int_values), graph_points)
+    binned = parameters[kde.PARAMETER_BINNED] if kde.PARAMETER_BINNED in parameters else None
+    if binned is None:
+        binned = len(values) > kde.BINNED_THRESHOLD
+    if binned and "points_to_sample" not in parameters:
+        # the binned estimation is linear in the number of values, that are hence all used
+        red_values = values
+    else:
+        points_to_sample = parameters["points_to_sample"] if "points_to_sample" in parameters else 400
+        red_values = pick_chosen_points_list(points_to_sample, values)
+    int_values = kde.get_timestamps_seconds(red_values)
+    xs = np.linspace(int_values.min(), int_values.max(), graph_points)
     xs_transf = pd.to_datetime(xs * 10 ** 9)
 
-    return [xs_transf, density(xs)]
+    kde_parameters = dict(parameters)
+    kde_parameters[kde.PARAMETER_BINNED] = binned
+    return [xs_transf, kde.get_density(int_values, xs, parameters=kde_parameters)]
 
 
 def get_kde_date_attribute_json(values, parameters=None):
@@ -0,0 +1 @@
+from pm4py.algo.filtering.common.filter_plan import filter_plan_common
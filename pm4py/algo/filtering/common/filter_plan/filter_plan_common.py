@@ -0,0 +1,171 @@
+import numpy as np
+
+# kinds of the steps of a filter plan
+ACTIVITIES = "activities"
+ACTIVITIES_AUTO = "activities_auto"
+TRACES_WITH_ACTIVITIES = "traces_with_activities"
+VARIANTS = "variants"
+VARIANTS_AUTO = "variants_auto"
+START_ACTIVITIES = "start_activities"
+START_ACTIVITIES_AUTO = "start_activities_auto"
+END_ACTIVITIES = "end_activities"
+END_ACTIVITIES_AUTO = "end_activities_auto"
+
+
+def get_projected_sequences(sequences, kept_activities):
+    """
+    Gets the sequences of activity codes of the variants, keeping only the activities that are kept
+
+    Parameters
+    -------------
+    sequences
+        List of the Numpy arrays of the activity codes of the (original) variants
+    kept_activities
+        Boolean mask of the kept activity codes (None if all the activities are kept)
+
+    Returns
+    -------------
+    projected
+        List of the projected sequences
+    """
+    if kept_activities is None:
+        return sequences
+    return [sequence[kept_activities[sequence]] for sequence in sequences]
+
+
+def get_current_variants(projected, item_variants, order, drop_empty):
+    """
+    Gets the variants of the current items (traces or cases), after the projection of the activities: different
+    original variants can share the same projected sequence. The current variants are numbered in order of first
+    appearance among the current items
+
+    Parameters
+    -------------
+    projected
+        List of the projected sequences of the original variants
+    item_variants
+        Numpy array containing, for each item, the number of its original variant
+    order
+        Numpy array of the positions of the current items (in their current order)
+    drop_empty
+        Remove the items whose projected sequence is empty
+
+    Returns
+    -------------
+    order
+        Numpy array of the positions of the current items
+    item_current_variants
+        Numpy array containing, for each current item, the number of its current variant
+    sequences
+        List of the sequences of the current variants
+    counts
+        Numpy array of the number of items of each current variant
+    """
+    variants = item_variants[order]
+    if drop_empty:
+        non_empty = np.array([len(x) > 0 for x in projected], dtype=np.bool_)
+        if len(non_empty) > 0:
+            keep = non_empty[variants]
+            order = order[keep]
+            variants = variants[keep]
+    originals, first_positions = np.unique(variants, return_index=True)
+    current_numbers = np.full(len(projected), -1, dtype=np.int64)
+    numbers = {}
+    sequences = []
+    for variant in originals[np.argsort(first_positions, kind="stable")].tolist():
+        key = tuple(projected[variant].tolist())
+        if key not in numbers:
+            numbers[key] = len(sequences)
+            sequences.append(projected[variant])
+        current_numbers[variant] = numbers[key]
+    item_current_variants = current_numbers[variants]
+    counts = np.bincount(item_current_variants, minlength=len(sequences))
+    return order, item_current_variants, sequences, counts
+
+
+def get_activities_count(sequences, counts, no_activities):
+    """
+    Gets the number of occurrences of each activity code, given the sequences and the counts of the variants
+    """
+    if not sequences:
+        return np.zeros(no_activities, dtype=np.int64)
+    lengths = np.array([len(x) for x in sequences], dtype=np.int64)
+    codes = np.concatenate(sequences).astype(np.int64)
+    return np.bincount(codes, weights=np.repeat(counts, lengths), minlength=no_activities).astype(np.int64)
+
+
+def get_boundary_activities(sequences, last=False):
+    """
+    Gets the code of the first (or last) activity of each variant (-1 for the empty variants)
+    """
+    position = -1 if last else 0
+    return np.array([x[position] if len(x) > 0 else -1 for x in sequences], dtype=np.int64)
+
+
+def get_boundary_activities_count(boundary_activities, counts, no_activities):
+    """
+    Gets the number of items starting (or ending) with each activity code
+    """
+    valid = boundary_activities >= 0
+    return np.bincount(boundary_activities[valid], weights=counts[valid], minlength=no_activities).astype(np.int64)
+
+
+def get_activities_in_order(sequences):
+    """
+    Gets the activity codes in order of first occurrence in the current items
+    """
+    seen = set()
+    codes = []
+    for sequence in sequences:
+        for code in sequence.tolist():
+            if code not in seen:
+                seen.add(code)
+                codes.append(code)
+    return codes
+
+
+def get_count_dictionary(activities, codes, count):
+    """
+    Gets the dictionary associating the activities (with at least an occurrence) to their count, inserted in the
+    order of the given codes
+    """
+    return {activities[code]: int(count[code]) for code in codes if count[code] > 0}
+
+
+def get_values_mask(activities, values):
+    """
+    Gets the boolean mask of the activity codes whose activity is among the given values
+    """
+    values = set(values)
+    return np.array([activity in values for activity in activities], dtype=np.bool_)
+
+
+def select_items(order, item_current_variants, kept_variants, variants_rank=None):
+    """
+    Keeps the current items whose variant is kept; if a rank of the variants is provided, the items are grouped
+    by variant in the order of the rank (keeping their relative order inside each variant)
+
+    Parameters
+    -------------
+    order
+        Numpy array of the positions of the current items
+    item_current_variants
+        Numpy array containing, for each current item, the number of its current variant
+    kept_variants
+        Boolean mask of the kept current variants
+    variants_rank
+        (If provided) Numpy array of the rank of each current variant
+
+    Returns
+    -------------
+    order
+        Numpy array of the positions of the kept items
+    """
+    kept_variants = np.asarray(kept_variants, dtype=np.bool_)
+    if len(kept_variants) == 0:
+        return order[:0]
+    mask = kept_variants[item_current_variants]
+    order = order[mask]
+    if variants_rank is not None:
+        order = order[np.argsort(variants_rank[item_current_variants[mask]], kind="stable")]
+    return order
@@ -1,12 +1,16 @@
+import numpy as np
+
 from pm4py.algo.filtering.common import filtering_constants
 from pm4py.algo.filtering.common.attributes import attributes_common
 from pm4py.algo.filtering.log.variants import variants_filter
 from pm4py.objects.conversion.log import factory as log_conv_fact
+from pm4py.objects.log import view as log_view
 from pm4py.objects.log.log import EventLog, Trace
-from pm4py.objects.log.util import sampling
-from pm4py.objects.log.util import xes
+from pm4py.objects.log.util import attributes_index, xes
 from pm4py.objects.log.util.xes import DEFAULT_NAME_KEY
 from pm4py.objects.log.util.xes import DEFAULT_TIMESTAMP_KEY
+from pm4py.statistics.attributes.common import attribute_profile
+from pm4py.statistics.attributes.log import attributes_profiler
 from pm4py.util.constants import PARAMETER_CONSTANT_ATTRIBUTE_KEY, PARAMETER_CONSTANT_ACTIVITY_KEY
 
 DEFAULT_MAX_CASES_FOR_ATTR_SELECTION = 50
@@ -67,7 +71,8 @@ def select_attributes_from_log_for_tree(log, max_cases_for_attr_selection=DEFAUL
     log
         Log
     max_cases_for_attr_selection
-        Maximum number of cases to consider for attribute selection
+        Deprecated and ignored: the attributes of the whole log are profiled in one pass, so no sample of the
+        cases is taken anymore. The parameter is kept for compatibility with the existing callers
     max_diff_occ
         Maximum number of different occurrences
 
@@ -75,45 +80,33 @@ def select_attributes_from_log_for_tree(log, max_cases_for_attr_selection=DEFAUL
     ------------
 
     """
-    if len(log) > max_cases_for_attr_selection:
-        filtered_log = sampling.sample(log, max_cases_for_attr_selection)
-    else:
-        filtered_log = log
-    event_attributes = get_all_event_attributes_from_log(filtered_log)
-    trace_attributes = get_all_trace_attributes_from_log(filtered_log)
-    event_attributes_values = {}
-    trace_attributes_values = {}
-    for attr in event_attributes:
-        event_attributes_values[attr] = set(get_attribute_values(log, attr).keys())
-    for attr in trace_attributes:
-        trace_attributes_values[attr] = set(get_trace_attribute_values(log, attr).keys())
+    del max_cases_for_attr_selection
+    event_profiles, trace_profiles = attributes_profiler.apply(log)
+    event_profiles.pop(xes.DEFAULT_TRANSITION_KEY, None)
+    trace_profiles.pop(xes.DEFAULT_TRACEID_KEY, None)
 
     numeric_event_attributes_to_consider = list()
     string_event_attributes_to_consider = list()
     numeric_trace_attributes_to_consider = list()
     string_trace_attributes_to_consider = list()
 
-    for attr in event_attributes_values:
-        if type(list(event_attributes_values[attr])[0]) is int or type(list(event_attributes_values[attr])[0]) is float:
+    for attr, profile in event_profiles.items():
+        # only the attributes that are present in each trace are considered
+        if profile.traces_count < len(log):
+            continue
+        if profile.get_type() == attribute_profile.TYPE_NUMERIC:
             numeric_event_attributes_to_consider.append(attr)
-        elif type(list(event_attributes_values[attr])[0]) is str and len(event_attributes_values[attr]) < max_diff_occ:
+        elif profile.get_type() == attribute_profile.TYPE_STRING and profile.get_cardinality() < max_diff_occ:
             string_event_attributes_to_consider.append(attr)
 
-    for attr in trace_attributes_values:
-        if type(list(trace_attributes_values[attr])[0]) is int or type(list(trace_attributes_values[attr])[0]) is float:
+    for attr, profile in trace_profiles.items():
+        if profile.traces_count < len(log):
+            continue
+        if profile.get_type() == attribute_profile.TYPE_NUMERIC:
             numeric_trace_attributes_to_consider.append(attr)
-        elif type(list(trace_attributes_values[attr])[0]) is str and len(trace_attributes_values[attr]) < max_diff_occ:
+        elif profile.get_type() == attribute_profile.TYPE_STRING and profile.get_cardinality() < max_diff_occ:
             string_trace_attributes_to_consider.append(attr)
 
-    numeric_event_attributes_to_consider = check_event_attributes_presence(log,
-                                                                           numeric_event_attributes_to_consider)
-    string_event_attributes_to_consider = check_event_attributes_presence(log,
-                                                                          string_event_attributes_to_consider)
-    numeric_trace_attributes_to_consider = check_trace_attributes_presence(log,
-                                                                           numeric_trace_attributes_to_consider)
-    string_trace_attributes_to_consider = check_trace_attributes_presence(log,
-                                                                          string_trace_attributes_to_consider)
-
     return string_trace_attributes_to_consider, string_event_attributes_to_consider, numeric_trace_attributes_to_consider, numeric_event_attributes_to_consider
 
 
@@ -226,6 +219,7 @@ def apply_events(log, values, parameters=None):
         Parameters of the algorithm, including:
             activity_key -> Attribute identifying the activity in the log
             positive -> Indicate if events should be kept/removed
+            view -> If True, returns a view on the log (see pm4py.objects.log.view)
 
     Returns
     -----------
@@ -239,6 +233,17 @@ def apply_events(log, values, parameters=None):
         PARAMETER_CONSTANT_ATTRIBUTE_KEY] if PARAMETER_CONSTANT_ATTRIBUTE_KEY in parameters else DEFAULT_NAME_KEY
     positive = parameters["positive"] if "positive" in parameters else True
 
+    if parameters[log_view.PARAMETER_VIEW] if log_view.PARAMETER_VIEW in parameters else False:
+        trace_positions = []
+        event_positions = []
+        for i, trace in enumerate(log):
+            events = [j for j, event in enumerate(trace) if attribute_key in event and (
+                event[attribute_key] in values) == positive]
+            if events:
+                trace_positions.append(i)
+                event_positions.append(np.array(events, dtype=np.int64) if len(events) < len(trace) else None)
+        return log_view.get_view(log, trace_positions, event_positions=event_positions)
+
     filtered_log = EventLog()
     for trace in log:
         new_trace = Trace()
@@ -270,6 +275,9 @@ def apply(log, values, parameters=None):
         Parameters of the algorithm, including:
             activity_key -> Attribute identifying the activity in the log
             positive -> Indicate if events should be kept/removed
+            view -> If True, returns a view on the log (see pm4py.objects.log.view)
+            use_attributes_index -> If True, reads the traces containing the values from the attributes index of the
+            log, that is built once and reused by the next calls (see pm4py.objects.log.util.attributes_index)
 
     Returns
     -----------
@@ -282,26 +290,31 @@ def apply(log, values, parameters=None):
     attribute_key = parameters[
         PARAMETER_CONSTANT_ATTRIBUTE_KEY] if PARAMETER_CONSTANT_ATTRIBUTE_KEY in parameters else DEFAULT_NAME_KEY
     positive = parameters["positive"] if "positive" in parameters else True
+    use_index = parameters[
+        attributes_index.PARAMETER_USE_INDEX] if attributes_index.PARAMETER_USE_INDEX in parameters else False
 
-    filtered_log = EventLog()
-    for trace in log:
-        new_trace = Trace()
-
-        found = False
-        for j in range(len(trace)):
-            if attribute_key in trace[j]:
-                attribute_value = trace[j][attribute_key]
-                if attribute_value in values:
-                    found = True
-
-        if (found and positive) or (not found and not positive):
-            new_trace = trace
-        else:
-            for attr in trace.attributes:
-                new_trace.attributes[attr] = trace.attributes[attr]
-
-        if len(new_trace) > 0:
-            filtered_log.append(new_trace)
+    if use_index:
+        index = attributes_index.get_attributes_index(log, attribute_key)
+        traces_mask = index.get_traces_mask(values)
+        trace_lengths = index.trace_lengths
+    else:
+        traces_mask = np.zeros(len(log), dtype=np.bool_)
+        trace_lengths = np.zeros(len(log), dtype=np.int64)
+        for i, trace in enumerate(log):
+            trace_lengths[i] = len(trace)
+            for event in trace:
+                if attribute_key in event and event[attribute_key] in values:
+                    traces_mask[i] = True
+                    break
+    if not positive:
+        traces_mask = ~traces_mask
+    # the empty traces are never kept
+    traces_mask = traces_mask & (trace_lengths > 0)
+
+    if parameters[log_view.PARAMETER_VIEW] if log_view.PARAMETER_VIEW in parameters else False:
+        return log_view.get_view(log, np.nonzero(traces_mask)[0])
+
+    filtered_log = EventLog([trace for trace, keep in zip(log, traces_mask.tolist()) if keep])
     return filtered_log
 
 
@@ -316,7 +329,9 @@ def get_attribute_values(log, attribute_key, parameters=None):
     attribute_key
         Attribute for which we would like to know the values along with their count
     parameters
-        Possible parameters of the algorithm
+        Possible parameters of the algorithm, including:
+            use_attributes_index -> If True, reads the counts from the attributes index of the log (see
+            pm4py.objects.log.util.attributes_index)
 
     Returns
     ----------
@@ -325,7 +340,11 @@ def get_attribute_values(log, attribute_key, parameters=None):
     """
     if parameters is None:
         parameters = {}
-    str(parameters)
+    use_index = parameters[
+        attributes_index.PARAMETER_USE_INDEX] if attributes_index.PARAMETER_USE_INDEX in parameters else False
+
+    if use_index:
+        return attributes_index.get_attributes_index(log, attribute_key).get_counts()
 
     attributes = {}
 
@@ -508,7 +527,7 @@ def get_kde_numeric_attribute(log, attribute, parameters=None):
         Y-axis values to represent
     """
 
-    if type(log) is EventLog:
+    if isinstance(log, EventLog):
         event_log = log_conv_fact.apply(log, variant=log_conv_fact.TO_EVENT_STREAM)
     else:
         event_log = log
@@ -542,7 +561,7 @@ def get_kde_numeric_attribute_json(log, attribute, parameters=None):
         Y-axis values to represent
     """
 
-    if type(log) is EventLog:
+    if isinstance(log, EventLog):
         event_log = log_conv_fact.apply(log, variant=log_conv_fact.TO_EVENT_STREAM)
     else:
         event_log = log
@@ -575,7 +594,7 @@ def get_kde_date_attribute(log, attribute=DEFAULT_TIMESTAMP_KEY, parameters=None
         Y-axis values to represent
     """
 
-    if type(log) is EventLog:
+    if isinstance(log, EventLog):
         event_log = log_conv_fact.apply(log, variant=log_conv_fact.TO_EVENT_STREAM)
     else:
         event_log = log
@@ -609,7 +628,7 @@ def get_kde_date_attribute_json(log, attribute=DEFAULT_TIMESTAMP_KEY, parameters
         Y-axis values to represent
     """
 
-    if type(log) is EventLog:
+    if isinstance(log, EventLog):
         event_log = log_conv_fact.apply(log, variant=log_conv_fact.TO_EVENT_STREAM)
     else:
         event_log = log
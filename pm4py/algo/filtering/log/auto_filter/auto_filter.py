@@ -1,8 +1,5 @@
 from pm4py.algo.filtering.common import filtering_constants
-from pm4py.algo.filtering.log.attributes import attributes_filter
-from pm4py.algo.filtering.log.end_activities import end_activities_filter
-from pm4py.algo.filtering.log.start_activities import start_activities_filter
-from pm4py.algo.filtering.log.variants import variants_filter as variants_module
+from pm4py.algo.filtering.log.filter_plan import filter_plan
 from pm4py.objects.log.util import xes
 from pm4py.util import constants
 from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY
@@ -20,6 +17,10 @@ def apply_auto_filter(log, parameters=None):
         Eventual parameters applied to the algorithms:
             decreasingFactor -> Decreasing factor (provided to all algorithms)
             activity_key -> Activity key (must be specified if different from concept:name)
+            enable_activities_filter -> Enables or disables auto filter on activities number. Default is True
+            enable_variants_filter -> Enables or disables auto filter on variants. Default is False
+            enable_start_activities_filter -> Enables or disables auto filter on start activities. Default is False
+            enable_end_activities_filter -> Enables or disables auto filter on end activities. Default is True
     
     Returns
     ---------
@@ -52,20 +53,17 @@ def apply_auto_filter(log, parameters=None):
     enable_end_activities_filter = parameters[
         "enable_end_activities_filter"] if "enable_end_activities_filter" in parameters else True
 
-    variants = variants_module.get_variants(log, parameters=parameters_child)
-
-    filtered_log = log
+    # the filters are recorded in a plan, evaluated on the variants of the log and materialized once
+    plan = filter_plan.FilterPlan(log, parameters=parameters_child)
     if enable_activities_filter:
-        filtered_log = attributes_filter.apply_auto_filter(log, variants=variants, parameters=parameters_child)
-        variants = variants_module.get_variants(filtered_log, parameters=parameters_child)
+        plan.filter_activities_auto(decreasing_factor=decreasing_factor)
     if enable_variants_filter:
-        filtered_log = variants_module.apply_auto_filter(filtered_log, variants=variants, parameters=parameters_child)
-        variants = variants_module.get_variants(filtered_log, parameters=parameters_child)
+        plan.filter_variants_auto(decreasing_factor=decreasing_factor)
     if enable_start_activities_filter:
-        filtered_log = start_activities_filter.apply_auto_filter(filtered_log, variants=variants,
-                                                                  parameters=parameters_child)
+        plan.filter_start_activities_auto(decreasing_factor=decreasing_factor)
     if enable_end_activities_filter:
-        filtered_log = end_activities_filter.apply_auto_filter(filtered_log, variants=variants,
-                                                                parameters=parameters_child)
+        plan.filter_end_activities_auto(decreasing_factor=decreasing_factor)
 
-    return filtered_log
+    if not plan.steps:
+        return log
+    return plan.apply()
@@ -1,4 +1,6 @@
+from pm4py.objects.log import view as log_view
 from pm4py.objects.log.log import EventLog
+from pm4py.objects.log.util import case_table
 from pm4py.objects.log.util.xes import DEFAULT_TIMESTAMP_KEY
 from pm4py.util.constants import PARAMETER_CONSTANT_TIMESTAMP_KEY
 
@@ -16,7 +18,11 @@ def filter_on_case_performance(log, inf_perf, sup_perf, parameters=None):
     sup_perf
         Upper bound on the performance
     parameters
-        Parameters
+        Parameters of the algorithm, including:
+            timestamp_key -> Attribute to use as timestamp
+            view -> If True, returns a view on the log (see pm4py.objects.log.view)
+            use_case_table_cache -> If True, stores the case table with the log and reuses the stored one (see
+            pm4py.objects.log.util.case_table)
 
     Returns
     -----------
@@ -27,11 +33,16 @@ def filter_on_case_performance(log, inf_perf, sup_perf, parameters=None):
         parameters = {}
     timestamp_key = parameters[
         PARAMETER_CONSTANT_TIMESTAMP_KEY] if PARAMETER_CONSTANT_TIMESTAMP_KEY in parameters else DEFAULT_TIMESTAMP_KEY
-    filtered_log = EventLog([trace for trace in log if satisfy_perf(trace, inf_perf, sup_perf, timestamp_key)])
-    return filtered_log
+    view = parameters[log_view.PARAMETER_VIEW] if log_view.PARAMETER_VIEW in parameters else False
+    use_cache = parameters[
+        case_table.PARAMETER_USE_CACHE] if case_table.PARAMETER_USE_CACHE in parameters else False
+    table = case_table.get_case_table(log, parameters={PARAMETER_CONSTANT_TIMESTAMP_KEY: timestamp_key,
+                                                        case_table.PARAMETER_USE_CACHE: use_cache})
+    durations = table.table[case_table.DURATION].values
+    return table.filter(log, (durations >= inf_perf) & (durations <= sup_perf), view=view)
 
 
-def filter_on_ncases(log, max_no_cases=1000):
+def filter_on_ncases(log, max_no_cases=1000, parameters=None):
     """
     Get only a specified number of traces from a log
 
@@ -41,17 +52,25 @@ def filter_on_ncases(log, max_no_cases=1000):
         Log
     max_no_cases
         Desidered number of traces from the log
+    parameters
+        Parameters of the algorithm, including:
+            view -> If True, returns a view on the log (see pm4py.objects.log.view)
 
     Returns
     -----------
     filtered_log
         Filtered log
     """
+    if parameters is None:
+        parameters = {}
+    view = parameters[log_view.PARAMETER_VIEW] if log_view.PARAMETER_VIEW in parameters else False
+    if view:
+        return log_view.get_view(log, range(min(len(log), max_no_cases)))
     filtered_log = EventLog(log[:min(len(log), max_no_cases)])
     return filtered_log
 
 
-def filter_on_case_size(log, min_case_size=2, max_case_size=None):
+def filter_on_case_size(log, min_case_size=2, max_case_size=None, parameters=None):
     """
     Get only traces in the log with a given size
 
@@ -63,12 +82,21 @@ def filter_on_case_size(log, min_case_size=2, max_case_size=None):
         Minimum desidered size of traces
     max_case_size
         Maximum desidered size of traces
+    parameters
+        Parameters of the algorithm, including:
+            view -> If True, returns a view on the log (see pm4py.objects.log.view)
 
     Returns
     -----------
     filtered_log
         Filtered log
     """
+    if parameters is None:
+        parameters = {}
+    view = parameters[log_view.PARAMETER_VIEW] if log_view.PARAMETER_VIEW in parameters else False
+    if view:
+        return log_view.get_view(log, [i for i, trace in enumerate(log) if min_case_size <= len(trace) and (
+                max_case_size is None or len(trace) <= max_case_size)])
     if max_case_size is not None:
         filtered_log = EventLog([trace for trace in log if min_case_size <= len(trace) <= max_case_size])
     else:
@@ -0,0 +1 @@
+from pm4py.algo.filtering.log.filter_plan import filter_plan
@@ -0,0 +1,271 @@
+import numpy as np
+
+from pm4py.algo.filtering.common import filtering_constants
+from pm4py.algo.filtering.common.attributes import attributes_common
+from pm4py.algo.filtering.common.end_activities import end_activities_common
+from pm4py.algo.filtering.common.filter_plan import filter_plan_common as common
+from pm4py.algo.filtering.common.start_activities import start_activities_common
+from pm4py.objects.log.log import EventLog, Trace
+from pm4py.objects.log.util import variants_index
+from pm4py.objects.log.util.xes import DEFAULT_NAME_KEY
+from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY
+
+
+class FilterPlan(object):
+    """
+    Lazy plan of filters on the activities of a log. The filters are only recorded when requested; when the plan
+    is applied, all the steps are evaluated on the variants index of the log (one integer-encoded sequence per
+    variant), without scanning the events, and the filtered log is built only once, at the end.
+
+    Each step gives the same traces, in the same order, that the corresponding filter of pm4py.algo.filtering.log
+    would give when applied to the result of the previous steps
+    """
+
+    def __init__(self, log, parameters=None):
+        """
+        Constructor
+
+        Parameters
+        -------------
+        log
+            Log
+        parameters
+            Parameters of the plan, including:
+                activity_key -> Attribute identifying the activity in the log
+                use_variants_index_cache -> If True, reuses the variants index stored with the log, and stores
+                the variants index of the filtered log with it (see pm4py.objects.log.util.variants_index)
+        """
+        if parameters is None:
+            parameters = {}
+
+        self.log = log
+        self.activity_key = parameters[
+            PARAMETER_CONSTANT_ACTIVITY_KEY] if PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else DEFAULT_NAME_KEY
+        self.use_cache = parameters[
+            variants_index.PARAMETER_USE_CACHE] if variants_index.PARAMETER_USE_CACHE in parameters else False
+        self.steps = []
+
+    def filter_activities(self, values, positive=True):
+        """
+        Keeps (or removes) the events whose activity belongs to the values (as attributes_filter.apply_events)
+        """
+        self.steps.append((common.ACTIVITIES, (values, positive)))
+        return self
+
+    def filter_activities_auto(self, decreasing_factor=filtering_constants.DECREASING_FACTOR):
+        """
+        Keeps the events of the most frequent activities (as attributes_filter.apply_auto_filter)
+        """
+        self.steps.append((common.ACTIVITIES_AUTO, (decreasing_factor,)))
+        return self
+
+    def filter_traces_with_activities(self, values, positive=True):
+        """
+        Keeps (or removes) the traces containing an activity among the values (as attributes_filter.apply)
+        """
+        self.steps.append((common.TRACES_WITH_ACTIVITIES, (values, positive)))
+        return self
+
+    def filter_variants(self, admitted_variants, positive=True):
+        """
+        Keeps (or removes) the traces of the given variants (as variants_filter.apply)
+        """
+        self.steps.append((common.VARIANTS, (admitted_variants, positive)))
+        return self
+
+    def filter_variants_auto(self, decreasing_factor=filtering_constants.DECREASING_FACTOR):
+        """
+        Keeps the traces of the most frequent variants (as variants_filter.apply_auto_filter)
+        """
+        self.steps.append((common.VARIANTS_AUTO, (decreasing_factor,)))
+        return self
+
+    def filter_start_activities(self, values, positive=True):
+        """
+        Keeps (or removes) the traces starting with one of the values (as start_activities_filter.apply)
+        """
+        self.steps.append((common.START_ACTIVITIES, (values, positive)))
+        return self
+
+    def filter_start_activities_auto(self, decreasing_factor=filtering_constants.DECREASING_FACTOR):
+        """
+        Keeps the traces starting with a frequent start activity (as start_activities_filter.apply_auto_filter)
+        """
+        self.steps.append((common.START_ACTIVITIES_AUTO, (decreasing_factor,)))
+        return self
+
+    def filter_end_activities(self, values, positive=True):
+        """
+        Keeps (or removes) the traces ending with one of the values (as end_activities_filter.apply)
+        """
+        self.steps.append((common.END_ACTIVITIES, (values, positive)))
+        return self
+
+    def filter_end_activities_auto(self, decreasing_factor=filtering_constants.DECREASING_FACTOR):
+        """
+        Keeps the traces ending with a frequent end activity (as end_activities_filter.apply_auto_filter)
+        """
+        self.steps.append((common.END_ACTIVITIES_AUTO, (decreasing_factor,)))
+        return self
+
+    def apply(self):
+        """
+        Applies the recorded filters
+
+        Returns
+        -------------
+        filtered_log
+            Filtered log (with its variants index already stored, if the plan uses the cache)
+        """
+        index = variants_index.get_variants_index(self.log, self.activity_key, use_cache=self.use_cache)
+        activities = list(index.activities)
+        sequences = [np.asarray(index.sequences[variant], dtype=np.int64) for variant in index.variants]
+        item_variants = np.asarray(index.trace_variants, dtype=np.int64)
+        order = np.arange(len(self.log), dtype=np.int64)
+        kept_activities = None
+
+        for step, arguments in self.steps:
+            projected = common.get_projected_sequences(sequences, kept_activities)
+            order, item_current_variants, current_sequences, counts = common.get_current_variants(
+                projected, item_variants, order, kept_activities is not None)
+            if step in (common.ACTIVITIES, common.ACTIVITIES_AUTO):
+                if step == common.ACTIVITIES:
+                    values_mask = common.get_values_mask(activities, arguments[0])
+                    mask = values_mask if arguments[1] else ~values_mask
+                else:
+                    mask = self.get_auto_activities(activities, current_sequences, counts, arguments[0])
+                kept_activities = mask if kept_activities is None else kept_activities & mask
+            else:
+                order = self.select_traces(step, arguments, activities, order, item_current_variants,
+                                           current_sequences, counts)
+
+        projected = common.get_projected_sequences(sequences, kept_activities)
+        order, item_current_variants, current_sequences, counts = common.get_current_variants(
+            projected, item_variants, order, kept_activities is not None)
+        return self.build_log(activities, kept_activities, order, item_current_variants, current_sequences)
+
+    def get_auto_activities(self, activities, current_sequences, counts, decreasing_factor):
+        """
+        Gets the mask of the activities kept by the automatic activities filter
+        """
+        activities_count = common.get_activities_count(current_sequences, counts, len(activities))
+        attributes = common.get_count_dictionary(activities, common.get_activities_in_order(current_sequences),
+                                                 activities_count)
+        mask = np.zeros(len(activities), dtype=np.bool_)
+        if not attributes:
+            return mask
+        alist = attributes_common.get_sorted_attributes_list(attributes)
+        threshold = attributes_common.get_attributes_threshold(alist, decreasing_factor)
+        mask = activities_count >= threshold
+        if self.activity_key == DEFAULT_NAME_KEY:
+            # the activities of the most frequent variant are always kept
+            mask[current_sequences[int(np.argmax(counts))]] = True
+        return mask
+
+    def select_traces(self, step, arguments, activities, order, item_current_variants, current_sequences,
+                      counts):
+        """
+        Applies a step that keeps or removes whole traces, deciding on their variants
+        """
+        no_variants = len(current_sequences)
+        if step == common.TRACES_WITH_ACTIVITIES:
+            values_mask = common.get_values_mask(activities, arguments[0])
+            contained = np.array([bool(values_mask[x].any()) for x in current_sequences], dtype=np.bool_)
+            return common.select_items(order, item_current_variants, contained if arguments[1] else ~contained)
+        if step == common.VARIANTS:
+            admitted = set(arguments[0])
+            contained = np.array([",".join([activities[code] for code in x.tolist()]) in admitted for x in
+                                  current_sequences], dtype=np.bool_)
+            # the traces are grouped by variant, in order of first appearance
+            return common.select_items(order, item_current_variants, contained if arguments[1] else ~contained,
+                                       variants_rank=np.arange(no_variants))
+        if step == common.VARIANTS_AUTO:
+            return self.select_auto_variants(order, item_current_variants, counts, arguments[0])
+        if step in (common.START_ACTIVITIES, common.END_ACTIVITIES):
+            boundary = common.get_boundary_activities(current_sequences, last=step == common.END_ACTIVITIES)
+            values_mask = np.append(common.get_values_mask(activities, arguments[0]), False)
+            contained = values_mask[boundary]
+            # the traces without events are removed in both cases
+            kept = contained if arguments[1] else ~contained & (boundary >= 0)
+            return common.select_items(order, item_current_variants, kept)
+        # automatic start or end activities filter
+        last = step == common.END_ACTIVITIES_AUTO
+        boundary = common.get_boundary_activities(current_sequences, last=last)
+        boundary_count = common.get_boundary_activities_count(boundary, counts, len(activities))
+        boundary_activities = common.get_count_dictionary(activities, [x for x in boundary.tolist() if x >= 0],
+                                                          boundary_count)
+        if not boundary_activities:
+            return order[:0]
+        if last:
+            salist = end_activities_common.get_sorted_end_activities_list(boundary_activities)
+            threshold = end_activities_common.get_end_activities_threshold(salist, arguments[0])
+        else:
+            salist = start_activities_common.get_sorted_start_activities_list(boundary_activities)
+            threshold = start_activities_common.get_start_activities_threshold(salist, arguments[0])
+        # the boundary activity of the most frequent variant is always kept
+        kept = (boundary >= 0) & ((np.append(boundary_count, 0)[boundary] >= threshold) | (
+                boundary == boundary[int(np.argmax(counts))]))
+        return common.select_items(order, item_current_variants, kept, variants_rank=np.arange(no_variants))
+
+    def select_auto_variants(self, order, item_current_variants, counts, decreasing_factor):
+        """
+        Keeps the traces of the most frequent variants, as variants_filter.apply_auto_filter: the variants are
+        considered by decreasing count while their count does not drop below the decreasing factor
+        """
+        no_traces = len(order)
+        ranking = np.argsort(-counts, kind="stable")
+        # percentage of the traces to keep (variants_filter.find_auto_threshold)
+        already_added_sum = 0
+        prev_var_count = -1
+        for variant in ranking.tolist():
+            if already_added_sum == 0 or counts[variant] > decreasing_factor * prev_var_count:
+                already_added_sum = already_added_sum + counts[variant]
+            else:
+                break
+            prev_var_count = counts[variant]
+        variants_percentage = already_added_sum / no_traces if no_traces else 0.0
+        # variants_filter.filter_log_by_variants_percentage
+        kept = np.zeros(len(counts), dtype=np.bool_)
+        already_added_sum = 0
+        for variant in ranking.tolist():
+            if already_added_sum == 0 or already_added_sum / no_traces < variants_percentage:
+                kept[variant] = True
+                already_added_sum = already_added_sum + counts[variant]
+        variants_rank = np.empty(len(counts), dtype=np.int64)
+        variants_rank[ranking] = np.arange(len(counts))
+        return common.select_items(order, item_current_variants, kept, variants_rank=variants_rank)
+
+    def build_log(self, activities, kept_activities, order, item_current_variants, current_sequences):
+        """
+        Builds the filtered log: the traces are shared with the original log, unless some of their events are
+        removed; if the plan uses the cache, the variants index of the filtered log is stored with it
+        """
+        traces = [self.log[i] for i in order.tolist()]
+        if kept_activities is not None:
+            kept_values = set(activities[code] for code in np.nonzero(kept_activities)[0].tolist())
+            activity_key = self.activity_key
+            projected_traces = []
+            for trace in traces:
+                new_trace = Trace([event for event in trace if activity_key in event and event[
+                    activity_key] in kept_values])
+                for attr in trace.attributes:
+                    new_trace.attributes[attr] = trace.attributes[attr]
+                projected_traces.append(new_trace)
+            traces = projected_traces
+        filtered_log = EventLog(traces, attributes=self.log.attributes, extensions=self.log.extensions,
+                                omni_present=self.log.omni_present, classifiers=self.log.classifiers)
+        if not self.use_cache:
+            return filtered_log
+
+        variants = {}
+        sequences = {}
+        keys = [",".join([activities[code] for code in x.tolist()]) for x in current_sequences]
+        for key, sequence in zip(keys, current_sequences):
+            variants[key] = []
+            sequences[key] = tuple(sequence.tolist())
+        for position, number in enumerate(item_current_variants.tolist()):
+            variants[keys[number]].append(position)
+        variants_index.store(filtered_log, variants_index.VariantsIndex(
+            self.activity_key, variants, sequences, activities, item_current_variants.copy(),
+            variants_index.get_signature(filtered_log)))
+        return filtered_log
@@ -1,5 +1,6 @@
 from pm4py.algo.filtering.common import filtering_constants
 from pm4py.algo.filtering.log.variants import variants_filter
+from pm4py.objects.log import view as log_view
 from pm4py.objects.log.log import EventLog, Trace
 from pm4py.objects.log.util import xes
 from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY
@@ -20,6 +21,7 @@ def apply(log, paths, parameters=None):
         Parameters of the algorithm, including:
             activity_key -> Attribute identifying the activity in the log
             positive -> Indicate if events should be kept/removed
+            view -> If True, returns a view on the log (see pm4py.objects.log.view)
 
     Returns
     -----------
@@ -31,8 +33,9 @@ def apply(log, paths, parameters=None):
     attribute_key = parameters[
         PARAMETER_CONSTANT_ATTRIBUTE_KEY] if PARAMETER_CONSTANT_ATTRIBUTE_KEY in parameters else xes.DEFAULT_NAME_KEY
     positive = parameters["positive"] if "positive" in parameters else True
-    filtered_log = EventLog()
-    for trace in log:
+    view = parameters[log_view.PARAMETER_VIEW] if log_view.PARAMETER_VIEW in parameters else False
+    trace_positions = []
+    for idx, trace in enumerate(log):
         found = False
         for i in range(len(trace) - 1):
             path = (trace[i][attribute_key], trace[i + 1][attribute_key])
@@ -40,7 +43,10 @@ def apply(log, paths, parameters=None):
                 found = True
                 break
         if (found and positive) or (not found and not positive):
-            filtered_log.append(trace)
+            trace_positions.append(idx)
+    if view:
+        return log_view.get_view(log, trace_positions)
+    filtered_log = EventLog([log[idx] for idx in trace_positions])
     return filtered_log
 
 
@@ -1,6 +1,7 @@
 from pm4py.algo.filtering.common.filtering_constants import DECREASING_FACTOR
 from pm4py.algo.filtering.common.start_activities import start_activities_common
 from pm4py.algo.filtering.log.variants import variants_filter
+from pm4py.objects.log import view as log_view
 from pm4py.objects.log.log import EventLog
 from pm4py.objects.log.util.xes import DEFAULT_NAME_KEY
 from pm4py.util import constants
@@ -18,7 +19,9 @@ def apply(log, admitted_start_activities, parameters=None):
     admitted_start_activities
         Admitted start activities
     parameters
-        Algorithm parameters
+        Algorithm parameters, including:
+            activity_key -> Attribute identifying the activity in the log
+            view -> If True, returns a view on the log (see pm4py.objects.log.view)
 
     Returns
     -----------
@@ -30,6 +33,10 @@ def apply(log, admitted_start_activities, parameters=None):
     attribute_key = parameters[
         PARAMETER_CONSTANT_ACTIVITY_KEY] if PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else DEFAULT_NAME_KEY
 
+    if parameters[log_view.PARAMETER_VIEW] if log_view.PARAMETER_VIEW in parameters else False:
+        return log_view.get_view(log, [i for i, trace in enumerate(log) if trace and trace[0][
+            attribute_key] in admitted_start_activities])
+
     filtered_log = [trace for trace in log if trace and trace[0][attribute_key] in admitted_start_activities]
     return filtered_log
 
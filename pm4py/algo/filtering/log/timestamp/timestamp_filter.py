@@ -1,6 +1,10 @@
+import numpy as np
+
 from pm4py.algo.filtering.common.timestamp.timestamp_common import get_dt_from_string
-from pm4py.objects.conversion.log import factory as log_converter
-from pm4py.objects.log.log import EventLog, EventStream
+from pm4py.objects.log import view as log_view
+from pm4py.objects.log.log import EventLog, Trace
+from pm4py.objects.log.util import case_table
+from pm4py.objects.log.util import interval_index
 from pm4py.objects.log.util.xes import DEFAULT_TIMESTAMP_KEY
 from pm4py.util.constants import PARAMETER_CONSTANT_TIMESTAMP_KEY
 
@@ -33,7 +37,9 @@ def is_contained(trace, dt1, dt2, timestamp_key):
 
 def filter_traces_contained(log, dt1, dt2, parameters=None):
     """
-    Get traces that are contained in the given interval
+    Get traces that are contained in the given interval (see is_contained). The time intervals of the traces are
+    indexed (see pm4py.objects.log.util.interval_index, once with use_case_table_cache), and only the traces found
+    in the index are checked
 
     Parameters
     -----------
@@ -46,6 +52,9 @@ def filter_traces_contained(log, dt1, dt2, parameters=None):
     parameters
         Possible parameters of the algorithm, including:
             timestamp_key -> Attribute to use as timestamp
+            view -> If True, returns a view on the log (see pm4py.objects.log.view)
+            use_case_table_cache -> If True, stores the case table (and the index) with the log and reuses the
+            stored one (see pm4py.objects.log.util.case_table)
 
     Returns
     ------------
@@ -56,10 +65,17 @@ def filter_traces_contained(log, dt1, dt2, parameters=None):
         parameters = {}
     timestamp_key = parameters[
         PARAMETER_CONSTANT_TIMESTAMP_KEY] if PARAMETER_CONSTANT_TIMESTAMP_KEY in parameters else DEFAULT_TIMESTAMP_KEY
+    view = parameters[log_view.PARAMETER_VIEW] if log_view.PARAMETER_VIEW in parameters else False
+    use_cache = parameters[
+        case_table.PARAMETER_USE_CACHE] if case_table.PARAMETER_USE_CACHE in parameters else False
     dt1 = get_dt_from_string(dt1)
     dt2 = get_dt_from_string(dt2)
-    filtered_log = EventLog([trace for trace in log if is_contained(trace, dt1, dt2, timestamp_key)])
-    return filtered_log
+    table, index = interval_index.get_cases_index(log, parameters={PARAMETER_CONSTANT_TIMESTAMP_KEY: timestamp_key,
+                                                                   case_table.PARAMETER_USE_CACHE: use_cache})
+    trace_mask = np.zeros(len(log), dtype=np.bool_)
+    for i in index.get_contained(interval_index.get_bound(dt1), interval_index.get_bound(dt2)).tolist():
+        trace_mask[i] = is_contained(log[i], dt1, dt2, timestamp_key)
+    return table.filter(log, trace_mask, view=view)
 
 
 def is_intersecting(trace, dt1, dt2, timestamp_key):
@@ -95,7 +111,9 @@ def is_intersecting(trace, dt1, dt2, timestamp_key):
 
 def filter_traces_intersecting(log, dt1, dt2, parameters=None):
     """
-    Filter traces intersecting the given interval
+    Filter traces intersecting the given interval (see is_intersecting). The time intervals of the traces are
+    indexed (see pm4py.objects.log.util.interval_index, once with use_case_table_cache), and only the traces
+    overlapping the interval are checked
 
     Parameters
     -----------
@@ -108,6 +126,9 @@ def filter_traces_intersecting(log, dt1, dt2, parameters=None):
     parameters
         Possible parameters of the algorithm, including:
             timestamp_key -> Attribute to use as timestamp
+            view -> If True, returns a view on the log (see pm4py.objects.log.view)
+            use_case_table_cache -> If True, stores the case table (and the index) with the log and reuses the
+            stored one (see pm4py.objects.log.util.case_table)
 
     Returns
     ------------
@@ -118,15 +139,27 @@ def filter_traces_intersecting(log, dt1, dt2, parameters=None):
         parameters = {}
     timestamp_key = parameters[
         PARAMETER_CONSTANT_TIMESTAMP_KEY] if PARAMETER_CONSTANT_TIMESTAMP_KEY in parameters else DEFAULT_TIMESTAMP_KEY
+    view = parameters[log_view.PARAMETER_VIEW] if log_view.PARAMETER_VIEW in parameters else False
+    use_cache = parameters[
+        case_table.PARAMETER_USE_CACHE] if case_table.PARAMETER_USE_CACHE in parameters else False
     dt1 = get_dt_from_string(dt1)
     dt2 = get_dt_from_string(dt2)
-    filtered_log = EventLog([trace for trace in log if is_intersecting(trace, dt1, dt2, timestamp_key)])
-    return filtered_log
+    table, index = interval_index.get_cases_index(log, parameters={PARAMETER_CONSTANT_TIMESTAMP_KEY: timestamp_key,
+                                                                   case_table.PARAMETER_USE_CACHE: use_cache})
+    # the index gives the traces overlapping the interval, that contain the intersecting ones if each trace ends
+    # after it starts; otherwise, all the traces are checked
+    candidates = index.get_intersecting(interval_index.get_bound(dt1), interval_index.get_bound(
+        dt2)) if index.ordered else np.nonzero(index.valid)[0]
+    trace_mask = np.zeros(len(log), dtype=np.bool_)
+    for i in candidates.tolist():
+        trace_mask[i] = is_intersecting(log[i], dt1, dt2, timestamp_key)
+    return table.filter(log, trace_mask, view=view)
 
 
 def apply_events(log, dt1, dt2, parameters=None):
     """
-    Get a new log containing all the events contained in the given interval
+    Get a new log containing all the events contained in the given interval. The events are indexed by timestamp
+    (see pm4py.objects.log.util.interval_index), once with use_events_index_cache
 
     Parameters
     -----------
@@ -139,6 +172,9 @@ def apply_events(log, dt1, dt2, parameters=None):
     parameters
         Possible parameters of the algorithm, including:
             timestamp_key -> Attribute to use as timestamp
+            view -> If True, returns a view on the log (see pm4py.objects.log.view)
+            use_events_index_cache -> If True, stores the index of the event times with the log and reuses the
+            stored one (see pm4py.objects.log.util.interval_index)
 
     Returns
     ------------
@@ -149,12 +185,30 @@ def apply_events(log, dt1, dt2, parameters=None):
         parameters = {}
     timestamp_key = parameters[
         PARAMETER_CONSTANT_TIMESTAMP_KEY] if PARAMETER_CONSTANT_TIMESTAMP_KEY in parameters else DEFAULT_TIMESTAMP_KEY
-    dt1 = get_dt_from_string(dt1)
-    dt2 = get_dt_from_string(dt2)
-
-    stream = log_converter.apply(log, variant=log_converter.TO_EVENT_STREAM)
-    filtered_stream = EventStream([x for x in stream if dt1 < x[timestamp_key].replace(tzinfo=None) < dt2])
-    filtered_log = log_converter.apply(filtered_stream)
+    view = parameters[log_view.PARAMETER_VIEW] if log_view.PARAMETER_VIEW in parameters else False
+    use_cache = parameters[
+        interval_index.PARAMETER_USE_CACHE] if interval_index.PARAMETER_USE_CACHE in parameters else False
+    dt1 = interval_index.get_bound(get_dt_from_string(dt1))
+    dt2 = interval_index.get_bound(get_dt_from_string(dt2))
+    index = interval_index.get_events_index(log, parameters={PARAMETER_CONSTANT_TIMESTAMP_KEY: timestamp_key,
+                                                             interval_index.PARAMETER_USE_CACHE: use_cache})
+    positions = index.get_events(dt1, dt2)
+    # the events in the interval are grouped by trace (each trace keeps the order of its events)
+    trace_positions = np.searchsorted(index.trace_offsets, positions, side="right") - 1
+    traces_from = np.searchsorted(trace_positions, np.arange(len(log)), side="left")
+    traces_to = np.searchsorted(trace_positions, np.arange(len(log)), side="right")
+    kept_traces = np.nonzero(traces_to > traces_from)[0]
+    if view:
+        event_positions = []
+        for trace_idx in kept_traces.tolist():
+            events_positions = positions[traces_from[trace_idx]:traces_to[trace_idx]] - index.trace_offsets[trace_idx]
+            event_positions.append(events_positions if len(events_positions) < len(log[trace_idx]) else None)
+        return log_view.get_view(log, kept_traces, event_positions=event_positions)
+    filtered_log = EventLog()
+    for trace_idx in kept_traces.tolist():
+        trace = log[trace_idx]
+        events_positions = positions[traces_from[trace_idx]:traces_to[trace_idx]] - index.trace_offsets[trace_idx]
+        filtered_log.append(Trace([trace[i] for i in events_positions.tolist()], attributes=dict(trace.attributes)))
 
     return filtered_log
 
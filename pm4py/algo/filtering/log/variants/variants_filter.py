@@ -1,5 +1,7 @@
 from pm4py.algo.filtering.common import filtering_constants
+from pm4py.objects.log import view as log_view
 from pm4py.objects.log.log import EventLog
+from pm4py.objects.log.util import variants_index
 from pm4py.objects.log.util.xes import DEFAULT_NAME_KEY
 from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY
 
@@ -18,11 +20,17 @@ def apply(log, admitted_variants, parameters=None):
         Parameters of the algorithm, including:
             activity_key -> Attribute identifying the activity in the log
             positive -> Indicate if events should be kept/removed
+            view -> If True, returns a view on the log (see pm4py.objects.log.view)
     """
 
     if parameters is None:
         parameters = {}
     positive = parameters["positive"] if "positive" in parameters else True
+    if parameters[log_view.PARAMETER_VIEW] if log_view.PARAMETER_VIEW in parameters else False:
+        # the traces are grouped by variant, as in the filtered log
+        variants_idx = get_variants_from_log_trace_idx(log, parameters=parameters)
+        return log_view.get_view(log, [idx for variant in variants_idx if (variant in admitted_variants) == positive
+                                       for idx in variants_idx[variant]])
     variants = get_variants(log, parameters=parameters)
     log = EventLog()
     for variant in variants:
@@ -59,7 +67,7 @@ def get_variants(log, parameters=None):
 def get_variants_from_log_trace_idx(log, parameters=None):
     """
     Gets a dictionary whose key is the variant and as value there
-    is the list of traces indexes that share the variant
+    is the list of traces indexes that share the variant (read from the variants index of the log)
 
     Parameters
     ----------
@@ -68,6 +76,8 @@ def get_variants_from_log_trace_idx(log, parameters=None):
     parameters
         Parameters of the algorithm, including:
             activity_key -> Attribute identifying the activity in the log
+            use_variants_index_cache -> If True, stores the variants index with the log and reuses the stored one
+            (see pm4py.objects.log.util.variants_index)
 
     Returns
     ----------
@@ -79,15 +89,43 @@ def get_variants_from_log_trace_idx(log, parameters=None):
 
     attribute_key = parameters[
         PARAMETER_CONSTANT_ACTIVITY_KEY] if PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else DEFAULT_NAME_KEY
+    use_cache = parameters[
+        variants_index.PARAMETER_USE_CACHE] if variants_index.PARAMETER_USE_CACHE in parameters else False
 
-    variants = {}
-    for trace_idx, trace in enumerate(log):
-        variant = ",".join([x[attribute_key] for x in trace if attribute_key in x])
-        if variant not in variants:
-            variants[variant] = []
-        variants[variant].append(trace_idx)
+    index = variants_index.get_variants_index(log, attribute_key, use_cache=use_cache)
 
-    return variants
+    return {variant: list(traces_idx) for variant, traces_idx in index.variants.items()}
+
+
+def get_variants_count(log, parameters=None):
+    """
+    Gets a dictionary whose key is the variant and as value there
+    is the number of traces that share the variant
+
+    Parameters
+    ----------
+    log
+        Log
+    parameters
+        Parameters of the algorithm, including:
+            activity_key -> Attribute identifying the activity in the log
+            use_variants_index_cache -> If True, stores the variants index with the log and reuses the stored one
+            (see pm4py.objects.log.util.variants_index)
+
+    Returns
+    ----------
+    variants_count
+        Dictionary with variant as the key and the number of traces as the value
+    """
+    if parameters is None:
+        parameters = {}
+
+    attribute_key = parameters[
+        PARAMETER_CONSTANT_ACTIVITY_KEY] if PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else DEFAULT_NAME_KEY
+    use_cache = parameters[
+        variants_index.PARAMETER_USE_CACHE] if variants_index.PARAMETER_USE_CACHE in parameters else False
+
+    return variants_index.get_variants_index(log, attribute_key, use_cache=use_cache).get_counts()
 
 
 def convert_variants_trace_idx_to_trace_obj(log, variants_trace_idx):
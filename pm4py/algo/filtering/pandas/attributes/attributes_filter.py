@@ -1,8 +1,13 @@
+import numpy as np
+import pandas as pd
+
 from pm4py.algo.filtering.common.attributes import attributes_common
 from pm4py.algo.filtering.common.filtering_constants import CASE_CONCEPT_NAME
 from pm4py.algo.filtering.common.filtering_constants import DECREASING_FACTOR
+from pm4py.algo.filtering.pandas.case_mask import case_mask
 from pm4py.algo.filtering.pandas.pd_filtering_constants import MAX_NO_OF_ACTIVITIES_TO_RETAIN_FOR_DIAGRAM
 from pm4py.algo.filtering.pandas.pd_filtering_constants import MIN_NO_OF_ACTIVITIES_TO_RETAIN_FOR_DIAGRAM
+from pm4py.objects.log.util import case_table
 from pm4py.objects.log.util.xes import DEFAULT_NAME_KEY
 from pm4py.objects.log.util.xes import DEFAULT_TIMESTAMP_KEY
 from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY
@@ -25,6 +30,8 @@ def apply_events(df, values, parameters=None):
             attribute_key -> Attribute we want to filter
             positive -> Specifies if the filter should be applied including traces (positive=True) or
             excluding traces (positive=False)
+            mask -> If True, returns a mask on the cases (see pm4py.algo.filtering.pandas.case_mask)
+            case_id_glue -> (For the mask) Case ID column in the dataframe
     Returns
     ----------
     df
@@ -35,6 +42,11 @@ def apply_events(df, values, parameters=None):
     attribute_key = parameters[
         PARAMETER_CONSTANT_ATTRIBUTE_KEY] if PARAMETER_CONSTANT_ATTRIBUTE_KEY in parameters else DEFAULT_NAME_KEY
     positive = parameters["positive"] if "positive" in parameters else True
+    if parameters[case_mask.PARAMETER_MASK] if case_mask.PARAMETER_MASK in parameters else False:
+        case_id_glue = parameters[
+            PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_CONCEPT_NAME
+        row_mask = df[attribute_key].isin(values).values
+        return case_mask.get_rows_mask(df, row_mask if positive else ~row_mask, case_id_glue)
     if positive:
         return df[df[attribute_key].isin(values)]
     else:
@@ -57,6 +69,9 @@ def apply(df, values, parameters=None):
             attribute_key -> Attribute we want to filter
             positive -> Specifies if the filter should be applied including traces (positive=True) or
             excluding traces (positive=False)
+            mask -> If True, returns a mask on the cases (see pm4py.algo.filtering.pandas.case_mask)
+            use_case_table_cache -> If True, stores the case table with the dataframe and reuses the stored one
+            (see pm4py.objects.log.util.case_table)
     Returns
     ----------
     df
@@ -70,9 +85,12 @@ def apply(df, values, parameters=None):
     attribute_key = parameters[
         PARAMETER_CONSTANT_ATTRIBUTE_KEY] if PARAMETER_CONSTANT_ATTRIBUTE_KEY in parameters else DEFAULT_NAME_KEY
     positive = parameters["positive"] if "positive" in parameters else True
+    mask = parameters[case_mask.PARAMETER_MASK] if case_mask.PARAMETER_MASK in parameters else False
+    use_cache = parameters[
+        case_table.PARAMETER_USE_CACHE] if case_table.PARAMETER_USE_CACHE in parameters else False
 
     return filter_df_on_attribute_values(df, values, case_id_glue=case_id_glue, attribute_key=attribute_key,
-                                         positive=positive)
+                                         positive=positive, mask=mask, use_cache=use_cache)
 
 
 def apply_auto_filter(df, parameters=None):
@@ -87,6 +105,8 @@ def apply_auto_filter(df, parameters=None):
         Possible parameters of the algorithm, including:
             activity_key -> Column containing the activity
             decreasingFactor -> Decreasing factor that should be passed to the algorithm
+            mask -> If True, returns a mask on the cases (see pm4py.algo.filtering.pandas.case_mask)
+            case_id_glue -> (For the mask) Case ID column in the dataframe
 
     Returns
     ------------
@@ -99,14 +119,25 @@ def apply_auto_filter(df, parameters=None):
         PARAMETER_CONSTANT_ACTIVITY_KEY] if PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else DEFAULT_NAME_KEY
     decreasing_factor = parameters[
         "decreasingFactor"] if "decreasingFactor" in parameters else DECREASING_FACTOR
+    mask = parameters[case_mask.PARAMETER_MASK] if case_mask.PARAMETER_MASK in parameters else False
+    case_id_glue = parameters[
+        PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_CONCEPT_NAME
 
-    activities = get_attribute_values(df, activity_key)
-    alist = attributes_common.get_sorted_attributes_list(activities)
+    activity_codes, activities = pd.factorize(df[activity_key])
+    counts = np.bincount(activity_codes[activity_codes >= 0], minlength=len(activities))
+    if len(activities) == 0:
+        if mask:
+            return case_mask.get_rows_mask(df, np.ones(len(df), dtype=np.bool_), case_id_glue)
+        return df
+    alist = attributes_common.get_sorted_attributes_list(dict(zip(activities, counts.tolist())))
     thresh = attributes_common.get_attributes_threshold(alist, decreasing_factor,
                                                         min_activity_count=MIN_NO_OF_ACTIVITIES_TO_RETAIN_FOR_DIAGRAM,
                                                         max_activity_count=MAX_NO_OF_ACTIVITIES_TO_RETAIN_FOR_DIAGRAM)
 
-    return filter_df_keeping_activ_exc_thresh(df, thresh, activity_key=activity_key, act_count=activities)
+    row_mask = np.append(counts >= thresh, False)[activity_codes]
+    if mask:
+        return case_mask.get_rows_mask(df, row_mask, case_id_glue)
+    return df[row_mask]
 
 
 def get_attribute_values(df, attribute_key, parameters=None):
@@ -136,7 +167,7 @@ def get_attribute_values(df, attribute_key, parameters=None):
 
 
 def filter_df_on_attribute_values(df, values, case_id_glue="case:concept:name", attribute_key="concept:name",
-                                  positive=True):
+                                  positive=True, mask=False, use_cache=False):
     """
     Filter dataframe on attribute values
 
@@ -153,6 +184,11 @@ def filter_df_on_attribute_values(df, values, case_id_glue="case:concept:name",
     positive
         Specifies if the filtered should be applied including traces (positive=True) or excluding traces
         (positive=False)
+    mask
+        If True, returns a mask on the cases (see pm4py.algo.filtering.pandas.case_mask)
+    use_cache
+        If True, stores the case table with the dataframe and reuses the stored one (see
+        pm4py.objects.log.util.case_table)
 
     Returns
     ----------
@@ -161,12 +197,11 @@ def filter_df_on_attribute_values(df, values, case_id_glue="case:concept:name",
     """
     if values is None:
         values = []
-    filtered_df_by_ev = df[df[attribute_key].isin(values)]
-    i1 = df.set_index(case_id_glue).index
-    i2 = filtered_df_by_ev.set_index(case_id_glue).index
-    if positive:
-        return df[i1.isin(i2)]
-    return df[~i1.isin(i2)]
+    table = case_table.get_case_table(df, parameters={PARAMETER_CONSTANT_CASEID_KEY: case_id_glue,
+                                                       PARAMETER_CONSTANT_ACTIVITY_KEY: attribute_key,
+                                                       case_table.PARAMETER_USE_CACHE: use_cache})
+    cases_mask = table.get_cases_mask(table.get_values_mask(df, values))
+    return case_mask.get_filtered_df(df, table, cases_mask if positive else ~cases_mask, mask=mask)
 
 
 def filter_df_keeping_activ_exc_thresh(df, thresh, act_count=None, activity_key="concept:name"):
@@ -189,11 +224,12 @@ def filter_df_keeping_activ_exc_thresh(df, thresh, act_count=None, activity_key=
     df
         Filtered dataframe
     """
+    activity_codes, activities = pd.factorize(df[activity_key])
     if act_count is None:
-        act_count = get_attribute_values(df, activity_key)
-    act_count = [k for k, v in act_count.items() if v >= thresh]
-    df = df[df[activity_key].isin(act_count)]
-    return df
+        counts = np.bincount(activity_codes[activity_codes >= 0], minlength=len(activities))
+    else:
+        counts = np.array([act_count[x] if x in act_count else 0 for x in activities], dtype=np.int64)
+    return df[np.append(counts >= thresh, False)[activity_codes]]
 
 
 def filter_df_keeping_spno_activities(df, activity_key="concept:name", max_no_activities=25):
@@ -214,18 +250,13 @@ def filter_df_keeping_spno_activities(df, activity_key="concept:name", max_no_ac
     df
         Filtered dataframe
     """
-    activity_values_dict = dict(df[activity_key].value_counts())
-    activity_values_ordered_list = []
-    for act in activity_values_dict:
-        activity_values_ordered_list.append([act, activity_values_dict[act]])
-    activity_values_ordered_list = sorted(activity_values_ordered_list, key=lambda x: (x[1], x[0]), reverse=True)
+    activity_codes, activities = pd.factorize(df[activity_key])
+    counts = np.bincount(activity_codes[activity_codes >= 0], minlength=len(activities))
+    activity_values_ordered_list = sorted(zip(counts.tolist(), activities, range(len(activities))), reverse=True)
     # keep only a number of attributes <= max_no_activities
-    activity_values_ordered_list = activity_values_ordered_list[
-                                   0:min(len(activity_values_ordered_list), max_no_activities)]
-    activity_to_keep = [x[0] for x in activity_values_ordered_list]
-
-    df = df[df[activity_key].isin(activity_to_keep)]
-    return df
+    kept = np.zeros(len(activities) + 1, dtype=np.bool_)
+    kept[[x[2] for x in activity_values_ordered_list[:max_no_activities]]] = True
+    return df[kept[activity_codes]]
 
 
 def get_kde_numeric_attribute(df, attribute, parameters=None):
@@ -1,7 +1,5 @@
-from pm4py.algo.filtering.pandas.attributes import attributes_filter
-from pm4py.algo.filtering.pandas.end_activities import end_activities_filter
-from pm4py.algo.filtering.pandas.start_activities import start_activities_filter
-from pm4py.algo.filtering.pandas.variants import variants_filter
+from pm4py.algo.filtering.common.filtering_constants import DECREASING_FACTOR
+from pm4py.algo.filtering.pandas.filter_plan import filter_plan
 
 
 def apply_auto_filter(df, parameters=None):
@@ -48,13 +46,20 @@ def apply_auto_filter(df, parameters=None):
     # - variants filter (if enabled)
     # - end activities filter (if enabled)
     # - start activities filter (if enabled)
+    decreasing_factor = parameters[
+        "decreasingFactor"] if "decreasingFactor" in parameters else DECREASING_FACTOR
+
+    # the filters are recorded in a plan, evaluated on the variants of the cases and the dataframe is sliced once
+    plan = filter_plan.FilterPlan(df, parameters=parameters)
     if enable_activities_filter:
-        df = attributes_filter.apply_auto_filter(df, parameters=parameters)
+        plan.filter_activities_auto(decreasing_factor=decreasing_factor)
     if enable_variants_filter:
-        df = variants_filter.apply_auto_filter(df, parameters=parameters)
+        plan.filter_variants_auto(decreasing_factor=decreasing_factor)
     if enable_end_activities_filter:
-        df = end_activities_filter.apply_auto_filter(df, parameters=parameters)
+        plan.filter_end_activities_auto(decreasing_factor=decreasing_factor)
     if enable_start_activities_filter:
-        df = start_activities_filter.apply_auto_filter(df, parameters=parameters)
+        plan.filter_start_activities_auto(decreasing_factor=decreasing_factor)
 
-    return df
+    if not plan.steps:
+        return df
+    return plan.apply()
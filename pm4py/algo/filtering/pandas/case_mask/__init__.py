@@ -0,0 +1 @@
+from pm4py.algo.filtering.pandas.case_mask import case_mask
@@ -0,0 +1,152 @@
+import numpy as np
+
+from pm4py.objects.log.util import case_table
+from pm4py.util.constants import PARAMETER_CONSTANT_CASEID_KEY
+
+# parameter of the filters asking for a mask on the cases of the dataframe (instead of the filtered dataframe)
+PARAMETER_MASK = "mask"
+
+
+class CaseMask(object):
+    """
+    Boolean mask over the cases of a dataframe, as returned by the filters when asked for a mask. The mask refers
+    to the cases of the case table of the dataframe (see pm4py.objects.log.util.case_table); the filters keeping
+    only some events of the cases (e.g. attributes_filter.apply_events) also keep a mask over the rows.
+
+    The masks computed on the same dataframe (and case ID column) are combined with &, | and ~, without touching
+    the dataframe, that is sliced only once, by apply. Each mask is computed on the whole dataframe: combining the
+    masks of two filters is not the same as applying the second filter on the result of the first, when the first
+    removes some events of the cases. The rows without case ID are never kept
+    """
+
+    def __init__(self, table, case_mask, row_mask=None):
+        """
+        Constructor
+
+        Parameters
+        -------------
+        table
+            Case table of the dataframe
+        case_mask
+            Boolean mask of the kept cases (one value per row of the table)
+        row_mask
+            (If provided) Boolean mask of the kept rows of the dataframe; None if all the rows of the kept cases
+            are kept
+        """
+        self.table = table
+        self.case_mask = np.asarray(case_mask, dtype=np.bool_)
+        self.row_mask = row_mask
+
+    def get_row_mask(self):
+        """
+        Gets the boolean mask of the kept rows of the dataframe
+        """
+        # the rows without case ID (number -1) take the last value, that is False
+        row_mask = np.append(self.case_mask, False)[self.table.row_cases]
+        if self.row_mask is not None:
+            row_mask = row_mask & self.row_mask
+        return row_mask
+
+    def get_cases(self):
+        """
+        Gets the IDs of the cases having at least a kept row
+        """
+        if self.row_mask is None:
+            return self.table.table.index[self.case_mask]
+        return self.table.table.index[self.table.get_cases_mask(self.get_row_mask())]
+
+    def check_compatible(self, other):
+        """
+        Checks that the other mask refers to the same cases (of the same dataframe) of this mask
+        """
+        if not isinstance(other, CaseMask):
+            raise TypeError("a case mask can only be combined with another case mask")
+        if other.table is not self.table and not np.array_equal(other.table.row_cases, self.table.row_cases):
+            raise ValueError("the masks refer to the cases of different dataframes")
+
+    def __and__(self, other):
+        self.check_compatible(other)
+        row_mask = None
+        if self.row_mask is not None or other.row_mask is not None:
+            row_mask = self.get_row_mask() & other.get_row_mask()
+        return CaseMask(self.table, self.case_mask & other.case_mask, row_mask=row_mask)
+
+    def __or__(self, other):
+        self.check_compatible(other)
+        row_mask = None
+        if self.row_mask is not None or other.row_mask is not None:
+            row_mask = self.get_row_mask() | other.get_row_mask()
+        return CaseMask(self.table, self.case_mask | other.case_mask, row_mask=row_mask)
+
+    def __invert__(self):
+        if self.row_mask is None:
+            return CaseMask(self.table, ~self.case_mask)
+        return CaseMask(self.table, np.ones(len(self.case_mask), dtype=np.bool_), row_mask=~self.get_row_mask())
+
+    def apply(self, df):
+        """
+        Applies the mask on the dataframe on which it has been computed
+
+        Parameters
+        -------------
+        df
+            Dataframe
+
+        Returns
+        -------------
+        df
+            Filtered dataframe
+        """
+        if len(df) != len(self.table.row_cases):
+            raise ValueError("the mask has been computed on a different dataframe")
+        if self.row_mask is None:
+            # the filtered dataframe gets the restriction of the case table
+            return self.table.filter(df, self.case_mask)
+        return df[self.get_row_mask()]
+
+
+def get_filtered_df(df, table, case_mask, mask=False):
+    """
+    Gets the result of a filter keeping whole cases: the mask (see CaseMask) or, otherwise, the filtered dataframe
+
+    Parameters
+    -------------
+    df
+        Dataframe
+    table
+        Case table of the dataframe
+    case_mask
+        Boolean mask of the kept cases (one value per row of the table)
+    mask
+        Boolean (returns the mask)
+
+    Returns
+    -------------
+    filtered_df
+        Filtered dataframe (or mask)
+    """
+    if mask:
+        return CaseMask(table, case_mask)
+    return table.filter(df, case_mask)
+
+
+def get_rows_mask(df, row_mask, case_id_glue):
+    """
+    Gets the mask of a filter keeping some rows of the dataframe, over the cases of the given case ID column
+
+    Parameters
+    -------------
+    df
+        Dataframe
+    row_mask
+        Boolean mask of the kept rows
+    case_id_glue
+        Column that contains the Case ID
+
+    Returns
+    -------------
+    mask
+        Case mask
+    """
+    table = case_table.get_case_table(df, parameters={PARAMETER_CONSTANT_CASEID_KEY: case_id_glue})
+    return CaseMask(table, np.ones(len(table.table), dtype=np.bool_), row_mask=np.asarray(row_mask, dtype=np.bool_))
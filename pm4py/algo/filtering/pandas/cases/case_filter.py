@@ -1,7 +1,11 @@
-import pandas as pd
+import numpy as np
 
+from pm4py.algo.filtering.pandas.case_mask import case_mask
+from pm4py.objects.log.util import case_table
+from pm4py.util.constants import PARAMETER_CONSTANT_CASEID_KEY, PARAMETER_CONSTANT_TIMESTAMP_KEY
 
-def filter_on_ncases(df, case_id_glue="case:concept:name", max_no_cases=1000):
+
+def filter_on_ncases(df, case_id_glue="case:concept:name", max_no_cases=1000, mask=False, use_cache=False):
     """
     Filter a dataframe keeping only the specified maximum number of traces
 
@@ -13,6 +17,11 @@ def filter_on_ncases(df, case_id_glue="case:concept:name", max_no_cases=1000):
         Case ID column in the CSV
     max_no_cases
         Maximum number of traces to keep
+    mask
+        If True, returns a mask on the cases (see pm4py.algo.filtering.pandas.case_mask)
+    use_cache
+        If True, stores the case table with the dataframe and reuses the stored one (see
+        pm4py.objects.log.util.case_table)
 
     Returns
     ------------
@@ -24,11 +33,16 @@ def filter_on_ncases(df, case_id_glue="case:concept:name", max_no_cases=1000):
     for case in cases_values_dict:
         cases_to_keep.append(case)
     cases_to_keep = cases_to_keep[0:min(len(cases_to_keep), max_no_cases)]
+    if mask:
+        table = case_table.get_case_table(df, parameters={PARAMETER_CONSTANT_CASEID_KEY: case_id_glue,
+                                                           case_table.PARAMETER_USE_CACHE: use_cache})
+        return case_mask.CaseMask(table, table.table.index.isin(cases_to_keep))
     df = df[df[case_id_glue].isin(cases_to_keep)]
     return df
 
 
-def filter_on_case_size(df, case_id_glue="case:concept:name", min_case_size=2, max_case_size=None):
+def filter_on_case_size(df, case_id_glue="case:concept:name", min_case_size=2, max_case_size=None, mask=False,
+                        use_cache=False):
     """
     Filter a dataframe keeping only traces with at least the specified number of events
 
@@ -42,20 +56,29 @@ def filter_on_case_size(df, case_id_glue="case:concept:name", min_case_size=2, m
         Minimum size of a case
     max_case_size
         Maximum case size
+    mask
+        If True, returns a mask on the cases (see pm4py.algo.filtering.pandas.case_mask)
+    use_cache
+        If True, stores the case table with the dataframe and reuses the stored one (see
+        pm4py.objects.log.util.case_table)
 
     Returns
     -----------
     df
         Filtered dataframe
     """
-    element_group_size = df[case_id_glue].groupby(df[case_id_glue]).transform('size')
+    table = case_table.get_case_table(df, parameters={PARAMETER_CONSTANT_CASEID_KEY: case_id_glue,
+                                                       case_table.PARAMETER_USE_CACHE: use_cache})
+    sizes = table.table[case_table.SIZE].values
+    cases_mask = sizes >= min_case_size
     if max_case_size:
-        return df[min_case_size <= element_group_size <= max_case_size]
-    return df[element_group_size >= min_case_size]
+        cases_mask = cases_mask & (sizes <= max_case_size)
+    return case_mask.get_filtered_df(df, table, cases_mask, mask=mask)
 
 
 def filter_on_case_performance(df, case_id_glue="case:concept:name", timestamp_key="time:timestamp",
-                               min_case_performance=0, max_case_performance=10000000000):
+                               min_case_performance=0, max_case_performance=10000000000, mask=False,
+                               use_cache=False):
     """
     Filter a dataframe on case performance
 
@@ -71,24 +94,24 @@ def filter_on_case_performance(df, case_id_glue="case:concept:name", timestamp_k
         Minimum case performance
     max_case_performance
         Maximum case performance
+    mask
+        If True, returns a mask on the cases (see pm4py.algo.filtering.pandas.case_mask)
+    use_cache
+        If True, stores the case table with the dataframe and reuses the stored one (see
+        pm4py.objects.log.util.case_table)
 
     Returns
     -----------
     df
         Filtered dataframe
     """
-    grouped_df = df[[case_id_glue, timestamp_key]].groupby(df[case_id_glue])
-    start_events = grouped_df.first()
-    end_events = grouped_df.last()
-    end_events.columns = [str(col) + '_2' for col in end_events.columns]
-    stacked_df = pd.concat([start_events, end_events], axis=1)
-    stacked_df['caseDuration'] = stacked_df[timestamp_key + "_2"] - stacked_df[timestamp_key]
-    stacked_df['caseDuration'] = stacked_df['caseDuration'].astype('timedelta64[s]')
-    stacked_df = stacked_df[stacked_df['caseDuration'] < max_case_performance]
-    stacked_df = stacked_df[stacked_df['caseDuration'] > min_case_performance]
-    i1 = df.set_index(case_id_glue).index
-    i2 = stacked_df.set_index(case_id_glue).index
-    return df[i1.isin(i2)]
+    table = case_table.get_case_table(df, parameters={PARAMETER_CONSTANT_CASEID_KEY: case_id_glue,
+                                                       PARAMETER_CONSTANT_TIMESTAMP_KEY: timestamp_key,
+                                                       case_table.PARAMETER_USE_CACHE: use_cache})
+    # the durations are compared in whole seconds
+    durations = np.floor(table.table[case_table.DURATION].values)
+    return case_mask.get_filtered_df(df, table, (durations > min_case_performance) & (
+            durations < max_case_performance), mask=mask)
 
 
 def apply(df, parameters=None):
@@ -0,0 +1 @@
+from pm4py.algo.filtering.pandas.filter_plan import filter_plan
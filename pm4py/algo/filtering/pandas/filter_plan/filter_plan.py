@@ -0,0 +1,215 @@
+import numpy as np
+
+from pm4py.algo.filtering.common import filtering_constants
+from pm4py.algo.filtering.common.attributes import attributes_common
+from pm4py.algo.filtering.common.end_activities import end_activities_common
+from pm4py.algo.filtering.common.filter_plan import filter_plan_common as common
+from pm4py.algo.filtering.common.filtering_constants import CASE_CONCEPT_NAME
+from pm4py.algo.filtering.common.start_activities import start_activities_common
+from pm4py.algo.filtering.pandas.pd_filtering_constants import MAX_NO_OF_ACTIVITIES_TO_RETAIN_FOR_DIAGRAM
+from pm4py.algo.filtering.pandas.pd_filtering_constants import MIN_NO_OF_ACTIVITIES_TO_RETAIN_FOR_DIAGRAM
+from pm4py.objects.log.util.xes import DEFAULT_NAME_KEY
+from pm4py.statistics.traces.pandas import case_statistics
+from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY
+from pm4py.util.constants import PARAMETER_CONSTANT_CASEID_KEY
+
+
+class FilterPlan(object):
+    """
+    Lazy plan of filters on the activities of a dataframe. The filters are only recorded when requested; when the
+    plan is applied, the case IDs and the activities are factorized once, all the steps are evaluated on the
+    integer-encoded variants of the cases, and the dataframe is sliced only once, at the end.
+
+    Each step keeps the rows that the corresponding filter of pm4py.algo.filtering.pandas would keep when applied
+    to the result of the previous steps (the rows without case ID or activity are removed)
+    """
+
+    def __init__(self, df, parameters=None):
+        """
+        Constructor
+
+        Parameters
+        -------------
+        df
+            Dataframe
+        parameters
+            Parameters of the plan, including:
+                case_id_glue -> Column that contains the Case ID
+                activity_key -> Column that contains the activity
+        """
+        if parameters is None:
+            parameters = {}
+
+        self.df = df
+        self.case_id_glue = parameters[
+            PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_CONCEPT_NAME
+        self.activity_key = parameters[
+            PARAMETER_CONSTANT_ACTIVITY_KEY] if PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else DEFAULT_NAME_KEY
+        self.steps = []
+
+    def filter_activities(self, values, positive=True):
+        """
+        Keeps (or removes) the events whose activity belongs to the values (as attributes_filter.apply_events)
+        """
+        self.steps.append((common.ACTIVITIES, (values, positive)))
+        return self
+
+    def filter_activities_auto(self, decreasing_factor=filtering_constants.DECREASING_FACTOR):
+        """
+        Keeps the events of the most frequent activities (as attributes_filter.apply_auto_filter)
+        """
+        self.steps.append((common.ACTIVITIES_AUTO, (decreasing_factor,)))
+        return self
+
+    def filter_traces_with_activities(self, values, positive=True):
+        """
+        Keeps (or removes) the cases containing an activity among the values (as attributes_filter.apply)
+        """
+        self.steps.append((common.TRACES_WITH_ACTIVITIES, (values, positive)))
+        return self
+
+    def filter_variants(self, admitted_variants, positive=True):
+        """
+        Keeps (or removes) the cases of the given variants (as variants_filter.apply)
+        """
+        self.steps.append((common.VARIANTS, (admitted_variants, positive)))
+        return self
+
+    def filter_variants_auto(self, decreasing_factor=filtering_constants.DECREASING_FACTOR):
+        """
+        Keeps the cases of the most frequent variants (as variants_filter.apply_auto_filter)
+        """
+        self.steps.append((common.VARIANTS_AUTO, (decreasing_factor,)))
+        return self
+
+    def filter_start_activities(self, values, positive=True):
+        """
+        Keeps (or removes) the cases starting with one of the values (as start_activities_filter.apply)
+        """
+        self.steps.append((common.START_ACTIVITIES, (values, positive)))
+        return self
+
+    def filter_start_activities_auto(self, decreasing_factor=filtering_constants.DECREASING_FACTOR):
+        """
+        Keeps the cases starting with a frequent start activity (as start_activities_filter.apply_auto_filter)
+        """
+        self.steps.append((common.START_ACTIVITIES_AUTO, (decreasing_factor,)))
+        return self
+
+    def filter_end_activities(self, values, positive=True):
+        """
+        Keeps (or removes) the cases ending with one of the values (as end_activities_filter.apply)
+        """
+        self.steps.append((common.END_ACTIVITIES, (values, positive)))
+        return self
+
+    def filter_end_activities_auto(self, decreasing_factor=filtering_constants.DECREASING_FACTOR):
+        """
+        Keeps the cases ending with a frequent end activity (as end_activities_filter.apply_auto_filter)
+        """
+        self.steps.append((common.END_ACTIVITIES_AUTO, (decreasing_factor,)))
+        return self
+
+    def apply(self):
+        """
+        Applies the recorded filters
+
+        Returns
+        -------------
+        df
+            Filtered dataframe
+        """
+        present, case_codes, cases, activity_codes, activities = case_statistics.get_events_codes(
+            self.df, parameters={PARAMETER_CONSTANT_CASEID_KEY: self.case_id_glue,
+                                 PARAMETER_CONSTANT_ACTIVITY_KEY: self.activity_key})
+        activities = list(activities)
+        item_variants, sequences = case_statistics.encode_variants(case_codes, activity_codes, len(cases),
+                                                                   len(activities))
+        item_variants = np.asarray(item_variants, dtype=np.int64)
+        order = np.arange(len(cases), dtype=np.int64)
+        kept_activities = None
+
+        for step, arguments in self.steps:
+            projected = common.get_projected_sequences(sequences, kept_activities)
+            order, item_current_variants, current_sequences, counts = common.get_current_variants(
+                projected, item_variants, order, kept_activities is not None)
+            if step in (common.ACTIVITIES, common.ACTIVITIES_AUTO):
+                if step == common.ACTIVITIES:
+                    values_mask = common.get_values_mask(activities, arguments[0])
+                    mask = values_mask if arguments[1] else ~values_mask
+                else:
+                    mask = get_auto_activities(activities, current_sequences, counts, arguments[0])
+                kept_activities = mask if kept_activities is None else kept_activities & mask
+            else:
+                order = select_cases(step, arguments, activities, order, item_current_variants,
+                                     current_sequences, counts)
+
+        kept_cases = np.zeros(len(cases), dtype=np.bool_)
+        kept_cases[order] = True
+        rows_mask = kept_cases[case_codes]
+        if kept_activities is not None:
+            rows_mask = rows_mask & kept_activities[activity_codes]
+        mask = np.zeros(len(self.df), dtype=np.bool_)
+        mask[np.nonzero(present)[0][rows_mask]] = True
+        return self.df[mask]
+
+
+def get_auto_activities(activities, current_sequences, counts, decreasing_factor):
+    """
+    Gets the mask of the activities kept by the automatic activities filter
+    """
+    activities_count = common.get_activities_count(current_sequences, counts, len(activities))
+    attributes = common.get_count_dictionary(activities, common.get_activities_in_order(current_sequences),
+                                             activities_count)
+    if not attributes:
+        return np.zeros(len(activities), dtype=np.bool_)
+    alist = attributes_common.get_sorted_attributes_list(attributes)
+    threshold = attributes_common.get_attributes_threshold(
+        alist, decreasing_factor, min_activity_count=MIN_NO_OF_ACTIVITIES_TO_RETAIN_FOR_DIAGRAM,
+        max_activity_count=MAX_NO_OF_ACTIVITIES_TO_RETAIN_FOR_DIAGRAM)
+    return (activities_count >= threshold) & (activities_count > 0)
+
+
+def select_cases(step, arguments, activities, order, item_current_variants, current_sequences, counts):
+    """
+    Applies a step that keeps or removes whole cases, deciding on their variants
+    """
+    if step == common.TRACES_WITH_ACTIVITIES:
+        values_mask = common.get_values_mask(activities, arguments[0])
+        contained = np.array([bool(values_mask[x].any()) for x in current_sequences], dtype=np.bool_)
+        return common.select_items(order, item_current_variants, contained if arguments[1] else ~contained)
+    if step == common.VARIANTS:
+        admitted = set(arguments[0])
+        contained = np.array([",".join([activities[code] for code in x.tolist()]) in admitted for x in
+                              current_sequences], dtype=np.bool_)
+        return common.select_items(order, item_current_variants, contained if arguments[1] else ~contained)
+    if step == common.VARIANTS_AUTO:
+        # the variants are considered by decreasing count, while their count does not drop below the decreasing
+        # factor times the count of the previous one
+        kept = np.zeros(len(counts), dtype=np.bool_)
+        current_variant_count = None
+        for variant in np.argsort(-counts, kind="stable").tolist():
+            if current_variant_count is not None and counts[variant] < arguments[0] * current_variant_count:
+                break
+            kept[variant] = True
+            current_variant_count = counts[variant]
+        return common.select_items(order, item_current_variants, kept)
+    last = step in (common.END_ACTIVITIES, common.END_ACTIVITIES_AUTO)
+    boundary = common.get_boundary_activities(current_sequences, last=last)
+    if step in (common.START_ACTIVITIES, common.END_ACTIVITIES):
+        contained = np.append(common.get_values_mask(activities, arguments[0]), False)[boundary]
+        return common.select_items(order, item_current_variants, contained if arguments[1] else ~contained)
+    # automatic start or end activities filter
+    boundary_count = common.get_boundary_activities_count(boundary, counts, len(activities))
+    boundary_activities = common.get_count_dictionary(activities, [x for x in boundary.tolist() if x >= 0],
+                                                      boundary_count)
+    if not boundary_activities:
+        return order[:0]
+    if last:
+        ealist = end_activities_common.get_sorted_end_activities_list(boundary_activities)
+        threshold = end_activities_common.get_end_activities_threshold(ealist, arguments[0])
+    else:
+        salist = start_activities_common.get_sorted_start_activities_list(boundary_activities)
+        threshold = start_activities_common.get_start_activities_threshold(salist, arguments[0])
+    kept = (boundary >= 0) & (np.append(boundary_count, 0)[boundary] >= threshold)
+    return common.select_items(order, item_current_variants, kept)
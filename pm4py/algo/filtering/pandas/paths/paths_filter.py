@@ -1,7 +1,10 @@
-import pandas as pd
+import numpy as np
 
 from pm4py.algo.filtering.common.filtering_constants import CASE_CONCEPT_NAME
+from pm4py.algo.filtering.pandas.case_mask import case_mask
+from pm4py.objects.log.util import case_table
 from pm4py.objects.log.util.xes import DEFAULT_NAME_KEY
+from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY
 from pm4py.util.constants import PARAMETER_CONSTANT_ATTRIBUTE_KEY
 from pm4py.util.constants import PARAMETER_CONSTANT_CASEID_KEY
 
@@ -22,6 +25,9 @@ def apply(df, paths, parameters=None):
             attribute_key -> Attribute we want to filter
             positive -> Specifies if the filter should be applied including traces (positive=True)
             or excluding traces (positive=False)
+            mask -> If True, returns a mask on the cases (see pm4py.algo.filtering.pandas.case_mask)
+            use_case_table_cache -> If True, stores the case table with the dataframe and reuses the stored one
+            (see pm4py.objects.log.util.case_table)
     Returns
     ----------
     df
@@ -29,24 +35,32 @@ def apply(df, paths, parameters=None):
     """
     if parameters is None:
         parameters = {}
-    paths = [path[0] + "," + path[1] for path in paths]
     case_id_glue = parameters[
         PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_CONCEPT_NAME
     attribute_key = parameters[
         PARAMETER_CONSTANT_ATTRIBUTE_KEY] if PARAMETER_CONSTANT_ATTRIBUTE_KEY in parameters else DEFAULT_NAME_KEY
     positive = parameters["positive"] if "positive" in parameters else True
-    filt_df = df[[case_id_glue, attribute_key]]
-    filt_dif_shifted = filt_df.shift(-1)
-    filt_dif_shifted.columns = [str(col) + '_2' for col in filt_dif_shifted.columns]
-    stacked_df = pd.concat([filt_df, filt_dif_shifted], axis=1)
-    stacked_df["@@path"] = stacked_df[attribute_key] + "," + stacked_df[attribute_key + "_2"]
-    stacked_df = stacked_df[stacked_df["@@path"].isin(paths)]
-    i1 = df.set_index(case_id_glue).index
-    i2 = stacked_df.set_index(case_id_glue).index
-    if positive:
-        return df[i1.isin(i2)]
-    else:
-        return df[~i1.isin(i2)]
+    mask = parameters[case_mask.PARAMETER_MASK] if case_mask.PARAMETER_MASK in parameters else False
+    use_cache = parameters[
+        case_table.PARAMETER_USE_CACHE] if case_table.PARAMETER_USE_CACHE in parameters else False
+    table = case_table.get_case_table(df, parameters={PARAMETER_CONSTANT_CASEID_KEY: case_id_glue,
+                                                       PARAMETER_CONSTANT_ACTIVITY_KEY: attribute_key,
+                                                       case_table.PARAMETER_USE_CACHE: use_cache})
+    activity_codes, activities = table.get_activity_codes(df)
+    no_activities = len(activities)
+    # each path is encoded as (code of the first activity) * (number of activities) + (code of the second)
+    paths_codes = np.array([activities.get_indexer([path[0], path[1]]) for path in paths],
+                           dtype=np.int64).reshape(-1, 2)
+    paths_codes = paths_codes[(paths_codes >= 0).all(axis=1)]
+    paths_codes = paths_codes[:, 0] * no_activities + paths_codes[:, 1]
+    # the couples of consecutive rows of the same case are compared by shifting the rows grouped by case
+    rows = table.get_rows_by_case()
+    rows_cases = table.row_cases[rows]
+    rows_activities = activity_codes[rows].astype(np.int64)
+    couples = (rows_cases[:-1] == rows_cases[1:]) & (rows_activities[:-1] >= 0) & (rows_activities[1:] >= 0)
+    couples = couples & np.isin(rows_activities[:-1] * no_activities + rows_activities[1:], paths_codes)
+    cases_mask = np.bincount(rows_cases[:-1][couples], minlength=len(table.table)) > 0
+    return case_mask.get_filtered_df(df, table, cases_mask if positive else ~cases_mask, mask=mask)
 
 
 def apply_auto_filter(df, parameters=None):
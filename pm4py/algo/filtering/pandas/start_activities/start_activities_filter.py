@@ -1,6 +1,8 @@
 from pm4py.algo.filtering.common import filtering_constants
 from pm4py.algo.filtering.common.filtering_constants import CASE_CONCEPT_NAME
 from pm4py.algo.filtering.common.start_activities import start_activities_common
+from pm4py.algo.filtering.pandas.case_mask import case_mask
+from pm4py.objects.log.util import case_table
 from pm4py.objects.log.util import xes
 from pm4py.objects.log.util.xes import DEFAULT_NAME_KEY
 from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY
@@ -23,6 +25,9 @@ def apply(df, values, parameters=None):
             activity_key -> Column that represents the activity
             positive -> Specifies if the filtered should be applied including traces (positive=True)
             or excluding traces (positive=False)
+            mask -> If True, returns a mask on the cases (see pm4py.algo.filtering.pandas.case_mask)
+            use_case_table_cache -> If True, stores the case table with the dataframe and reuses the stored one
+            (see pm4py.objects.log.util.case_table)
 
     Returns
     ----------
@@ -36,9 +41,12 @@ def apply(df, values, parameters=None):
     activity_key = parameters[
         PARAMETER_CONSTANT_ACTIVITY_KEY] if PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else DEFAULT_NAME_KEY
     positive = parameters["positive"] if "positive" in parameters else True
+    mask = parameters[case_mask.PARAMETER_MASK] if case_mask.PARAMETER_MASK in parameters else False
+    use_cache = parameters[
+        case_table.PARAMETER_USE_CACHE] if case_table.PARAMETER_USE_CACHE in parameters else False
 
     return filter_df_on_start_activities(df, values, case_id_glue=case_id_glue, activity_key=activity_key,
-                                         positive=positive)
+                                         positive=positive, mask=mask, use_cache=use_cache)
 
 
 def apply_auto_filter(df, parameters=None):
@@ -54,6 +62,9 @@ def apply_auto_filter(df, parameters=None):
             case_id_glue -> Case ID column in the dataframe
             activity_key -> Column that represents the activity
             decreasingFactor -> Decreasing factor that should be passed to the algorithm
+            mask -> If True, returns a mask on the cases (see pm4py.algo.filtering.pandas.case_mask)
+            use_case_table_cache -> If True, stores the case table with the dataframe and reuses the stored one
+            (see pm4py.objects.log.util.case_table)
 
     Returns
     -----------
@@ -69,13 +80,16 @@ def apply_auto_filter(df, parameters=None):
         PARAMETER_CONSTANT_ACTIVITY_KEY] if PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else DEFAULT_NAME_KEY
     decreasing_factor = parameters[
         "decreasingFactor"] if "decreasingFactor" in parameters else filtering_constants.DECREASING_FACTOR
+    mask = parameters[case_mask.PARAMETER_MASK] if case_mask.PARAMETER_MASK in parameters else False
+    use_cache = parameters[
+        case_table.PARAMETER_USE_CACHE] if case_table.PARAMETER_USE_CACHE in parameters else False
 
     start_activities = get_start_activities(df, parameters=parameters)
     salist = start_activities_common.get_sorted_start_activities_list(start_activities)
     sathreshold = start_activities_common.get_start_activities_threshold(salist, decreasing_factor)
 
     return filter_df_on_start_activities_nocc(df, sathreshold, sa_count=start_activities, case_id_glue=case_id_glue,
-                                              activity_key=activity_key)
+                                              activity_key=activity_key, mask=mask, use_cache=use_cache)
 
 
 def get_start_activities(df, parameters=None):
@@ -90,6 +104,8 @@ def get_start_activities(df, parameters=None):
         Parameters of the algorithm, including:
             case_id_glue -> Case ID column in the dataframe
             activity_key -> Column that represents the activity
+            use_case_table_cache -> If True, stores the case table with the dataframe and reuses the stored one
+            (see pm4py.objects.log.util.case_table)
 
     Returns
     -----------
@@ -103,14 +119,18 @@ def get_start_activities(df, parameters=None):
         PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_CONCEPT_NAME
     activity_key = parameters[
         PARAMETER_CONSTANT_ACTIVITY_KEY] if PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else DEFAULT_NAME_KEY
+    use_cache = parameters[
+        case_table.PARAMETER_USE_CACHE] if case_table.PARAMETER_USE_CACHE in parameters else False
 
-    first_eve_df = df.groupby(case_id_glue).first()
-    startact_dict = dict(first_eve_df[activity_key].value_counts())
+    table = case_table.get_case_table(df, parameters={PARAMETER_CONSTANT_CASEID_KEY: case_id_glue,
+                                                       PARAMETER_CONSTANT_ACTIVITY_KEY: activity_key,
+                                                       case_table.PARAMETER_USE_CACHE: use_cache})
+    startact_dict = dict(table.table[case_table.START_ACTIVITY].value_counts())
     return startact_dict
 
 
 def filter_df_on_start_activities(df, values, case_id_glue=filtering_constants.CASE_CONCEPT_NAME,
-                                  activity_key=xes.DEFAULT_NAME_KEY, positive=True):
+                                  activity_key=xes.DEFAULT_NAME_KEY, positive=True, mask=False, use_cache=False):
     """
     Filter dataframe on start activities
 
@@ -127,23 +147,26 @@ def filter_df_on_start_activities(df, values, case_id_glue=filtering_constants.C
     positive
         Specifies if the filtered should be applied including traces (positive=True) or excluding traces
         (positive=False)
+    mask
+        If True, returns a mask on the cases (see pm4py.algo.filtering.pandas.case_mask)
+    use_cache
+        If True, stores the case table with the dataframe and reuses the stored one (see
+        pm4py.objects.log.util.case_table)
 
     Returns
     ----------
     df
         Filtered dataframe
     """
-    first_eve_df = df.groupby(case_id_glue).first()
-    first_eve_df = first_eve_df[first_eve_df[activity_key].isin(values)]
-    i1 = df.set_index(case_id_glue).index
-    i2 = first_eve_df.index
-    if positive:
-        return df[i1.isin(i2)]
-    return df[~i1.isin(i2)]
+    table = case_table.get_case_table(df, parameters={PARAMETER_CONSTANT_CASEID_KEY: case_id_glue,
+                                                       PARAMETER_CONSTANT_ACTIVITY_KEY: activity_key,
+                                                       case_table.PARAMETER_USE_CACHE: use_cache})
+    cases_mask = table.table[case_table.START_ACTIVITY].isin(values).values
+    return case_mask.get_filtered_df(df, table, cases_mask if positive else ~cases_mask, mask=mask)
 
 
 def filter_df_on_start_activities_nocc(df, nocc, sa_count=None, case_id_glue=CASE_CONCEPT_NAME,
-                                       activity_key=DEFAULT_NAME_KEY):
+                                       activity_key=DEFAULT_NAME_KEY, mask=False, use_cache=False):
     """
     Filter dataframe on start activities number of occurrences
 
@@ -159,17 +182,22 @@ def filter_df_on_start_activities_nocc(df, nocc, sa_count=None, case_id_glue=CAS
         Column that contains the Case ID
     activity_key
         Column that contains the activity
+    mask
+        If True, returns a mask on the cases (see pm4py.algo.filtering.pandas.case_mask)
+    use_cache
+        If True, stores the case table with the dataframe and reuses the stored one (see
+        pm4py.objects.log.util.case_table)
 
     Returns
     ------------
     df
         Filtered dataframe
     """
-    first_eve_df = df.groupby(case_id_glue).first()
+    parameters = {PARAMETER_CONSTANT_CASEID_KEY: case_id_glue, PARAMETER_CONSTANT_ACTIVITY_KEY: activity_key,
+                  case_table.PARAMETER_USE_CACHE: use_cache}
     if sa_count is None:
-        sa_count = get_start_activities(df)
+        sa_count = get_start_activities(df, parameters=parameters)
     sa_count = [k for k, v in sa_count.items() if v >= nocc]
-    first_eve_df = first_eve_df[first_eve_df[activity_key].isin(sa_count)]
-    i1 = df.set_index(case_id_glue).index
-    i2 = first_eve_df.index
-    return df[i1.isin(i2)]
+    table = case_table.get_case_table(df, parameters=parameters)
+    return case_mask.get_filtered_df(df, table, table.table[case_table.START_ACTIVITY].isin(sa_count).values,
+                                     mask=mask)
@@ -1,16 +1,19 @@
-import pandas as pd
-import pytz
+import numpy as np
 
 from pm4py.algo.filtering.common.filtering_constants import CASE_CONCEPT_NAME
 from pm4py.algo.filtering.common.timestamp.timestamp_common import get_dt_from_string
+from pm4py.algo.filtering.pandas.case_mask import case_mask
+from pm4py.objects.log.util import case_table
+from pm4py.objects.log.util import interval_index
 from pm4py.objects.log.util.xes import DEFAULT_TIMESTAMP_KEY
 from pm4py.util.constants import PARAMETER_CONSTANT_TIMESTAMP_KEY, PARAMETER_CONSTANT_CASEID_KEY
-from pm4py.util.versions import check_pandas_ge_024
 
 
 def filter_traces_contained(df, dt1, dt2, parameters=None):
     """
-    Get traces that are contained in the given interval
+    Get traces that are contained in the given interval. The time intervals of the traces are indexed (see
+    pm4py.objects.log.util.interval_index); with use_case_table_cache, the index is kept with the case table of the
+    dataframe, so the following queries on the same dataframe only search the index
 
     Parameters
     ----------
@@ -24,6 +27,9 @@ def filter_traces_contained(df, dt1, dt2, parameters=None):
         Possible parameters of the algorithm, including:
             timestamp_key -> Attribute to use as timestamp
             case_id_glue -> Column that contains the timestamp
+            mask -> If True, returns a mask on the cases (see pm4py.algo.filtering.pandas.case_mask)
+            use_case_table_cache -> If True, stores the case table (and the index) with the dataframe and reuses
+            the stored one (see pm4py.objects.log.util.case_table)
 
     Returns
     ----------
@@ -36,29 +42,24 @@ def filter_traces_contained(df, dt1, dt2, parameters=None):
         PARAMETER_CONSTANT_TIMESTAMP_KEY] if PARAMETER_CONSTANT_TIMESTAMP_KEY in parameters else DEFAULT_TIMESTAMP_KEY
     case_id_glue = parameters[
         PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_CONCEPT_NAME
-    dt1 = get_dt_from_string(dt1)
-    dt2 = get_dt_from_string(dt2)
-    needs_conversion = check_pandas_ge_024()
-    if needs_conversion:
-        dt1 = dt1.replace(tzinfo=pytz.utc)
-        dt2 = dt2.replace(tzinfo=pytz.utc)
-        dt1 = pd.to_datetime(dt1, utc=True)
-        dt2 = pd.to_datetime(dt2, utc=True)
-    grouped_df = df[[case_id_glue, timestamp_key]].groupby(df[case_id_glue])
-    first = grouped_df.first()
-    last = grouped_df.last()
-    last.columns = [str(col) + '_2' for col in last.columns]
-    stacked = pd.concat([first, last], axis=1)
-    stacked = stacked[stacked[timestamp_key] > dt1]
-    stacked = stacked[stacked[timestamp_key + "_2"] < dt2]
-    i1 = df.set_index(case_id_glue).index
-    i2 = stacked.set_index(case_id_glue).index
-    return df[i1.isin(i2)]
+    mask = parameters[case_mask.PARAMETER_MASK] if case_mask.PARAMETER_MASK in parameters else False
+    use_cache = parameters[
+        case_table.PARAMETER_USE_CACHE] if case_table.PARAMETER_USE_CACHE in parameters else False
+    dt1 = interval_index.get_bound(get_dt_from_string(dt1))
+    dt2 = interval_index.get_bound(get_dt_from_string(dt2))
+    table, index = interval_index.get_cases_index(df, parameters={PARAMETER_CONSTANT_CASEID_KEY: case_id_glue,
+                                                                  PARAMETER_CONSTANT_TIMESTAMP_KEY: timestamp_key,
+                                                                  case_table.PARAMETER_USE_CACHE: use_cache})
+    cases_mask = np.zeros(len(table.table), dtype=np.bool_)
+    cases_mask[index.get_contained(dt1, dt2)] = True
+    return case_mask.get_filtered_df(df, table, cases_mask, mask=mask)
 
 
 def filter_traces_intersecting(df, dt1, dt2, parameters=None):
     """
-    Filter traces intersecting the given interval
+    Filter traces intersecting the given interval: the traces starting or ending inside the interval, and the traces
+    starting before it and ending after it (the bounds are excluded). The time intervals of the traces are indexed
+    (see pm4py.objects.log.util.interval_index), once with use_case_table_cache
 
     Parameters
     ----------
@@ -72,6 +73,9 @@ def filter_traces_intersecting(df, dt1, dt2, parameters=None):
         Possible parameters of the algorithm, including:
             timestamp_key -> Attribute to use as timestamp
             case_id_glue -> Column that contains the timestamp
+            mask -> If True, returns a mask on the cases (see pm4py.algo.filtering.pandas.case_mask)
+            use_case_table_cache -> If True, stores the case table (and the index) with the dataframe and reuses
+            the stored one (see pm4py.objects.log.util.case_table)
 
     Returns
     ----------
@@ -84,34 +88,29 @@ def filter_traces_intersecting(df, dt1, dt2, parameters=None):
         PARAMETER_CONSTANT_TIMESTAMP_KEY] if PARAMETER_CONSTANT_TIMESTAMP_KEY in parameters else DEFAULT_TIMESTAMP_KEY
     case_id_glue = parameters[
         PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_CONCEPT_NAME
-    dt1 = get_dt_from_string(dt1)
-    dt2 = get_dt_from_string(dt2)
-    needs_conversion = check_pandas_ge_024()
-    if needs_conversion:
-        dt1 = dt1.replace(tzinfo=pytz.utc)
-        dt2 = dt2.replace(tzinfo=pytz.utc)
-        dt1 = pd.to_datetime(dt1, utc=True)
-        dt2 = pd.to_datetime(dt2, utc=True)
-    grouped_df = df[[case_id_glue, timestamp_key]].groupby(df[case_id_glue])
-    first = grouped_df.first()
-    last = grouped_df.last()
-    last.columns = [str(col) + '_2' for col in last.columns]
-    stacked = pd.concat([first, last], axis=1)
-    stacked1 = stacked[stacked[timestamp_key] > dt1]
-    stacked1 = stacked1[stacked1[timestamp_key] < dt2]
-    stacked2 = stacked[stacked[timestamp_key + "_2"] > dt1]
-    stacked2 = stacked2[stacked2[timestamp_key + "_2"] < dt2]
-    stacked3 = stacked[stacked[timestamp_key] < dt1]
-    stacked3 = stacked3[stacked3[timestamp_key + "_2"] > dt2]
-    stacked = pd.concat([stacked1, stacked2, stacked3], axis=0)
-    i1 = df.set_index(case_id_glue).index
-    i2 = stacked.set_index(case_id_glue).index
-    return df[i1.isin(i2)]
+    mask = parameters[case_mask.PARAMETER_MASK] if case_mask.PARAMETER_MASK in parameters else False
+    use_cache = parameters[
+        case_table.PARAMETER_USE_CACHE] if case_table.PARAMETER_USE_CACHE in parameters else False
+    dt1 = interval_index.get_bound(get_dt_from_string(dt1))
+    dt2 = interval_index.get_bound(get_dt_from_string(dt2))
+    table, index = interval_index.get_cases_index(df, parameters={PARAMETER_CONSTANT_CASEID_KEY: case_id_glue,
+                                                                  PARAMETER_CONSTANT_TIMESTAMP_KEY: timestamp_key,
+                                                                  case_table.PARAMETER_USE_CACHE: use_cache})
+    # the index gives the cases overlapping the interval, that contain the intersecting ones if the bounds are in
+    # order and each case ends after it starts; otherwise, all the cases are checked
+    candidates = index.get_intersecting(dt1, dt2) if index.ordered and dt1 < dt2 else np.nonzero(index.valid)[0]
+    starts = index.starts[candidates]
+    ends = index.ends[candidates]
+    cases_mask = np.zeros(len(table.table), dtype=np.bool_)
+    cases_mask[candidates[((starts > dt1) & (starts < dt2)) | ((ends > dt1) & (ends < dt2)) | (
+            (starts < dt1) & (ends > dt2))]] = True
+    return case_mask.get_filtered_df(df, table, cases_mask, mask=mask)
 
 
 def apply_events(df, dt1, dt2, parameters=None):
     """
-    Get a new log containing all the events contained in the given interval
+    Get a new log containing all the events contained in the given interval. The events are indexed by timestamp
+    (see pm4py.objects.log.util.interval_index), once with use_events_index_cache
 
     Parameters
     ----------
@@ -124,6 +123,10 @@ def apply_events(df, dt1, dt2, parameters=None):
     parameters
         Possible parameters of the algorithm, including:
             timestamp_key -> Attribute to use as timestamp
+            mask -> If True, returns a mask on the cases (see pm4py.algo.filtering.pandas.case_mask)
+            case_id_glue -> (For the mask) Column that contains the Case ID
+            use_events_index_cache -> If True, stores the index of the event times with the dataframe and reuses
+            the stored one (see pm4py.objects.log.util.interval_index)
 
     Returns
     ----------
@@ -135,19 +138,20 @@ def apply_events(df, dt1, dt2, parameters=None):
 
     timestamp_key = parameters[
         PARAMETER_CONSTANT_TIMESTAMP_KEY] if PARAMETER_CONSTANT_TIMESTAMP_KEY in parameters else DEFAULT_TIMESTAMP_KEY
-    dt1 = get_dt_from_string(dt1)
-    dt2 = get_dt_from_string(dt2)
-    needs_conversion = check_pandas_ge_024()
-    if needs_conversion:
-        dt1 = dt1.replace(tzinfo=pytz.utc)
-        dt2 = dt2.replace(tzinfo=pytz.utc)
-        dt1 = pd.to_datetime(dt1, utc=True)
-        dt2 = pd.to_datetime(dt2, utc=True)
-
-    df = df[df[timestamp_key] > dt1]
-    df = df[df[timestamp_key] < dt2]
-
-    return df
+    use_cache = parameters[
+        interval_index.PARAMETER_USE_CACHE] if interval_index.PARAMETER_USE_CACHE in parameters else False
+    dt1 = interval_index.get_bound(get_dt_from_string(dt1))
+    dt2 = interval_index.get_bound(get_dt_from_string(dt2))
+    index = interval_index.get_events_index(df, parameters={PARAMETER_CONSTANT_TIMESTAMP_KEY: timestamp_key,
+                                                            interval_index.PARAMETER_USE_CACHE: use_cache})
+
+    if parameters[case_mask.PARAMETER_MASK] if case_mask.PARAMETER_MASK in parameters else False:
+        case_id_glue = parameters[
+            PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_CONCEPT_NAME
+        row_mask = np.zeros(len(df), dtype=np.bool_)
+        row_mask[index.get_events(dt1, dt2)] = True
+        return case_mask.get_rows_mask(df, row_mask, case_id_glue)
+    return df.take(index.get_events(dt1, dt2))
 
 
 def apply(df, parameters=None):
@@ -1,7 +1,12 @@
+import numpy as np
+
 from pm4py.algo.filtering.common import filtering_constants
 from pm4py.algo.filtering.common.filtering_constants import CASE_CONCEPT_NAME
+from pm4py.algo.filtering.pandas.case_mask import case_mask
+from pm4py.objects.log.util import case_table
+from pm4py.objects.log.util.xes import DEFAULT_NAME_KEY
 from pm4py.statistics.traces.pandas import case_statistics
-from pm4py.statistics.traces.pandas.case_statistics import get_variants_df
+from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY
 from pm4py.util.constants import PARAMETER_CONSTANT_CASEID_KEY
 
 
@@ -19,6 +24,9 @@ def apply_auto_filter(df, parameters=None):
             activity_key -> Column that contains the activity
             variants_df -> If provided, avoid recalculation of the variants dataframe
             decreasingFactor -> Decreasing factor that should be passed to the algorithm
+            mask -> If True, returns a mask on the cases (see pm4py.algo.filtering.pandas.case_mask)
+            use_case_table_cache -> If True, stores the case table with the dataframe and reuses the stored one
+            (see pm4py.objects.log.util.case_table)
 
     Returns
     -----------
@@ -27,26 +35,25 @@ def apply_auto_filter(df, parameters=None):
     """
     if parameters is None:
         parameters = {}
-    case_id_glue = parameters[
-        PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_CONCEPT_NAME
-    variants_df = case_statistics.get_variants_df(df, parameters=parameters)
-    parameters["variants_df"] = variants_df
-    variants = case_statistics.get_variant_statistics(df, parameters=parameters)
     decreasing_factor = parameters[
         "decreasingFactor"] if "decreasingFactor" in parameters else filtering_constants.DECREASING_FACTOR
+    mask = parameters[case_mask.PARAMETER_MASK] if case_mask.PARAMETER_MASK in parameters else False
 
-    admitted_variants = []
-    if len(variants) > 0:
-        current_variant_count = variants[0][case_id_glue]
-
-        for i in range(len(variants)):
-            if variants[i][case_id_glue] >= decreasing_factor * current_variant_count:
-                admitted_variants.append(variants[i]["variant"])
-            else:
-                break
-            current_variant_count = variants[i][case_id_glue]
+    table = get_case_table(df, parameters)
+    case_variants, variants = get_cases_variants(df, table)
+    counts = np.bincount(case_variants, minlength=len(variants))
+    counts[np.array([x is None for x in variants], dtype=np.bool_)] = 0
+    admitted = np.zeros(len(variants), dtype=np.bool_)
+    current_variant_count = None
+    # the variants are considered by decreasing count (the variants with the same count are all admitted or not)
+    for variant in np.argsort(-counts, kind="mergesort").tolist():
+        if counts[variant] == 0 or (
+                current_variant_count is not None and counts[variant] < decreasing_factor * current_variant_count):
+            break
+        admitted[variant] = True
+        current_variant_count = counts[variant]
 
-    return apply(df, admitted_variants, parameters=parameters)
+    return case_mask.get_filtered_df(df, table, admitted[case_variants], mask=mask)
 
 
 def apply(df, admitted_variants, parameters=None):
@@ -66,6 +73,9 @@ def apply(df, admitted_variants, parameters=None):
             positive -> Specifies if the filter should be applied including traces (positive=True)
             or excluding traces (positive=False)
             variants_df -> If provided, avoid recalculation of the variants dataframe
+            mask -> If True, returns a mask on the cases (see pm4py.algo.filtering.pandas.case_mask)
+            use_case_table_cache -> If True, stores the case table with the dataframe and reuses the stored one
+            (see pm4py.objects.log.util.case_table)
 
     Returns
     -----------
@@ -75,16 +85,60 @@ def apply(df, admitted_variants, parameters=None):
     if parameters is None:
         parameters = {}
 
-    case_id_glue = parameters[
-        PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_CONCEPT_NAME
     positive = parameters["positive"] if "positive" in parameters else True
-    variants_df = parameters["variants_df"] if "variants_df" in parameters else get_variants_df(df,
-                                                                                                parameters=parameters)
-    variants_df = variants_df[variants_df["variant"].isin(admitted_variants)]
-    i1 = df.set_index(case_id_glue).index
-    i2 = variants_df.index
-    if positive:
-        ret = df[i1.isin(i2)]
+    mask = parameters[case_mask.PARAMETER_MASK] if case_mask.PARAMETER_MASK in parameters else False
+    table = get_case_table(df, parameters)
+    if "variants_df" in parameters:
+        variants_df = parameters["variants_df"]
+        cases_mask = table.table.index.isin(variants_df.index[variants_df["variant"].isin(admitted_variants)])
     else:
-        ret = df[~i1.isin(i2)]
-    return ret
+        case_variants, variants = get_cases_variants(df, table)
+        admitted_variants = set(admitted_variants)
+        cases_mask = np.array([x in admitted_variants for x in variants], dtype=np.bool_)[case_variants]
+    return case_mask.get_filtered_df(df, table, cases_mask if positive else ~cases_mask, mask=mask)
+
+
+def get_case_table(df, parameters):
+    """
+    Gets the case table of the dataframe for the case ID and activity columns (and the use of the cache) of the
+    parameters
+    """
+    case_id_glue = parameters[
+        PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_CONCEPT_NAME
+    activity_key = parameters[
+        PARAMETER_CONSTANT_ACTIVITY_KEY] if PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else DEFAULT_NAME_KEY
+    use_cache = parameters[
+        case_table.PARAMETER_USE_CACHE] if case_table.PARAMETER_USE_CACHE in parameters else False
+    return case_table.get_case_table(df, parameters={PARAMETER_CONSTANT_CASEID_KEY: case_id_glue,
+                                                      PARAMETER_CONSTANT_ACTIVITY_KEY: activity_key,
+                                                      case_table.PARAMETER_USE_CACHE: use_cache})
+
+
+def get_cases_variants(df, table):
+    """
+    Gets the variant of each case of the case table, encoding the activity codes of the rows (see
+    case_statistics.encode_variants): only the distinct variants are decoded into strings
+
+    Parameters
+    -----------
+    df
+        Dataframe
+    table
+        Case table of the dataframe
+
+    Returns
+    -----------
+    case_variants
+        Numpy array containing, for each case, the number of its variant
+    variants
+        Numpy array of the variants (activities separated by comma; None for the cases without activities)
+    """
+    activity_codes, activities = table.get_activity_codes(df)
+    present = (table.row_cases >= 0) & (activity_codes >= 0)
+    case_variants, variants_sequences = case_statistics.encode_variants(
+        table.row_cases[present], activity_codes[present], len(table.table), len(activities))
+    variants = np.empty(len(variants_sequences), dtype=object)
+    variants[:] = case_statistics.decode_variants(variants_sequences, activities)
+    # the cases without activities have no variant
+    variants[[len(x) == 0 for x in variants_sequences]] = None
+    return case_variants, variants
@@ -1 +1,2 @@
-from pm4py.objects.conversion.log.versions import to_dataframe, to_event_stream, to_event_log, df_to_event_log_1v
+from pm4py.objects.conversion.log.versions import to_dataframe, to_event_stream, to_event_log, df_to_event_log_1v, \
+    to_columnar_log
@@ -0,0 +1,43 @@
+import pandas
+
+import pm4py
+from pm4py import util as pmutil
+from pm4py.objects.conversion.log.versions import to_event_log
+from pm4py.objects.log import columnar
+from pm4py.objects.log.util import general as log_util
+
+
+def apply(log, parameters=None):
+    """
+    Converts a log (or a stream, that is converted to an event log first, or a dataframe, that is converted
+    column by column) into a columnar event log
+
+    Parameters
+    -----------
+    log
+        Log/stream/dataframe
+    parameters
+        Parameters of the algorithm (passed to the conversion to event log)
+
+    Returns
+    -----------
+    columnar_log
+        Columnar event log
+    """
+    if isinstance(log, columnar.ColumnarEventLog):
+        return log
+    if isinstance(log, pandas.core.frame.DataFrame):
+        parameters = parameters if parameters is not None else dict()
+        if pmutil.constants.PARAMETER_CONSTANT_CASEID_KEY in parameters:
+            glue = parameters[pmutil.constants.PARAMETER_CONSTANT_CASEID_KEY]
+        else:
+            glue = log_util.CASE_ATTRIBUTE_GLUE
+        if log_util.PARAMETER_KEY_CASE_ATTRIBUTE_PRFIX in parameters:
+            case_pref = parameters[log_util.PARAMETER_KEY_CASE_ATTRIBUTE_PRFIX]
+        else:
+            case_pref = log_util.CASE_ATTRIBUTE_PREFIX
+        if glue in log.columns and not log[glue].isnull().any():
+            return columnar.from_dataframe(log, glue, case_pref)
+    if isinstance(log, pandas.core.frame.DataFrame) or not isinstance(log, pm4py.objects.log.log.EventLog):
+        log = to_event_log.apply(log, parameters=parameters)
+    return columnar.from_event_log(log)
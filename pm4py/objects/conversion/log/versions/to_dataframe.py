@@ -1,8 +1,18 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
 import pandas as pd
 
+from pm4py.objects.log import columnar
 from pm4py.objects.log import log as log_instance
-#from pm4py.objects.conversion.log import factory as log_conv_fact
-from pm4py.objects.conversion.log.versions import to_event_stream
+from pm4py.objects.log.util import general as log_util
+
+CATEGORICAL_COLUMNS = "categorical_columns"
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
 
 def apply(log, parameters=None):
     """
@@ -13,7 +23,9 @@ def apply(log, parameters=None):
     log: :class:`pm4py.log.log.EventLog`
         Event log. Also, can take a log and convert it to event stream
     parameters
-        Parameters of the algorithm
+        Parameters of the algorithm, including:
+            categorical_columns -> Columns that shall be stored as categoricals (e.g. the activity and the resource)
+            case: -> Prefix of the case attributes (default: case:)
 
     Returns
     -----------
@@ -23,7 +35,12 @@ def apply(log, parameters=None):
     if parameters is None:
         parameters = {}
 
-    return get_dataframe_from_event_stream(log)
+    categorical_columns = parameters[CATEGORICAL_COLUMNS] if CATEGORICAL_COLUMNS in parameters else None
+    case_pref = parameters[
+        log_util.PARAMETER_KEY_CASE_ATTRIBUTE_PRFIX] if log_util.PARAMETER_KEY_CASE_ATTRIBUTE_PRFIX in parameters \
+        else log_util.CASE_ATTRIBUTE_PREFIX
+
+    return get_dataframe_from_log(log, case_attribute_prefix=case_pref, categorical_columns=categorical_columns)
 
 
 def get_dataframe_from_event_stream(log):
@@ -40,9 +57,167 @@ def get_dataframe_from_event_stream(log):
     df
         Pandas dataframe
     """
-    if type(log) is log_instance.EventLog:
-        log = to_event_stream.transform_event_log_to_event_stream(log)
-    transf_log = [dict(x) for x in log]
-    df = pd.DataFrame.from_dict(transf_log)
+    return get_dataframe_from_log(log)
+
+
+def get_series(values, index=None):
+    """
+    Gets a series, with the dtype inferred as in the construction of a dataframe from dictionaries,
+    from the (dense, with NaN for the missing values) list of the values of an attribute
+
+    Parameters
+    -----------
+    values
+        List of values
+    index
+        (If specified) positions of the values to take (e.g. to repeat a case attribute along the events)
+
+    Returns
+    -----------
+    series
+        Pandas series (with a range index)
+    """
+    series = get_datetime_series(values)
+    if series is None:
+        series = pd.Series(values)
+    if index is not None:
+        series = series.take(index).reset_index(drop=True)
+    return series
+
+
+def get_datetime_series(values):
+    """
+    Gets a datetime64 series from a list of datetimes sharing the same UTC offset (or all naive), computing
+    the nanoseconds since the epoch directly instead of letting Pandas infer and parse each value
+
+    Parameters
+    -----------
+    values
+        List of values
+
+    Returns
+    -----------
+    series
+        Pandas series (None if the values are not all datetimes with the same UTC offset)
+    """
+    if not values or type(values[0]) is not datetime or set(map(type, values)) != {datetime}:
+        return None
+    if len(set(map(datetime.utcoffset, values))) > 1:
+        return None
+    tz = values[0].tzinfo
+    epoch = EPOCH if tz is None else EPOCH_UTC
+    try:
+        ns = np.array([(value - epoch) // ONE_MICROSECOND for value in values], dtype=np.int64) * 1000
+        series = pd.Series(pd.to_datetime(ns, utc=tz is not None))
+    except (OverflowError, pd.errors.OutOfBoundsDatetime):
+        return None
+    if tz is not None:
+        series = series.dt.tz_convert(tz)
+    return series
+
+
+def get_dataframe_from_columnar_log(log, case_attribute_prefix=log_util.CASE_ATTRIBUTE_PREFIX):
+    """
+    Return a Pandas dataframe from a columnar event log, decoding column by column
+
+    Parameters
+    -----------
+    log
+        Columnar event log
+    case_attribute_prefix
+        Prefix of the case attributes
+
+    Returns
+    -----------
+    columns
+        Dictionary associating to each column the corresponding series
+    """
+    trace_index = np.repeat(np.arange(len(log)), log.get_trace_lengths())
+    columns = {}
+    for tables, index, prefix in [(log.events_table, None, ""), (log.traces_table, trace_index,
+                                                                 case_attribute_prefix)]:
+        for key, column in tables.columns.items():
+            mask = np.asarray(column.present(), dtype=np.bool_)
+            if isinstance(column, columnar.DatetimeColumn) and not isinstance(column,
+                                                                              columnar.OffsetDatetimeColumn):
+                values = pd.to_datetime(pd.Series(column.values), utc=column.tz is not None)
+                if column.tz is not None:
+                    values = values.dt.tz_convert(column.tz)
+                values = values.where(mask)
+            elif type(column) is columnar.ArrayColumn and column.values.dtype != object and mask.all():
+                values = pd.Series(column.values)
+            else:
+                values = column.decode()
+                values[~mask] = np.nan
+                values = pd.Series(list(values))
+            if index is not None:
+                values = values.take(index).reset_index(drop=True)
+            columns[prefix + key] = values
+    return columns
+
+
+def get_dataframe_from_log(log, case_attribute_prefix=log_util.CASE_ATTRIBUTE_PREFIX, categorical_columns=None):
+    """
+    Return a Pandas dataframe from a given log (or event stream), building each column directly with the
+    appropriate dtype (the case attributes are repeated along the events of the case with the given prefix),
+    without creating intermediate per-event dictionaries
+
+    Parameters
+    -----------
+    log
+        Event log, columnar event log or event stream
+    case_attribute_prefix
+        Prefix of the case attributes
+    categorical_columns
+        (If specified) columns that shall be stored as categoricals
+
+    Returns
+    -----------
+    df
+        Pandas dataframe
+    """
+    if isinstance(log, columnar.ColumnarEventLog):
+        columns = get_dataframe_from_columnar_log(log, case_attribute_prefix=case_attribute_prefix)
+    else:
+        traces = log if isinstance(log, log_instance.EventLog) else [log]
+        n_rows = sum(len(trace) for trace in traces)
+
+        # dense lists of values, created when the attribute is first met
+        event_values = {}
+        row = 0
+        for trace in traces:
+            for event in trace:
+                for key, value in event.items():
+                    if key not in event_values:
+                        event_values[key] = [np.nan] * n_rows
+                    event_values[key][row] = value
+                row += 1
+        columns = {key: get_series(values) for key, values in event_values.items()}
+
+        if isinstance(log, log_instance.EventLog):
+            trace_values = {}
+            for trace_no, trace in enumerate(log):
+                for key, value in trace.attributes.items():
+                    if key not in trace_values:
+                        trace_values[key] = [np.nan] * len(log)
+                    trace_values[key][trace_no] = value
+            trace_index = np.repeat(np.arange(len(log)), [len(trace) for trace in log])
+            for key, values in trace_values.items():
+                columns[case_attribute_prefix + key] = get_series(values, index=trace_index)
+
+    if isinstance(log, log_instance.EventLog) and len(log) > 0:
+        # fix 14/02/2019: since the XES standard does not force to specify a case ID, when event log->event
+        # stream conversion is done, the possibility to get back the original event log is lost
+        glue = columns[log_util.CASE_ATTRIBUTE_GLUE] if log_util.CASE_ATTRIBUTE_GLUE in columns else None
+        if glue is None or glue.isnull().any():
+            trace_lengths = [len(trace) for trace in log]
+            hashes = get_series([str(hash(trace)) for trace in log],
+                                index=np.repeat(np.arange(len(log)), trace_lengths))
+            columns[log_util.CASE_ATTRIBUTE_GLUE] = hashes if glue is None else glue.where(~glue.isnull(), hashes)
 
+    df = pd.DataFrame(columns)
+    if categorical_columns:
+        for key in categorical_columns:
+            if key in df.columns:
+                df[key] = df[key].astype("category")
     return df
@@ -1,5 +1,6 @@
 from copy import deepcopy
 
+import numpy as np
 import pandas
 
 import pm4py
@@ -15,6 +16,18 @@ DEEPCOPY = constants.DEEPCOPY
 
 def apply(log, parameters=None):
     if isinstance(log, pandas.core.frame.DataFrame):
+        parameters = parameters if parameters is not None else dict()
+        if pmutil.constants.PARAMETER_CONSTANT_CASEID_KEY in parameters:
+            glue = parameters[pmutil.constants.PARAMETER_CONSTANT_CASEID_KEY]
+        else:
+            glue = log_util.CASE_ATTRIBUTE_GLUE
+        if log_util.PARAMETER_KEY_CASE_ATTRIBUTE_PRFIX in parameters:
+            case_pref = parameters[log_util.PARAMETER_KEY_CASE_ATTRIBUTE_PRFIX]
+        else:
+            case_pref = log_util.CASE_ATTRIBUTE_PREFIX
+        if glue in log.columns and not log[glue].isnull().any():
+            return transform_dataframe_to_event_log(log, case_glue=glue, include_case_attributes=True,
+                                                    case_attribute_prefix=case_pref)
         log = to_event_stream.apply(log)
     if isinstance(log, pm4py.objects.log.log.EventStream) and (not isinstance(log, pm4py.objects.log.log.EventLog)):
         parameters = parameters if parameters is not None else dict()
@@ -80,3 +93,60 @@ def transform_event_stream_to_event_log(log, case_glue=log_util.CASE_ATTRIBUTE_G
         traces[glue].append(event)
     return log_instance.EventLog(traces.values(), attributes=log.attributes, classifiers=log.classifiers,
                                  omni_present=log.omni_present, extensions=log.extensions)
+
+
+def transform_dataframe_to_event_log(df, case_glue=log_util.CASE_ATTRIBUTE_GLUE, include_case_attributes=True,
+                                     case_attribute_prefix=log_util.CASE_ATTRIBUTE_PREFIX):
+    """
+    Converts a dataframe to an event log, obtaining the same log as the conversion passing through the event stream
+    but working column by column: the dataframe is grouped once by the case ID, the case attributes are taken
+    from the first row of each case, and the traces are built in bulk
+
+    Parameters
+    ----------
+    df
+        Dataframe
+    case_glue:
+        Case identifier. Default is 'case:concept:name'
+    include_case_attributes:
+        Default is True
+    case_attribute_prefix:
+        Default is 'case:'
+
+    Returns
+        -------
+    log : :class:`pm4py.log.log.EventLog`
+        An event log
+    """
+    # codes of the cases (that shall be all defined), numbered in order of first appearance
+    codes, cases = pandas.factorize(df[case_glue])
+    # positions of the rows grouped by case, keeping the order of the events inside the case
+    order = np.argsort(codes, kind="mergesort")
+    ends = np.cumsum(np.bincount(codes, minlength=len(cases)))
+    starts = ends - np.bincount(codes, minlength=len(cases))
+
+    if include_case_attributes:
+        case_columns = [x for x in df.columns if x.startswith(case_attribute_prefix)]
+    else:
+        case_columns = []
+    event_columns = [x for x in df.columns if x not in case_columns]
+
+    # tolist() gives the same (native Python or pandas) values as the records of to_dict
+    event_values = [df[x].take(order).tolist() for x in event_columns]
+    events = [log_instance.Event(zip(event_columns, row)) for row in zip(*event_values)]
+
+    first_rows = order[starts]
+    case_keys = [x.replace(case_attribute_prefix, '') for x in case_columns]
+    case_values = [df[x].iloc[first_rows].tolist() for x in case_columns]
+    traces_attributes = [dict(zip(case_keys, row)) for row in zip(*case_values)] if case_columns else [
+        {} for _ in range(len(cases))]
+
+    case_ids = df[case_glue].take(first_rows).tolist()
+    traces = []
+    for index in range(len(cases)):
+        trace_attr = traces_attributes[index]
+        if xes.DEFAULT_TRACEID_KEY not in trace_attr:
+            trace_attr[xes.DEFAULT_TRACEID_KEY] = case_ids[index]
+        traces.append(log_instance.Trace(events[starts[index]:ends[index]], attributes=trace_attr))
+
+    return log_instance.EventLog(traces, attributes={'origin': 'csv'})
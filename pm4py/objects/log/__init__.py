@@ -1 +1 @@
-from pm4py.objects.log import adapters, exporter, importer, util, log
+from pm4py.objects.log import adapters, exporter, importer, util, log, columnar, view
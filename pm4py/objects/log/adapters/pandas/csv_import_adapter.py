@@ -1,43 +1,193 @@
 import os
 import tempfile
+from datetime import datetime
 
 import pandas as pd
 
+from pm4py.objects.log.util import compression
 from pm4py.util.versions import check_pandas_ge_024
 
+# default number of rows of each chunk when the CSV is read in chunks
+DEFAULT_CHUNKSIZE = 100000
 
-def import_dataframe_from_path_wo_timeconversion(path, sep=',', quotechar=None, nrows=None):
+
+def get_read_csv_arguments(sep=',', quotechar=None, nrows=None, usecols=None, dtype=None, categorical_columns=None):
+    """
+    Gets the keyword arguments to pass to pd.read_csv
+
+    Parameters
+    ----------
+    sep:
+        column separator
+    quotechar
+        (if specified) Character that starts/end big strings in CSV
+    nrows
+        (if specified) Maximum number of rows to read from the CSV
+    usecols
+        (if specified) Columns to read from the CSV
+    dtype
+        (if specified) Dictionary associating to some columns the type that shall be used to read them
+    categorical_columns
+        (if specified) Columns (e.g. case ID, activity, resource) that are read as categorical (interned codes)
+
+    Returns
+    -------
+    kwargs
+        Keyword arguments of pd.read_csv
+    """
+    kwargs = {"sep": sep}
+    if quotechar:
+        kwargs["quotechar"] = quotechar
+    if nrows:
+        kwargs["nrows"] = nrows
+    if usecols is not None:
+        kwargs["usecols"] = usecols
+    if dtype is not None or categorical_columns is not None:
+        kwargs["dtype"] = dict(dtype) if dtype is not None else {}
+        if categorical_columns is not None:
+            for col in categorical_columns:
+                if usecols is None or col in usecols:
+                    kwargs["dtype"][col] = "category"
+    return kwargs
+
+
+def import_dataframe_from_path_wo_timeconversion(path, sep=',', quotechar=None, nrows=None, usecols=None, dtype=None,
+                                                 categorical_columns=None):
     """
     Imports a dataframe from the given path (without doing the timestamp columns conversion)
 
     Parameters
     ----------
     path:
-        Input CSV file path
+        Input CSV file path (gzip, bz2 and xz compressed files are read directly as a stream)
     sep:
         column separator
     quotechar
         (if specified) Character that starts/end big strings in CSV
     nrows
         (if specified) Maximum number of rows to read from the CSV
+    usecols
+        (if specified) Columns to read from the CSV
+    dtype
+        (if specified) Dictionary associating to some columns the type that shall be used to read them
+    categorical_columns
+        (if specified) Columns (e.g. case ID, activity, resource) that are read as categorical (interned codes)
 
      Returns
     -------
     pd
         Pandas dataframe
     """
-    if quotechar:
-        if nrows:
-            df = pd.read_csv(path, sep=sep, quotechar=quotechar, nrows=nrows)
-        else:
-            df = pd.read_csv(path, sep=sep, quotechar=quotechar)
-    else:
-        if nrows:
-            df = pd.read_csv(path, sep=sep, nrows=nrows)
-        else:
-            df = pd.read_csv(path, sep=sep)
+    if compression.is_compressed(path):
+        with compression.open_file(path) as f:
+            return import_dataframe_from_path_wo_timeconversion(f, sep=sep, quotechar=quotechar, nrows=nrows,
+                                                                usecols=usecols, dtype=dtype,
+                                                                categorical_columns=categorical_columns)
 
-    return df
+    return pd.read_csv(path, **get_read_csv_arguments(sep=sep, quotechar=quotechar, nrows=nrows, usecols=usecols,
+                                                      dtype=dtype, categorical_columns=categorical_columns))
+
+
+def import_dataframe_chunks_from_path(path, sep=',', quotechar=None, nrows=None, chunksize=DEFAULT_CHUNKSIZE,
+                                      usecols=None, dtype=None, categorical_columns=None, timest_format=None,
+                                      timest_columns=None):
+    """
+    Reads a CSV file as a generator of dataframes (chunks of at most chunksize rows), so the memory usage is bounded
+    by the size of a chunk. The chunks can be consumed one at a time (e.g. by the DFG or variants aggregators)
+    or concatenated through concat_chunks
+
+    Parameters
+    ----------
+    path:
+        Input CSV file path (gzip, bz2 and xz compressed files are read directly as a stream)
+    sep:
+        column separator
+    quotechar
+        (if specified) Character that starts/end big strings in CSV
+    nrows
+        (if specified) Maximum number of rows to read from the CSV
+    chunksize
+        Number of rows of each chunk
+    usecols
+        (if specified) Columns to read from the CSV
+    dtype
+        (if specified) Dictionary associating to some columns the type that shall be used to read them
+    categorical_columns
+        (if specified) Columns (e.g. case ID, activity, resource) that are read as categorical (interned codes)
+    timest_format
+        (If provided) Format of the timestamp columns in the CSV file
+    timest_columns
+        Columns of the CSV that shall be converted into timestamp. If not provided, they are detected
+        on the first chunk, and only those columns are converted in the following chunks
+
+    Returns
+    -------
+    chunks
+        Generator of Pandas dataframes
+    """
+    kwargs = get_read_csv_arguments(sep=sep, quotechar=quotechar, nrows=nrows, usecols=usecols, dtype=dtype,
+                                    categorical_columns=categorical_columns)
+    f = compression.open_file(path) if compression.is_compressed(path) else path
+    try:
+        for chunk in pd.read_csv(f, chunksize=chunksize, **kwargs):
+            chunk = convert_timestamp_columns_in_df(chunk, timest_format=timest_format, timest_columns=timest_columns)
+            if timest_columns is None:
+                timest_columns = [col for col in chunk.columns if is_timestamp_column(chunk[col])]
+            yield chunk
+    finally:
+        if f is not path:
+            f.close()
+
+
+def is_timestamp_column(series):
+    """
+    Checks if a (converted) column of a dataframe contains timestamps
+
+    Parameters
+    ----------
+    series
+        Column of the dataframe
+
+    Returns
+    -------
+    boolean
+        Boolean value
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return True
+    if series.dtype == 'object':
+        first_valid_index = series.first_valid_index()
+        return first_valid_index is not None and isinstance(series[first_valid_index], datetime)
+    return False
+
+
+def concat_chunks(chunks):
+    """
+    Concatenates the chunks of a dataframe, keeping the categorical columns as categorical
+    (the categories of the different chunks are merged)
+
+    Parameters
+    ----------
+    chunks
+        Iterable of dataframes
+
+    Returns
+    -------
+    df
+        Pandas dataframe
+    """
+    chunks = list(chunks)
+    if not chunks:
+        return pd.DataFrame()
+    if len(chunks) == 1:
+        return chunks[0]
+    categorical_columns = [col for col in chunks[0].columns if isinstance(chunks[0][col].dtype, pd.CategoricalDtype)]
+    categories = {}
+    for col in categorical_columns:
+        categories[col] = pd.api.types.union_categoricals([chunk[col] for chunk in chunks]).categories
+        for chunk in chunks:
+            chunk[col] = chunk[col].cat.set_categories(categories[col])
+    return pd.concat(chunks, ignore_index=True)
 
 
 def import_dataframe_from_csv_string(csv_string, sep=',', quotechar=None, nrows=None, sort=False,
@@ -140,14 +290,15 @@ def convert_timestamp_columns_in_df(df, timest_format=None, timest_columns=None)
 
 
 def import_dataframe_from_path(path, sep=',', quotechar=None, nrows=None, sort=False, sort_field="time:timestamp",
-                               timest_format=None, timest_columns=None):
+                               timest_format=None, timest_columns=None, usecols=None, dtype=None,
+                               categorical_columns=None, chunksize=None):
     """
     Imports a dataframe from the given path
 
     Parameters
     ----------
     path:
-        Input CSV file path
+        Input CSV file path (gzip, bz2 and xz compressed files are read directly as a stream)
     sep:
         column separator
     quotechar
@@ -162,14 +313,31 @@ def import_dataframe_from_path(path, sep=',', quotechar=None, nrows=None, sort=F
         (If provided) Format of the timestamp columns in the CSV file
     timest_columns
         Columns of the CSV that shall be converted into timestamp
+    usecols
+        (if specified) Columns to read from the CSV
+    dtype
+        (if specified) Dictionary associating to some columns the type that shall be used to read them
+    categorical_columns
+        (if specified) Columns (e.g. case ID, activity, resource) that are read as categorical (interned codes)
+    chunksize
+        (if specified) The CSV is read and converted in chunks of the given number of rows
 
      Returns
     -------
     pd
         Pandas dataframe
     """
-    df = import_dataframe_from_path_wo_timeconversion(path, sep=sep, quotechar=quotechar, nrows=nrows)
-    df = convert_timestamp_columns_in_df(df, timest_format=timest_format, timest_columns=timest_columns)
+    if chunksize:
+        df = concat_chunks(import_dataframe_chunks_from_path(path, sep=sep, quotechar=quotechar, nrows=nrows,
+                                                             chunksize=chunksize, usecols=usecols, dtype=dtype,
+                                                             categorical_columns=categorical_columns,
+                                                             timest_format=timest_format,
+                                                             timest_columns=timest_columns))
+    else:
+        df = import_dataframe_from_path_wo_timeconversion(path, sep=sep, quotechar=quotechar, nrows=nrows,
+                                                          usecols=usecols, dtype=dtype,
+                                                          categorical_columns=categorical_columns)
+        df = convert_timestamp_columns_in_df(df, timest_format=timest_format, timest_columns=timest_columns)
     if sort and sort_field:
         df = df.sort_values(sort_field)
     return df
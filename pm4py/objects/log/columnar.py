@@ -0,0 +1,741 @@
+from collections.abc import Mapping
+from copy import deepcopy
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from pm4py.objects.log.log import Event, Trace, EventLog
+from pm4py.objects.log.util import xes
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_INT64_MIN = np.iinfo(np.int64).min
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+class CategoricalColumn(object):
+    """
+    Column of (interned) string values, stored as int32 codes pointing into a list of labels.
+    A code equal to -1 means that the attribute is not present in the row
+    """
+
+    def __init__(self, codes, labels):
+        self.codes = codes
+        self.labels = labels
+        self._label_index = None
+
+    def has(self, row):
+        return self.codes[row] >= 0
+
+    def get(self, row):
+        code = self.codes[row]
+        if code < 0:
+            raise KeyError
+        return self.labels[code]
+
+    def set(self, row, value):
+        if type(value) is not str:
+            return False
+        if self._label_index is None:
+            self._label_index = {label: code for code, label in enumerate(self.labels)}
+        if value not in self._label_index:
+            self._label_index[value] = len(self.labels)
+            self.labels.append(value)
+        self.codes[row] = self._label_index[value]
+        return True
+
+    def unset(self, row):
+        self.codes[row] = -1
+
+    def present(self):
+        return self.codes >= 0
+
+    def decode(self):
+        values = np.empty(len(self.labels) + 1, dtype=object)
+        values[:-1] = self.labels
+        values[-1] = None
+        return values[self.codes]
+
+    def take(self, rows):
+        return CategoricalColumn(self.codes[rows], list(self.labels))
+
+    def nbytes(self):
+        return self.codes.nbytes
+
+    def __len__(self):
+        return len(self.codes)
+
+
+class ArrayColumn(object):
+    """
+    Column of values stored in a typed Numpy array (int64, float64, bool or object),
+    along with a boolean mask that tells if the attribute is present in the row
+    """
+
+    def __init__(self, values, mask):
+        self.values = values
+        self.mask = mask
+
+    def has(self, row):
+        return self.mask[row]
+
+    def get(self, row):
+        if not self.mask[row]:
+            raise KeyError
+        return self.values[row].item() if self.values.dtype != object else self.values[row]
+
+    def accepts(self, value):
+        if self.values.dtype == object:
+            return True
+        if self.values.dtype == np.bool_:
+            return type(value) is bool
+        if self.values.dtype == np.int64:
+            return type(value) is int and _INT64_MIN <= value <= _INT64_MAX
+        return type(value) is float
+
+    def set(self, row, value):
+        if not self.accepts(value):
+            return False
+        self.values[row] = value
+        self.mask[row] = True
+        return True
+
+    def unset(self, row):
+        self.mask[row] = False
+
+    def present(self):
+        return self.mask
+
+    def decode(self):
+        values = self.values.astype(object)
+        values[~self.mask] = None
+        return values
+
+    def take(self, rows):
+        return ArrayColumn(self.values[rows], self.mask[rows])
+
+    def nbytes(self):
+        return self.values.nbytes + self.mask.nbytes
+
+    def __len__(self):
+        return len(self.values)
+
+
+class DatetimeColumn(ArrayColumn):
+    """
+    Column of datetimes, stored as int64 nanoseconds since the epoch (UTC) along with the common timezone
+    (or None for naive datetimes) and the Python class that shall be used to box the values
+    """
+
+    def __init__(self, values, mask, tz, box_class):
+        ArrayColumn.__init__(self, values, mask)
+        self.tz = tz
+        self.box_class = box_class
+
+    def get(self, row):
+        if not self.mask[row]:
+            raise KeyError
+        return self._box(int(self.values[row]))
+
+    def _box(self, ns):
+        if self.box_class is pd.Timestamp:
+            return pd.Timestamp(ns, tz=self.tz)
+        if self.tz is None:
+            return _EPOCH + timedelta(microseconds=ns // 1000)
+        return (_EPOCH_UTC + timedelta(microseconds=ns // 1000)).astimezone(self.tz)
+
+    def accepts(self, value):
+        return type(value) is self.box_class and _same_offset(value, self.tz)
+
+    def set(self, row, value):
+        if not self.accepts(value):
+            return False
+        self.values[row] = _to_ns(value)
+        self.mask[row] = True
+        return True
+
+    def decode(self):
+        values = np.empty(len(self.values), dtype=object)
+        for row in np.nonzero(self.mask)[0]:
+            values[row] = self._box(int(self.values[row]))
+        return values
+
+    def take(self, rows):
+        return DatetimeColumn(self.values[rows], self.mask[rows], self.tz, self.box_class)
+
+
+class OffsetDatetimeColumn(DatetimeColumn):
+    """
+    Column of timezone-aware datetimes with different UTC offsets (e.g. because of the daylight saving time),
+    stored as int64 nanoseconds since the epoch (UTC) along with the int32 UTC offset (in seconds) of each value
+    """
+
+    def __init__(self, values, offsets, mask, box_class):
+        DatetimeColumn.__init__(self, values, mask, None, box_class)
+        self.offsets = offsets
+        self._timezones = {}
+
+    def get(self, row):
+        if not self.mask[row]:
+            raise KeyError
+        return self._box_with_offset(int(self.values[row]), int(self.offsets[row]))
+
+    def _box_with_offset(self, ns, offset):
+        if offset not in self._timezones:
+            self._timezones[offset] = timezone(timedelta(seconds=offset))
+        tz = self._timezones[offset]
+        if self.box_class is pd.Timestamp:
+            return pd.Timestamp(ns, tz=tz)
+        return (_EPOCH_UTC + timedelta(microseconds=ns // 1000)).astimezone(tz)
+
+    def accepts(self, value):
+        return type(value) is self.box_class and value.tzinfo is not None and value.utcoffset() is not None
+
+    def set(self, row, value):
+        if not self.accepts(value):
+            return False
+        self.values[row] = _to_ns(value)
+        self.offsets[row] = _get_offset(value)
+        self.mask[row] = True
+        return True
+
+    def decode(self):
+        values = np.empty(len(self.values), dtype=object)
+        for row in np.nonzero(self.mask)[0]:
+            values[row] = self._box_with_offset(int(self.values[row]), int(self.offsets[row]))
+        return values
+
+    def take(self, rows):
+        return OffsetDatetimeColumn(self.values[rows], self.offsets[rows], self.mask[rows], self.box_class)
+
+    def nbytes(self):
+        return self.values.nbytes + self.offsets.nbytes + self.mask.nbytes
+
+
+def _same_offset(value, tz):
+    if tz is None:
+        return value.tzinfo is None
+    return value.tzinfo is not None and value.utcoffset() == tz.utcoffset(None)
+
+
+def _get_offset(value):
+    return value.utcoffset() // timedelta(seconds=1)
+
+
+def _to_ns(value):
+    if type(value) is pd.Timestamp:
+        return value.value
+    if value.tzinfo is None:
+        return ((value - _EPOCH) // _ONE_MICROSECOND) * 1000
+    return ((value - _EPOCH_UTC) // _ONE_MICROSECOND) * 1000
+
+
+def _build_column(n_rows, rows, values):
+    """
+    Build a typed column from the (sparse) list of values assumed by an attribute
+
+    Parameters
+    -------------
+    n_rows
+        Number of rows of the table
+    rows
+        Rows in which the attribute is present
+    values
+        Values of the attribute in the given rows
+
+    Returns
+    -------------
+    column
+        Column object
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    types = set(type(v) for v in values)
+    if len(types) == 1:
+        value_type = next(iter(types))
+        if value_type is str:
+            label_index = {}
+            codes = np.full(n_rows, -1, dtype=np.int32)
+            codes[rows] = [label_index.setdefault(v, len(label_index)) for v in values]
+            return CategoricalColumn(codes, list(label_index))
+        if value_type is bool or value_type is float or value_type is int:
+            dtype = {bool: np.bool_, float: np.float64, int: np.int64}[value_type]
+            try:
+                array = np.zeros(n_rows, dtype=dtype)
+                array[rows] = values
+                mask = np.zeros(n_rows, dtype=np.bool_)
+                mask[rows] = True
+                return ArrayColumn(array, mask)
+            except OverflowError:
+                pass
+        if value_type is datetime or value_type is pd.Timestamp:
+            tz = values[0].tzinfo
+            same_offset = all(_same_offset(v, tz) for v in values)
+            if same_offset or all(v.tzinfo is not None and v.utcoffset() is not None for v in values):
+                try:
+                    array = np.zeros(n_rows, dtype=np.int64)
+                    array[rows] = [_to_ns(v) for v in values]
+                    mask = np.zeros(n_rows, dtype=np.bool_)
+                    mask[rows] = True
+                    if same_offset:
+                        return DatetimeColumn(array, mask, tz, value_type)
+                    offsets = np.zeros(n_rows, dtype=np.int32)
+                    offsets[rows] = [_get_offset(v) for v in values]
+                    return OffsetDatetimeColumn(array, offsets, mask, value_type)
+                except OverflowError:
+                    pass
+    array = np.empty(n_rows, dtype=object)
+    for row, value in zip(rows, values):
+        array[row] = value
+    mask = np.zeros(n_rows, dtype=np.bool_)
+    mask[rows] = True
+    return ArrayColumn(array, mask)
+
+
+def _build_object_column(column):
+    """
+    Converts a column into a generic object column (used when a value of a different type is set)
+    """
+    values = column.decode()
+    mask = np.array(column.present(), dtype=np.bool_)
+    return ArrayColumn(values, mask)
+
+
+class AttributeTable(object):
+    """
+    Table storing, for a fixed number of rows, the attributes as per-attribute typed columns
+    """
+
+    def __init__(self, n_rows, columns=None):
+        self.n_rows = n_rows
+        self.columns = columns if columns is not None else {}
+
+    @classmethod
+    def from_dicts(cls, dicts):
+        """
+        Builds the table from an iterable of dictionaries (one per row)
+        """
+        sparse = {}
+        n_rows = 0
+        for row, dictio in enumerate(dicts):
+            for key, value in dictio.items():
+                if key not in sparse:
+                    sparse[key] = ([], [])
+                sparse[key][0].append(row)
+                sparse[key][1].append(value)
+            n_rows = row + 1
+        return cls(n_rows, {key: _build_column(n_rows, rows_values[0], rows_values[1]) for key, rows_values in
+                            sparse.items()})
+
+    def get(self, row, key):
+        return self.columns[key].get(row)
+
+    def set(self, row, key, value):
+        if key not in self.columns:
+            self.columns[key] = _build_column(self.n_rows, [row], [value])
+        elif not self.columns[key].set(row, value):
+            self.columns[key] = _build_object_column(self.columns[key])
+            self.columns[key].set(row, value)
+
+    def unset(self, row, key):
+        if key not in self.columns or not self.columns[key].has(row):
+            raise KeyError(key)
+        self.columns[key].unset(row)
+
+    def keys(self, row):
+        return [key for key, column in self.columns.items() if column.has(row)]
+
+    def take(self, rows):
+        return AttributeTable(len(rows), {key: column.take(rows) for key, column in self.columns.items()})
+
+    def nbytes(self):
+        return sum(column.nbytes() for column in self.columns.values())
+
+
+class ColumnarEvent(Event):
+    """
+    Lightweight view over a row of an attribute table, exposing the Event (Mapping) interface
+    """
+
+    def __init__(self, table, row):
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, key):
+        column = self._table.columns.get(key)
+        if column is None:
+            raise KeyError(key)
+        try:
+            return column.get(self._row)
+        except KeyError:
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        self._table.set(self._row, key, value)
+
+    def __delitem__(self, key):
+        self._table.unset(self._row, key)
+
+    def __contains__(self, key):
+        column = self._table.columns.get(key)
+        return column is not None and bool(column.has(self._row))
+
+    def __iter__(self):
+        return iter(self._table.keys(self._row))
+
+    def __len__(self):
+        return len(self._table.keys(self._row))
+
+    # the views of the Mapping interface, instead of the ones of the dictionary of the plain events
+    keys = Mapping.keys
+    items = Mapping.items
+    values = Mapping.values
+
+    def __repr__(self):
+        return str(dict(self))
+
+    def __copy__(self):
+        return ColumnarEvent(self._table, self._row)
+
+    def __deepcopy__(self, memo):
+        return Event(deepcopy(dict(self), memo))
+
+
+class ColumnarTrace(Trace):
+    """
+    Lightweight view over a trace of a columnar event log, exposing the Trace (Sequence) interface
+    """
+
+    def __init__(self, log, index):
+        self._log = log
+        self._index = index
+
+    def _get_bounds(self):
+        return int(self._log.trace_offsets[self._index]), int(self._log.trace_offsets[self._index + 1])
+
+    def _get_list(self):
+        start, end = self._get_bounds()
+        events = self._log.events_table
+        return [ColumnarEvent(events, row) for row in range(start, end)]
+
+    def _get_attributes(self):
+        return ColumnarEvent(self._log.traces_table, self._index)
+
+    _list = property(_get_list)
+    _attributes = property(_get_attributes)
+    attributes = property(_get_attributes)
+
+    def __getitem__(self, key):
+        start, end = self._get_bounds()
+        if isinstance(key, slice):
+            return [ColumnarEvent(self._log.events_table, row) for row in range(start, end)[key]]
+        if key < 0:
+            key = key + end - start
+        if not 0 <= key < end - start:
+            raise IndexError("trace index out of range")
+        return ColumnarEvent(self._log.events_table, start + key)
+
+    def __iter__(self):
+        start, end = self._get_bounds()
+        events = self._log.events_table
+        for row in range(start, end):
+            yield ColumnarEvent(events, row)
+
+    def __len__(self):
+        return int(self._log.trace_offsets[self._index + 1] - self._log.trace_offsets[self._index])
+
+    def __setitem__(self, key, value):
+        raise NotImplementedError("the events of a columnar trace can not be replaced")
+
+    def insert(self, i, x):
+        raise NotImplementedError("events can not be inserted in a columnar trace")
+
+    def append(self, x):
+        raise NotImplementedError("events can not be appended to a columnar trace")
+
+    def __eq__(self, other):
+        return isinstance(other, ColumnarTrace) and self._log is other._log and self._index == other._index
+
+    def __hash__(self):
+        return hash((id(self._log), self._index))
+
+    def __copy__(self):
+        return ColumnarTrace(self._log, self._index)
+
+    def __deepcopy__(self, memo):
+        return Trace([deepcopy(event, memo) for event in self], attributes=deepcopy(dict(self.attributes), memo))
+
+
+class ColumnarEventLog(EventLog):
+    """
+    Event log storing events and traces as typed columns (interned codes for string attributes, int64 nanoseconds
+    for timestamps, typed Numpy arrays for numeric attributes) along with the per-trace offsets in the events table.
+
+    Traces and events are exposed through lightweight views, so the object can be used in place of an EventLog.
+    """
+
+    def __init__(self, events_table, traces_table, trace_offsets, **kwargs):
+        self._attributes = kwargs['attributes'] if 'attributes' in kwargs else {}
+        self._extensions = kwargs['extensions'] if 'extensions' in kwargs else {}
+        self._omni = kwargs['omni_present'] if 'omni_present' in kwargs else kwargs[
+            'globals'] if 'globals' in kwargs else {}
+        self._classifiers = kwargs['classifiers'] if 'classifiers' in kwargs else {}
+        self.events_table = events_table
+        self.traces_table = traces_table
+        self.trace_offsets = trace_offsets
+
+    def _get_list(self):
+        return [ColumnarTrace(self, i) for i in range(len(self))]
+
+    _list = property(_get_list)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [ColumnarTrace(self, i) for i in range(len(self))[key]]
+        if key < 0:
+            key = key + len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("log index out of range")
+        return ColumnarTrace(self, key)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield ColumnarTrace(self, i)
+
+    def __len__(self):
+        return len(self.trace_offsets) - 1
+
+    def __contains__(self, item):
+        return isinstance(item, ColumnarTrace) and item._log is self
+
+    def __reversed__(self):
+        for i in reversed(range(len(self))):
+            yield ColumnarTrace(self, i)
+
+    def __setitem__(self, key, value):
+        raise NotImplementedError("the traces of a columnar log can not be replaced")
+
+    def append(self, x):
+        raise NotImplementedError("traces can not be appended to a columnar log")
+
+    def get_trace_lengths(self):
+        """
+        Gets the number of events of each trace
+
+        Returns
+        ------------
+        lengths
+            Numpy array containing the length of each trace
+        """
+        return np.diff(self.trace_offsets)
+
+    def get_event_attribute_codes(self, attribute_key):
+        """
+        Gets the integer codes of a string event attribute (e.g. the activity), without decoding them
+
+        Parameters
+        ------------
+        attribute_key
+            Event attribute
+
+        Returns
+        ------------
+        codes
+            Numpy int32 array containing, for each event, the code of the value (-1 if the attribute is missing)
+        labels
+            List of values (the code is the position in the list)
+        """
+        column = self.events_table.columns.get(attribute_key)
+        if column is None:
+            return np.full(self.events_table.n_rows, -1, dtype=np.int32), []
+        if not isinstance(column, CategoricalColumn):
+            values = column.decode()
+            present = np.array(column.present(), dtype=np.bool_)
+            labels, codes = np.unique(values[present].astype(str), return_inverse=True) if present.any() else (
+                np.array([], dtype=str), np.array([], dtype=np.int32))
+            all_codes = np.full(len(values), -1, dtype=np.int32)
+            all_codes[present] = codes
+            return all_codes, list(labels)
+        return column.codes, column.labels
+
+    def get_event_attribute_timestamps(self, attribute_key):
+        """
+        Gets the values of a date event attribute as int64 nanoseconds since the epoch (UTC)
+
+        Parameters
+        ------------
+        attribute_key
+            Event attribute
+
+        Returns
+        ------------
+        values
+            Numpy int64 array of nanoseconds since the epoch
+        mask
+            Numpy boolean array telling if the attribute is present in the event
+        """
+        column = self.events_table.columns.get(attribute_key)
+        if isinstance(column, DatetimeColumn):
+            return column.values, column.mask
+        values = np.zeros(self.events_table.n_rows, dtype=np.int64)
+        mask = np.zeros(self.events_table.n_rows, dtype=np.bool_)
+        if column is not None:
+            for row, value in enumerate(column.decode()):
+                if isinstance(value, datetime):
+                    values[row] = _to_ns(value)
+                    mask[row] = True
+        return values, mask
+
+    def get_event_attribute_values(self, attribute_key):
+        """
+        Gets the (decoded) values of an event attribute
+
+        Parameters
+        ------------
+        attribute_key
+            Event attribute
+
+        Returns
+        ------------
+        values
+            Numpy object array (None where the attribute is missing)
+        """
+        column = self.events_table.columns.get(attribute_key)
+        if column is None:
+            return np.full(self.events_table.n_rows, None, dtype=object)
+        return column.decode()
+
+    def get_memory_usage(self):
+        """
+        Gets the number of bytes occupied by the Numpy arrays backing the log
+        (the labels of the categorical columns are excluded)
+
+        Returns
+        ------------
+        nbytes
+            Number of bytes
+        """
+        return self.events_table.nbytes() + self.traces_table.nbytes() + self.trace_offsets.nbytes
+
+
+def from_event_log(log):
+    """
+    Builds a columnar event log from an event log
+
+    Parameters
+    ------------
+    log
+        Event log
+
+    Returns
+    ------------
+    columnar_log
+        Columnar event log
+    """
+    trace_offsets = np.zeros(len(log) + 1, dtype=np.int64)
+    trace_offsets[1:] = np.cumsum([len(trace) for trace in log])
+    events_table = AttributeTable.from_dicts(event for trace in log for event in trace)
+    traces_table = AttributeTable.from_dicts(trace.attributes for trace in log)
+    return ColumnarEventLog(events_table, traces_table, trace_offsets, attributes=log.attributes,
+                            extensions=log.extensions, omni_present=log.omni_present, classifiers=log.classifiers)
+
+
+def _build_column_from_series(series):
+    """
+    Build a typed column from a (fully present) Pandas series, without boxing the values when the dtype allows it
+    """
+    n_rows = len(series)
+    values = series.values
+    mask = np.ones(n_rows, dtype=np.bool_)
+    if pd.api.types.is_bool_dtype(series.dtype) and values.dtype == np.bool_:
+        return ArrayColumn(values.copy(), mask)
+    if pd.api.types.is_integer_dtype(series.dtype) and values.dtype == np.int64:
+        return ArrayColumn(values.copy(), mask)
+    if pd.api.types.is_float_dtype(series.dtype) and values.dtype == np.float64:
+        return ArrayColumn(values.copy(), mask)
+    if pd.api.types.is_datetime64_any_dtype(series.dtype) and not series.isnull().any():
+        tz = series.dt.tz
+        if tz is None or tz.utcoffset(None) is not None:
+            # the unit of the series (ns, us, s ...) depends on its source: the column stores nanoseconds
+            values = series.values if tz is None else series.dt.tz_convert("UTC").dt.tz_localize(None).values
+            return DatetimeColumn(values.astype("datetime64[ns]").view(np.int64), mask, tz, pd.Timestamp)
+    if series.dtype == object or isinstance(series.dtype, pd.CategoricalDtype):
+        codes, labels = pd.factorize(series)
+        if not (codes < 0).any() and all(type(label) is str for label in labels):
+            return CategoricalColumn(codes.astype(np.int32), list(labels))
+    return _build_column(n_rows, np.arange(n_rows), series.tolist())
+
+
+def from_dataframe(df, case_glue, case_attribute_prefix):
+    """
+    Builds a columnar event log directly from a dataframe (in which the case ID is always defined),
+    column by column: the events are grouped by case (in order of first appearance of the case, keeping the order
+    of the rows inside the case), and the case attributes (the columns starting with the prefix, that is removed)
+    are taken from the first row of each case
+
+    Parameters
+    ------------
+    df
+        Dataframe
+    case_glue
+        Column containing the case ID
+    case_attribute_prefix
+        Prefix of the case attributes
+
+    Returns
+    ------------
+    columnar_log
+        Columnar event log
+    """
+    codes, cases = pd.factorize(df[case_glue])
+    order = np.argsort(codes, kind="mergesort")
+    trace_offsets = np.zeros(len(cases) + 1, dtype=np.int64)
+    trace_offsets[1:] = np.cumsum(np.bincount(codes, minlength=len(cases)))
+    first_rows = order[trace_offsets[:-1]]
+
+    case_columns = [x for x in df.columns if x.startswith(case_attribute_prefix)]
+    events_table = AttributeTable(len(df), {x: _build_column_from_series(df[x].take(order)) for x in df.columns if
+                                            x not in case_columns})
+    traces_table = AttributeTable(len(cases), {x.replace(case_attribute_prefix, ''): _build_column_from_series(
+        df[x].take(first_rows)) for x in case_columns})
+    if xes.DEFAULT_TRACEID_KEY not in traces_table.columns:
+        traces_table.columns[xes.DEFAULT_TRACEID_KEY] = _build_column_from_series(df[case_glue].take(first_rows))
+    return ColumnarEventLog(events_table, traces_table, trace_offsets, attributes={'origin': 'csv'})
+
+
+def _get_dicts(table):
+    """
+    Materializes the rows of an attribute table as dictionaries
+    """
+    dicts = [{} for _ in range(table.n_rows)]
+    for key, column in table.columns.items():
+        values = column.decode()
+        for row in np.nonzero(column.present())[0]:
+            dicts[row][key] = values[row]
+    return dicts
+
+
+def to_event_log(log):
+    """
+    Builds an event log (with plain traces and events) from a columnar event log
+
+    Parameters
+    ------------
+    log
+        Columnar event log
+
+    Returns
+    ------------
+    event_log
+        Event log
+    """
+    events = _get_dicts(log.events_table)
+    traces_attributes = _get_dicts(log.traces_table)
+    event_log = EventLog(attributes=log.attributes, extensions=log.extensions, omni_present=log.omni_present,
+                         classifiers=log.classifiers)
+    for index, attributes in enumerate(traces_attributes):
+        trace = Trace([Event(event) for event in events[log.trace_offsets[index]:log.trace_offsets[index + 1]]],
+                      attributes=attributes)
+        event_log.append(trace)
+    return event_log
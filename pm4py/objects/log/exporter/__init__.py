@@ -1 +1 @@
-from pm4py.objects.log.exporter import csv, xes, parquet
+from pm4py.objects.log.exporter import csv, xes, parquet, snapshot
@@ -1,3 +1,4 @@
+from pm4py.objects.log import view as log_view
 from pm4py.objects.log.exporter.csv.versions import pandas_csv_exp
 
 PANDAS = "pandas"
@@ -23,6 +24,7 @@ def export_log_as_string(log, variant="pandas", parameters=None):
     string
         String describing the CSV
     """
+    log = log_view.materialize(log)
     return VERSIONS_STRING[variant](log, parameters=parameters)
 
 
@@ -41,6 +43,7 @@ def export(log, output_file_path, variant="pandas", parameters=None):
     parameters
         Parameters of the algorithm
     """
+    log = log_view.materialize(log)
     VERSIONS[variant](log, output_file_path, parameters=parameters)
 
 
@@ -1,4 +1,5 @@
 from pm4py.objects.conversion.log.versions.to_dataframe import get_dataframe_from_event_stream
+from pm4py.objects.log.util import compression
 
 
 def export_log_as_string(log, parameters=None):
@@ -35,7 +36,7 @@ def export(log, output_file_path, parameters=None):
     log: :class:`pm4py.log.log.EventLog`
         Event log. Also, can take a log and convert it to event stream
     output_file_path:
-        Output file path
+        Output file path (if it ends with .gz, .bz2 or .xz, the CSV is compressed while it is written)
     parameters
         Possible parameters of the algorithm
     """
@@ -44,7 +45,9 @@ def export(log, output_file_path, parameters=None):
     del parameters
 
     df = get_dataframe_from_event_stream(log)
-    df.to_csv(output_file_path, index=False)
+    # the same encoding and line endings of to_csv on a path, whatever the platform
+    with compression.open_file(output_file_path, "wt", encoding="utf-8", newline="") as f:
+        df.to_csv(f, index=False)
 
 
 def export_log(log, output_file_path, parameters=None):
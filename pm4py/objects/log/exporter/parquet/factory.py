@@ -11,7 +11,7 @@ VERSIONS = {PYARROW: pyarrow.apply}
 
 def apply(log, path, parameters=None, variant=PYARROW):
     """
-    Exports a log to a Parquet file
+    Exports a log to a Parquet file (or to a partitioned Parquet dataset)
 
     Parameters
     ------------
@@ -20,7 +20,11 @@ def apply(log, path, parameters=None, variant=PYARROW):
     path
         Path
     parameters
-        Possible parameters of the algorithm
+        Possible parameters of the algorithm, including:
+            partition_columns -> Columns by which the dataset is partitioned
+            partition_by_month -> Partitions the dataset by the month of the timestamp of the events
+            case_buckets -> Partitions the dataset in the given number of buckets by the hash of the case ID
+            row_group_size -> Maximum number of rows of a row group
     variant
         Variant of the algorithm, possible values: pyarrow
     """
@@ -32,7 +36,7 @@ def apply(log, path, parameters=None, variant=PYARROW):
 
 def export_log(log, path, parameters=None, variant=PYARROW):
     """
-    Exports a log to a Parquet file
+    Exports a log to a Parquet file (or to a partitioned Parquet dataset)
 
     Parameters
     ------------
@@ -41,7 +45,11 @@ def export_log(log, path, parameters=None, variant=PYARROW):
     path
         Path
     parameters
-        Possible parameters of the algorithm
+        Possible parameters of the algorithm, including:
+            partition_columns -> Columns by which the dataset is partitioned
+            partition_by_month -> Partitions the dataset by the month of the timestamp of the events
+            case_buckets -> Partitions the dataset in the given number of buckets by the hash of the case ID
+            row_group_size -> Maximum number of rows of a row group
     variant
         Variant of the algorithm, possible values: pyarrow
     """
@@ -53,7 +61,7 @@ def export_log(log, path, parameters=None, variant=PYARROW):
 
 def export_df(log, path, parameters=None, variant=PYARROW):
     """
-    Exports a log to a Parquet file
+    Exports a log to a Parquet file (or to a partitioned Parquet dataset)
 
     Parameters
     ------------
@@ -62,7 +70,11 @@ def export_df(log, path, parameters=None, variant=PYARROW):
     path
         Path
     parameters
-        Possible parameters of the algorithm
+        Possible parameters of the algorithm, including:
+            partition_columns -> Columns by which the dataset is partitioned
+            partition_by_month -> Partitions the dataset by the month of the timestamp of the events
+            case_buckets -> Partitions the dataset in the given number of buckets by the hash of the case ID
+            row_group_size -> Maximum number of rows of a row group
     variant
         Variant of the algorithm, possible values: pyarrow
     """
@@ -1,23 +1,126 @@
+import os
+from urllib.parse import quote
+
+import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 
+from pm4py.objects.log.util import parquet as parquet_util
+from pm4py.objects.log.util import xes
+from pm4py.objects.log.util.general import CASE_ATTRIBUTE_GLUE
+from pm4py.util.constants import PARAMETER_CONSTANT_TIMESTAMP_KEY, PARAMETER_CONSTANT_CASEID_KEY
+
+PARTITION_COLUMNS = "partition_columns"
+PARTITION_BY_MONTH = "partition_by_month"
+CASE_BUCKETS = "case_buckets"
+ROW_GROUP_SIZE = "row_group_size"
+
+# name of the directory of the null values of a partition column (as in Hive)
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+PARTITION_FILE_NAME = "part-0.parquet"
+
+
+def get_partition_directory(partition_columns, values):
+    """
+    Gets the (Hive-style) relative directory of a partition, e.g. @@month=2011-01/@@case_bucket=2
+
+    Parameters
+    ------------
+    partition_columns
+        Partition columns
+    values
+        Values of the partition columns
+
+    Returns
+    ------------
+    directory
+        Relative directory
+    """
+    segments = []
+    for column, value in zip(partition_columns, values):
+        value = NULL_PARTITION if pd.isnull(value) else quote(str(value), safe="")
+        segments.append(column + "=" + value)
+    return os.path.join(*segments)
+
+
+def write_dataset(df, path, partition_columns, metadata, row_group_size=None):
+    """
+    Writes a dataframe as a (Hive-style) partitioned Parquet dataset, with one file per partition.
+    The values of the partition columns are stored in the names of the directories
+
+    Parameters
+    ------------
+    df
+        Dataframe
+    path
+        Root directory of the dataset
+    partition_columns
+        Partition columns
+    metadata
+        Metadata of the schema of the files
+    row_group_size
+        Maximum number of rows of a row group
+    """
+    other_columns = [x for x in df.columns if x not in partition_columns]
+    # the schema is inferred once on the whole dataframe: a column that is null in all the rows of a partition
+    # would otherwise get the null type in its file, that can not be read along with the other files
+    schema = pa.Schema.from_pandas(df[other_columns], preserve_index=False)
+    grouping = partition_columns[0] if len(partition_columns) == 1 else partition_columns
+    for values, partition_df in df.groupby(grouping, sort=False, dropna=False):
+        if not isinstance(values, tuple):
+            values = (values,)
+        directory = os.path.join(path, get_partition_directory(partition_columns, values))
+        os.makedirs(directory, exist_ok=True)
+        table = pa.Table.from_pandas(partition_df[other_columns], schema=schema, preserve_index=False)
+        table = table.replace_schema_metadata({**table.schema.metadata, **metadata})
+        pq.write_table(table, os.path.join(directory, PARTITION_FILE_NAME), row_group_size=row_group_size)
+
 
 def apply(df, path, parameters=None):
     """
-    Exports a dataframe to a Parquet file
+    Exports a dataframe to a Parquet file, or to a (Hive-style) partitioned Parquet dataset if some
+    partitioning is requested
 
     Parameters
     ------------
     df
         Dataframe
     path
-        Path
+        Path (of the file, or of the root directory of the partitioned dataset)
     parameters
-        Possible parameters of the algorithm
+        Possible parameters of the algorithm, including:
+            partition_columns -> Columns of the dataframe by which the dataset is partitioned
+            partition_by_month -> Partitions the dataset by the month (in UTC) of the timestamp of the events
+            case_buckets -> Partitions the dataset in the given number of buckets by the hash of the case ID
+            row_group_size -> Maximum number of rows of a row group
+            timestamp_key -> Column that contains the timestamp
+            case_id_glue -> Column that contains the Case ID
     """
     if parameters is None:
         parameters = {}
 
-    df.columns = [x.replace(":", "AAA") for x in df.columns]
-    df = pa.Table.from_pandas(df)
-    pq.write_table(df, path)
+    partition_columns = list(parameters[PARTITION_COLUMNS]) if PARTITION_COLUMNS in parameters else []
+    partition_by_month = parameters[PARTITION_BY_MONTH] if PARTITION_BY_MONTH in parameters else False
+    case_buckets = parameters[CASE_BUCKETS] if CASE_BUCKETS in parameters else None
+    row_group_size = parameters[ROW_GROUP_SIZE] if ROW_GROUP_SIZE in parameters else None
+    timestamp_key = parameters[
+        PARAMETER_CONSTANT_TIMESTAMP_KEY] if PARAMETER_CONSTANT_TIMESTAMP_KEY in parameters else xes.DEFAULT_TIMESTAMP_KEY
+    case_id_glue = parameters[
+        PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_ATTRIBUTE_GLUE
+
+    metadata = {parquet_util.META_PLAIN_COLUMNS: b"true"}
+    if partition_by_month:
+        df = df.assign(**{parquet_util.MONTH_COLUMN: parquet_util.get_months(df[timestamp_key])})
+        partition_columns.append(parquet_util.MONTH_COLUMN)
+    if case_buckets:
+        df = df.assign(**{parquet_util.CASE_BUCKET_COLUMN: parquet_util.get_case_buckets(df[case_id_glue],
+                                                                                         case_buckets)})
+        partition_columns.append(parquet_util.CASE_BUCKET_COLUMN)
+        metadata[parquet_util.META_CASE_BUCKETS] = str(case_buckets).encode("utf-8")
+
+    if partition_columns:
+        write_dataset(df, path, partition_columns, metadata, row_group_size=row_group_size)
+    else:
+        table = pa.Table.from_pandas(df)
+        table = table.replace_schema_metadata({**table.schema.metadata, **metadata})
+        pq.write_table(table, path, row_group_size=row_group_size)
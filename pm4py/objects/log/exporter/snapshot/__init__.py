@@ -0,0 +1 @@
+from pm4py.objects.log.exporter.snapshot import factory, versions
\ No newline at end of file
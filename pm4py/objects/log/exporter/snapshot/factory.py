@@ -0,0 +1,44 @@
+from pm4py.objects.log import view as log_view
+from pm4py.objects.log.exporter.snapshot.versions import arrow_ipc
+
+ARROW_IPC = "arrow_ipc"
+
+VERSIONS = {ARROW_IPC: arrow_ipc.export_log}
+
+
+def apply(log, path, parameters=None, variant=ARROW_IPC):
+    """
+    Exports a log to a binary snapshot, that can be reloaded (or memory-mapped) much faster than a XES file
+
+    Parameters
+    ------------
+    log
+        Log
+    path
+        Path
+    parameters
+        Possible parameters of the algorithm
+    variant
+        Variant of the algorithm, possible values: arrow_ipc
+    """
+    log = log_view.materialize(log)
+    return VERSIONS[variant](log, path, parameters=parameters)
+
+
+def export_log(log, path, parameters=None, variant=ARROW_IPC):
+    """
+    Exports a log to a binary snapshot, that can be reloaded (or memory-mapped) much faster than a XES file
+
+    Parameters
+    ------------
+    log
+        Log
+    path
+        Path
+    parameters
+        Possible parameters of the algorithm
+    variant
+        Variant of the algorithm, possible values: arrow_ipc
+    """
+    log = log_view.materialize(log)
+    return VERSIONS[variant](log, path, parameters=parameters)
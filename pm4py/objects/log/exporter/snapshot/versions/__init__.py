@@ -0,0 +1 @@
+from pm4py.objects.log.exporter.snapshot.versions import arrow_ipc
\ No newline at end of file
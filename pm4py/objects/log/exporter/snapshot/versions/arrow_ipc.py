@@ -0,0 +1,127 @@
+from datetime import datetime
+
+import numpy as np
+import pyarrow as pa
+
+from pm4py.objects.conversion.log import factory as log_conv_factory
+from pm4py.objects.log import columnar
+from pm4py.objects.log.util import snapshot
+
+# the events table is written at an offset multiple of this alignment, so its buffers can be memory-mapped
+ALIGNMENT = 64
+
+
+def get_arrow_column(column):
+    """
+    Converts a column of a columnar attribute table into an Arrow array
+
+    Parameters
+    ------------
+    column
+        Column of an attribute table
+
+    Returns
+    ------------
+    array
+        Arrow array
+    metadata
+        Metadata of the field (None if not needed)
+    """
+    if isinstance(column, columnar.CategoricalColumn):
+        codes = np.asarray(column.codes, dtype=np.int32)
+        indices = pa.array(codes, mask=codes < 0, type=pa.int32())
+        return pa.DictionaryArray.from_arrays(indices, pa.array(column.labels, type=pa.string())), None
+    mask = np.asarray(column.mask, dtype=np.bool_)
+    arrow_mask = None if mask.all() else ~mask
+    if isinstance(column, columnar.DatetimeColumn):
+        box_type = snapshot.TYPE_DATETIME if column.box_class is datetime else snapshot.TYPE_TIMESTAMP
+        if isinstance(column, columnar.OffsetDatetimeColumn):
+            # the UTC offset of each value is stored alongside the UTC timestamp
+            timestamps = pa.array(column.values, type=pa.timestamp("ns", tz="+00:00"))
+            offsets = pa.array(column.offsets, type=pa.int32())
+            struct_mask = pa.array(arrow_mask) if arrow_mask is not None else None
+            array = pa.StructArray.from_arrays([timestamps, offsets],
+                                               names=[snapshot.STRUCT_TIMESTAMP, snapshot.STRUCT_OFFSET],
+                                               mask=struct_mask)
+            return array, {snapshot.META_TYPE: box_type}
+        arrow_type = pa.timestamp("ns", tz=snapshot.tz_to_string(column.tz))
+        return pa.array(column.values, mask=arrow_mask, type=arrow_type), {snapshot.META_TYPE: box_type}
+    if column.values.dtype == object:
+        values = [snapshot.dumps(value) if present else None for value, present in zip(column.values, mask)]
+        return pa.array(values, type=pa.string()), {snapshot.META_TYPE: snapshot.TYPE_JSON}
+    return pa.array(column.values, mask=arrow_mask), None
+
+
+def get_arrow_table(table, metadata=None, extra_columns=None):
+    """
+    Converts a columnar attribute table into an Arrow table
+
+    Parameters
+    ------------
+    table
+        Attribute table
+    metadata
+        Metadata of the schema
+    extra_columns
+        (If provided) Dictionary of further Arrow arrays (one value per row of the table), put before the columns
+        of the attributes
+
+    Returns
+    ------------
+    arrow_table
+        Arrow table
+    """
+    arrays = []
+    fields = []
+    if extra_columns is not None:
+        for key, array in extra_columns.items():
+            arrays.append(array)
+            fields.append(pa.field(key, array.type))
+    for key, column in table.columns.items():
+        array, field_metadata = get_arrow_column(column)
+        arrays.append(array)
+        fields.append(pa.field(key, array.type, metadata=field_metadata))
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields, metadata=metadata))
+
+
+def export_log(log, output_file_path, parameters=None):
+    """
+    Exports a log into a binary snapshot, i.e. a file containing two Arrow IPC files:
+    the first contains the traces table (with the offset of the first event of each trace),
+    the second contains the events table along with the log-level information (attributes, extensions,
+    globals, classifiers) and the size of the first part in the metadata.
+    The attributes are stored in typed columns (dictionary-encoded strings, int64, float64, bool,
+    timestamps); the columns with mixed or nested values are stored as JSON strings
+
+    Parameters
+    ------------
+    log
+        Event log (or columnar event log)
+    output_file_path
+        Output file path
+    parameters
+        Parameters of the algorithm
+    """
+    if parameters is None:
+        parameters = {}
+
+    if not isinstance(log, columnar.ColumnarEventLog):
+        log = columnar.from_event_log(log_conv_factory.apply(log, parameters=parameters,
+                                                             variant=log_conv_factory.TO_EVENT_LOG))
+
+    # the offsets give the number of rows of the traces table also when the traces have no attributes
+    traces_table = get_arrow_table(log.traces_table, extra_columns={
+        snapshot.TRACE_OFFSET_COLUMN: pa.array(np.asarray(log.trace_offsets[:-1], dtype=np.int64))})
+    header = {"attributes": log.attributes, "extensions": log.extensions, "omni_present": log.omni_present,
+              "classifiers": log.classifiers}
+
+    with pa.OSFile(output_file_path, "wb") as sink:
+        with pa.ipc.new_file(sink, traces_table.schema) as writer:
+            writer.write_table(traces_table)
+        traces_size = sink.tell()
+        sink.write(b"\0" * (-traces_size % ALIGNMENT))
+        metadata = {snapshot.META_HEADER: snapshot.dumps(header), snapshot.META_TRACES_SIZE: str(traces_size),
+                    snapshot.META_NO_EVENTS: str(log.events_table.n_rows)}
+        events_table = get_arrow_table(log.events_table, metadata=metadata)
+        with pa.ipc.new_file(sink, events_table.schema) as writer:
+            writer.write_table(events_table)
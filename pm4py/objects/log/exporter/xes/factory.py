@@ -1,9 +1,11 @@
-from pm4py.objects.log.exporter.xes.versions import etree_xes_exp
+from pm4py.objects.log import view as log_view
+from pm4py.objects.log.exporter.xes.versions import etree_xes_exp, stream_xes_exp
 from pm4py.objects.log.util import compression
 
 ETREE = "etree"
-VERSIONS_STRING = {ETREE: etree_xes_exp.export_log_as_string}
-VERSIONS = {ETREE: etree_xes_exp.export_log}
+STREAM = "stream"
+VERSIONS_STRING = {ETREE: etree_xes_exp.export_log_as_string, STREAM: stream_xes_exp.export_log_as_string}
+VERSIONS = {ETREE: etree_xes_exp.export_log, STREAM: stream_xes_exp.export_log}
 
 
 def export_log_as_string(log, variant="etree", parameters=None):
@@ -15,7 +17,9 @@ def export_log_as_string(log, variant="etree", parameters=None):
     log
         Trace log
     variant
-        Selected variant of the algorithm
+        Selected variant of the algorithm, possible values:
+            etree (builds the whole XML tree before writing it),
+            stream (writes the log trace by trace, with constant memory usage)
     parameters
         Parameters of the algorithm
 
@@ -24,6 +28,7 @@ def export_log_as_string(log, variant="etree", parameters=None):
     string
         String describing the XES
     """
+    log = log_view.materialize(log)
     return VERSIONS_STRING[variant](log, parameters=parameters)
 
 
@@ -36,18 +41,21 @@ def export_log(log, output_file_path, variant="etree", parameters=None):
     log
         Trace log
     output_file_path
-        Output file path
+        Output file path (if it ends with .gz, .bz2 or .xz, the XES is compressed while it is written)
     variant
-        Selected variant of the algorithm
+        Selected variant of the algorithm, possible values:
+            etree (builds the whole XML tree before writing it),
+            stream (writes the log trace by trace, with constant memory usage)
     parameters
         Parameters of the algorithm:
-            compress -> Indicates that the XES file must be compressed
+            compress -> Indicates that the XES file must be compressed (with gzip, in output_file_path + ".gz")
     """
     if parameters is None:
         parameters = {}
+    if "compress" in parameters and parameters["compress"] and not compression.is_compressed(output_file_path):
+        output_file_path = output_file_path + ".gz"
+    log = log_view.materialize(log)
     VERSIONS[variant](log, output_file_path, parameters=parameters)
-    if "compress" in parameters and parameters["compress"]:
-        compression.compress(output_file_path)
 
 
 def apply(log, output_file_path, variant="etree", parameters=None):
@@ -59,11 +67,13 @@ def apply(log, output_file_path, variant="etree", parameters=None):
     log
         Trace log
     output_file_path
-        Output file path
+        Output file path (if it ends with .gz, .bz2 or .xz, the XES is compressed while it is written)
     variant
-        Selected variant of the algorithm
+        Selected variant of the algorithm, possible values:
+            etree (builds the whole XML tree before writing it),
+            stream (writes the log trace by trace, with constant memory usage)
     parameters
         Parameters of the algorithm:
-            compress -> Indicates that the XES file must be compressed
+            compress -> Indicates that the XES file must be compressed (with gzip, in output_file_path + ".gz")
     """
     export_log(log, output_file_path, variant=variant, parameters=parameters)
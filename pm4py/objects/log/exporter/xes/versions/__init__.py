@@ -1 +1 @@
-from pm4py.objects.log.exporter.xes.versions import etree_xes_exp
+from pm4py.objects.log.exporter.xes.versions import etree_xes_exp, stream_xes_exp
\ No newline at end of file
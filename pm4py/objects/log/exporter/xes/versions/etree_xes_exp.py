@@ -2,6 +2,7 @@ from lxml import etree
 
 from pm4py.objects.conversion.log import factory as log_converter
 from pm4py.objects.log import log as log_instance
+from pm4py.objects.log.util import compression
 from pm4py.objects.log.util import xes as xes_util
 
 # defines correspondence between Python types and XES types
@@ -285,7 +286,7 @@ def export_log(log, output_file_path, parameters=None):
     log: :class:`pm4py.log.log.EventLog`
         PM4PY log
     output_file_path:
-        Output file path
+        Output file path (if it ends with .gz, .bz2 or .xz, the XES is compressed while it is written)
     parameters
         Parameters of the algorithm
 
@@ -297,4 +298,5 @@ def export_log(log, output_file_path, parameters=None):
     # Gets the XML tree to export
     tree = export_log_tree(log)
     # Effectively do the export of the event log
-    tree.write(output_file_path, pretty_print=True, xml_declaration=True, encoding="utf-8")
+    with compression.open_file(output_file_path, "wb") as f:
+        tree.write(f, pretty_print=True, xml_declaration=True, encoding="utf-8")
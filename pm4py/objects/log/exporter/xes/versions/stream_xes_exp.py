@@ -0,0 +1,146 @@
+import io
+
+from lxml import etree
+
+from pm4py.objects.conversion.log import factory as log_converter
+from pm4py.objects.log import log as log_instance
+from pm4py.objects.log.exporter.xes.versions import etree_xes_exp
+from pm4py.objects.log.util import compression
+from pm4py.objects.log.util import xes as xes_util
+
+LOG_HEADER = "log_header"
+
+
+def export_log_header(log):
+    """
+    Get the XML elements describing the log-level information (attributes, extensions, globals, classifiers)
+
+    Parameters
+    -----------
+    log
+        PM4Py log
+
+    Returns
+    -----------
+    elements
+        List of XML elements
+    """
+    root = etree.Element(xes_util.TAG_LOG)
+    if hasattr(log, "attributes"):
+        etree_xes_exp.export_attributes(log, root)
+    if hasattr(log, "extensions"):
+        etree_xes_exp.export_extensions(log, root)
+    if hasattr(log, "omni_present"):
+        etree_xes_exp.export_globals(log, root)
+    if hasattr(log, "classifiers"):
+        etree_xes_exp.export_classifiers(log, root)
+    return list(root)
+
+
+def export_trace(tr):
+    """
+    Get the XML element of a single trace
+
+    Parameters
+    -----------
+    tr: :class:`pm4py.log.log.Trace`
+        PM4PY trace
+
+    Returns
+    -----------
+    trace
+        XML element
+    """
+    trace = etree.Element(xes_util.TAG_TRACE)
+    etree_xes_exp.export_attributes_element(tr, trace)
+    etree_xes_exp.export_traces_events(tr, trace)
+    return trace
+
+
+def export_log_to_file(log, f, header=None):
+    """
+    Writes the XES of a log on a file object, trace by trace, with an incremental XML writer.
+    Only the XML tree of the trace that is currently written is kept in memory
+
+    Parameters
+    -----------
+    log
+        PM4Py log, or iterable of traces (e.g. the generator returned by the iterparse importer)
+    f
+        File object (opened in binary mode)
+    header
+        (If provided) Log object from which the log-level information is taken (e.g. the log filled by the
+        iterparse importer while the generator of traces is consumed); otherwise, the log itself is used
+    """
+    if type(log) is log_instance.EventStream:
+        log = log_converter.apply(log)
+    if header is None:
+        header = log
+
+    traces = iter(log)
+    # reading the first trace makes the lazy importers fill the log-level information
+    first_trace = next(traces, None)
+
+    with etree.xmlfile(f, encoding="utf-8") as xf:
+        xf.write_declaration()
+        with xf.element(xes_util.TAG_LOG):
+            xf.write("\n")
+            for element in export_log_header(header):
+                xf.write(element, pretty_print=True)
+            if first_trace is not None:
+                xf.write(export_trace(first_trace), pretty_print=True)
+            for tr in traces:
+                xf.write(export_trace(tr), pretty_print=True)
+
+
+def export_log_as_string(log, parameters=None):
+    """
+    Export a log into a string
+
+    Parameters
+    -----------
+    log: :class:`pm4py.log.log.EventLog`
+        PM4PY log
+    parameters
+        Parameters of the algorithm, including:
+            log_header -> Log object providing the log-level information (when the log is an iterable of traces)
+
+    Returns
+    -----------
+    logString
+        Log as a string
+    """
+    if parameters is None:
+        parameters = {}
+
+    header = parameters[LOG_HEADER] if LOG_HEADER in parameters else None
+
+    f = io.BytesIO()
+    export_log_to_file(log, f, header=header)
+
+    return f.getvalue()
+
+
+def export_log(log, output_file_path, parameters=None):
+    """
+    Export XES log from a PM4PY log, writing it trace by trace so the memory usage does not depend
+    on the size of the log
+
+    Parameters
+    ----------
+    log: :class:`pm4py.log.log.EventLog`
+        PM4PY log, or iterable of traces (e.g. the generator returned by the iterparse importer)
+    output_file_path:
+        Output file path (if it ends with .gz, .bz2 or .xz, the XES is compressed while it is written)
+    parameters
+        Parameters of the algorithm, including:
+            log_header -> Log object providing the log-level information (when the log is an iterable of traces)
+
+    """
+    if parameters is None:
+        parameters = {}
+
+    header = parameters[LOG_HEADER] if LOG_HEADER in parameters else None
+
+    with compression.open_file(output_file_path, "wb") as f:
+        export_log_to_file(log, f, header=header)
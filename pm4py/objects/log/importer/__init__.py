@@ -1 +1 @@
-from pm4py.objects.log.importer import csv, xes, parquet
+from pm4py.objects.log.importer import csv, xes, parquet, snapshot
@@ -17,6 +17,10 @@ def import_event_stream(path, parameters=None):
             nrows -> (if specified) Maximum number of rows to read from the CSV
             sort -> Boolean value that tells if the CSV should be ordered
             sort_field -> If sort option is enabled, then the CSV is automatically sorted by the specified column
+            usecols -> (if specified) Columns to read from the CSV
+            dtype -> (if specified) Dictionary associating to some columns the type that shall be used to read them
+            categorical_columns -> (if specified) Columns read as categorical (e.g. case ID, activity, resource)
+            chunksize -> (if specified) The CSV is read and converted in chunks of the given number of rows
 
      Returns
     -------
@@ -32,6 +36,10 @@ def import_event_stream(path, parameters=None):
     insert_event_indexes = False
     timest_format = None
     timest_columns = None
+    usecols = None
+    dtype = None
+    categorical_columns = None
+    chunksize = None
 
     if parameters is None:
         parameters = {}
@@ -51,9 +59,18 @@ def import_event_stream(path, parameters=None):
         timest_format = parameters["timest_format"]
     if "timest_columns" in parameters:
         timest_columns = parameters["timest_columns"]
+    if "usecols" in parameters:
+        usecols = parameters["usecols"]
+    if "dtype" in parameters:
+        dtype = parameters["dtype"]
+    if "categorical_columns" in parameters:
+        categorical_columns = parameters["categorical_columns"]
+    if "chunksize" in parameters:
+        chunksize = parameters["chunksize"]
 
     df = import_dataframe_from_path(path, sep=sep, quotechar=quotechar, nrows=nrows, sort=sort, sort_field=sort_field,
-                                    timest_format=timest_format, timest_columns=timest_columns)
+                                    timest_format=timest_format, timest_columns=timest_columns, usecols=usecols,
+                                    dtype=dtype, categorical_columns=categorical_columns, chunksize=chunksize)
     event_log = log_conv_fact.apply(df, variant=log_conv_fact.TO_EVENT_STREAM)
 
     if insert_event_indexes:
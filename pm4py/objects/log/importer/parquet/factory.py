@@ -9,15 +9,18 @@ COLUMNS = "columns"
 
 def apply(path, parameters=None, variant=PYARROW):
     """
-    Import a Parquet file
+    Import a Parquet file (or a partitioned Parquet dataset)
 
     Parameters
     -------------
     path
-        Path of the file to import
+        Path of the file (or of the root directory of the dataset) to import
     parameters
         Parameters of the algorithm, possible values:
             columns -> columns to import from the Parquet file
+            min_timestamp, max_timestamp -> range of the timestamps of the events to import
+            activities -> activities of the events to import
+            case_ids -> case IDs of the events to import
     variant
         Variant of the algorithm, possible values: pyarrow
 
@@ -31,15 +34,18 @@ def apply(path, parameters=None, variant=PYARROW):
 
 def import_log(path, parameters=None, variant=PYARROW):
     """
-    Import a Parquet file
+    Import a Parquet file (or a partitioned Parquet dataset)
 
     Parameters
     -------------
     path
-        Path of the file to import
+        Path of the file (or of the root directory of the dataset) to import
     parameters
         Parameters of the algorithm, possible values:
             columns -> columns to import from the Parquet file
+            min_timestamp, max_timestamp -> range of the timestamps of the events to import
+            activities -> activities of the events to import
+            case_ids -> case IDs of the events to import
     variant
         Variant of the algorithm, possible values: pyarrow
 
@@ -53,15 +59,18 @@ def import_log(path, parameters=None, variant=PYARROW):
 
 def import_df(path, parameters=None, variant=PYARROW):
     """
-    Import a Parquet file
+    Import a Parquet file (or a partitioned Parquet dataset)
 
     Parameters
     -------------
     path
-        Path of the file to import
+        Path of the file (or of the root directory of the dataset) to import
     parameters
         Parameters of the algorithm, possible values:
             columns -> columns to import from the Parquet file
+            min_timestamp, max_timestamp -> range of the timestamps of the events to import
+            activities -> activities of the events to import
+            case_ids -> case IDs of the events to import
     variant
         Variant of the algorithm, possible values: pyarrow
 
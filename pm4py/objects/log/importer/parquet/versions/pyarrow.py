@@ -1,19 +1,121 @@
-import pyarrow.parquet as pq
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from pm4py.objects.log.util import parquet as parquet_util
+from pm4py.objects.log.util import xes
+from pm4py.objects.log.util.general import CASE_ATTRIBUTE_GLUE
+from pm4py.util.constants import PARAMETER_CONSTANT_TIMESTAMP_KEY, PARAMETER_CONSTANT_CASEID_KEY
+from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY
 
 COLUMNS = "columns"
+MIN_TIMESTAMP = "min_timestamp"
+MAX_TIMESTAMP = "max_timestamp"
+ACTIVITIES = "activities"
+CASE_IDS = "case_ids"
+
+
+def get_timestamp_scalar(timestamp, field_type):
+    """
+    Gets an Arrow scalar, of the type of the timestamp field, representing the given timestamp.
+    Naive timestamps compared with a timezone-aware field are considered to be expressed in UTC
+    """
+    timestamp = pd.Timestamp(timestamp)
+    if field_type.tz is None:
+        timestamp = parquet_util.to_utc_naive(timestamp)
+    elif timestamp.tz is None:
+        timestamp = timestamp.tz_localize("UTC")
+    return pa.scalar(timestamp, type=field_type)
+
+
+def get_filter(dataset, mapping, parameters):
+    """
+    Gets the filter expression pushed down to the Parquet reader: the partitions, the row groups and the rows
+    that do not satisfy the filters are skipped
+
+    Parameters
+    -------------
+    dataset
+        Arrow dataset
+    mapping
+        Mapping between the column names of the log and the names of the fields
+    parameters
+        Parameters of the algorithm (see apply)
+
+    Returns
+    -------------
+    expression
+        Filter expression (None if no filter is required)
+    """
+    timestamp_key = parameters[
+        PARAMETER_CONSTANT_TIMESTAMP_KEY] if PARAMETER_CONSTANT_TIMESTAMP_KEY in parameters else xes.DEFAULT_TIMESTAMP_KEY
+    activity_key = parameters[
+        PARAMETER_CONSTANT_ACTIVITY_KEY] if PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else xes.DEFAULT_NAME_KEY
+    case_id_glue = parameters[
+        PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_ATTRIBUTE_GLUE
+    min_timestamp = parameters[MIN_TIMESTAMP] if MIN_TIMESTAMP in parameters else None
+    max_timestamp = parameters[MAX_TIMESTAMP] if MAX_TIMESTAMP in parameters else None
+    activities = parameters[ACTIVITIES] if ACTIVITIES in parameters else None
+    case_ids = parameters[CASE_IDS] if CASE_IDS in parameters else None
+
+    schema = dataset.schema
+    conditions = []
+
+    if min_timestamp is not None or max_timestamp is not None:
+        field = schema.field(mapping[timestamp_key])
+        if min_timestamp is not None:
+            conditions.append(ds.field(field.name) >= get_timestamp_scalar(min_timestamp, field.type))
+        if max_timestamp is not None:
+            conditions.append(ds.field(field.name) <= get_timestamp_scalar(max_timestamp, field.type))
+        if parquet_util.MONTH_COLUMN in schema.names:
+            # skips the whole partitions of the months outside the range
+            min_month, max_month = parquet_util.get_months_range(min_timestamp, max_timestamp)
+            if min_month is not None:
+                conditions.append(ds.field(parquet_util.MONTH_COLUMN) >= min_month)
+            if max_month is not None:
+                conditions.append(ds.field(parquet_util.MONTH_COLUMN) <= max_month)
+
+    if activities is not None:
+        field = schema.field(mapping[activity_key])
+        conditions.append(ds.field(field.name).isin(pa.array(list(activities)).cast(field.type)))
+
+    if case_ids is not None:
+        field = schema.field(mapping[case_id_glue])
+        conditions.append(ds.field(field.name).isin(pa.array(list(case_ids)).cast(field.type)))
+        if parquet_util.CASE_BUCKET_COLUMN in schema.names:
+            # skips the whole partitions of the buckets not containing any of the cases
+            no_buckets = int(schema.metadata[parquet_util.META_CASE_BUCKETS])
+            buckets = parquet_util.get_case_buckets(case_ids, no_buckets)
+            bucket_type = schema.field(parquet_util.CASE_BUCKET_COLUMN).type
+            conditions.append(ds.field(parquet_util.CASE_BUCKET_COLUMN).isin(
+                pa.array(buckets).cast(bucket_type)))
+
+    if not conditions:
+        return None
+    expression = conditions[0]
+    for condition in conditions[1:]:
+        expression = expression & condition
+    return expression
 
 
 def apply(path, parameters=None):
     """
-    Import a Parquet file
+    Import a Parquet file, or a (Hive-style) partitioned Parquet dataset
 
     Parameters
     -------------
     path
-        Path of the file to import
+        Path of the file (or of the root directory of the dataset) to import
     parameters
         Parameters of the algorithm, possible values:
             columns -> columns to import from the Parquet file
+            min_timestamp -> (if specified) only the events having a timestamp greater or equal are imported
+            max_timestamp -> (if specified) only the events having a timestamp lower or equal are imported
+            activities -> (if specified) only the events having one of the given activities are imported
+            case_ids -> (if specified) only the events of the given cases are imported
+            timestamp_key -> Column that contains the timestamp
+            activity_key -> Column that contains the activity
+            case_id_glue -> Column that contains the Case ID
 
     Returns
     -------------
@@ -25,11 +127,18 @@ def apply(path, parameters=None):
 
     columns = parameters[COLUMNS] if COLUMNS in parameters else None
 
+    dataset = ds.dataset(path, format="parquet", partitioning="hive")
+    mapping = parquet_util.get_column_names_mapping(dataset.schema)
+    expression = get_filter(dataset, mapping, parameters)
+
     if columns:
-        columns = [x.replace(":", "AAA") for x in columns]
-        df = pq.read_pandas(path, columns=columns).to_pandas()
+        columns = [mapping[x] for x in columns]
     else:
-        df = pq.read_pandas(path, columns=columns).to_pandas()
-    df.columns = [x.replace("AAA", ":") for x in df.columns]
+        columns = [x for x in dataset.schema.names if
+                   x not in (parquet_util.MONTH_COLUMN, parquet_util.CASE_BUCKET_COLUMN)]
+
+    df = dataset.to_table(columns=columns, filter=expression).to_pandas()
+    inverse_mapping = {y: x for x, y in mapping.items()}
+    df.columns = [inverse_mapping[x] if x in inverse_mapping else x for x in df.columns]
 
     return df
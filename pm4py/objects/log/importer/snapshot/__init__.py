@@ -0,0 +1 @@
+from pm4py.objects.log.importer.snapshot import versions, factory
\ No newline at end of file
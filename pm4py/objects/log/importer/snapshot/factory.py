@@ -0,0 +1,51 @@
+from pm4py.objects.log.importer.snapshot.versions import arrow_ipc
+
+ARROW_IPC = "arrow_ipc"
+
+VERSIONS = {ARROW_IPC: arrow_ipc.import_log}
+
+MEMORY_MAP = arrow_ipc.MEMORY_MAP
+
+
+def apply(path, parameters=None, variant=ARROW_IPC):
+    """
+    Imports a binary snapshot of a log
+
+    Parameters
+    -------------
+    path
+        Path of the file to import
+    parameters
+        Parameters of the algorithm, possible values:
+            memory_map -> if True, returns a read-only columnar event log backed by the memory-mapped file
+    variant
+        Variant of the algorithm, possible values: arrow_ipc
+
+    Returns
+    -------------
+    log
+        Event log
+    """
+    return VERSIONS[variant](path, parameters=parameters)
+
+
+def import_log(path, parameters=None, variant=ARROW_IPC):
+    """
+    Imports a binary snapshot of a log
+
+    Parameters
+    -------------
+    path
+        Path of the file to import
+    parameters
+        Parameters of the algorithm, possible values:
+            memory_map -> if True, returns a read-only columnar event log backed by the memory-mapped file
+    variant
+        Variant of the algorithm, possible values: arrow_ipc
+
+    Returns
+    -------------
+    log
+        Event log
+    """
+    return VERSIONS[variant](path, parameters=parameters)
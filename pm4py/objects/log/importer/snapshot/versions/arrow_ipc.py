@@ -0,0 +1,144 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from pm4py.objects.log import columnar
+from pm4py.objects.log.util import snapshot
+
+MEMORY_MAP = "memory_map"
+
+
+def get_values(array, dtype):
+    """
+    Gets a (read-only) Numpy view over the values buffer of a fixed-width Arrow array, without copying it
+    """
+    return np.frombuffer(array.buffers()[1], dtype=dtype, count=len(array),
+                         offset=array.offset * np.dtype(dtype).itemsize)
+
+
+def get_mask(array):
+    """
+    Gets the boolean mask telling which values of the Arrow array are present
+    """
+    if array.null_count == 0:
+        return np.ones(len(array), dtype=np.bool_)
+    return array.is_valid().to_numpy(zero_copy_only=False)
+
+
+def get_column(array, field):
+    """
+    Converts an Arrow array into a column of a columnar attribute table (the fixed-width buffers are not copied)
+
+    Parameters
+    ------------
+    array
+        Arrow array
+    field
+        Field of the schema
+
+    Returns
+    ------------
+    column
+        Column of an attribute table
+    """
+    field_type = field.metadata.get(snapshot.META_TYPE) if field.metadata else None
+    if pa.types.is_dictionary(array.type):
+        codes = get_values(array.indices, np.int32)
+        if array.null_count > 0:
+            codes = np.where(get_mask(array), codes, -1).astype(np.int32)
+        return columnar.CategoricalColumn(codes, array.dictionary.to_pylist())
+    mask = get_mask(array)
+    box_class = datetime if field_type == snapshot.TYPE_DATETIME else pd.Timestamp
+    if pa.types.is_timestamp(array.type):
+        return columnar.DatetimeColumn(get_values(array, np.int64), mask, snapshot.string_to_tz(array.type.tz),
+                                       box_class)
+    if pa.types.is_struct(array.type):
+        # timestamps with different UTC offsets
+        return columnar.OffsetDatetimeColumn(get_values(array.field(snapshot.STRUCT_TIMESTAMP), np.int64),
+                                             get_values(array.field(snapshot.STRUCT_OFFSET), np.int32), mask,
+                                             box_class)
+    if field_type == snapshot.TYPE_JSON:
+        values = np.empty(len(array), dtype=object)
+        for row, value in enumerate(array.to_pylist()):
+            if value is not None:
+                values[row] = snapshot.loads(value)
+        return columnar.ArrayColumn(values, mask)
+    if pa.types.is_boolean(array.type):
+        # booleans are stored as bits in Arrow, hence they are unpacked
+        return columnar.ArrayColumn(array.fill_null(False).to_numpy(zero_copy_only=False), mask)
+    return columnar.ArrayColumn(get_values(array, array.type.to_pandas_dtype()), mask)
+
+
+def get_table(batch, n_rows, excluded_columns=None):
+    """
+    Converts an Arrow record batch into a columnar attribute table
+    """
+    columns = {}
+    for index, field in enumerate(batch.schema):
+        if excluded_columns is None or field.name not in excluded_columns:
+            columns[field.name] = get_column(batch.column(index), field)
+    return columnar.AttributeTable(n_rows, columns)
+
+
+def read_batch(buffer):
+    """
+    Reads the content of an Arrow IPC file as a single record batch
+    """
+    reader = pa.ipc.open_file(buffer)
+    if reader.num_record_batches == 1:
+        return reader.get_batch(0), reader.schema
+    batches = reader.read_all().combine_chunks().to_batches()
+    if not batches:
+        return pa.RecordBatch.from_arrays([pa.array([], type=field.type) for field in reader.schema],
+                                          schema=reader.schema), reader.schema
+    return batches[0], reader.schema
+
+
+def import_log(path, parameters=None):
+    """
+    Imports a binary snapshot written by the Arrow IPC snapshot exporter
+
+    Parameters
+    ------------
+    path
+        Path of the snapshot
+    parameters
+        Parameters of the algorithm, including:
+            memory_map -> If True, the snapshot is memory-mapped and a (read-only) columnar event log backed by the
+            buffers of the file is returned, without deserializing the events; otherwise, an EventLog is returned
+
+    Returns
+    ------------
+    log
+        Event log (or columnar event log)
+    """
+    if parameters is None:
+        parameters = {}
+
+    memory_map = parameters[MEMORY_MAP] if MEMORY_MAP in parameters else False
+
+    # the buffer keeps the mapping alive after the file is closed
+    with pa.memory_map(path, "r") as source:
+        buffer = source.read_buffer()
+    events_batch, events_schema = read_batch(buffer)
+    metadata = events_schema.metadata
+    traces_batch, _ = read_batch(buffer.slice(0, int(metadata[snapshot.META_TRACES_SIZE])))
+
+    no_events = int(metadata[snapshot.META_NO_EVENTS])
+    header = snapshot.loads(metadata[snapshot.META_HEADER])
+    trace_offsets = np.empty(traces_batch.num_rows + 1, dtype=np.int64)
+    trace_offsets[:-1] = get_values(traces_batch.column(traces_batch.schema.get_field_index(
+        snapshot.TRACE_OFFSET_COLUMN)), np.int64)
+    trace_offsets[-1] = no_events
+
+    log = columnar.ColumnarEventLog(get_table(events_batch, no_events),
+                                    get_table(traces_batch, traces_batch.num_rows,
+                                              excluded_columns={snapshot.TRACE_OFFSET_COLUMN}),
+                                    trace_offsets, attributes=header["attributes"], extensions=header["extensions"],
+                                    omni_present=header["omni_present"], classifiers=header["classifiers"])
+
+    if memory_map:
+        return log
+    return columnar.to_event_log(log)
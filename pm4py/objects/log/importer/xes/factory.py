@@ -1,11 +1,13 @@
-from pm4py.objects.log.importer.xes.versions import iterparse_xes, python_nonstandard
+from pm4py.objects.log.importer.xes.versions import iterparse_xes, python_nonstandard, parallel_xes
 from pm4py.objects.log.util import string_to_file
-from pm4py.objects.log.util import compression
 
 ITERPARSE = "iterparse"
 NONSTANDARD = "nonstandard"
+PARALLEL = "parallel"
 
-VERSIONS = {ITERPARSE: iterparse_xes.import_log, NONSTANDARD: python_nonstandard.import_log}
+VERSIONS = {ITERPARSE: iterparse_xes.import_log, NONSTANDARD: python_nonstandard.import_log,
+            PARALLEL: parallel_xes.import_log}
+VERSIONS_TRACES = {ITERPARSE: iterparse_xes.import_traces}
 
 
 def import_log_from_string(log_string, parameters=None, variant=ITERPARSE):
@@ -26,7 +28,7 @@ def import_log_from_string(log_string, parameters=None, variant=ITERPARSE):
             (read in order in the XML file)
     variant
         Variant of the algorithm to use, including:
-            iterparse, nonstandard
+            iterparse, nonstandard, parallel
 
     Returns
     -----------
@@ -44,7 +46,7 @@ def import_log(path, parameters=None, variant=ITERPARSE):
     Parameters
     -----------
     path
-        Log path
+        Log path (gzip, bz2 and xz compressed files are read directly as a stream)
     parameters
         Parameters of the algorithm, including
             timestamp_sort -> Specify if we should sort log by timestamp
@@ -55,19 +57,47 @@ def import_log(path, parameters=None, variant=ITERPARSE):
             (read in order in the XML file)
     variant
         Variant of the algorithm to use, including:
-            iterparse, nonstandard
+            iterparse, nonstandard, parallel
 
     Returns
     -----------
     log
         Trace log object
     """
-    if path.endswith("gz"):
-        path = compression.decompress(path)
-
     return VERSIONS[variant](path, parameters=parameters)
 
 
+def import_traces(path, parameters=None, variant=ITERPARSE, log=None):
+    """
+    Import a XES log lazily, obtaining a generator of traces (read one at a time with bounded memory)
+
+    Parameters
+    -----------
+    path
+        Log path (gzip, bz2 and xz compressed files are read directly as a stream)
+    parameters
+        Parameters of the algorithm, including
+            timestamp_sort -> Specify if the events of each trace should be sorted by timestamp
+            timestamp_key -> If sort is enabled, then sort the events by using this key
+            reverse_sort -> Specify in which direction the events should be sorted
+            index_trace_indexes -> Specify if trace indexes should be added as event attribute for each event
+            max_no_traces_to_import -> Specify the maximum number of traces to import from the log
+            (read in order in the XML file)
+    variant
+        Variant of the algorithm to use, including:
+            iterparse
+    log
+        (If provided) Empty log object that is filled with the log-level attributes, extensions,
+        globals and classifiers of the XES
+
+    Returns
+    -----------
+    traces
+        Generator of traces
+    """
+    return VERSIONS_TRACES[variant](path, parameters=parameters, log=log)
+
+
 def apply(path, parameters=None, variant=ITERPARSE):
     """
     Import a XES log into a EventLog object
@@ -75,7 +105,7 @@ def apply(path, parameters=None, variant=ITERPARSE):
     Parameters
     -----------
     path
-        Log path
+        Log path (gzip, bz2 and xz compressed files are read directly as a stream)
     parameters
         Parameters of the algorithm, including
             timestamp_sort -> Specify if we should sort log by timestamp
@@ -86,7 +116,7 @@ def apply(path, parameters=None, variant=ITERPARSE):
             (read in order in the XML file)
     variant
         Variant of the algorithm to use, including:
-            iterparse, nonstandard
+            iterparse, nonstandard, parallel
 
     Returns
     -----------
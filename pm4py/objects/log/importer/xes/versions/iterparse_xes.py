@@ -4,7 +4,8 @@ import ciso8601
 from lxml import etree
 
 from pm4py.objects import log as log_lib
-from pm4py.objects.log.util import sorting
+from pm4py.objects.log.util import compression, index_attribute, sorting
+from pm4py.objects.log.util.value_cache import ValueCache, DEFAULT_MAX_SIZE
 
 # ITERPARSE EVENTS
 EVENT_END = 'end'
@@ -18,7 +19,7 @@ def import_log(filename, parameters=None):
     Parameters
     ----------
     filename:
-        Absolute filename
+        Absolute filename (possibly compressed with gzip, bz2 or xz)
     parameters
         Parameters of the algorithm, including
             timestamp_sort -> Specify if we should sort log by timestamp
@@ -27,6 +28,8 @@ def import_log(filename, parameters=None):
             index_trace_indexes -> Specify if trace indexes should be added as event attribute for each event
             max_no_traces_to_import -> Specify the maximum number of traces to import from the log
             (read in order in the XML file)
+            max_cached_values -> Maximum number of distinct keys and string values kept in the cache
+            used to share repeated values between events
 
     Returns
     -------
@@ -41,7 +44,6 @@ def import_log(filename, parameters=None):
     timestamp_key = "time:timestamp"
     reverse_sort = False
     insert_trace_indexes = False
-    max_no_traces_to_import = 1000000000
 
     if "timestamp_sort" in parameters:
         timestamp_sort = parameters["timestamp_sort"]
@@ -51,31 +53,143 @@ def import_log(filename, parameters=None):
         reverse_sort = parameters["reverse_sort"]
     if "insert_trace_indexes" in parameters:
         insert_trace_indexes = parameters["insert_trace_indexes"]
+
+    log = log_lib.log.EventLog()
+    for trace in __parse_traces(filename, log, parameters):
+        log.append(trace)
+
+    if timestamp_sort:
+        log = sorting.sort_timestamp(log, timestamp_key=timestamp_key, reverse_sort=reverse_sort,
+                                     mode=sorting.SORT_INPLACE)
+    if insert_trace_indexes:
+        log = index_attribute.insert_trace_index_as_event_attribute(log)
+
+    return log
+
+
+def import_traces(filename, parameters=None, log=None):
+    """
+    Imports an XES file lazily, yielding the traces one at a time (in the order of the XML file).
+    The parsed XML elements are cleared as soon as they are read, so the memory usage is bounded by the size
+    of a single trace, and the traces can be consumed as a pipeline (e.g. by the DFG discovery or by filters)
+
+    Parameters
+    ----------
+    filename:
+        Absolute filename (possibly compressed with gzip, bz2 or xz)
+    parameters
+        Parameters of the algorithm, including
+            timestamp_sort -> Specify if the events of each trace should be sorted by timestamp
+            timestamp_key -> If sort is enabled, then sort the events by using this key
+            reverse_sort -> Specify in which direction the events should be sorted
+            index_trace_indexes -> Specify if trace indexes should be added as event attribute for each event
+            max_no_traces_to_import -> Specify the maximum number of traces to import from the log
+            (read in order in the XML file)
+            max_cached_values -> Maximum number of distinct keys and string values kept in the cache
+            used to share repeated values between events
+    log
+        (If provided) Empty log object that is filled with the log-level attributes, extensions,
+        globals and classifiers found in the XES file (the traces are not appended to it)
+
+    Returns
+    -------
+    traces
+        Generator of :class:`pm4py.log.log.Trace` objects
+    """
+    if parameters is None:
+        parameters = {}
+
+    timestamp_sort = False
+    timestamp_key = "time:timestamp"
+    reverse_sort = False
+    insert_trace_indexes = False
+
+    if "timestamp_sort" in parameters:
+        timestamp_sort = parameters["timestamp_sort"]
+    if "timestamp_key" in parameters:
+        timestamp_key = parameters["timestamp_key"]
+    if "reverse_sort" in parameters:
+        reverse_sort = parameters["reverse_sort"]
+    if "insert_trace_indexes" in parameters:
+        insert_trace_indexes = parameters["insert_trace_indexes"]
+
+    if log is None:
+        log = log_lib.log.EventLog()
+
+    for trace_index, trace in enumerate(__parse_traces(filename, log, parameters)):
+        if timestamp_sort:
+            trace = sorting.sort_timestamp_trace(trace, timestamp_key=timestamp_key, reverse_sort=reverse_sort,
+                                                 mode=sorting.SORT_INPLACE)
+        if insert_trace_indexes:
+            for event in trace:
+                event["@@traceindex"] = trace_index + 1
+        yield trace
+
+
+def __parse_traces(filename, log, parameters):
+    """
+    Parses an XES file, filling the provided log object with the log-level information
+    and yielding the traces as soon as they are completely read
+
+    Parameters
+    ----------
+    filename:
+        Absolute filename (possibly compressed with gzip, bz2 or xz) or file object
+    log
+        Log object that is filled with attributes, extensions, globals and classifiers
+    parameters
+        Parameters of the algorithm, including
+            max_no_traces_to_import -> Specify the maximum number of traces to import from the log
+            max_cached_values -> Maximum number of distinct keys and string values kept in the cache
+
+    Returns
+    -------
+    traces
+        Generator of traces
+    """
+    max_no_traces_to_import = 1000000000
+    max_cached_values = DEFAULT_MAX_SIZE
+
     if "max_no_traces_to_import" in parameters:
         max_no_traces_to_import = parameters["max_no_traces_to_import"]
+    if "max_cached_values" in parameters:
+        max_cached_values = parameters["max_cached_values"]
+
+    if compression.is_compressed(filename):
+        # the compressed file is read as a stream, without inflating it on the disk
+        f = compression.open_file(filename)
+        try:
+            for trace in __parse_traces(f, log, parameters):
+                yield trace
+        finally:
+            f.close()
+        return
 
     context = etree.iterparse(filename, events=['start', 'end'])
 
-    log = None
+    log_found = False
+    no_traces = 0
     trace = None
     event = None
 
     tree = {}
+    # repeated keys and string values are shared between the events
+    cache = ValueCache(max_size=max_cached_values)
 
     for tree_event, elem in context:
         if tree_event == EVENT_START:  # starting to read
             parent = tree[elem.getparent()] if elem.getparent() in tree else None
-
             if elem.tag.endswith(log_lib.util.xes.TAG_STRING):
                 if parent is not None:
-                    tree = __parse_attribute(elem, parent, elem.get(log_lib.util.xes.KEY_KEY),
-                                             elem.get(log_lib.util.xes.KEY_VALUE), tree)
+                    tree = __parse_attribute(elem, parent, cache[elem.get(log_lib.util.xes.KEY_KEY)],
+                                             cache[elem.get(log_lib.util.xes.KEY_VALUE)], tree)
                 continue
 
             elif elem.tag.endswith(log_lib.util.xes.TAG_DATE):
                 try:
                     dt = ciso8601.parse_datetime(elem.get(log_lib.util.xes.KEY_VALUE))
-                    tree = __parse_attribute(elem, parent, elem.get(log_lib.util.xes.KEY_KEY), dt, tree)
+                    tree = __parse_attribute(elem, parent, cache[elem.get(log_lib.util.xes.KEY_KEY)], dt,
+                                             tree)
                 except TypeError:
                     logging.info("failed to parse date: " + str(elem.get(log_lib.util.xes.KEY_VALUE)))
                 except ValueError:
@@ -90,7 +204,7 @@ def import_log(filename, parameters=None):
                 continue
 
             elif elem.tag.endswith(log_lib.util.xes.TAG_TRACE):
-                if len(log) >= max_no_traces_to_import:
+                if no_traces >= max_no_traces_to_import:
                     break
                 if trace is not None:
                     raise SyntaxError('file contains <trace> in another <trace> tag')
@@ -102,7 +216,8 @@ def import_log(filename, parameters=None):
                 if parent is not None:
                     try:
                         val = float(elem.get(log_lib.util.xes.KEY_VALUE))
-                        tree = __parse_attribute(elem, parent, elem.get(log_lib.util.xes.KEY_KEY), val, tree)
+                        tree = __parse_attribute(elem, parent, cache[elem.get(log_lib.util.xes.KEY_KEY)], val,
+                                                 tree)
                     except ValueError:
                         logging.info("failed to parse float: " + str(elem.get(log_lib.util.xes.KEY_VALUE)))
                 continue
@@ -111,7 +226,8 @@ def import_log(filename, parameters=None):
                 if parent is not None:
                     try:
                         val = int(elem.get(log_lib.util.xes.KEY_VALUE))
-                        tree = __parse_attribute(elem, parent, elem.get(log_lib.util.xes.KEY_KEY), val, tree)
+                        tree = __parse_attribute(elem, parent, cache[elem.get(log_lib.util.xes.KEY_KEY)], val,
+                                                 tree)
                     except ValueError:
                         logging.info("failed to parse int: " + str(elem.get(log_lib.util.xes.KEY_VALUE)))
                 continue
@@ -123,7 +239,8 @@ def import_log(filename, parameters=None):
                         val = False
                         if str(val0).lower() == "true":
                             val = True
-                        tree = __parse_attribute(elem, parent, elem.get(log_lib.util.xes.KEY_KEY), val, tree)
+                        tree = __parse_attribute(elem, parent, cache[elem.get(log_lib.util.xes.KEY_KEY)], val,
+                                                 tree)
                     except ValueError:
                         logging.info("failed to parse boolean: " + str(elem.get(log_lib.util.xes.KEY_VALUE)))
                 continue
@@ -141,7 +258,7 @@ def import_log(filename, parameters=None):
                 continue
 
             elif elem.tag.endswith(log_lib.util.xes.TAG_EXTENSION):
-                if log is None:
+                if not log_found:
                     raise SyntaxError('extension found outside of <log> tag')
                 if elem.get(log_lib.util.xes.KEY_NAME) is not None and elem.get(
                         log_lib.util.xes.KEY_PREFIX) is not None and elem.get(log_lib.util.xes.KEY_URI) is not None:
@@ -151,7 +268,7 @@ def import_log(filename, parameters=None):
                 continue
 
             elif elem.tag.endswith(log_lib.util.xes.TAG_GLOBAL):
-                if log is None:
+                if not log_found:
                     raise SyntaxError('global found outside of <log> tag')
                 if elem.get(log_lib.util.xes.KEY_SCOPE) is not None:
                     log.omni_present[elem.get(log_lib.util.xes.KEY_SCOPE)] = {}
@@ -159,7 +276,7 @@ def import_log(filename, parameters=None):
                 continue
 
             elif elem.tag.endswith(log_lib.util.xes.TAG_CLASSIFIER):
-                if log is None:
+                if not log_found:
                     raise SyntaxError('classifier found outside of <log> tag')
                 if elem.get(log_lib.util.xes.KEY_KEYS) is not None:
                     classifier_value = elem.get(log_lib.util.xes.KEY_KEYS)
@@ -171,9 +288,9 @@ def import_log(filename, parameters=None):
                 continue
 
             elif elem.tag.endswith(log_lib.util.xes.TAG_LOG):
-                if log is not None:
+                if log_found:
                     raise SyntaxError('file contains > 1 <log> tags')
-                log = log_lib.log.EventLog()
+                log_found = True
                 tree[elem] = log.attributes
                 continue
 
@@ -194,8 +311,10 @@ def import_log(filename, parameters=None):
                 continue
 
             elif elem.tag.endswith(log_lib.util.xes.TAG_TRACE):
-                log.append(trace)
+                completed_trace = trace
                 trace = None
+                no_traces = no_traces + 1
+                yield completed_trace
                 continue
 
             elif elem.tag.endswith(log_lib.util.xes.TAG_LOG):
@@ -203,13 +322,6 @@ def import_log(filename, parameters=None):
 
     del context
 
-    if timestamp_sort:
-        log = sorting.sort_timestamp(log, timestamp_key=timestamp_key, reverse_sort=reverse_sort)
-    if insert_trace_indexes:
-        log.insert_trace_index_as_event_attribute()
-
-    return log
-
 
 def __parse_attribute(elem, store, key, value, tree):
     if len(elem.getchildren()) == 0:
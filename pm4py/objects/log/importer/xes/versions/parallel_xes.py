@@ -0,0 +1,255 @@
+import io
+import multiprocessing
+import os
+
+from pm4py.objects import log as log_lib
+from pm4py.objects.log.importer.xes.versions import iterparse_xes
+from pm4py.objects.log.util import compression, index_attribute, sorting
+
+TRACE_START_TAG = b"<trace"
+LOG_END_TAG = b"</log"
+# characters that could follow the name of the tag in a <trace> opening tag
+TRACE_TAG_DELIMITERS = b" >\t\r\n/"
+READ_BLOCK_SIZE = 1048576
+DEFAULT_MIN_CHUNK_SIZE = 4 * 1048576
+
+
+def import_log(filename, parameters=None):
+    """
+    Imports an XES file into a log object, parsing it in parallel with a pool of processes.
+    The file is split into byte ranges on <trace> boundaries, each range is parsed (with the same attribute-typing
+    logic of the iterparse importer) by a different process, and the traces are merged in the order of the file.
+    The parsed traces are pickled back to this process, that unpickles them sequentially: this part does not scale
+    with the number of processes and limits the speedup (it took about a fifth of the time of the sequential
+    parsing in our measures, so the speedup is at most about 5x). The speedup on multiple cores has not been
+    measured; with a single CPU, use the iterparse importer
+
+    Parameters
+    ----------
+    filename:
+        Absolute filename
+    parameters
+        Parameters of the algorithm, including
+            timestamp_sort -> Specify if we should sort log by timestamp
+            timestamp_key -> If sort is enabled, then sort the log by using this key
+            reverse_sort -> Specify in which direction the log should be sorted
+            index_trace_indexes -> Specify if trace indexes should be added as event attribute for each event
+            max_no_traces_to_import -> Specify the maximum number of traces to import from the log
+            (read in order in the XML file; if specified, the file is parsed sequentially)
+            (compressed files are also parsed sequentially, as a stream)
+            max_no_workers -> Maximum number of processes to use (default: number of CPUs)
+            min_chunk_size -> Minimum size (in bytes) of the byte range parsed by a process
+
+    Returns
+    -------
+    log : :class:`pm4py.log.log.EventLog`
+        A log
+    """
+    if parameters is None:
+        parameters = {}
+
+    timestamp_sort = False
+    timestamp_key = "time:timestamp"
+    reverse_sort = False
+    insert_trace_indexes = False
+    max_no_workers = multiprocessing.cpu_count()
+    min_chunk_size = DEFAULT_MIN_CHUNK_SIZE
+
+    if "timestamp_sort" in parameters:
+        timestamp_sort = parameters["timestamp_sort"]
+    if "timestamp_key" in parameters:
+        timestamp_key = parameters["timestamp_key"]
+    if "reverse_sort" in parameters:
+        reverse_sort = parameters["reverse_sort"]
+    if "insert_trace_indexes" in parameters:
+        insert_trace_indexes = parameters["insert_trace_indexes"]
+    if "max_no_workers" in parameters:
+        max_no_workers = parameters["max_no_workers"]
+    if "min_chunk_size" in parameters:
+        min_chunk_size = parameters["min_chunk_size"]
+
+    if "max_no_traces_to_import" in parameters or compression.is_compressed(filename):
+        # compressed streams cannot be split in byte ranges
+        return iterparse_xes.import_log(filename, parameters=parameters)
+
+    boundaries = get_trace_boundaries(filename, max_no_workers, min_chunk_size)
+    if len(boundaries) < 3:
+        # the whole body fits in a single chunk
+        return iterparse_xes.import_log(filename, parameters=parameters)
+
+    header_size = boundaries[0]
+    log = log_lib.log.EventLog()
+    for trace in iterparse_xes.import_traces(io.BytesIO(get_chunk_bytes(filename, header_size, header_size,
+                                                                        header_size)), log=log):
+        log.append(trace)
+
+    chunks = [(filename, header_size, boundaries[i], boundaries[i + 1]) for i in range(len(boundaries) - 1)]
+    pool = multiprocessing.Pool(processes=min(max_no_workers, len(chunks)))
+    try:
+        for traces in pool.map(import_chunk, chunks):
+            for trace in traces:
+                log.append(trace)
+    finally:
+        pool.close()
+        pool.join()
+
+    if timestamp_sort:
+        log = sorting.sort_timestamp(log, timestamp_key=timestamp_key, reverse_sort=reverse_sort,
+                                     mode=sorting.SORT_INPLACE)
+    if insert_trace_indexes:
+        log = index_attribute.insert_trace_index_as_event_attribute(log)
+
+    return log
+
+
+def get_trace_boundaries(filename, no_chunks, min_chunk_size=DEFAULT_MIN_CHUNK_SIZE):
+    """
+    Splits the body of the XES file (that goes from the first <trace> tag to the closing </log> tag)
+    in byte ranges that start on a <trace> tag
+
+    Parameters
+    ------------
+    filename
+        XES file
+    no_chunks
+        Desired number of byte ranges
+    min_chunk_size
+        Minimum size of a byte range
+
+    Returns
+    ------------
+    boundaries
+        Sorted list of offsets: the first is the start of the body (i.e. the size of the header),
+        the last is the end of the body, the others are the starts of the byte ranges
+    """
+    file_size = os.stat(filename).st_size
+    with open(filename, "rb") as f:
+        body_start = find_trace_start(f, 0)
+        if body_start is None:
+            return []
+        body_end = find_log_end(f, file_size)
+        if body_end is None or body_end < body_start:
+            return []
+        no_chunks = max(1, min(no_chunks, (body_end - body_start) // max(min_chunk_size, 1)))
+        boundaries = [body_start]
+        for i in range(1, no_chunks):
+            target = body_start + i * (body_end - body_start) // no_chunks
+            if target <= boundaries[-1]:
+                continue
+            position = find_trace_start(f, target)
+            if position is None or position >= body_end:
+                break
+            if position > boundaries[-1]:
+                boundaries.append(position)
+        boundaries.append(body_end)
+    return boundaries
+
+
+def find_trace_start(f, offset):
+    """
+    Finds the first <trace> opening tag starting from the given offset
+
+    Parameters
+    ------------
+    f
+        File object (opened in binary mode)
+    offset
+        Offset from which the search starts
+
+    Returns
+    ------------
+    position
+        Offset of the tag (None if not found)
+    """
+    f.seek(offset)
+    # keeps the end of the previous block, in order to match tags spanning two blocks
+    carry = b""
+    carry_offset = offset
+    while True:
+        block = f.read(READ_BLOCK_SIZE)
+        if not block:
+            return None
+        data = carry + block
+        index = data.find(TRACE_START_TAG)
+        while index >= 0:
+            following = index + len(TRACE_START_TAG)
+            if following >= len(data):
+                break
+            if data[following] in TRACE_TAG_DELIMITERS:
+                return carry_offset + index
+            index = data.find(TRACE_START_TAG, index + 1)
+        carry = data[-len(TRACE_START_TAG):]
+        carry_offset = carry_offset + len(data) - len(carry)
+
+
+def find_log_end(f, file_size):
+    """
+    Finds the closing </log> tag, searching from the end of the file
+
+    Parameters
+    ------------
+    f
+        File object (opened in binary mode)
+    file_size
+        Size of the file
+
+    Returns
+    ------------
+    position
+        Offset of the tag (None if not found)
+    """
+    end = file_size
+    while end > 0:
+        start = max(0, end - READ_BLOCK_SIZE)
+        f.seek(start)
+        data = f.read(end - start + len(LOG_END_TAG))
+        index = data.rfind(LOG_END_TAG)
+        if index >= 0:
+            return start + index
+        end = start
+    return None
+
+
+def get_chunk_bytes(filename, header_size, start, end):
+    """
+    Gets a well-formed XES document containing the header of the file and the traces in the given byte range
+
+    Parameters
+    ------------
+    filename
+        XES file
+    header_size
+        Size of the header of the file (the part before the first <trace> tag)
+    start
+        Start of the byte range
+    end
+        End of the byte range
+
+    Returns
+    ------------
+    document
+        Bytes of the XES document
+    """
+    with open(filename, "rb") as f:
+        header = f.read(header_size)
+        f.seek(start)
+        chunk = f.read(end - start)
+    return header + chunk + LOG_END_TAG + b">"
+
+
+def import_chunk(chunk):
+    """
+    Parses the traces contained in a byte range of the XES file (executed by the processes of the pool)
+
+    Parameters
+    ------------
+    chunk
+        Tuple (filename, header_size, start, end)
+
+    Returns
+    ------------
+    traces
+        List of traces
+    """
+    filename, header_size, start, end = chunk
+    return list(iterparse_xes.import_traces(io.BytesIO(get_chunk_bytes(filename, header_size, start, end))))
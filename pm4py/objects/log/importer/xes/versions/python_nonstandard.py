@@ -1,8 +1,10 @@
-import ciso8601
 import os
 
+import ciso8601
+
 from pm4py.objects import log as log_lib
-from pm4py.objects.log.util import sorting
+from pm4py.objects.log.util import compression, sorting
+from pm4py.objects.log.util.value_cache import ValueCache, DEFAULT_MAX_SIZE
 
 
 def import_log(filename, parameters=None):
@@ -13,7 +15,7 @@ def import_log(filename, parameters=None):
     Parameters
     -----------
     filename
-        XES file to parse
+        XES file to parse (possibly compressed with gzip, bz2 or xz)
     parameters
         Parameters of the algorithm, including
             timestamp_sort -> Specify if we should sort log by timestamp
@@ -22,6 +24,10 @@ def import_log(filename, parameters=None):
             index_trace_indexes -> Specify if trace indexes should be added as event attribute for each event
             max_no_traces_to_import -> Specify the maximum number of traces to import from the log
             (read in order in the XML file)
+            max_bytes_to_read -> Specify the maximum number of bytes to read from the end of the file
+            (only for uncompressed files)
+            max_cached_values -> Maximum number of distinct keys and string values kept in the cache
+            used to share repeated values between events
 
     Returns
     -----------
@@ -38,6 +44,7 @@ def import_log(filename, parameters=None):
     max_no_traces_to_import = 1000000000
     skip_bytes = 0
     max_bytes_to_read = 100000000000
+    max_cached_values = DEFAULT_MAX_SIZE
 
     if "timestamp_sort" in parameters:
         timestamp_sort = parameters["timestamp_sort"]
@@ -51,18 +58,23 @@ def import_log(filename, parameters=None):
         max_no_traces_to_import = parameters["max_no_traces_to_import"]
     if "max_bytes_to_read" in parameters:
         max_bytes_to_read = parameters["max_bytes_to_read"]
+    if "max_cached_values" in parameters:
+        max_cached_values = parameters["max_cached_values"]
 
-    file_size = os.stat(filename).st_size
+    if not compression.is_compressed(filename):
+        file_size = os.stat(filename).st_size
 
-    if file_size > max_bytes_to_read:
-        skip_bytes = file_size - max_bytes_to_read
+        if file_size > max_bytes_to_read:
+            skip_bytes = file_size - max_bytes_to_read
 
     log = log_lib.log.EventLog()
     tracecount = 0
     trace = None
     event = None
+    # repeated keys and string values are shared between the events
+    cache = ValueCache(max_size=max_cached_values)
 
-    f = open(filename, "r")
+    f = compression.open_file(filename, "rt")
     f.seek(skip_bytes)
 
     for line in f:
@@ -72,32 +84,34 @@ def import_log(filename, parameters=None):
             if trace is not None:
                 if event is not None:
                     if len(content) == 5:
+                        key = cache[content[1]]
                         if tag.startswith("string"):
-                            event[content[1]] = content[3]
+                            event[key] = cache[content[3]]
                         elif tag.startswith("date"):
-                            event[content[1]] = ciso8601.parse_datetime(content[3])
+                            event[key] = ciso8601.parse_datetime(content[3])
                         elif tag.startswith("int"):
-                            event[content[1]] = int(content[3])
+                            event[key] = int(content[3])
                         elif tag.startswith("float"):
-                            event[content[1]] = float(content[3])
+                            event[key] = float(content[3])
                         else:
-                            event[content[1]] = content[3]
+                            event[key] = cache[content[3]]
                     elif tag.startswith("/event"):
                         trace.append(event)
                         event = None
                 elif tag.startswith("event"):
                     event = log_lib.log.Event()
                 elif len(content) == 5:
+                    key = cache[content[1]]
                     if tag.startswith("string"):
-                        trace.attributes[content[1]] = content[3]
+                        trace.attributes[key] = cache[content[3]]
                     elif tag.startswith("date"):
-                        trace.attributes[content[1]] = ciso8601.parse_datetime(content[3])
+                        trace.attributes[key] = ciso8601.parse_datetime(content[3])
                     elif tag.startswith("int"):
-                        trace.attributes[content[1]] = int(content[3])
+                        trace.attributes[key] = int(content[3])
                     elif tag.startswith("float"):
-                        trace.attributes[content[1]] = float(content[3])
+                        trace.attributes[key] = float(content[3])
                     else:
-                        trace.attributes[content[1]] = content[3]
+                        trace.attributes[key] = cache[content[3]]
                 elif tag.startswith("/trace"):
                     log.append(trace)
                     tracecount += 1
@@ -109,7 +123,8 @@ def import_log(filename, parameters=None):
     f.close()
 
     if timestamp_sort:
-        log = sorting.sort_timestamp(log, timestamp_key=timestamp_key, reverse_sort=reverse_sort)
+        log = sorting.sort_timestamp(log, timestamp_key=timestamp_key, reverse_sort=reverse_sort,
+                                     mode=sorting.SORT_INPLACE)
     if insert_trace_indexes:
         log.insert_trace_index_as_event_attribute()
 
@@ -20,6 +20,15 @@ class Event(Mapping):
     def __delitem__(self, key):
         del self._dict[key]
 
+    def keys(self):
+        return self._dict.keys()
+
+    def items(self):
+        return self._dict.items()
+
+    def values(self):
+        return self._dict.values()
+
     def __repr__(self):
         return str(dict(self))
 
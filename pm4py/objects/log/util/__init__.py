@@ -1,2 +1,3 @@
 from pm4py.objects.log.util import compression, general, insert_classifier, string_to_file, log, xes, sampling, \
-    sorting, index_attribute, get_class_representation, get_log_representation, get_prefixes
+    sorting, index_attribute, get_class_representation, get_log_representation, get_prefixes, value_cache, snapshot, \
+    parquet, variants_index, case_table, attributes_index
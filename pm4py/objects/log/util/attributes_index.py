@@ -0,0 +1,158 @@
+import numpy as np
+
+from pm4py.objects.log import columnar
+from pm4py.objects.log.util import variants_index
+
+# name of the attribute of the log object in which the attributes indexes (one per attribute key) are stored
+CACHE_ATTRIBUTE = "_attributes_indexes"
+# parameter of the attributes filters asking to use the attributes index (instead of scanning the events)
+PARAMETER_USE_INDEX = "use_attributes_index"
+
+
+class AttributesIndex(object):
+    """
+    Inverted index of an event attribute of a log: for each value, the (sorted) positions of the traces containing
+    it and the number of events having it. The traces containing any of a set of values are then obtained as a
+    boolean mask over the traces, without scanning the events
+    """
+
+    def __init__(self, attribute_key, traces, counts, trace_lengths, signature):
+        self.attribute_key = attribute_key
+        # value -> Numpy array of the positions of the traces (the values are in order of first appearance)
+        self.traces = traces
+        # value -> number of events
+        self.counts = counts
+        self.trace_lengths = trace_lengths
+        self.signature = signature
+
+    def get_counts(self):
+        """
+        Gets the number of events having each value
+        """
+        return dict(self.counts)
+
+    def get_traces_mask(self, values):
+        """
+        Gets the boolean mask of the traces containing at least an event with one of the given values
+
+        Parameters
+        -------------
+        values
+            Values of the attribute
+
+        Returns
+        -------------
+        mask
+            Numpy boolean array (one value per trace)
+        """
+        mask = np.zeros(len(self.trace_lengths), dtype=np.bool_)
+        for value in values:
+            if value in self.traces:
+                mask[self.traces[value]] = True
+        return mask
+
+
+def build_columnar_attributes_index(log, attribute_key, column):
+    """
+    Computes the attributes index of a columnar log on a string attribute, reading the codes of the values
+    """
+    trace_lengths = log.get_trace_lengths()
+    present = np.nonzero(column.codes >= 0)[0]
+    codes = column.codes[present]
+    trace_idxs = np.repeat(np.arange(len(trace_lengths), dtype=np.int64), trace_lengths)[present]
+    used_codes, first_rows, counts = np.unique(codes, return_index=True, return_counts=True)
+    # (code, trace) pairs, encoded in a single integer and sorted by code and then by trace
+    no_traces = max(len(trace_lengths), 1)
+    pairs = np.unique(codes.astype(np.int64) * no_traces + trace_idxs)
+    bounds = np.searchsorted(pairs // no_traces, used_codes, side="left").tolist() + [len(pairs)]
+    pair_traces = pairs % no_traces
+    traces = {}
+    counts_dict = {}
+    # the values are listed in order of first appearance, as in the other logs
+    for i in np.argsort(first_rows, kind="mergesort").tolist():
+        value = column.labels[int(used_codes[i])]
+        traces[value] = pair_traces[bounds[i]:bounds[i + 1]]
+        counts_dict[value] = int(counts[i])
+    return traces, counts_dict, trace_lengths
+
+
+def build_attributes_index(log, attribute_key):
+    """
+    Computes the attributes index of a log
+
+    Parameters
+    -------------
+    log
+        Event log
+    attribute_key
+        Event attribute
+
+    Returns
+    -------------
+    index
+        Attributes index
+    """
+    column = log.events_table.columns.get(attribute_key) if isinstance(log, columnar.ColumnarEventLog) else None
+    if isinstance(column, columnar.CategoricalColumn):
+        traces, counts, trace_lengths = build_columnar_attributes_index(log, attribute_key, column)
+    else:
+        trace_lists = {}
+        counts = {}
+        trace_lengths = np.zeros(len(log), dtype=np.int64)
+        for trace_idx, trace in enumerate(log):
+            trace_lengths[trace_idx] = len(trace)
+            for event in trace:
+                if attribute_key in event:
+                    value = event[attribute_key]
+                    if value not in counts:
+                        counts[value] = 0
+                        trace_lists[value] = []
+                    counts[value] = counts[value] + 1
+                    # the traces are visited in order: the last one is enough to avoid duplicates
+                    if not trace_lists[value] or trace_lists[value][-1] != trace_idx:
+                        trace_lists[value].append(trace_idx)
+        traces = {value: np.array(trace_list, dtype=np.int64) for value, trace_list in trace_lists.items()}
+    return AttributesIndex(attribute_key, traces, counts, trace_lengths, variants_index.get_signature(log))
+
+
+def get_attributes_index(log, attribute_key):
+    """
+    Gets the attributes index of a log for the given event attribute. The index is computed once and stored with
+    the log; it is computed again if traces or events have been added, removed, replaced or reordered since then
+    (see variants_index.get_signature). The in-place modification of the value of an event (e.g.
+    log[0][0]["concept:name"] = "A") is not detected: call invalidate after it
+
+    Parameters
+    -------------
+    log
+        Event log
+    attribute_key
+        Event attribute
+
+    Returns
+    -------------
+    index
+        Attributes index
+    """
+    indexes = getattr(log, CACHE_ATTRIBUTE, None)
+    if indexes is not None and attribute_key in indexes and variants_index.is_signature_valid(
+            log, indexes[attribute_key].signature):
+        return indexes[attribute_key]
+    index = build_attributes_index(log, attribute_key)
+    try:
+        if indexes is None:
+            indexes = {}
+            setattr(log, CACHE_ATTRIBUTE, indexes)
+        indexes[attribute_key] = index
+    except AttributeError:
+        # objects that do not accept new attributes (e.g. lists of traces) are not cached
+        pass
+    return index
+
+
+def invalidate(log):
+    """
+    Removes the attributes indexes stored with the log
+    """
+    if hasattr(log, CACHE_ATTRIBUTE):
+        delattr(log, CACHE_ATTRIBUTE)
@@ -0,0 +1,340 @@
+import numpy as np
+import pandas as pd
+
+from pm4py.objects.log import view as log_view
+from pm4py.objects.log.log import EventLog
+from pm4py.objects.log.util import variants_index
+from pm4py.objects.log.util import xes
+from pm4py.objects.log.util.general import CASE_ATTRIBUTE_GLUE
+from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY, PARAMETER_CONSTANT_CASEID_KEY
+from pm4py.util.constants import PARAMETER_CONSTANT_TIMESTAMP_KEY
+
+# name of the attribute of the dataframe (or log) object in which the case tables are stored
+CACHE_ATTRIBUTE = "_case_tables"
+# parameter asking to store the case table with the dataframe (or log), and to reuse the stored one
+PARAMETER_USE_CACHE = "use_case_table_cache"
+
+SIZE = "size"
+START_ACTIVITY = "start_activity"
+END_ACTIVITY = "end_activity"
+START_TIMESTAMP = "start_timestamp"
+END_TIMESTAMP = "end_timestamp"
+# duration of the case (in seconds)
+DURATION = "duration"
+
+
+class CaseTable(object):
+    """
+    Per-case measures of a dataframe or of a log: size, start and end activity, start and end timestamp and
+    duration of each case (the activity and the timestamp measures are present only if the corresponding
+    attribute is). For a dataframe, the table is indexed by the (sorted) case IDs, and each row of the dataframe
+    is associated to the number of its case; for a log, the table is indexed by the position of the trace
+    """
+
+    def __init__(self, keys, table, row_cases, signature, cached=False):
+        # (case ID, activity, timestamp) keys used to compute the table
+        self.keys = keys
+        self.table = table
+        # number of the case of each row of the dataframe (-1 for the rows without case ID); None for a log
+        self.row_cases = row_cases
+        self.signature = signature
+        # the table is stored with its dataframe (or log), and its restrictions with the filtered ones
+        self.cached = cached
+        # (dataframe) codes of the activities of the rows and rows grouped by case, computed when first requested
+        self.activity_codes = None
+        self.rows_by_case = None
+        # index of the time intervals of the cases (see interval_index), computed when first requested
+        self.interval_index = None
+
+    def filter(self, data, case_mask, view=False):
+        """
+        Keeps only the cases of the dataframe (or the traces of the log) selected by the given mask.
+        If this table is cached, the restriction of this table is stored with the result
+
+        Parameters
+        -------------
+        data
+            Dataframe or log from which the table has been computed
+        case_mask
+            Boolean mask (one value per row of the table)
+        view
+            (For a log) returns a view on the log (see pm4py.objects.log.view)
+
+        Returns
+        -------------
+        filtered_data
+            Filtered dataframe (or log)
+        """
+        case_mask = np.asarray(case_mask, dtype=np.bool_)
+        if self.row_cases is None:
+            if view:
+                filtered_data = log_view.get_view(data, np.nonzero(case_mask)[0])
+            else:
+                filtered_data = EventLog([data[i] for i in np.nonzero(case_mask)[0].tolist()])
+        else:
+            # the rows without case ID (number -1) take the last value, that is False
+            row_mask = np.append(case_mask, False)[self.row_cases]
+            filtered_data = data[row_mask]
+        if not self.cached:
+            return filtered_data
+        table = self.table[case_mask]
+        if self.row_cases is None:
+            table = table.reset_index(drop=True)
+            row_cases = None
+        else:
+            row_cases = (np.cumsum(case_mask) - 1)[self.row_cases[row_mask]]
+        case_table = CaseTable(self.keys, table, row_cases, get_signature(filtered_data, self.keys), cached=True)
+        if self.activity_codes is not None and row_cases is not None:
+            # the activities keep their codes in the filtered dataframe
+            case_table.activity_codes = self.activity_codes[0][row_mask], self.activity_codes[1]
+        store(filtered_data, case_table)
+        return filtered_data
+
+    def get_activity_codes(self, df):
+        """
+        Gets the integer codes of the activities of the rows of the dataframe (computed once, and kept by the
+        tables of the dataframes filtered by cases)
+
+        Parameters
+        -------------
+        df
+            Dataframe from which the table has been computed
+
+        Returns
+        -------------
+        activity_codes
+            Numpy array of the code of the activity of each row (-1 for the rows without activity)
+        activities
+            Index of the activities (the code of an activity is its position)
+        """
+        if self.activity_codes is None:
+            self.activity_codes = pd.factorize(df[self.keys[1]])
+        return self.activity_codes
+
+    def get_values_mask(self, df, values):
+        """
+        Gets the boolean mask of the rows of the dataframe whose activity is among the given values, looking up
+        the codes of the activities (the values are compared once per distinct activity)
+        """
+        activity_codes, activities = self.get_activity_codes(df)
+        values_mask = np.append(activities.isin(list(values)), False)
+        return values_mask[activity_codes]
+
+    def get_cases_mask(self, row_mask):
+        """
+        Gets the boolean mask of the cases having at least a row selected by the given row mask
+        """
+        return np.bincount(self.row_cases[row_mask & (self.row_cases >= 0)], minlength=len(self.table)) > 0
+
+    def get_rows_by_case(self):
+        """
+        Gets the positions of the rows having a case ID, grouped by case (with a stable sort, so the rows of a
+        case keep their order in the dataframe)
+        """
+        if self.rows_by_case is None:
+            rows = np.nonzero(self.row_cases >= 0)[0]
+            self.rows_by_case = rows[np.argsort(self.row_cases[rows], kind="mergesort")]
+        return self.rows_by_case
+
+
+def get_keys(data, parameters):
+    """
+    Gets the (case ID, activity, timestamp) keys from the parameters (the case ID is None for a log)
+    """
+    activity_key = parameters[
+        PARAMETER_CONSTANT_ACTIVITY_KEY] if PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else xes.DEFAULT_NAME_KEY
+    timestamp_key = parameters[
+        PARAMETER_CONSTANT_TIMESTAMP_KEY] if PARAMETER_CONSTANT_TIMESTAMP_KEY in parameters else \
+        xes.DEFAULT_TIMESTAMP_KEY
+    if isinstance(data, pd.DataFrame):
+        case_id_glue = parameters[
+            PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_ATTRIBUTE_GLUE
+        return case_id_glue, activity_key, timestamp_key
+    return None, activity_key, timestamp_key
+
+
+def get_column_values(df, key):
+    """
+    Gets the values backing a column of the dataframe (None if the column is not there)
+    """
+    return df[key].values if key in df.columns else None
+
+
+def is_same_column(values, other_values):
+    """
+    Checks if two values of get_column_values come from the same column: the series (and, since the copy-on-write
+    of Pandas, also the arrays) returned for a column are new objects at each access, so the arrays are compared on
+    the memory they point to (that cannot be reused, since the signature keeps a reference to it)
+    """
+    if values is None or other_values is None:
+        return values is other_values
+    if isinstance(values, np.ndarray) and isinstance(other_values, np.ndarray):
+        return values.__array_interface__["data"][0] == other_values.__array_interface__["data"][0] and \
+               values.shape == other_values.shape and values.dtype == other_values.dtype
+    return values is other_values
+
+
+def get_signature(data, keys):
+    """
+    Gets what identifies the current content of a dataframe (its length, its index and the values of the
+    columns of the keys, that are replaced when the columns are assigned) or of a log (see variants_index)
+    """
+    if isinstance(data, pd.DataFrame):
+        return len(data), data.index, tuple(get_column_values(data, key) for key in keys)
+    return variants_index.get_signature(data)
+
+
+def is_signature_valid(data, keys, signature):
+    if isinstance(data, pd.DataFrame):
+        length, index, columns = signature
+        if len(data) != length or data.index is not index:
+            return False
+        return all(is_same_column(get_column_values(data, key), column) for key, column in zip(keys, columns))
+    return variants_index.is_signature_valid(data, signature)
+
+
+def build_dataframe_case_table(df, keys):
+    """
+    Computes the case table of a dataframe: the events are grouped by case with a single stable sort, and
+    the measures are taken from the first and the last event of each case
+    """
+    case_id_glue, activity_key, timestamp_key = keys
+    case_codes, cases = pd.factorize(df[case_id_glue], sort=True)
+    no_cases = len(cases)
+    present = case_codes >= 0
+
+    rows = np.nonzero(present)[0]
+    order = rows[np.argsort(case_codes[present], kind="mergesort")]
+    sizes = np.bincount(case_codes[present], minlength=no_cases)
+    ends = np.cumsum(sizes)
+    first_rows = order[ends - sizes]
+    last_rows = order[ends - 1]
+
+    index = pd.Index(cases, name=case_id_glue)
+    columns = {SIZE: sizes}
+    if activity_key in df.columns:
+        activities = df[activity_key]
+        columns[START_ACTIVITY] = activities.take(first_rows).values
+        columns[END_ACTIVITY] = activities.take(last_rows).values
+    if timestamp_key in df.columns:
+        timestamps = df[timestamp_key]
+        start_timestamps = timestamps.take(first_rows).reset_index(drop=True)
+        end_timestamps = timestamps.take(last_rows).reset_index(drop=True)
+        # .array keeps the timezone of the timestamps
+        columns[START_TIMESTAMP] = start_timestamps.array
+        columns[END_TIMESTAMP] = end_timestamps.array
+        if pd.api.types.is_datetime64_any_dtype(timestamps):
+            columns[DURATION] = ((end_timestamps - start_timestamps) / pd.Timedelta(seconds=1)).values
+        elif timestamps.dtype == object:
+            # e.g. timestamps with different UTC offsets, that Pandas keeps as objects
+            try:
+                columns[DURATION] = ((pd.to_datetime(end_timestamps, utc=True) - pd.to_datetime(
+                    start_timestamps, utc=True)) / pd.Timedelta(seconds=1)).values
+            except (TypeError, ValueError):
+                pass
+    table = pd.DataFrame(columns, index=index)
+
+    return CaseTable(keys, table, case_codes, get_signature(df, keys))
+
+
+def build_log_case_table(log, keys):
+    """
+    Computes the case table of a log, in a single pass over the traces
+    """
+    case_id_glue, activity_key, timestamp_key = keys
+    sizes = []
+    start_activities = []
+    end_activities = []
+    start_timestamps = []
+    end_timestamps = []
+    durations = []
+    for trace in log:
+        sizes.append(len(trace))
+        first = trace[0] if trace else {}
+        last = trace[-1] if trace else {}
+        start_activities.append(first[activity_key] if activity_key in first else None)
+        end_activities.append(last[activity_key] if activity_key in last else None)
+        start_timestamp = first[timestamp_key] if timestamp_key in first else None
+        end_timestamp = last[timestamp_key] if timestamp_key in last else None
+        start_timestamps.append(start_timestamp)
+        end_timestamps.append(end_timestamp)
+        durations.append((end_timestamp - start_timestamp).total_seconds() if start_timestamp is not None and
+                         end_timestamp is not None else np.nan)
+
+    # the activities and the timestamps are kept as they are in the log
+    table = pd.DataFrame({SIZE: np.array(sizes, dtype=np.int64),
+                          START_ACTIVITY: pd.Series(start_activities, dtype=object),
+                          END_ACTIVITY: pd.Series(end_activities, dtype=object),
+                          START_TIMESTAMP: pd.Series(start_timestamps, dtype=object),
+                          END_TIMESTAMP: pd.Series(end_timestamps, dtype=object),
+                          DURATION: np.array(durations, dtype=np.float64)})
+
+    return CaseTable(keys, table, None, get_signature(log, keys))
+
+
+def store(data, case_table):
+    """
+    Stores the case table with the dataframe (or log)
+    """
+    indexes = getattr(data, CACHE_ATTRIBUTE, None)
+    try:
+        if indexes is None:
+            indexes = {}
+            # bypasses the attribute handling of the dataframes, that would try to create a column
+            object.__setattr__(data, CACHE_ATTRIBUTE, indexes)
+        indexes[case_table.keys] = case_table
+    except AttributeError:
+        # objects that do not accept new attributes (e.g. lists of traces) are not cached
+        pass
+
+
+def get_case_table(data, parameters=None):
+    """
+    Gets the case table of a dataframe or of a log. By default, the table is computed at each call.
+    With use_case_table_cache, the table is computed once and stored with the dataframe (or log), so that the
+    statistics and the filters applied on the same object share it, and the filters keeping whole cases pass its
+    restriction to their result. A stored table is computed again if the object has been changed since then
+    (see get_signature); the in-place modification of the values is not detected: call invalidate after it
+
+    Parameters
+    -------------
+    data
+        Dataframe or log
+    parameters
+        Parameters of the algorithm, including:
+            case_id_glue -> Column that contains the Case ID (dataframe)
+            activity_key -> Attribute that contains the activity
+            timestamp_key -> Attribute that contains the timestamp
+            use_case_table_cache -> Stores the table with the dataframe (or log), and reuses the stored one
+            (default: False)
+
+    Returns
+    -------------
+    case_table
+        Case table
+    """
+    if parameters is None:
+        parameters = {}
+
+    keys = get_keys(data, parameters)
+    use_cache = parameters[PARAMETER_USE_CACHE] if PARAMETER_USE_CACHE in parameters else False
+    if use_cache:
+        indexes = getattr(data, CACHE_ATTRIBUTE, None)
+        if indexes is not None and keys in indexes and is_signature_valid(data, keys, indexes[keys].signature):
+            return indexes[keys]
+    if isinstance(data, pd.DataFrame):
+        case_table = build_dataframe_case_table(data, keys)
+    else:
+        case_table = build_log_case_table(data, keys)
+    if use_cache:
+        case_table.cached = True
+        store(data, case_table)
+    return case_table
+
+
+def invalidate(data):
+    """
+    Removes the case tables stored with the dataframe (or log)
+    """
+    if getattr(data, CACHE_ATTRIBUTE, None) is not None:
+        object.__delattr__(data, CACHE_ATTRIBUTE)
@@ -1,8 +1,79 @@
+import bz2
 import gzip
+import lzma
 import os
 import shutil
 import tempfile
 
+# modules providing the file-like (de)compression streams, indexed by the extension of the file
+COMPRESSION_MODULES = {"gz": gzip, "bz2": bz2, "xz": lzma}
+
+
+def get_compression_extension(path):
+    """
+    Gets the extension of the compression format of the given file
+
+    Parameters
+    -----------
+    path
+        File path
+
+    Returns
+    -----------
+    extension
+        Extension of the compression format (gz, bz2, xz); None if the file is not compressed
+    """
+    if not isinstance(path, str):
+        return None
+    extension = path.split(".")[-1].lower()
+    if extension in COMPRESSION_MODULES:
+        return extension
+    return None
+
+
+def is_compressed(path):
+    """
+    Checks if the given file is compressed (gzip, bz2 or xz), according to its extension
+
+    Parameters
+    -----------
+    path
+        File path
+
+    Returns
+    -----------
+    boolean
+        Boolean value
+    """
+    return get_compression_extension(path) is not None
+
+
+def open_file(path, mode="rb", encoding=None, newline=None):
+    """
+    Opens a file, (de)compressing it on the fly if it has the extension of a compression format,
+    so no temporary file is written on the disk
+
+    Parameters
+    -----------
+    path
+        File path
+    mode
+        Mode in which the file is opened (rb, wb, rt, wt)
+    encoding
+        (Text mode) Encoding of the file
+    newline
+        (Text mode) Handling of the line endings, as in the built-in open
+
+    Returns
+    -----------
+    file
+        File object
+    """
+    extension = get_compression_extension(path)
+    if extension is None:
+        return open(path, mode, encoding=encoding, newline=newline)
+    return COMPRESSION_MODULES[extension].open(path, mode, encoding=encoding, newline=newline)
+
 
 def compress(file):
     """
@@ -1,3 +1,7 @@
+from pm4py.objects.log.util import attributes_index
+from pm4py.objects.log.util import variants_index
+
+
 def search_act_class_attr(log, force_activity_transition_insertion=False):
     """
     Search among classifiers expressed in the log one that is good for the process model extraction
@@ -57,6 +61,10 @@ def insert_activity_classifier_attribute(log, classifier, force_activity_transit
                 for event in trace:
                     classifier_value = event["concept:name"] + "+" + event["lifecycle:transition"]
                     event[classifier_attr_key] = classifier_value
+    if classifier_attr_key is not None:
+        # the values of the classifier attribute have been replaced in place
+        variants_index.invalidate(log)
+        attributes_index.invalidate(log)
     return log, classifier_attr_key
 
 
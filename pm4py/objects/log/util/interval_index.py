@@ -0,0 +1,319 @@
+import numpy as np
+import pandas as pd
+
+from pm4py.objects.log.util import case_table
+from pm4py.objects.log.util import xes
+from pm4py.util.constants import PARAMETER_CONSTANT_TIMESTAMP_KEY
+
+# name of the attribute of the dataframe (or log) object in which the indexes of the event times are stored
+CACHE_ATTRIBUTE = "_events_time_indexes"
+# parameter asking to store the index of the event times with the dataframe (or log), and to reuse the stored one
+PARAMETER_USE_CACHE = "use_events_index_cache"
+# maximum number of intervals in a leaf of the interval tree
+LEAF_SIZE = 64
+# value of the missing timestamps (NaT) in the arrays of nanoseconds
+MISSING = np.iinfo(np.int64).min
+
+
+def get_nanoseconds(values, data):
+    """
+    Gets the timestamps as nanoseconds: for a dataframe, the instants in UTC (timestamps without timezone are
+    considered in UTC); for a log, the wall-clock time (the timezone is ignored, as in the log filters)
+
+    Parameters
+    -------------
+    values
+        Iterable of timestamps (the missing ones as None or NaT)
+    data
+        Dataframe or log that contains the timestamps
+
+    Returns
+    -------------
+    nanoseconds
+        Numpy array of nanoseconds (MISSING for the missing timestamps)
+    """
+    if isinstance(data, pd.DataFrame):
+        timestamps = pd.to_datetime(pd.Series(values), utc=True)
+    else:
+        timestamps = pd.to_datetime(pd.Series([x.replace(tzinfo=None) if x is not None else None for x in values],
+                                              dtype=object))
+    return timestamps.values.astype("datetime64[ns]").astype(np.int64)
+
+
+def get_bound(dt):
+    """
+    Gets a bound of a time interval (datetime) as nanoseconds: the timezone of the bound is ignored (for a
+    dataframe, the bound is considered in UTC, as in the timestamp filters)
+    """
+    return pd.Timestamp(dt.replace(tzinfo=None)).value
+
+
+class IntervalTree(object):
+    """
+    Centered interval tree on closed intervals [start, end] (start <= end), answering stabbing queries
+    (the intervals containing an instant) in O(log n + k). Each node keeps the intervals containing its center,
+    sorted by start and by end; the intervals ending before the center go to the left subtree, the ones starting
+    after it to the right subtree. The center is the median of the endpoints, so each subtree contains at most
+    half of the intervals
+    """
+
+    def __init__(self, starts, ends, positions):
+        # each node is a tuple (center, positions by start, starts, positions by decreasing end, ends, left, right);
+        # each leaf is a tuple (None, positions, starts, ends)
+        self.nodes = []
+        self.root = self.build(starts, ends, positions)
+
+    def build(self, starts, ends, positions):
+        if len(positions) <= LEAF_SIZE:
+            self.nodes.append((None, positions, starts, ends))
+            return len(self.nodes) - 1
+        endpoints = np.concatenate([starts, ends])
+        center = np.partition(endpoints, len(starts))[len(starts)]
+        left = ends < center
+        right = starts > center
+        middle = ~(left | right)
+        by_start = np.argsort(starts[middle], kind="mergesort")
+        by_end = np.argsort(-ends[middle], kind="mergesort")
+        middle_positions = positions[middle]
+        left_node = self.build(starts[left], ends[left], positions[left]) if left.any() else None
+        right_node = self.build(starts[right], ends[right], positions[right]) if right.any() else None
+        self.nodes.append((center, middle_positions[by_start], starts[middle][by_start], middle_positions[by_end],
+                           ends[middle][by_end], left_node, right_node))
+        return len(self.nodes) - 1
+
+    def stab(self, instant):
+        """
+        Gets the positions of the intervals containing the given instant (start <= instant <= end)
+        """
+        found = []
+        node = self.root
+        while node is not None:
+            current = self.nodes[node]
+            if current[0] is None:
+                found.append(current[1][(current[2] <= instant) & (current[3] >= instant)])
+                break
+            center, positions_by_start, starts, positions_by_end, ends, left_node, right_node = current
+            if instant < center:
+                found.append(positions_by_start[:np.searchsorted(starts, instant, side="right")])
+                node = left_node
+            elif instant > center:
+                found.append(positions_by_end[:np.searchsorted(-ends, -instant, side="right")])
+                node = right_node
+            else:
+                found.append(positions_by_start)
+                break
+        return np.concatenate(found) if found else np.zeros(0, dtype=np.int64)
+
+
+class CasesTimeIndex(object):
+    """
+    Index of the time intervals (first and last timestamp) of the cases of a dataframe or of a log: the cases
+    sorted by their start and by their end, and an interval tree on the intervals. The cases without timestamps
+    are never returned
+    """
+
+    def __init__(self, starts, ends):
+        # start and end of each case, in nanoseconds
+        self.starts = starts
+        self.ends = ends
+        self.valid = (starts != MISSING) & (ends != MISSING)
+        # the queries on the sorted arrays assume that each case ends after it starts
+        self.ordered = bool((starts[self.valid] <= ends[self.valid]).all())
+        positions = np.nonzero(self.valid)[0]
+        self.by_start = positions[np.argsort(starts[positions], kind="mergesort")]
+        self.sorted_starts = starts[self.by_start]
+        self.by_end = positions[np.argsort(ends[positions], kind="mergesort")]
+        self.sorted_ends = ends[self.by_end]
+        self.tree = IntervalTree(starts[positions], ends[positions], positions) if self.ordered else None
+
+    def get_contained(self, t1, t2):
+        """
+        Gets the (sorted) positions of the cases contained in the interval: t1 < start and end < t2.
+        The cases starting, or ending, in the interval are taken from the sorted arrays (the smallest set of the
+        two), so the query costs O(log n + m), where m is the number of these cases
+
+        Parameters
+        -------------
+        t1
+            Lower bound of the interval (nanoseconds)
+        t2
+            Upper bound of the interval (nanoseconds)
+
+        Returns
+        -------------
+        positions
+            Numpy array of the positions of the cases
+        """
+        if not self.ordered:
+            return np.nonzero(self.valid & (self.starts > t1) & (self.ends < t2))[0]
+        start_from = np.searchsorted(self.sorted_starts, t1, side="right")
+        start_to = np.searchsorted(self.sorted_starts, t2, side="left")
+        end_from = np.searchsorted(self.sorted_ends, t1, side="right")
+        end_to = np.searchsorted(self.sorted_ends, t2, side="left")
+        if start_to - start_from <= end_to - end_from:
+            candidates = self.by_start[start_from:start_to]
+            candidates = candidates[self.ends[candidates] < t2]
+        else:
+            candidates = self.by_end[end_from:end_to]
+            candidates = candidates[self.starts[candidates] > t1]
+        return np.sort(candidates)
+
+    def get_intersecting(self, t1, t2):
+        """
+        Gets the (sorted) positions of the cases intersecting the interval: start < t2 and end > t1. These are the
+        cases starting inside the interval (a slice of the sorted starts) and the cases running at t1 (a stabbing
+        query on the interval tree), so the query costs O(log n + k). If the bounds are inverted (t1 >= t2), the
+        cases running at t1 or at t2 are returned
+
+        Parameters
+        -------------
+        t1
+            Lower bound of the interval (nanoseconds)
+        t2
+            Upper bound of the interval (nanoseconds)
+
+        Returns
+        -------------
+        positions
+            Numpy array of the positions of the cases
+        """
+        if t1 >= t2:
+            return np.nonzero(self.valid & (((self.starts < t1) & (self.ends > t1)) | (
+                    (self.starts < t2) & (self.ends > t2))))[0]
+        if not self.ordered:
+            return np.nonzero(self.valid & (self.starts < t2) & (self.ends > t1))[0]
+        starting = self.by_start[np.searchsorted(self.sorted_starts, t1, side="right"):np.searchsorted(
+            self.sorted_starts, t2, side="left")]
+        running = self.tree.stab(t1)
+        running = running[self.ends[running] > t1]
+        return np.sort(np.concatenate([starting, running]))
+
+
+class EventsTimeIndex(object):
+    """
+    Index of the timestamps of the events of a dataframe (rows) or of a log (events in the order of the traces):
+    the positions of the events sorted by timestamp. The events without timestamp are never returned
+    """
+
+    def __init__(self, times, trace_offsets, signature):
+        positions = np.nonzero(times != MISSING)[0]
+        self.by_time = positions[np.argsort(times[positions], kind="mergesort")]
+        self.sorted_times = times[self.by_time]
+        # (log) position of the first event of each trace, and number of events; None for a dataframe
+        self.trace_offsets = trace_offsets
+        self.signature = signature
+
+    def get_events(self, t1, t2):
+        """
+        Gets the (sorted) positions of the events in the interval (t1 < timestamp < t2), in O(log n + k log k)
+
+        Parameters
+        -------------
+        t1
+            Lower bound of the interval (nanoseconds)
+        t2
+            Upper bound of the interval (nanoseconds)
+
+        Returns
+        -------------
+        positions
+            Numpy array of the positions of the events
+        """
+        return np.sort(self.by_time[np.searchsorted(self.sorted_times, t1, side="right"):np.searchsorted(
+            self.sorted_times, t2, side="left")])
+
+
+def get_cases_index(data, parameters=None):
+    """
+    Gets the index of the time intervals of the cases of a dataframe or of a log, along with the case table on
+    which it is built. The index is kept with the case table, so it is computed once when the case table is
+    cached (see case_table.get_case_table)
+
+    Parameters
+    -------------
+    data
+        Dataframe or log
+    parameters
+        Parameters of the algorithm, including:
+            case_id_glue -> Column that contains the Case ID (dataframe)
+            timestamp_key -> Attribute that contains the timestamp
+            use_case_table_cache -> Stores the case table (and the index) with the dataframe (or log), and reuses
+            the stored one
+
+    Returns
+    -------------
+    table
+        Case table
+    index
+        Index of the time intervals of the cases (the position of a case is its row in the table)
+    """
+    table = case_table.get_case_table(data, parameters=parameters)
+    if table.interval_index is None:
+        table.interval_index = CasesTimeIndex(get_nanoseconds(table.table[case_table.START_TIMESTAMP], data),
+                                              get_nanoseconds(table.table[case_table.END_TIMESTAMP], data))
+    return table, table.interval_index
+
+
+def get_events_index(data, parameters=None):
+    """
+    Gets the index of the timestamps of the events of a dataframe or of a log. By default, the index is computed at
+    each call. With use_events_index_cache, it is computed once and stored with the dataframe (or log); it is
+    computed again if the object has been changed since then (see case_table.get_signature), but the in-place
+    modification of the timestamps is not detected: call invalidate after it
+
+    Parameters
+    -------------
+    data
+        Dataframe or log
+    parameters
+        Parameters of the algorithm, including:
+            timestamp_key -> Attribute that contains the timestamp
+            use_events_index_cache -> Stores the index with the dataframe (or log), and reuses the stored one
+            (default: False)
+
+    Returns
+    -------------
+    index
+        Index of the timestamps of the events
+    """
+    if parameters is None:
+        parameters = {}
+
+    timestamp_key = parameters[
+        PARAMETER_CONSTANT_TIMESTAMP_KEY] if PARAMETER_CONSTANT_TIMESTAMP_KEY in parameters else \
+        xes.DEFAULT_TIMESTAMP_KEY
+    use_cache = parameters[PARAMETER_USE_CACHE] if PARAMETER_USE_CACHE in parameters else False
+    keys = (timestamp_key,)
+    indexes = getattr(data, CACHE_ATTRIBUTE, None)
+    if use_cache and indexes is not None and timestamp_key in indexes and case_table.is_signature_valid(
+            data, keys, indexes[timestamp_key].signature):
+        return indexes[timestamp_key]
+    if isinstance(data, pd.DataFrame):
+        times = get_nanoseconds(data[timestamp_key], data)
+        trace_offsets = None
+    else:
+        times = get_nanoseconds([event[timestamp_key] if timestamp_key in event else None for trace in data
+                                 for event in trace], data)
+        trace_offsets = np.zeros(len(data) + 1, dtype=np.int64)
+        trace_offsets[1:] = np.cumsum([len(trace) for trace in data])
+    index = EventsTimeIndex(times, trace_offsets, case_table.get_signature(data, keys))
+    if not use_cache:
+        return index
+    try:
+        if indexes is None:
+            indexes = {}
+            # bypasses the attribute handling of the dataframes, that would try to create a column
+            object.__setattr__(data, CACHE_ATTRIBUTE, indexes)
+        indexes[timestamp_key] = index
+    except AttributeError:
+        # objects that do not accept new attributes (e.g. lists of traces) are not cached
+        pass
+    return index
+
+
+def invalidate(data):
+    """
+    Removes the indexes of the event times stored with the dataframe (or log)
+    """
+    if getattr(data, CACHE_ATTRIBUTE, None) is not None:
+        object.__delattr__(data, CACHE_ATTRIBUTE)
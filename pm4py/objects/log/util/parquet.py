@@ -0,0 +1,87 @@
+import pandas as pd
+
+# key of the schema metadata telling that the column names are stored as they are
+# (older versions replaced ':' by 'AAA' in the column names)
+META_PLAIN_COLUMNS = b"pm4py:plain_columns"
+# key of the schema metadata storing the number of case buckets of a partitioned dataset
+META_CASE_BUCKETS = b"pm4py:case_buckets"
+
+# separator used by the older versions instead of ':' in the column names
+LEGACY_SEPARATOR = "AAA"
+
+# partition columns derived from the log when exporting a partitioned dataset
+MONTH_COLUMN = "@@month"
+CASE_BUCKET_COLUMN = "@@case_bucket"
+
+MONTH_FORMAT = "%Y-%m"
+
+
+def get_column_names_mapping(schema):
+    """
+    Gets the mapping between the column names of the log and the names of the fields of a Parquet schema
+
+    Parameters
+    ------------
+    schema
+        Arrow schema
+
+    Returns
+    ------------
+    mapping
+        Dictionary associating to each column name of the log the name of the field
+    """
+    if schema.metadata is not None and META_PLAIN_COLUMNS in schema.metadata:
+        return {name: name for name in schema.names}
+    return {name.replace(LEGACY_SEPARATOR, ":"): name for name in schema.names}
+
+
+def to_utc_naive(timestamps):
+    """
+    Converts a series of timestamps (or a single timestamp) to UTC naive timestamps (naive ones are kept as they are)
+    """
+    if isinstance(timestamps, pd.Series):
+        if timestamps.dt.tz is not None:
+            return timestamps.dt.tz_convert("UTC").dt.tz_localize(None)
+        return timestamps
+    timestamps = pd.Timestamp(timestamps)
+    if timestamps.tz is not None:
+        return timestamps.tz_convert("UTC").tz_localize(None)
+    return timestamps
+
+
+def get_months(timestamps):
+    """
+    Gets the month partition values (YYYY-MM, in UTC) of a series of timestamps
+    """
+    return to_utc_naive(pd.to_datetime(timestamps)).dt.strftime(MONTH_FORMAT)
+
+
+def get_months_range(min_timestamp, max_timestamp):
+    """
+    Gets the month partition values (YYYY-MM, in UTC) bounding a range of timestamps (None for an open bound)
+    """
+    min_month = to_utc_naive(min_timestamp).strftime(MONTH_FORMAT) if min_timestamp is not None else None
+    max_month = to_utc_naive(max_timestamp).strftime(MONTH_FORMAT) if max_timestamp is not None else None
+    return min_month, max_month
+
+
+def get_case_buckets(case_ids, no_buckets):
+    """
+    Gets the case bucket partition values of a collection of case IDs.
+    The hash is computed on the string representation of the case ID, so it is stable across processes
+    and does not depend on the type of the column
+
+    Parameters
+    ------------
+    case_ids
+        Case IDs
+    no_buckets
+        Number of buckets
+
+    Returns
+    ------------
+    buckets
+        Numpy array of buckets
+    """
+    case_ids = pd.Series(list(case_ids), dtype=object).astype(str)
+    return (pd.util.hash_pandas_object(case_ids, index=False).values % no_buckets).astype("int64")
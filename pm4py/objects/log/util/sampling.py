@@ -1,7 +1,14 @@
+import math
 import random
+from collections import Counter
 from copy import copy
 
+from scipy.stats import norm
+
 from pm4py.objects.log.log import EventStream, EventLog
+from pm4py.objects.log.util import variants_index
+from pm4py.objects.log.util.xes import DEFAULT_NAME_KEY
+from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY
 
 
 def sample_stream(event_log, no_events=100):
@@ -75,7 +82,173 @@ def sample(log, n=100):
         Filtered log
     """
 
-    if type(log) is EventLog:
+    if isinstance(log, EventLog):
         return sample_log(log, no_traces=n)
 
     return sample_stream(log, no_events=n)
+
+
+def get_trace_dfg(activities):
+    """
+    Gets the number of occurrences of each couple of directly-following activities in a sequence of activities
+    """
+    return Counter(zip(activities[:-1], activities[1:]))
+
+
+def get_uniform_dfg_bounds(sampled_log, population_size, activity_key=DEFAULT_NAME_KEY, confidence=0.95):
+    """
+    Estimates the frequency of the DFG edges in the whole log from a uniform sample of its traces, along
+    with the half-width of the (normal approximation) confidence interval of the estimate, including the
+    correction for sampling without replacement from a finite log
+
+    Parameters
+    -----------
+    sampled_log
+        Uniform sample of the traces of the log
+    population_size
+        Number of traces of the log
+    activity_key
+        Attribute identifying the activity
+    confidence
+        Confidence level of the intervals
+
+    Returns
+    -----------
+    dfg_bounds
+        Dictionary that associates each couple of activities seen in the sample to its
+        (estimated frequency, half-width of the interval)
+    """
+    no_sampled = len(sampled_log)
+    if not no_sampled:
+        return {}
+    traces_dfgs = [get_trace_dfg([event[activity_key] for event in trace]) for trace in sampled_log]
+    couples = set()
+    for trace_dfg in traces_dfgs:
+        couples.update(trace_dfg)
+    z = float(norm.ppf(0.5 + confidence / 2.0))
+    correction = math.sqrt((population_size - no_sampled) / (population_size - 1)) if population_size > 1 else 0.0
+    dfg_bounds = {}
+    for couple in couples:
+        values = [trace_dfg[couple] for trace_dfg in traces_dfgs]
+        mean = sum(values) / no_sampled
+        variance = sum((value - mean) ** 2 for value in values) / (no_sampled - 1) if no_sampled > 1 else 0.0
+        dfg_bounds[couple] = (population_size * mean,
+                              z * population_size * math.sqrt(variance / no_sampled) * correction)
+    return dfg_bounds
+
+
+def reservoir_sample_log(traces, no_traces=100, parameters=None, log=None):
+    """
+    Samples uniformly a fixed number of traces from an iterable of traces (e.g. the generator returned by
+    iterparse_xes.import_traces) in a single pass, keeping in memory only the sampled traces
+    (reservoir sampling)
+
+    Parameters
+    -----------
+    traces
+        Iterable of traces
+    no_traces
+        Number of traces that the sample should have
+    parameters
+        Parameters of the algorithm, including:
+            activity_key -> Attribute identifying the activity
+            confidence -> Confidence level of the error bounds of the DFG (default: 0.95)
+    log
+        (If provided) Log from which the attributes, extensions, globals and classifiers of the sample are taken
+
+    Returns
+    -----------
+    sampled_log
+        Sampled log
+    dfg_bounds
+        Dictionary that associates each couple of directly-following activities of the sample to its estimated
+        frequency in the whole log and to the half-width of the confidence interval of the estimate
+    """
+    if parameters is None:
+        parameters = {}
+    activity_key = parameters[
+        PARAMETER_CONSTANT_ACTIVITY_KEY] if PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else DEFAULT_NAME_KEY
+    confidence = parameters["confidence"] if "confidence" in parameters else 0.95
+
+    reservoir = []
+    no_seen = 0
+    for trace in traces:
+        no_seen += 1
+        if len(reservoir) < no_traces:
+            reservoir.append(trace)
+        else:
+            position = random.randrange(0, no_seen)
+            if position < no_traces:
+                reservoir[position] = trace
+
+    if log is None:
+        new_log = EventLog()
+    else:
+        new_log = EventLog(attributes=log.attributes, extensions=log.extensions, globals=log._omni,
+                           classifiers=log.classifiers)
+    for trace in reservoir:
+        new_log.append(copy(trace))
+    return new_log, get_uniform_dfg_bounds(new_log, no_seen, activity_key=activity_key, confidence=confidence)
+
+
+def stratified_sample_log(log, no_traces=100, parameters=None):
+    """
+    Samples a fixed number of traces from the log, stratifying on the variants: each variant gets a number of
+    traces proportional to its frequency (largest remainder method), so the frequent variants are kept, while
+    the variants too infrequent to get a trace are dropped.
+
+    Since the traces of a variant share the same DFG, the frequencies of the DFG edges in the whole log are
+    computed exactly from the variants index, without estimating them from the sample
+
+    Parameters
+    -----------
+    log
+        Log
+    no_traces
+        Number of traces that the sample should have
+    parameters
+        Parameters of the algorithm, including:
+            activity_key -> Attribute identifying the activity
+            use_variants_index_cache -> If True, stores the variants index with the log and reuses the stored one
+            (see pm4py.objects.log.util.variants_index)
+
+    Returns
+    -----------
+    sampled_log
+        Sampled log
+    dfg_bounds
+        Dictionary that associates each couple of directly-following activities of the log to its (exact)
+        frequency in the whole log and to the half-width of the interval, that is 0 (the same format of
+        reservoir_sample_log)
+    """
+    if parameters is None:
+        parameters = {}
+    activity_key = parameters[
+        PARAMETER_CONSTANT_ACTIVITY_KEY] if PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else DEFAULT_NAME_KEY
+    use_cache = parameters[
+        variants_index.PARAMETER_USE_CACHE] if variants_index.PARAMETER_USE_CACHE in parameters else False
+
+    index = variants_index.get_variants_index(log, activity_key, use_cache=use_cache)
+    no_log_traces = len(log)
+    no_traces = min(no_traces, no_log_traces)
+    quotas = {variant: no_traces * len(traces_idx) / no_log_traces for variant, traces_idx in
+              index.variants.items()}
+    allocation = {variant: int(quota) for variant, quota in quotas.items()}
+    remaining = no_traces - sum(allocation.values())
+    for variant in sorted(quotas, key=lambda v: quotas[v] - allocation[v], reverse=True)[:remaining]:
+        allocation[variant] += 1
+
+    chosen_traces = []
+    dfg = Counter()
+    for variant, traces_idx in index.variants.items():
+        if allocation[variant]:
+            chosen_traces.extend(random.sample(traces_idx, allocation[variant]))
+        for couple, count in get_trace_dfg([index.activities[code] for code in index.sequences[variant]]).items():
+            dfg[couple] += count * len(traces_idx)
+
+    new_log = EventLog(attributes=log.attributes, extensions=log.extensions, globals=log._omni,
+                       classifiers=log.classifiers)
+    for trace_idx in sorted(chosen_traces):
+        new_log.append(copy(log[trace_idx]))
+
+    return new_log, {couple: (count, 0.0) for couple, count in dfg.items()}
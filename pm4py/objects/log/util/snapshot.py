@@ -0,0 +1,112 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import ciso8601
+import pandas as pd
+
+# keys of the metadata stored in the schema of the binary snapshots
+META_HEADER = b"pm4py:header"
+META_TRACES_SIZE = b"pm4py:traces_size"
+META_NO_EVENTS = b"pm4py:no_events"
+META_TYPE = b"pm4py:type"
+
+# values of the type metadata of a column
+TYPE_DATETIME = b"datetime"
+TYPE_TIMESTAMP = b"Timestamp"
+TYPE_JSON = b"json"
+
+# names of the fields of the struct columns storing timestamps with different UTC offsets
+STRUCT_TIMESTAMP = "timestamp"
+STRUCT_OFFSET = "offset"
+
+# name of the column of the traces table containing the offset of the first event of the trace
+TRACE_OFFSET_COLUMN = "@@trace_offset"
+
+# tags used to encode, in JSON, the values that have not a JSON counterpart
+TAG_DATETIME = "@@datetime"
+TAG_TIMESTAMP = "@@timestamp"
+TAG_DICT = "@@dict"
+
+
+def encode_value(value):
+    """
+    Encodes an attribute value (possibly nested) into a JSON-serializable object
+
+    Parameters
+    ------------
+    value
+        Attribute value
+
+    Returns
+    ------------
+    encoded_value
+        JSON-serializable object
+    """
+    if isinstance(value, pd.Timestamp):
+        return {TAG_TIMESTAMP: value.isoformat()}
+    if isinstance(value, datetime):
+        return {TAG_DATETIME: value.isoformat()}
+    if isinstance(value, dict):
+        return {TAG_DICT: [[encode_value(k), encode_value(v)] for k, v in value.items()]}
+    if isinstance(value, (list, tuple)):
+        return [encode_value(v) for v in value]
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    return str(value)
+
+
+def decode_value(value):
+    """
+    Decodes an attribute value encoded by encode_value
+
+    Parameters
+    ------------
+    value
+        JSON object
+
+    Returns
+    ------------
+    decoded_value
+        Attribute value
+    """
+    if isinstance(value, dict):
+        if TAG_TIMESTAMP in value:
+            return pd.Timestamp(value[TAG_TIMESTAMP])
+        if TAG_DATETIME in value:
+            return ciso8601.parse_datetime(value[TAG_DATETIME])
+        if TAG_DICT in value:
+            return {decode_value(k): decode_value(v) for k, v in value[TAG_DICT]}
+    if isinstance(value, list):
+        return [decode_value(v) for v in value]
+    return value
+
+
+def dumps(value):
+    return json.dumps(encode_value(value))
+
+
+def loads(string):
+    return decode_value(json.loads(string))
+
+
+def tz_to_string(tz):
+    """
+    Gets the string representing the (fixed) UTC offset of a timezone, e.g. +01:00 (None for naive datetimes)
+    """
+    if tz is None:
+        return None
+    offset = tz.utcoffset(None)
+    sign = "-" if offset < timedelta(0) else "+"
+    minutes = abs(offset) // timedelta(minutes=1)
+    return "%s%02d:%02d" % (sign, minutes // 60, minutes % 60)
+
+
+def string_to_tz(string):
+    """
+    Gets the timezone corresponding to a string produced by tz_to_string
+    """
+    if string is None:
+        return None
+    sign = -1 if string[0] == "-" else 1
+    hours, minutes = string[1:].split(":")
+    return timezone(sign * timedelta(hours=int(hours), minutes=int(minutes)))
@@ -1,10 +1,137 @@
 from copy import deepcopy
+from datetime import datetime
 
-from pm4py.objects.log.log import EventLog
+import numpy as np
+import pandas as pd
+
+from pm4py.objects.log import columnar
+from pm4py.objects.log import view
+from pm4py.objects.log.log import EventLog, EventStream, Trace
+from pm4py.objects.log.util import attributes_index
+from pm4py.objects.log.util import case_table
+from pm4py.objects.log.util import variants_index
 from pm4py.objects.log.util import xes
 
+# the object is deep-copied and the copy is sorted
+SORT_COPY = "copy"
+# the object itself is sorted (its list of events/traces is reordered) and returned
+SORT_INPLACE = "inplace"
+# a new object is returned, that refers the same events (and, for logs, new traces referring the same events)
+SORT_VIEW = "view"
+
+
+def get_sort_keys(values):
+    """
+    Extracts the sort keys into a numpy array (the timestamps are converted to integers);
+    returns None if the values cannot be represented in a numpy array that is sorted as the values
+    """
+    if values and isinstance(values[0], datetime):
+        try:
+            return pd.to_datetime(values, utc=True).asi8
+        except (TypeError, ValueError):
+            return None
+    try:
+        keys = np.asarray(values)
+    except (TypeError, ValueError):
+        return None
+    if keys.ndim != 1 or (keys.dtype.kind in "US" and not isinstance(values[0], str)):
+        # e.g. numbers mixed with strings, that numpy would convert to strings
+        return None
+    return keys
+
+
+def is_sorted(keys, reverse=False):
+    """
+    Checks if the keys are already sorted (in the given direction)
+    """
+    if reverse:
+        return bool(np.all(keys[:-1] >= keys[1:]))
+    return bool(np.all(keys[:-1] <= keys[1:]))
+
+
+def get_sorting_order(values, reverse=False):
+    """
+    Gets the (stable) order of the positions that sorts the given values, or None if the values are already sorted
+
+    Parameters
+    ------------
+    values
+        List of values
+    reverse
+        Boolean (sort by reverse order); elements with the same value keep their relative order, as in list.sort
+
+    Returns
+    ------------
+    order
+        Array of positions (None if the values are already sorted)
+    """
+    if len(values) < 2:
+        return None
+    keys = get_sort_keys(values)
+    if keys is None:
+        order = sorted(range(len(values)), key=values.__getitem__, reverse=reverse)
+        if order == list(range(len(values))):
+            return None
+        return order
+    try:
+        if is_sorted(keys, reverse=reverse):
+            return None
+        return argsort_keys(keys, reverse=reverse)
+    except TypeError:
+        return sorted(range(len(values)), key=values.__getitem__, reverse=reverse)
+
+
+def argsort_keys(keys, reverse=False):
+    """
+    Stable argsort of a numpy array of keys, also in the reverse direction
+    """
+    if reverse:
+        # the reversed keys are sorted ascending, so that the equal keys keep their relative order
+        return len(keys) - 1 - np.argsort(keys[::-1], kind="stable")[::-1]
+    return np.argsort(keys, kind="stable")
 
-def sort_timestamp_trace(trace, timestamp_key=xes.DEFAULT_TIMESTAMP_KEY, reverse_sort=False):
+
+def get_sorted_list(elements, values, reverse=False):
+    """
+    Gets the list of the elements sorted by the given values (one per element); only the references are reordered
+    """
+    order = get_sorting_order(values, reverse=reverse)
+    if order is None:
+        return list(elements)
+    return [elements[i] for i in order]
+
+
+def get_view(container, elements):
+    """
+    Gets a new container (trace, log or stream) with the same attributes of the given one and the given elements
+    """
+    if isinstance(container, Trace):
+        return Trace(elements, attributes=container.attributes)
+    container_class = EventLog if isinstance(container, EventLog) else EventStream
+    return container_class(elements, attributes=container.attributes, extensions=container.extensions,
+                           globals=container.omni_present, classifiers=container.classifiers)
+
+
+def sort_container(container, values, reverse=False, mode=SORT_COPY):
+    """
+    Sorts a trace, a log or a stream by the given values (one per element), in the given mode
+    """
+    if mode == SORT_VIEW:
+        return get_view(container, get_sorted_list(container._list, values, reverse=reverse))
+    if mode == SORT_COPY:
+        container = deepcopy(container)
+    elif isinstance(container, columnar.ColumnarTrace):
+        raise NotImplementedError("the traces of a columnar log can not be sorted in place")
+    elif isinstance(container, (view.EventLogView, view.TraceView)):
+        raise NotImplementedError("a log view can not be sorted in place: use the copy or the view mode")
+    order = get_sorting_order(values, reverse=reverse)
+    if order is not None:
+        elements = container._list
+        container._list = [elements[i] for i in order]
+    return container
+
+
+def sort_timestamp_trace(trace, timestamp_key=xes.DEFAULT_TIMESTAMP_KEY, reverse_sort=False, mode=SORT_COPY):
     """
     Sort a trace based on timestamp key
 
@@ -16,18 +143,19 @@ def sort_timestamp_trace(trace, timestamp_key=xes.DEFAULT_TIMESTAMP_KEY, reverse
         Timestamp key
     reverse_sort
         If true, reverses the direction in which the sort is done (ascending)
+    mode
+        Sorting mode: SORT_COPY (sorts a deep copy), SORT_INPLACE (sorts the trace itself) or SORT_VIEW
+        (returns a new trace referring the same events)
 
     Returns
     -----------
     trace
         Sorted trace
     """
-    new_trace = deepcopy(trace)
-    new_trace._list.sort(key=lambda x: x[timestamp_key], reverse=reverse_sort)
-    return new_trace
+    return sort_container(trace, [x[timestamp_key] for x in trace], reverse=reverse_sort, mode=mode)
 
 
-def sort_timestamp_stream(event_log, timestamp_key=xes.DEFAULT_TIMESTAMP_KEY, reverse_sort=False):
+def sort_timestamp_stream(event_log, timestamp_key=xes.DEFAULT_TIMESTAMP_KEY, reverse_sort=False, mode=SORT_COPY):
     """
     Sort an event log based on timestamp key
 
@@ -39,18 +167,63 @@ def sort_timestamp_stream(event_log, timestamp_key=xes.DEFAULT_TIMESTAMP_KEY, re
         Timestamp key
     reverse_sort
         If true, reverses the direction in which the sort is done (ascending)
+    mode
+        Sorting mode: SORT_COPY (sorts a deep copy), SORT_INPLACE (sorts the event log itself) or SORT_VIEW
+        (returns a new event log referring the same events)
 
     Returns
     -----------
     event_log
         Sorted event log
     """
-    new_event_log = deepcopy(event_log)
-    new_event_log._list.sort(key=lambda x: x[timestamp_key], reverse=reverse_sort)
-    return new_event_log
+    return sort_container(event_log, [x[timestamp_key] for x in event_log], reverse=reverse_sort, mode=mode)
 
 
-def sort_timestamp_log(log, timestamp_key=xes.DEFAULT_TIMESTAMP_KEY, reverse_sort=False):
+def sort_timestamp_columnar_log(log, timestamp_key=xes.DEFAULT_TIMESTAMP_KEY, reverse_sort=False):
+    """
+    Sort a columnar log based on timestamp key, getting a new columnar log: the rows of the events and traces
+    tables are reordered at once, without decoding the events
+
+    Parameters
+    -----------
+    log
+        Columnar log
+    timestamp_key
+        Timestamp key
+    reverse_sort
+        If true, reverses the direction in which the sort is done (ascending)
+
+    Returns
+    -----------
+    log
+        Sorted columnar log
+    """
+    column = log.events_table.columns.get(timestamp_key)
+    if not isinstance(column, columnar.DatetimeColumn) or not np.all(column.mask):
+        # the timestamps are not all dates: the log is sorted as an event log
+        return columnar.from_event_log(sort_timestamp_log(columnar.to_event_log(log), timestamp_key=timestamp_key,
+                                                          reverse_sort=reverse_sort, mode=SORT_INPLACE))
+    keys = np.asarray(column.values, dtype=np.int64)
+    lengths = log.get_trace_lengths()
+    offsets = log.trace_offsets
+    # stable sort of the events of each trace (the events of the traces stay grouped, in the order of the traces)
+    events_order = np.lexsort((-keys if reverse_sort else keys, np.repeat(np.arange(len(lengths)), lengths)))
+    non_empty = np.nonzero(lengths > 0)[0]
+    # after the sort, the first event of a trace has its minimum (maximum, if reverse) timestamp
+    first_keys = keys[events_order[offsets[non_empty]]]
+    traces_order = non_empty[argsort_keys(first_keys, reverse=reverse_sort)]
+    sorted_lengths = lengths[traces_order]
+    sorted_offsets = np.zeros(len(traces_order) + 1, dtype=np.int64)
+    sorted_offsets[1:] = np.cumsum(sorted_lengths)
+    # position of each event of the sorted log in the sorted events of the original log
+    positions = np.arange(sorted_offsets[-1]) + np.repeat(offsets[traces_order] - sorted_offsets[:-1], sorted_lengths)
+    return columnar.ColumnarEventLog(log.events_table.take(events_order[positions]),
+                                     log.traces_table.take(traces_order), sorted_offsets,
+                                     attributes=deepcopy(log.attributes), extensions=deepcopy(log.extensions),
+                                     omni_present=deepcopy(log.omni_present), classifiers=deepcopy(log.classifiers))
+
+
+def sort_timestamp_log(log, timestamp_key=xes.DEFAULT_TIMESTAMP_KEY, reverse_sort=False, mode=SORT_COPY):
     """
     Sort a log based on timestamp key
 
@@ -62,24 +235,65 @@ def sort_timestamp_log(log, timestamp_key=xes.DEFAULT_TIMESTAMP_KEY, reverse_sor
         Timestamp key
     reverse_sort
         If true, reverses the direction in which the sort is done (ascending)
+    mode
+        Sorting mode: SORT_COPY (sorts a deep copy), SORT_INPLACE (sorts the log and its traces) or SORT_VIEW
+        (returns a new log, with new traces referring the same events). A columnar log is sorted into a new
+        columnar log in SORT_COPY mode. Columnar logs and log views can not be sorted in place
 
     Returns
     -----------
     log
         Sorted log
     """
-    new_log = deepcopy(log)
-    new_log._list = [x for x in new_log._list if len(x) > 0]
-    for i in range(len(new_log._list)):
-        new_log._list[i] = sort_timestamp_trace(new_log._list[i], timestamp_key=timestamp_key,
-                                                      reverse_sort=reverse_sort)
-
-    new_log._list.sort(key=lambda x: x[0][timestamp_key], reverse=reverse_sort)
-
-    return new_log
-
-
-def sort_timestamp(log, timestamp_key=xes.DEFAULT_TIMESTAMP_KEY, reverse_sort=False):
+    if isinstance(log, columnar.ColumnarEventLog) and mode != SORT_VIEW:
+        if mode == SORT_INPLACE:
+            raise NotImplementedError("a columnar log can not be sorted in place: use the copy or the view mode")
+        return sort_timestamp_columnar_log(log, timestamp_key=timestamp_key, reverse_sort=reverse_sort)
+    if mode == SORT_INPLACE and isinstance(log, view.EventLogView):
+        # the positions stored in the view would no longer match its traces and events
+        raise NotImplementedError("a log view can not be sorted in place: use the copy or the view mode")
+    if mode == SORT_COPY:
+        log = deepcopy(log)
+        mode = SORT_INPLACE
+    traces = [x for x in log if len(x) > 0]
+    # the timestamps of all the events are extracted at once
+    keys = get_sort_keys([event[timestamp_key] for trace in traces for event in trace]) if traces else None
+    if keys is None or keys.dtype.kind not in "iufmM":
+        traces = [sort_timestamp_trace(x, timestamp_key=timestamp_key, reverse_sort=reverse_sort, mode=mode) for x
+                  in traces]
+        sorted_traces = get_sorted_list(traces, [x[0][timestamp_key] for x in traces], reverse=reverse_sort)
+    else:
+        lengths = np.array([len(x) for x in traces])
+        ends = np.cumsum(lengths)
+        starts = ends - lengths
+        # couples of consecutive events in the wrong order, excluding the couples across two traces
+        wrong_couples = keys[1:] > keys[:-1] if reverse_sort else keys[1:] < keys[:-1]
+        wrong_couples[starts[1:] - 1] = False
+        unsorted_traces = set(np.searchsorted(ends, np.nonzero(wrong_couples)[0], side="right").tolist())
+        for i in range(len(traces)):
+            trace = traces[i]
+            elements = trace._list
+            if i in unsorted_traces:
+                elements = [elements[j] for j in argsort_keys(keys[starts[i]:ends[i]], reverse=reverse_sort)]
+            if mode == SORT_VIEW:
+                traces[i] = get_view(trace, elements)
+            elif i in unsorted_traces:
+                trace._list = elements
+        # after the sort, the first event of a trace has its minimum (maximum, if reverse) timestamp
+        first_keys = np.maximum.reduceat(keys, starts) if reverse_sort else np.minimum.reduceat(keys, starts)
+        sorted_traces = traces if is_sorted(first_keys, reverse=reverse_sort) else [
+            traces[i] for i in argsort_keys(first_keys, reverse=reverse_sort)]
+    if mode == SORT_VIEW:
+        return get_view(log, sorted_traces)
+    log._list = sorted_traces
+    # the events have been reordered inside the same traces, that the stored indexes do not detect
+    variants_index.invalidate(log)
+    attributes_index.invalidate(log)
+    case_table.invalidate(log)
+    return log
+
+
+def sort_timestamp(log, timestamp_key=xes.DEFAULT_TIMESTAMP_KEY, reverse_sort=False, mode=SORT_COPY):
     """
     Sort a log based on timestamp key
 
@@ -91,18 +305,20 @@ def sort_timestamp(log, timestamp_key=xes.DEFAULT_TIMESTAMP_KEY, reverse_sort=Fa
         Timestamp key
     reverse_sort
         If true, reverses the direction in which the sort is done (ascending)
+    mode
+        Sorting mode (SORT_COPY, SORT_INPLACE or SORT_VIEW)
 
     Returns
     -----------
     log
         Sorted Trace/Event log
     """
-    if type(log) is EventLog:
-        return sort_timestamp_log(log, timestamp_key=timestamp_key, reverse_sort=reverse_sort)
-    return sort_timestamp_stream(log, timestamp_key=timestamp_key, reverse_sort=reverse_sort)
+    if isinstance(log, EventLog):
+        return sort_timestamp_log(log, timestamp_key=timestamp_key, reverse_sort=reverse_sort, mode=mode)
+    return sort_timestamp_stream(log, timestamp_key=timestamp_key, reverse_sort=reverse_sort, mode=mode)
 
 
-def sort_lambda_log(log, sort_function, reverse=False):
+def sort_lambda_log(log, sort_function, reverse=False, mode=SORT_COPY):
     """
     Sort a log based on a lambda expression
 
@@ -114,19 +330,18 @@ def sort_lambda_log(log, sort_function, reverse=False):
         Sort function
     reverse
         Boolean (sort by reverse order)
+    mode
+        Sorting mode (SORT_COPY, SORT_INPLACE or SORT_VIEW)
 
     Returns
     ------------
     new_log
         Sorted log
     """
-    new_log = deepcopy(log)
-    new_log._list.sort(key=sort_function, reverse=reverse)
-
-    return new_log
+    return sort_container(log, [sort_function(x) for x in log], reverse=reverse, mode=mode)
 
 
-def sort_lambda_stream(stream, sort_function, reverse=False):
+def sort_lambda_stream(stream, sort_function, reverse=False, mode=SORT_COPY):
     """
     Sort a stream based on a lambda expression
 
@@ -138,19 +353,18 @@ def sort_lambda_stream(stream, sort_function, reverse=False):
         Sort function
     reverse
         Boolean (sort by reverse order)
+    mode
+        Sorting mode (SORT_COPY, SORT_INPLACE or SORT_VIEW)
 
     Returns
     ------------
     stream
         Sorted stream
     """
-    new_event_log = deepcopy(stream)
-    new_event_log._list.sort(key=sort_function, reverse=reverse)
-
-    return new_event_log
+    return sort_container(stream, [sort_function(x) for x in stream], reverse=reverse, mode=mode)
 
 
-def sort_lambda(log, sort_function, reverse=False):
+def sort_lambda(log, sort_function, reverse=False, mode=SORT_COPY):
     """
     Sort a log based on lambda expression
 
@@ -162,12 +376,14 @@ def sort_lambda(log, sort_function, reverse=False):
         Sort function
     reverse
         Boolean (sort by reverse order)
+    mode
+        Sorting mode (SORT_COPY, SORT_INPLACE or SORT_VIEW)
 
     Returns
     -------------
     log
         Sorted log
     """
-    if type(log) is EventLog:
-        return sort_lambda_log(log, sort_function, reverse=reverse)
-    return sort_lambda_stream(log, sort_function, reverse=reverse)
+    if isinstance(log, EventLog):
+        return sort_lambda_log(log, sort_function, reverse=reverse, mode=mode)
+    return sort_lambda_stream(log, sort_function, reverse=reverse, mode=mode)
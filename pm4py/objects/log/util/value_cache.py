@@ -0,0 +1,24 @@
+# maximum number of distinct values kept in the cache
+DEFAULT_MAX_SIZE = 100000
+
+
+class ValueCache(dict):
+    """
+    Cache used by the importers to share the repeated attribute keys and string values (e.g. activities,
+    resources, lifecycle transitions) between the events: cache[value] gets the cached copy of the value.
+    The lookup of a cached value is done by the dictionary itself, without calls to Python code; only the
+    values that are not cached go through __missing__. The timestamps are not cached: they are almost all
+    distinct, so the lookups would cost more than the parsing they save. The cache is emptied when it reaches
+    its maximum size, so the memory used by it is bounded also while streaming big logs
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        super().__init__()
+        self.max_size = max_size
+
+    def __missing__(self, value):
+        if len(self) >= self.max_size:
+            self.clear()
+        self[value] = value
+        return value
+
@@ -0,0 +1,172 @@
+import operator
+
+import numpy as np
+
+from pm4py.objects.log import columnar
+
+# name of the attribute of the log object in which the variant indexes (one per activity key) are stored
+CACHE_ATTRIBUTE = "_variants_indexes"
+# parameter asking to store the variants index with the log, and to reuse the stored one
+PARAMETER_USE_CACHE = "use_variants_index_cache"
+
+
+class VariantsIndex(object):
+    """
+    Index of the variants of a log, computed for a given activity key:
+    the traces sharing each variant, the integer-encoded sequence of each variant (the code of an activity is its
+    position in the list of activities) and, for each trace, the number of its variant
+    """
+
+    def __init__(self, activity_key, variants, sequences, activities, trace_variants, signature):
+        self.activity_key = activity_key
+        # variant -> list of the indexes of the traces (the variants are in order of first appearance)
+        self.variants = variants
+        # variant -> tuple of the codes of the activities
+        self.sequences = sequences
+        self.activities = activities
+        # number of the variant of each trace (position in the list of variants)
+        self.trace_variants = trace_variants
+        self.signature = signature
+
+    def get_variants_list(self):
+        return list(self.variants)
+
+    def get_counts(self):
+        """
+        Gets the number of traces of each variant
+        """
+        return {variant: len(traces) for variant, traces in self.variants.items()}
+
+
+def get_signature(log):
+    """
+    Gets what identifies the current content of the log: the trace objects and the event objects of each trace
+    (for a columnar log, the arrays backing it). A log that has been mutated by adding, removing, replacing or
+    sorting traces or events gets a different signature; the in-place modification of the attributes of an event
+    does not change it
+    """
+    if isinstance(log, columnar.ColumnarEventLog):
+        return log.events_table, log.trace_offsets
+    return [trace for trace in log], [list(trace) for trace in log]
+
+
+def is_signature_valid(log, signature):
+    if isinstance(log, columnar.ColumnarEventLog):
+        return signature[0] is log.events_table and signature[1] is log.trace_offsets
+    traces, events = signature
+    return len(traces) == len(log) and all(
+        x is y and len(x) == len(trace_events) and all(map(operator.is_, trace_events, y)) for x, y, trace_events in
+        zip(traces, log, events))
+
+
+def build_variants_index(log, activity_key):
+    """
+    Computes the variants index of a log
+
+    Parameters
+    -------------
+    log
+        Event log
+    activity_key
+        Attribute identifying the activity
+
+    Returns
+    -------------
+    index
+        Variants index
+    """
+    trace_variants = np.zeros(len(log), dtype=np.int64)
+    variants = {}
+    sequences = {}
+    if isinstance(log, columnar.ColumnarEventLog):
+        # the sequences are read from the codes of the activities, without decoding the events
+        codes, activities = log.get_event_attribute_codes(activity_key)
+        activities = list(activities)
+        offsets = log.trace_offsets
+        variant_numbers = {}
+        for trace_idx in range(len(log)):
+            trace_codes = codes[offsets[trace_idx]:offsets[trace_idx + 1]]
+            sequence = tuple(trace_codes[trace_codes >= 0].tolist())
+            if sequence not in variant_numbers:
+                variant = ",".join([activities[code] for code in sequence])
+                variant_numbers[sequence] = len(variants)
+                variants[variant] = []
+                sequences[variant] = sequence
+            trace_variants[trace_idx] = variant_numbers[sequence]
+        # the indexes of the traces are grouped by variant number
+        variants_list = list(variants)
+        for trace_idx, number in enumerate(trace_variants.tolist()):
+            variants[variants_list[number]].append(trace_idx)
+    else:
+        activity_codes = {}
+        activities = []
+        variant_numbers = {}
+        for trace_idx, trace in enumerate(log):
+            trace_activities = [x[activity_key] for x in trace if activity_key in x]
+            variant = ",".join(trace_activities)
+            if variant not in variants:
+                variant_numbers[variant] = len(variants)
+                variants[variant] = []
+                for activity in trace_activities:
+                    if activity not in activity_codes:
+                        activity_codes[activity] = len(activities)
+                        activities.append(activity)
+                sequences[variant] = tuple(activity_codes[activity] for activity in trace_activities)
+            variants[variant].append(trace_idx)
+            trace_variants[trace_idx] = variant_numbers[variant]
+    return VariantsIndex(activity_key, variants, sequences, activities, trace_variants, get_signature(log))
+
+
+def get_variants_index(log, activity_key, use_cache=False):
+    """
+    Gets the variants index of a log for the given activity key. By default, the index is computed at each call.
+    With use_cache, the index is computed once and stored with the log; it is computed again if the log has been
+    mutated since then (see get_signature: checking it visits the events, but not their attributes). The in-place
+    modification of the activity of an event is not detected: call invalidate after it
+
+    Parameters
+    -------------
+    log
+        Event log
+    activity_key
+        Attribute identifying the activity
+    use_cache
+        Stores the index with the log, and reuses the stored one
+
+    Returns
+    -------------
+    index
+        Variants index
+    """
+    if use_cache:
+        indexes = getattr(log, CACHE_ATTRIBUTE, None)
+        if indexes is not None and activity_key in indexes and is_signature_valid(
+                log, indexes[activity_key].signature):
+            return indexes[activity_key]
+    index = build_variants_index(log, activity_key)
+    if use_cache:
+        store(log, index)
+    return index
+
+
+def store(log, index):
+    """
+    Stores the variants index with the log (e.g. the index of a filtered log, already known by the filter)
+    """
+    indexes = getattr(log, CACHE_ATTRIBUTE, None)
+    try:
+        if indexes is None:
+            indexes = {}
+            setattr(log, CACHE_ATTRIBUTE, indexes)
+        indexes[index.activity_key] = index
+    except AttributeError:
+        # objects that do not accept new attributes (e.g. lists of traces) are not cached
+        pass
+
+
+def invalidate(log):
+    """
+    Removes the variants indexes stored with the log
+    """
+    if hasattr(log, CACHE_ATTRIBUTE):
+        delattr(log, CACHE_ATTRIBUTE)
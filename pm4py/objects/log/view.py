@@ -0,0 +1,152 @@
+from copy import deepcopy
+
+import numpy as np
+
+from pm4py.objects.log.log import EventLog, Trace
+
+# parameter of the filters asking for a view on the log (instead of a new log)
+PARAMETER_VIEW = "view"
+
+
+class TraceView(Trace):
+    """
+    Lightweight view over a trace, keeping only some of its events: the parent trace and the positions of the kept
+    events. The attributes are the ones of the parent trace (shared, not copied)
+    """
+
+    def __init__(self, trace, positions):
+        self._trace = trace
+        self._positions = positions
+
+    def _get_list(self):
+        events = self._trace._list
+        return [events[i] for i in self._positions.tolist()]
+
+    def _get_attributes(self):
+        return self._trace.attributes
+
+    _list = property(_get_list)
+    _attributes = property(_get_attributes)
+    attributes = property(_get_attributes)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            events = self._trace._list
+            return [events[i] for i in self._positions[key].tolist()]
+        return self._trace[int(self._positions[key])]
+
+    def __iter__(self):
+        events = self._trace._list
+        for i in self._positions.tolist():
+            yield events[i]
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __setitem__(self, key, value):
+        raise NotImplementedError("the events of a trace view can not be replaced")
+
+    def insert(self, i, x):
+        raise NotImplementedError("events can not be inserted in a trace view")
+
+    def append(self, x):
+        raise NotImplementedError("events can not be appended to a trace view")
+
+    def materialize(self):
+        """
+        Gets a new trace with the events of the view (the events are not copied)
+        """
+        return Trace(self._get_list(), attributes=dict(self.attributes))
+
+    def __copy__(self):
+        return TraceView(self._trace, self._positions)
+
+    def __deepcopy__(self, memo):
+        return deepcopy(self.materialize(), memo)
+
+
+class EventLogView(EventLog):
+    """
+    Lightweight view over an event log, as returned by the filters when asked for a view: the parent log, the
+    positions of the kept traces and, for the traces from which some events are removed, the positions of the kept
+    events. The kept traces are the traces of the parent log (or trace views over them), and the attributes of the
+    log are the ones of the parent, so no event, trace or attribute is copied.
+
+    A view can be used in place of an event log (e.g. by the discovery and conformance checking algorithms); it is
+    materialized into a new log by materialize (that is called by the exporters)
+    """
+
+    def __init__(self, parent, trace_positions, event_positions=None):
+        super(EventLogView, self).__init__(attributes=parent.attributes, extensions=parent.extensions,
+                                           omni_present=parent.omni_present, classifiers=parent.classifiers)
+        self.parent = parent
+        self.trace_positions = trace_positions
+        # positions of the kept events of each kept trace (None if all its events are kept)
+        self.event_positions = event_positions if event_positions is not None else [None] * len(trace_positions)
+        traces = parent._list
+        self._list = [traces[i] if events is None else TraceView(traces[i], events) for i, events in
+                      zip(trace_positions.tolist(), self.event_positions)]
+
+    def __setitem__(self, key, value):
+        raise NotImplementedError("the traces of a log view can not be replaced")
+
+    def append(self, x):
+        raise NotImplementedError("traces can not be appended to a log view")
+
+    def materialize(self):
+        """
+        Gets a new event log with the traces of the view: the traces from which some events are removed are
+        materialized, the others are shared with the parent log (the events are not copied)
+        """
+        return EventLog([trace.materialize() if isinstance(trace, TraceView) else trace for trace in self._list],
+                        attributes=dict(self.attributes), extensions=dict(self.extensions),
+                        omni_present=dict(self.omni_present), classifiers=dict(self.classifiers))
+
+    def __copy__(self):
+        return EventLogView(self.parent, self.trace_positions, self.event_positions)
+
+    def __deepcopy__(self, memo):
+        return deepcopy(self.materialize(), memo)
+
+
+def get_view(log, trace_positions, event_positions=None):
+    """
+    Gets a view over the log, keeping the traces at the given positions (and, for each of them, the events at the
+    given positions). The view of a view refers directly the log of the first one
+
+    Parameters
+    -------------
+    log
+        Event log (or view)
+    trace_positions
+        Positions of the kept traces
+    event_positions
+        (If provided) List containing, for each kept trace, the Numpy array of the positions of its kept events (None
+        if all its events are kept)
+
+    Returns
+    -------------
+    view
+        View over the log
+    """
+    trace_positions = np.asarray(trace_positions, dtype=np.int64)
+    if isinstance(log, EventLogView):
+        if event_positions is None:
+            event_positions = [log.event_positions[i] for i in trace_positions.tolist()]
+        else:
+            # the positions of the events are referred to the traces of the parent log
+            event_positions = [parent_events if events is None else (
+                events if parent_events is None else parent_events[events]) for events, parent_events in
+                zip(event_positions, [log.event_positions[i] for i in trace_positions.tolist()])]
+        trace_positions = log.trace_positions[trace_positions]
+        log = log.parent
+    return EventLogView(log, trace_positions, event_positions)
+
+
+def materialize(log):
+    """
+    Materializes a log view into a new event log (other objects are returned as they are)
+    """
+    if isinstance(log, EventLogView):
+        return log.materialize()
+    return log
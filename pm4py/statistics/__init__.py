@@ -1 +1 @@
-from pm4py.statistics import traces
+from pm4py.statistics import traces, online, attributes
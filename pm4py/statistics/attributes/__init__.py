@@ -0,0 +1 @@
+from pm4py.statistics.attributes import common, log, pandas
@@ -0,0 +1 @@
+from pm4py.statistics.attributes.common import sketches, attribute_profile
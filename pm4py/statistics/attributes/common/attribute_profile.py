@@ -0,0 +1,189 @@
+from collections import Counter
+from datetime import datetime
+
+import numpy as np
+
+from pm4py.statistics.attributes.common.sketches import HyperLogLog, QuantileSketch
+from pm4py.statistics.attributes.common.sketches import DEFAULT_HLL_PRECISION, DEFAULT_QUANTILE_SKETCH_SIZE
+
+# parameter: maximum number of distinct values for which the count of each value is kept; above it, the number
+# of distinct values is estimated with HyperLogLog
+PARAMETER_MAX_DISTINCT_VALUES = "max_distinct_values"
+# parameter: precision (number of bits of the register index) of the HyperLogLog estimator
+PARAMETER_HLL_PRECISION = "hll_precision"
+# parameter: capacity of the compactors of the quantile sketch
+PARAMETER_QUANTILE_SKETCH_SIZE = "quantile_sketch_size"
+
+DEFAULT_MAX_DISTINCT_VALUES = 1000
+
+TYPE_NUMERIC = "numeric"
+TYPE_STRING = "string"
+TYPE_DATE = "date"
+TYPE_BOOLEAN = "boolean"
+TYPE_MIXED = "mixed"
+
+NUMERIC_TYPES = {int, float, np.int8, np.int16, np.int32, np.int64, np.uint8, np.uint16, np.uint32, np.uint64,
+                 np.float16, np.float32, np.float64}
+
+
+def get_type_name(value_type):
+    """
+    Gets the name of the type of the attribute values of the given Python type
+    """
+    if value_type in NUMERIC_TYPES:
+        return TYPE_NUMERIC
+    if value_type is str:
+        return TYPE_STRING
+    if value_type is bool or value_type is np.bool_:
+        return TYPE_BOOLEAN
+    if issubclass(value_type, datetime):
+        return TYPE_DATE
+    return value_type.__name__
+
+
+class AttributeProfile(object):
+    """
+    Profile of the values of an attribute, filled in one pass: number of occurrences, types of the values,
+    count of each value (or, for high-cardinality attributes, a HyperLogLog estimation of the number of distinct
+    values), and minimum, maximum and quantile sketch of the numeric values
+    """
+
+    def __init__(self, parameters=None):
+        """
+        Constructor
+
+        Parameters
+        -------------
+        parameters
+            Parameters of the profile, including:
+                max_distinct_values -> Maximum number of distinct values for which the count of each value is kept
+                hll_precision -> Precision of the HyperLogLog estimator
+                quantile_sketch_size -> Capacity of the compactors of the quantile sketch
+        """
+        if parameters is None:
+            parameters = {}
+
+        self.max_distinct_values = parameters[
+            PARAMETER_MAX_DISTINCT_VALUES] if PARAMETER_MAX_DISTINCT_VALUES in parameters else \
+            DEFAULT_MAX_DISTINCT_VALUES
+        self.hll_precision = parameters[
+            PARAMETER_HLL_PRECISION] if PARAMETER_HLL_PRECISION in parameters else DEFAULT_HLL_PRECISION
+        quantile_sketch_size = parameters[
+            PARAMETER_QUANTILE_SKETCH_SIZE] if PARAMETER_QUANTILE_SKETCH_SIZE in parameters else \
+            DEFAULT_QUANTILE_SKETCH_SIZE
+
+        # number of occurrences of the attribute
+        self.count = 0
+        # number of traces (cases) in which the attribute occurs
+        self.traces_count = 0
+        # Python type -> number of values of that type
+        self.types = Counter()
+        # value -> number of occurrences (None when the number of distinct values exceeds max_distinct_values)
+        self.value_counts = Counter()
+        self.hll = None
+        self.min = None
+        self.max = None
+        self.quantiles = QuantileSketch(size=quantile_sketch_size)
+
+    def add(self, value):
+        """
+        Adds an occurrence of the attribute to the profile
+        """
+        self.count += 1
+        value_type = type(value)
+        self.types[value_type] += 1
+        if self.value_counts is not None:
+            try:
+                self.value_counts[value] += 1
+            except TypeError:
+                # unhashable values (e.g. lists) are counted by their representation
+                self.value_counts[repr(value)] += 1
+            if len(self.value_counts) > self.max_distinct_values:
+                self.switch_to_hll()
+        else:
+            self.hll.add(value)
+        if value_type in NUMERIC_TYPES and value == value:
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+            self.quantiles.add(value)
+
+    def switch_to_hll(self):
+        """
+        Replaces the count of each value with the HyperLogLog estimator of the number of distinct values
+        """
+        self.hll = HyperLogLog(precision=self.hll_precision)
+        for value in self.value_counts:
+            self.hll.add(value)
+        self.value_counts = None
+
+    def merge(self, other):
+        """
+        Merges the profile of the same attribute on another part of the data into this one
+        """
+        self.count += other.count
+        self.traces_count += other.traces_count
+        self.types.update(other.types)
+        if self.value_counts is not None and other.value_counts is not None:
+            self.value_counts.update(other.value_counts)
+            if len(self.value_counts) > self.max_distinct_values:
+                self.switch_to_hll()
+        else:
+            if self.value_counts is not None:
+                self.switch_to_hll()
+            if other.value_counts is not None:
+                for value in other.value_counts:
+                    self.hll.add(value)
+            else:
+                self.hll.merge(other.hll)
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+        self.quantiles.merge(other.quantiles)
+
+    def get_type(self):
+        """
+        Gets the type of the attribute (numeric, string, date, boolean, the name of another Python type, or mixed)
+        """
+        names = set(get_type_name(value_type) for value_type in self.types)
+        if not names:
+            return None
+        if len(names) > 1:
+            return TYPE_MIXED
+        return names.pop()
+
+    def is_cardinality_exact(self):
+        """
+        Checks if the number of distinct values is exact (or estimated with HyperLogLog)
+        """
+        return self.value_counts is not None
+
+    def get_cardinality(self):
+        """
+        Gets the (exact or estimated) number of distinct values
+        """
+        if self.value_counts is not None:
+            return len(self.value_counts)
+        return self.hll.count()
+
+    def get_value_counts(self):
+        """
+        Gets the dictionary of the values along with their count (None for high-cardinality attributes)
+        """
+        if self.value_counts is None:
+            return None
+        return dict(self.value_counts)
+
+    def get_quantiles(self, quantiles):
+        """
+        Gets the approximate values at the given quantiles of the numeric values
+        """
+        return self.quantiles.get_quantiles(quantiles)
+
+    def get_quantile(self, quantile):
+        """
+        Gets the approximate value at the given quantile of the numeric values
+        """
+        return self.quantiles.get_quantile(quantile)
@@ -0,0 +1,207 @@
+import hashlib
+import math
+
+import numpy as np
+
+DEFAULT_HLL_PRECISION = 12
+DEFAULT_QUANTILE_SKETCH_SIZE = 256
+
+
+def get_hash(value):
+    """
+    Gets a 64-bit hash of the value that is stable across processes (as required to merge the sketches)
+    """
+    return int.from_bytes(hashlib.blake2b(repr(value).encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HyperLogLog(object):
+    """
+    HyperLogLog estimator of the number of distinct values, in constant memory (2^precision registers);
+    the relative standard error of the estimation is about 1.04 / sqrt(2^precision)
+    """
+
+    def __init__(self, precision=DEFAULT_HLL_PRECISION):
+        """
+        Constructor
+
+        Parameters
+        -------------
+        precision
+            Number of bits of the hash that select the register
+        """
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, value):
+        """
+        Adds a value to the estimator
+        """
+        self.add_hash(get_hash(value))
+
+    def add_hash(self, value_hash):
+        """
+        Adds the 64-bit hash of a value to the estimator
+        """
+        bits = 64 - self.precision
+        index = value_hash >> bits
+        rank = bits - (value_hash & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def add_hashes(self, hashes):
+        """
+        Adds a numpy array of 64-bit hashes (e.g. the ones of pandas.util.hash_pandas_object) to the estimator
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if len(hashes) == 0:
+            return
+        bits = 64 - self.precision
+        indexes = (hashes >> np.uint64(bits)).astype(np.int64)
+        remainders = (hashes & np.uint64((1 << bits) - 1)).astype(np.float64)
+        # the exponent returned by frexp is the bit length (the remainders have less than 53 bits)
+        ranks = bits - np.frexp(remainders)[1] + 1
+        registers = np.frombuffer(self.registers, dtype=np.uint8).copy()
+        np.maximum.at(registers, indexes, ranks.astype(np.uint8))
+        self.registers = bytearray(registers.tobytes())
+
+    def merge(self, other):
+        """
+        Merges the registers of another estimator (with the same precision) into this one
+        """
+        if other.precision != self.precision:
+            raise Exception("cannot merge HyperLogLog estimators with different precision")
+        self.registers = bytearray(np.maximum(np.frombuffer(self.registers, dtype=np.uint8),
+                                              np.frombuffer(other.registers, dtype=np.uint8)).tobytes())
+
+    def count(self):
+        """
+        Gets the estimated number of distinct values
+        """
+        m = len(self.registers)
+        registers = np.frombuffer(self.registers, dtype=np.uint8)
+        alpha = 0.7213 / (1.0 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -registers.astype(np.float64)))
+        zeros = int(np.sum(registers == 0))
+        if estimate <= 2.5 * m and zeros > 0:
+            # linear counting on the empty registers is more accurate for small cardinalities
+            estimate = m * math.log(float(m) / zeros)
+        return int(round(estimate))
+
+
+class QuantileSketch(object):
+    """
+    Mergeable quantile sketch: a stack of compactors, where the compactor at level h contains values that stand
+    for 2^h values each. When a compactor is full, its values are sorted and every other one is promoted to the
+    next level, so the memory is O(size * log(n / size)) and the rank error is O(log(n / size) / size)
+    """
+
+    def __init__(self, size=DEFAULT_QUANTILE_SKETCH_SIZE):
+        """
+        Constructor
+
+        Parameters
+        -------------
+        size
+            Capacity of each compactor
+        """
+        self.size = size
+        self.compactors = [[]]
+        # the offset of the promoted values alternates at each compaction of a level, to avoid a bias
+        self.offsets = [0]
+        self.count = 0
+
+    def add(self, value):
+        """
+        Adds a value to the sketch
+        """
+        self.compactors[0].append(value)
+        self.count += 1
+        if len(self.compactors[0]) >= self.size:
+            self.compress()
+
+    def add_values(self, values):
+        """
+        Adds a numpy array of values to the sketch: the sorted values are directly compacted to the first level
+        at which they fit in a compactor
+        """
+        values = np.sort(np.asarray(values, dtype=np.float64))
+        if len(values) == 0:
+            return
+        level = 0
+        while len(values) >> level >= self.size:
+            level += 1
+        self.ensure_level(level)
+        step = 1 << level
+        self.compactors[level].extend(values[step // 2::step].tolist())
+        self.count += len(values)
+        self.compress()
+
+    def ensure_level(self, level):
+        """
+        Adds the compactors up to the given level
+        """
+        while len(self.compactors) <= level:
+            self.compactors.append([])
+            self.offsets.append(0)
+
+    def compress(self):
+        """
+        Compacts the full compactors, from the lowest level
+        """
+        level = 0
+        while level < len(self.compactors):
+            compactor = self.compactors[level]
+            if len(compactor) >= self.size:
+                compactor.sort()
+                # with an odd number of values, the last one stays at this level
+                kept = [compactor.pop()] if len(compactor) % 2 == 1 else []
+                self.ensure_level(level + 1)
+                self.compactors[level + 1].extend(compactor[self.offsets[level]::2])
+                self.offsets[level] = 1 - self.offsets[level]
+                self.compactors[level] = kept
+            level += 1
+
+    def merge(self, other):
+        """
+        Merges another sketch into this one
+        """
+        self.ensure_level(len(other.compactors) - 1)
+        for level in range(len(other.compactors)):
+            self.compactors[level].extend(other.compactors[level])
+        self.count += other.count
+        self.compress()
+
+    def get_quantiles(self, quantiles):
+        """
+        Gets the (approximate) values at the given quantiles
+
+        Parameters
+        -------------
+        quantiles
+            List of quantiles (between 0 and 1)
+
+        Returns
+        -------------
+        values
+            List of values (None if the sketch is empty)
+        """
+        values = []
+        weights = []
+        for level in range(len(self.compactors)):
+            values.extend(self.compactors[level])
+            weights.extend([1 << level] * len(self.compactors[level]))
+        if not values:
+            return [None] * len(quantiles)
+        values = np.asarray(values, dtype=np.float64)
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        cumulative = np.cumsum(np.asarray(weights, dtype=np.float64)[order])
+        positions = np.searchsorted(cumulative, np.asarray(quantiles, dtype=np.float64) * cumulative[-1],
+                                    side="left")
+        return [float(values[min(p, len(values) - 1)]) for p in positions]
+
+    def get_quantile(self, quantile):
+        """
+        Gets the (approximate) value at the given quantile
+        """
+        return self.get_quantiles([quantile])[0]
@@ -0,0 +1 @@
+from pm4py.statistics.attributes.log import attributes_profiler
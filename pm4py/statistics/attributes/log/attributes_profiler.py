@@ -0,0 +1,51 @@
+from pm4py.statistics.attributes.common.attribute_profile import AttributeProfile
+
+
+def apply(log, parameters=None):
+    """
+    Profiles all the event and trace attributes of the log in a single pass over it
+
+    Parameters
+    -------------
+    log
+        Log
+    parameters
+        Parameters of the profiles, including:
+            max_distinct_values -> Maximum number of distinct values for which the count of each value is kept
+            (above it, the number of distinct values is estimated with HyperLogLog)
+            hll_precision -> Precision of the HyperLogLog estimator
+            quantile_sketch_size -> Capacity of the compactors of the quantile sketches
+
+    Returns
+    -------------
+    event_profiles
+        Dictionary associating to each event attribute its profile
+    trace_profiles
+        Dictionary associating to each trace attribute its profile
+    """
+    if parameters is None:
+        parameters = {}
+
+    event_profiles = {}
+    trace_profiles = {}
+    # attribute -> index of the last trace in which the attribute occurred
+    last_trace = {}
+
+    for index, trace in enumerate(log):
+        for attribute, value in trace.attributes.items():
+            profile = trace_profiles.get(attribute)
+            if profile is None:
+                profile = trace_profiles[attribute] = AttributeProfile(parameters=parameters)
+            profile.add(value)
+            profile.traces_count += 1
+        for event in trace:
+            for attribute, value in event.items():
+                profile = event_profiles.get(attribute)
+                if profile is None:
+                    profile = event_profiles[attribute] = AttributeProfile(parameters=parameters)
+                profile.add(value)
+                if last_trace.get(attribute) != index:
+                    last_trace[attribute] = index
+                    profile.traces_count += 1
+
+    return event_profiles, trace_profiles
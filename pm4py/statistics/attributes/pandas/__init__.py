@@ -0,0 +1 @@
+from pm4py.statistics.attributes.pandas import attributes_profiler
@@ -0,0 +1,102 @@
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from pm4py.algo.filtering.common.filtering_constants import CASE_CONCEPT_NAME
+from pm4py.objects.log.util.general import CASE_ATTRIBUTE_PREFIX
+from pm4py.statistics.attributes.common.attribute_profile import AttributeProfile
+from pm4py.statistics.attributes.common.sketches import HyperLogLog
+from pm4py.util.constants import PARAMETER_CONSTANT_CASEID_KEY
+
+# Python types of the values of the columns with the given numpy kind
+KIND_TYPES = {"i": int, "u": int, "f": float, "b": bool, "M": pd.Timestamp}
+
+
+def fill_profile(profile, series):
+    """
+    Fills the profile with the (not null) values of the series, through vectorised operations
+
+    The HyperLogLog estimator is filled with the hashes computed by pandas, so the profiles obtained from
+    dataframes should not be merged with the profiles of high-cardinality attributes obtained from logs
+    """
+    values = series[series.notna()]
+    profile.count = len(values)
+    if profile.count == 0:
+        return profile
+
+    kind = values.dtype.kind
+    if kind in KIND_TYPES:
+        profile.types[KIND_TYPES[kind]] = profile.count
+    else:
+        profile.types.update(values.map(type).value_counts().to_dict())
+
+    hll = HyperLogLog(precision=profile.hll_precision)
+    hll.add_hashes(pd.util.hash_pandas_object(values, index=False).values)
+    if hll.count() <= profile.max_distinct_values:
+        profile.value_counts = Counter(values.value_counts().to_dict())
+    if profile.value_counts is None or len(profile.value_counts) > profile.max_distinct_values:
+        profile.value_counts = None
+        profile.hll = hll
+
+    if kind in "iuf":
+        numbers = values.to_numpy()
+        if kind == "f":
+            numbers = numbers[~np.isnan(numbers)]
+        if len(numbers) > 0:
+            profile.min = numbers.min().item()
+            profile.max = numbers.max().item()
+            profile.quantiles.add_values(numbers)
+    return profile
+
+
+def apply(df, parameters=None):
+    """
+    Profiles all the columns of the dataframe: the columns starting with the case attribute prefix are profiled
+    as trace attributes (one value per case), the other ones as event attributes
+
+    Parameters
+    -------------
+    df
+        Dataframe
+    parameters
+        Parameters of the profiles, including:
+            case_id_glue -> Column that contains the Case ID
+            max_distinct_values -> Maximum number of distinct values for which the count of each value is kept
+            (above it, the number of distinct values is estimated with HyperLogLog)
+            hll_precision -> Precision of the HyperLogLog estimator
+            quantile_sketch_size -> Capacity of the compactors of the quantile sketches
+
+    Returns
+    -------------
+    event_profiles
+        Dictionary associating to each event attribute its profile
+    trace_profiles
+        Dictionary associating to each trace attribute its profile
+    """
+    if parameters is None:
+        parameters = {}
+
+    case_id_glue = parameters[
+        PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_CONCEPT_NAME
+
+    event_columns = [x for x in df.columns if not str(x).startswith(CASE_ATTRIBUTE_PREFIX)]
+    trace_columns = [x for x in df.columns if str(x).startswith(CASE_ATTRIBUTE_PREFIX)]
+
+    event_profiles = {}
+    trace_profiles = {}
+
+    # number of cases in which each column has a value, in one grouping
+    traces_count = df[event_columns].notna().groupby(df[case_id_glue], sort=False).any().sum()
+    for column in event_columns:
+        event_profiles[column] = fill_profile(AttributeProfile(parameters=parameters), df[column])
+        event_profiles[column].traces_count = int(traces_count[column])
+
+    if trace_columns:
+        # the value of the case attributes is taken from the first event of each case
+        case_values = df[trace_columns].groupby(df[case_id_glue], sort=False).first()
+        for column in trace_columns:
+            trace_profiles[column] = fill_profile(AttributeProfile(parameters=parameters), case_values[column])
+            trace_profiles[column].traces_count = trace_profiles[column].count
+
+    return event_profiles, trace_profiles
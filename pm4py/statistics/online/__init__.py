@@ -0,0 +1 @@
+from pm4py.statistics.online import online_statistics
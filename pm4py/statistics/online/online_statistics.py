@@ -0,0 +1,336 @@
+import copy
+from collections import Counter
+
+from pm4py.algo.filtering.common.filtering_constants import CASE_CONCEPT_NAME
+from pm4py.objects.log.util.xes import DEFAULT_NAME_KEY, DEFAULT_TIMESTAMP_KEY
+from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY, PARAMETER_CONSTANT_CASEID_KEY
+from pm4py.util.constants import PARAMETER_CONSTANT_TIMESTAMP_KEY
+
+# positions of the fields in the state of a case
+FIRST_ACTIVITY = 0
+LAST_ACTIVITY = 1
+FIRST_TIMESTAMP = 2
+LAST_TIMESTAMP = 3
+VARIANT_NODE = 4
+
+# positions of the fields in the performance statistics of a couple of activities
+PERF_SUM = 0
+PERF_COUNT = 1
+PERF_MIN = 2
+PERF_MAX = 3
+
+# node of the prefix tree of the variants corresponding to the empty sequence of activities
+ROOT_NODE = 0
+
+
+class OnlineStatistics(object):
+    """
+    Statistics of a process (DFG frequency and performance, start and end activities, variants and case
+    durations) kept up to date while the events (case ID, activity, timestamp) arrive, one at a time or in
+    batches, in constant amortised time per event. The events of each case are expected to arrive in
+    chronological order.
+
+    The variants are kept in a prefix tree: each case points to the node of its sequence of activities,
+    that moves to a child node when an event arrives, and the string of a variant is built only when requested
+    """
+
+    def __init__(self, parameters=None):
+        """
+        Constructor
+
+        Parameters
+        -------------
+        parameters
+            Parameters of the algorithm, including:
+                case_id_glue -> Attribute that contains the Case ID (events added through add_event_dict)
+                activity_key -> Attribute that contains the activity (events added through add_event_dict)
+                timestamp_key -> Attribute that contains the timestamp (events added through add_event_dict)
+        """
+        if parameters is None:
+            parameters = {}
+
+        self.case_id_glue = parameters[
+            PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_CONCEPT_NAME
+        self.activity_key = parameters[
+            PARAMETER_CONSTANT_ACTIVITY_KEY] if PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else DEFAULT_NAME_KEY
+        self.timestamp_key = parameters[
+            PARAMETER_CONSTANT_TIMESTAMP_KEY] if PARAMETER_CONSTANT_TIMESTAMP_KEY in parameters else \
+            DEFAULT_TIMESTAMP_KEY
+
+        # case ID -> [first activity, last activity, first timestamp, last timestamp, variant node]
+        self.cases = {}
+        self.dfg_frequency = Counter()
+        # couple of activities -> [sum, count, min, max] of the times between them (in seconds)
+        self.dfg_performance = {}
+        self.start_activities = Counter()
+        self.end_activities = Counter()
+        # prefix tree of the variants: (node, activity) -> child node, and parent and activity of each node
+        self.variant_children = {}
+        self.variant_parents = [None]
+        self.variant_activities = [None]
+        # variant node -> number of cases currently having it as variant
+        self.variant_counts = Counter()
+        self.events_count = 0
+
+    def get_child_node(self, node, activity):
+        """
+        Gets the node of the prefix tree reached from the given node with the given activity
+        """
+        child = self.variant_children.get((node, activity))
+        if child is None:
+            child = len(self.variant_parents)
+            self.variant_children[(node, activity)] = child
+            self.variant_parents.append(node)
+            self.variant_activities.append(activity)
+        return child
+
+    def add_event(self, case_id, activity, timestamp=None):
+        """
+        Adds an event to the statistics
+
+        Parameters
+        -------------
+        case_id
+            Case ID of the event
+        activity
+            Activity of the event
+        timestamp
+            Timestamp of the event (if None, the event does not contribute to the performance measures)
+        """
+        self.events_count += 1
+        case = self.cases.get(case_id)
+        if case is None:
+            node = self.get_child_node(ROOT_NODE, activity)
+            self.cases[case_id] = [activity, activity, timestamp, timestamp, node]
+            self.start_activities[activity] += 1
+            self.end_activities[activity] += 1
+            self.variant_counts[node] += 1
+            return
+
+        previous_activity = case[LAST_ACTIVITY]
+        couple = (previous_activity, activity)
+        self.dfg_frequency[couple] += 1
+        if timestamp is not None and case[LAST_TIMESTAMP] is not None:
+            self.update_performance(couple, (timestamp - case[LAST_TIMESTAMP]).total_seconds())
+
+        self.end_activities[previous_activity] -= 1
+        if not self.end_activities[previous_activity]:
+            del self.end_activities[previous_activity]
+        self.end_activities[activity] += 1
+
+        node = case[VARIANT_NODE]
+        self.variant_counts[node] -= 1
+        if not self.variant_counts[node]:
+            del self.variant_counts[node]
+        node = self.get_child_node(node, activity)
+        self.variant_counts[node] += 1
+
+        case[LAST_ACTIVITY] = activity
+        case[VARIANT_NODE] = node
+        if timestamp is not None:
+            if case[FIRST_TIMESTAMP] is None:
+                case[FIRST_TIMESTAMP] = timestamp
+            case[LAST_TIMESTAMP] = timestamp
+
+    def update_performance(self, couple, value, count=1, min_value=None, max_value=None):
+        """
+        Adds the time(s) between a couple of activities to the performance statistics
+        """
+        min_value = value if min_value is None else min_value
+        max_value = value if max_value is None else max_value
+        stats = self.dfg_performance.get(couple)
+        if stats is None:
+            self.dfg_performance[couple] = [value, count, min_value, max_value]
+        else:
+            stats[PERF_SUM] += value
+            stats[PERF_COUNT] += count
+            stats[PERF_MIN] = min(stats[PERF_MIN], min_value)
+            stats[PERF_MAX] = max(stats[PERF_MAX], max_value)
+
+    def add_events(self, events):
+        """
+        Adds a batch of events to the statistics
+
+        Parameters
+        -------------
+        events
+            Iterable of (case ID, activity, timestamp) tuples
+        """
+        for case_id, activity, timestamp in events:
+            self.add_event(case_id, activity, timestamp)
+
+    def add_event_dict(self, event):
+        """
+        Adds an event expressed as a dictionary of attributes (e.g. an event of an EventStream)
+        """
+        self.add_event(event[self.case_id_glue], event[self.activity_key],
+                       event[self.timestamp_key] if self.timestamp_key in event else None)
+
+    def add_event_stream(self, stream):
+        """
+        Adds the events of an event stream (or any iterable of events expressed as dictionaries)
+        """
+        for event in stream:
+            self.add_event_dict(event)
+
+    def add_dataframe(self, df):
+        """
+        Adds the events of a dataframe, in the order of its rows
+        """
+        timestamps = df[self.timestamp_key] if self.timestamp_key in df.columns else [None] * len(df)
+        self.add_events(zip(df[self.case_id_glue].tolist(), df[self.activity_key].tolist(), timestamps))
+
+    def map_node(self, other, other_node, nodes_map, start_node=ROOT_NODE):
+        """
+        Gets the node of this prefix tree reached from start_node with the sequence of activities of a node of
+        the prefix tree of another aggregator
+        """
+        path = []
+        while other_node != ROOT_NODE and other_node not in nodes_map:
+            path.append(other_node)
+            other_node = other.variant_parents[other_node]
+        node = start_node if other_node == ROOT_NODE else nodes_map[other_node]
+        for path_node in reversed(path):
+            node = self.get_child_node(node, other.variant_activities[path_node])
+            if start_node == ROOT_NODE:
+                nodes_map[path_node] = node
+        return node
+
+    def merge(self, other):
+        """
+        Merges the statistics of another aggregator (with the same keys) in this one, e.g. to combine the
+        aggregators of different partitions of a stream. The events of a case present in both the aggregators
+        are considered to follow, in the other aggregator, the ones of this aggregator
+
+        Parameters
+        -------------
+        other
+            Other aggregator (not modified)
+        """
+        self.events_count += other.events_count
+        self.dfg_frequency.update(other.dfg_frequency)
+        for couple, stats in other.dfg_performance.items():
+            self.update_performance(couple, stats[PERF_SUM], count=stats[PERF_COUNT], min_value=stats[PERF_MIN],
+                                    max_value=stats[PERF_MAX])
+
+        nodes_map = {}
+        for case_id, other_case in other.cases.items():
+            case = self.cases.get(case_id)
+            if case is None:
+                node = self.map_node(other, other_case[VARIANT_NODE], nodes_map)
+                self.cases[case_id] = other_case[:VARIANT_NODE] + [node]
+                self.start_activities[other_case[FIRST_ACTIVITY]] += 1
+                self.end_activities[other_case[LAST_ACTIVITY]] += 1
+                self.variant_counts[node] += 1
+                continue
+
+            # the two parts of the case are joined by the couple (last activity here, first activity there)
+            couple = (case[LAST_ACTIVITY], other_case[FIRST_ACTIVITY])
+            self.dfg_frequency[couple] += 1
+            if case[LAST_TIMESTAMP] is not None and other_case[FIRST_TIMESTAMP] is not None:
+                self.update_performance(couple, (other_case[FIRST_TIMESTAMP] - case[LAST_TIMESTAMP]).total_seconds())
+
+            self.end_activities[case[LAST_ACTIVITY]] -= 1
+            if not self.end_activities[case[LAST_ACTIVITY]]:
+                del self.end_activities[case[LAST_ACTIVITY]]
+            self.end_activities[other_case[LAST_ACTIVITY]] += 1
+
+            node = case[VARIANT_NODE]
+            self.variant_counts[node] -= 1
+            if not self.variant_counts[node]:
+                del self.variant_counts[node]
+            node = self.map_node(other, other_case[VARIANT_NODE], {}, start_node=node)
+            self.variant_counts[node] += 1
+
+            case[LAST_ACTIVITY] = other_case[LAST_ACTIVITY]
+            case[VARIANT_NODE] = node
+            if case[FIRST_TIMESTAMP] is None:
+                case[FIRST_TIMESTAMP] = other_case[FIRST_TIMESTAMP]
+            if other_case[LAST_TIMESTAMP] is not None:
+                case[LAST_TIMESTAMP] = other_case[LAST_TIMESTAMP]
+
+    def snapshot(self):
+        """
+        Gets an independent copy of the current state of the aggregator (that can be pickled, stored and
+        merged later)
+        """
+        return copy.deepcopy(self)
+
+    def get_dfg(self, measure="frequency", perf_aggregation_key="mean"):
+        """
+        Gets the DFG
+
+        Parameters
+        -------------
+        measure
+            Measure to use (frequency/performance/both)
+        perf_aggregation_key
+            Performance aggregation key (mean, min, max, sum)
+
+        Returns
+        -------------
+        dfg
+            DFG in the chosen measure (may be only the frequency, only the performance, or both)
+        """
+        if perf_aggregation_key not in ["mean", "min", "max", "sum"]:
+            raise ValueError("aggregation not supported on online statistics: " + str(perf_aggregation_key))
+
+        dfg_performance = {}
+        for couple, stats in self.dfg_performance.items():
+            if perf_aggregation_key == "mean":
+                dfg_performance[couple] = stats[PERF_SUM] / stats[PERF_COUNT]
+            elif perf_aggregation_key == "sum":
+                dfg_performance[couple] = stats[PERF_SUM]
+            elif perf_aggregation_key == "min":
+                dfg_performance[couple] = stats[PERF_MIN]
+            else:
+                dfg_performance[couple] = stats[PERF_MAX]
+
+        if measure == "frequency":
+            return dict(self.dfg_frequency)
+
+        if measure == "performance":
+            return dfg_performance
+
+        return [dict(self.dfg_frequency), dfg_performance]
+
+    def get_start_activities(self):
+        """
+        Gets the start activities along with their count
+        """
+        return dict(self.start_activities)
+
+    def get_end_activities(self):
+        """
+        Gets the end activities (last activity of each case seen so far) along with their count
+        """
+        return dict(self.end_activities)
+
+    def get_variant(self, node):
+        """
+        Gets the variant (activities separated by a comma) corresponding to a node of the prefix tree
+        """
+        activities = []
+        while node != ROOT_NODE:
+            activities.append(self.variant_activities[node])
+            node = self.variant_parents[node]
+        return ",".join(reversed(activities))
+
+    def get_variants_count(self):
+        """
+        Gets the variants (activities separated by a comma) along with the number of cases having them
+        """
+        return {self.get_variant(node): count for node, count in self.variant_counts.items()}
+
+    def get_case_durations(self):
+        """
+        Gets the duration (in seconds) of each case seen so far
+        """
+        return {case_id: (case[LAST_TIMESTAMP] - case[FIRST_TIMESTAMP]).total_seconds() if case[
+            FIRST_TIMESTAMP] is not None else 0.0 for case_id, case in self.cases.items()}
+
+    def get_all_casedurations(self):
+        """
+        Gets all the case durations (sorted)
+        """
+        return sorted(self.get_case_durations().values())
@@ -1,8 +1,9 @@
-from scipy.stats import gaussian_kde
 import numpy as np
 import json
 import math
 
+from pm4py.util import kde
+
 
 def get_kde_caseduration(duration_values, parameters=None):
     """
@@ -15,6 +16,7 @@ def get_kde_caseduration(duration_values, parameters=None):
     parameters
         Possible parameters of the algorithm, including:
             graph_points -> number of points to include in the graph
+            kde_binned, kde_grid_size, kde_pre_aggregation -> options of the estimation (see pm4py.util.kde)
 
     Returns
     --------------
@@ -27,13 +29,14 @@ def get_kde_caseduration(duration_values, parameters=None):
         parameters = {}
 
     graph_points = parameters["graph_points"] if "graph_points" in parameters else 200
-    duration_values = sorted(duration_values)
-    density = gaussian_kde(duration_values)
-    xs1 = list(np.linspace(min(duration_values), max(duration_values), graph_points/2))
-    xs2 = list(np.geomspace(max(min(duration_values), 0.001), max(duration_values), graph_points/2))
+    duration_values = np.asarray(duration_values, dtype=np.float64)
+    min_value = duration_values.min()
+    max_value = duration_values.max()
+    xs1 = list(np.linspace(min_value, max_value, graph_points // 2))
+    xs2 = list(np.geomspace(max(min_value, 0.001), max_value, graph_points // 2))
     xs = sorted(xs1 + xs2)
 
-    return [xs, list(density(xs))]
+    return [xs, list(kde.get_density(duration_values, xs, parameters=parameters))]
 
 
 def get_kde_caseduration_json(duration_values, parameters=None):
@@ -1,6 +1,8 @@
+import numpy as np
 import pandas as pd
 
 from pm4py.algo.filtering.common.filtering_constants import CASE_CONCEPT_NAME
+from pm4py.objects.log.util import case_table
 from pm4py.objects.log.util import xes
 from pm4py.objects.log.util.xes import DEFAULT_TIMESTAMP_KEY
 from pm4py.statistics.traces.common import case_duration as case_duration_commons
@@ -34,10 +36,16 @@ def get_variant_statistics(df, parameters=None):
     case_id_glue = parameters[
         PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_CONCEPT_NAME
     max_variants_to_return = parameters["max_variants_to_return"] if "max_variants_to_return" in parameters else None
-    variants_df = parameters["variants_df"] if "variants_df" in parameters else get_variants_df(df,
-                                                                                                parameters=parameters)
-    variants_df = variants_df.reset_index()
-    variants_list = variants_df.groupby("variant").agg("count").reset_index().to_dict('records')
+    if "variants_df" in parameters:
+        variants_df = parameters["variants_df"].reset_index()
+        variants_list = variants_df.groupby("variant").agg("count").reset_index().to_dict('records')
+    else:
+        # the variants are counted on their codes, and only the distinct variants are decoded
+        cases, case_variants, variants_sequences, activities = get_variants_codes(df, parameters=parameters)
+        counts = np.bincount(case_variants, minlength=len(variants_sequences)).tolist()
+        variants_list = sorted([{"variant": variant, case_id_glue: count} for variant, count in
+                                zip(decode_variants(variants_sequences, activities), counts)],
+                               key=lambda x: x["variant"])
     variants_list = sorted(variants_list, key=lambda x: x[case_id_glue], reverse=True)
     if max_variants_to_return:
         variants_list = variants_list[:min(len(variants_list), max_variants_to_return)]
@@ -98,6 +106,8 @@ def get_cases_description(df, parameters=None):
             sort_ascending -> Set sort direction (boolean; it true then the sort direction is ascending,
             otherwise descending)
             max_ret_cases -> Set the maximum number of returned traces
+            use_case_table_cache -> If True, stores the case table with the dataframe and reuses the stored one
+            (see pm4py.objects.log.util.case_table)
 
     Returns
     -----------
@@ -115,22 +125,18 @@ def get_cases_description(df, parameters=None):
     sort_by_column = parameters["sort_by_column"] if "sort_by_column" in parameters else "startTime"
     sort_ascending = parameters["sort_ascending"] if "sort_ascending" in parameters else "ascending"
     max_ret_cases = parameters["max_ret_cases"] if "max_ret_cases" in parameters else None
-
-    grouped_df = df[[case_id_glue, timestamp_key]].groupby(df[case_id_glue])
-    first_eve_df = grouped_df.first()
-    last_eve_df = grouped_df.last()
-    del grouped_df
-    last_eve_df.columns = [str(col) + '_2' for col in first_eve_df.columns]
-    stacked_df = pd.concat([first_eve_df, last_eve_df], axis=1)
-    del first_eve_df
-    del last_eve_df
-    del stacked_df[case_id_glue]
-    del stacked_df[case_id_glue + "_2"]
-    stacked_df['caseDuration'] = stacked_df[timestamp_key + "_2"] - stacked_df[timestamp_key]
-    stacked_df['caseDuration'] = stacked_df['caseDuration'].astype('timedelta64[s]')
-    stacked_df[timestamp_key + "_2"] = stacked_df[timestamp_key + "_2"].astype('int64') // 10 ** 9
-    stacked_df[timestamp_key] = stacked_df[timestamp_key].astype('int64') // 10 ** 9
-    stacked_df = stacked_df.rename(columns={timestamp_key: 'startTime', timestamp_key + "_2": 'endTime'})
+    use_cache = parameters[
+        case_table.PARAMETER_USE_CACHE] if case_table.PARAMETER_USE_CACHE in parameters else False
+
+    table = case_table.get_case_table(df, parameters={PARAMETER_CONSTANT_CASEID_KEY: case_id_glue,
+                                                       PARAMETER_CONSTANT_TIMESTAMP_KEY: timestamp_key,
+                                                       case_table.PARAMETER_USE_CACHE: use_cache}).table
+    epoch = pd.Timestamp(0, tz="UTC")
+    stacked_df = pd.DataFrame({"startTime": (pd.to_datetime(table[case_table.START_TIMESTAMP], utc=True) - epoch) //
+                                            pd.Timedelta(seconds=1),
+                               "endTime": (pd.to_datetime(table[case_table.END_TIMESTAMP], utc=True) - epoch) //
+                                          pd.Timedelta(seconds=1),
+                               "caseDuration": np.floor(table[case_table.DURATION].values)}, index=table.index)
     if enable_sort:
         stacked_df = stacked_df.sort_values(sort_by_column, ascending=sort_ascending)
 
@@ -140,6 +146,159 @@ def get_cases_description(df, parameters=None):
     return ret
 
 
+def get_variants_codes(df, parameters=None):
+    """
+    Computes the variants of the cases of a Pandas dataframe working on integer codes: the activities are
+    factorized, the events are grouped by case with a stable sort (keeping their order inside the case), and the
+    code sequences are encoded level by level as the nodes of a prefix tree (two cases share the node at the end
+    of their sequences exactly when they have the same variant), so no string is built per case
+
+    Parameters
+    -----------
+    df
+        Dataframe
+    parameters
+        Parameters of the algorithm, including:
+            case_id_glue -> Column that contains the Case ID
+            activity_key -> Column that contains the activity
+
+    Returns
+    -----------
+    cases
+        Index of the (sorted) case IDs
+    case_variants
+        Numpy array containing, for each case, the number of its variant
+    variants_sequences
+        List containing, for each variant, the Numpy array of the codes of its activities
+    activities
+        Activities (the code of an activity is its position)
+    """
+    if parameters is None:
+        parameters = {}
+
+    present, case_codes, cases, activity_codes, activities = get_events_codes(df, parameters=parameters)
+    case_variants, variants_sequences = encode_variants(case_codes, activity_codes, len(cases), len(activities))
+
+    return cases, case_variants, variants_sequences, activities
+
+
+def get_events_codes(df, parameters=None):
+    """
+    Factorizes the case IDs and the activities of the events of a Pandas dataframe
+
+    Parameters
+    -----------
+    df
+        Dataframe
+    parameters
+        Parameters of the algorithm, including:
+            case_id_glue -> Column that contains the Case ID
+            activity_key -> Column that contains the activity
+
+    Returns
+    -----------
+    present
+        Boolean mask of the rows having both a case ID and an activity
+    case_codes
+        Numpy array of the case codes of these rows (the code of a case is its position in cases)
+    cases
+        Index of the (sorted) case IDs having at least an event with an activity
+    activity_codes
+        Numpy array of the activity codes of these rows
+    activities
+        Activities (the code of an activity is its position)
+    """
+    if parameters is None:
+        parameters = {}
+
+    case_id_glue = parameters[
+        PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_CONCEPT_NAME
+    activity_key = parameters[
+        PARAMETER_CONSTANT_ACTIVITY_KEY] if PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else xes.DEFAULT_NAME_KEY
+
+    case_codes, cases = pd.factorize(df[case_id_glue], sort=True)
+    activity_codes, activities = pd.factorize(df[activity_key])
+    # the events without case ID or activity are not considered
+    present = (case_codes >= 0) & (activity_codes >= 0)
+    if not present.all():
+        case_codes = case_codes[present]
+        activity_codes = activity_codes[present]
+        cases_with_events = np.unique(case_codes)
+        cases = cases[cases_with_events]
+        case_codes = np.searchsorted(cases_with_events, case_codes)
+
+    return present, case_codes, cases, activity_codes, activities
+
+
+def encode_variants(case_codes, activity_codes, no_cases, no_activities):
+    """
+    Encodes the variants of the cases, given the case and activity codes of the events (see get_variants_codes)
+
+    Parameters
+    -----------
+    case_codes
+        Numpy array of the case codes of the events
+    activity_codes
+        Numpy array of the activity codes of the events
+    no_cases
+        Number of cases
+    no_activities
+        Number of activities
+
+    Returns
+    -----------
+    case_variants
+        Numpy array containing, for each case, the number of its variant
+    variants_sequences
+        List containing, for each variant, the Numpy array of the codes of its activities
+    """
+    order = np.argsort(case_codes, kind="mergesort")
+    sequences = activity_codes[order].astype(np.int64)
+    lengths = np.bincount(case_codes, minlength=no_cases)
+    starts = np.zeros(no_cases, dtype=np.int64)
+    starts[1:] = np.cumsum(lengths)[:-1]
+
+    # cases sorted by decreasing length: at the k-th level, the cases having at least k+1 events are a prefix
+    cases_by_length = np.argsort(-lengths, kind="mergesort")
+    sorted_lengths = lengths[cases_by_length]
+    nodes = np.zeros(no_cases, dtype=np.int64)
+    next_node = 1
+    no_activities = max(no_activities, 1)
+    for level in range(int(sorted_lengths[0]) if no_cases > 0 else 0):
+        active = cases_by_length[:np.searchsorted(-sorted_lengths, -level, side="left")]
+        keys = nodes[active] * no_activities + sequences[starts[active] + level]
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        nodes[active] = inverse + next_node
+        next_node += len(unique_keys)
+
+    case_variants, variants_nodes = pd.factorize(nodes)
+    # the first case of each variant is its representative
+    representatives = np.unique(case_variants, return_index=True)[1]
+    variants_sequences = [sequences[starts[case]:starts[case] + lengths[case]] for case in representatives]
+
+    return case_variants, variants_sequences
+
+
+def decode_variants(variants_sequences, activities):
+    """
+    Decodes the variants (expressed as sequences of activity codes) into strings
+
+    Parameters
+    -----------
+    variants_sequences
+        List of sequences of activity codes
+    activities
+        Activities
+
+    Returns
+    -----------
+    variants
+        List of variants (activities separated by comma)
+    """
+    activities = list(activities)
+    return [",".join([activities[code] for code in sequence.tolist()]) for sequence in variants_sequences]
+
+
 def get_variants_df(df, parameters=None):
     """
     Get variants dataframe from a Pandas dataframe
@@ -161,12 +320,85 @@ def get_variants_df(df, parameters=None):
     if parameters is None:
         parameters = {}
 
+    case_id_glue = parameters[
+        PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_CONCEPT_NAME
+
+    cases, case_variants, variants_sequences, activities = get_variants_codes(df, parameters=parameters)
+    # each variant is decoded once, and then associated to its cases
+    variants = np.empty(len(variants_sequences), dtype=object)
+    variants[:] = decode_variants(variants_sequences, activities)
+
+    return pd.DataFrame({"variant": variants[case_variants]}, index=pd.Index(cases, name=case_id_glue))
+
+
+def get_variants_df_from_chunks(chunks, parameters=None):
+    """
+    Get variants dataframe from an iterable of Pandas dataframes (e.g. the chunks of a CSV file read by
+    csv_import_adapter.import_dataframe_chunks_from_path), consuming one chunk at a time.
+    Only the prefix tree of the sequences of activities and the node of each case are kept between the chunks
+    (memory proportional to the number of cases and of distinct prefixes), and the events of a case are expected
+    to appear in chronological order across the chunks (e.g. in a CSV sorted by timestamp)
+
+    Parameters
+    -----------
+    chunks
+        Iterable of dataframes
+    parameters
+        Parameters of the algorithm, including:
+            case_id_glue -> Column that contains the Case ID
+            activity_key -> Column that contains the activity
+            timestamp_key -> Column that contains the timestamp (if present, the events of a case inside a chunk
+            are sorted by it)
+
+    Returns
+    -----------
+    variants_df
+        Variants dataframe
+    """
+    if parameters is None:
+        parameters = {}
+
     case_id_glue = parameters[
         PARAMETER_CONSTANT_CASEID_KEY] if PARAMETER_CONSTANT_CASEID_KEY in parameters else CASE_CONCEPT_NAME
     activity_key = parameters[
         PARAMETER_CONSTANT_ACTIVITY_KEY] if PARAMETER_CONSTANT_ACTIVITY_KEY in parameters else xes.DEFAULT_NAME_KEY
+    timestamp_key = parameters[
+        PARAMETER_CONSTANT_TIMESTAMP_KEY] if PARAMETER_CONSTANT_TIMESTAMP_KEY in parameters else DEFAULT_TIMESTAMP_KEY
 
-    return df.groupby(case_id_glue)[activity_key].agg({'variant': lambda col: ','.join(col)})
+    # prefix tree of the sequences of activities read so far: node 0 is the empty sequence, and each other node
+    # has a parent and an activity. Each case only keeps its node, that is extended chunk by chunk
+    children = {}
+    parents = [-1]
+    labels = [None]
+    case_nodes = {}
+    for chunk in chunks:
+        sort_columns = [case_id_glue, timestamp_key] if timestamp_key in chunk.columns else [case_id_glue]
+        chunk = chunk.sort_values(sort_columns, kind="mergesort")
+        for case, activities in chunk.groupby(case_id_glue, sort=False, observed=True)[activity_key]:
+            node = case_nodes.get(case, 0)
+            for activity in activities:
+                child = children.get((node, activity))
+                if child is None:
+                    child = len(parents)
+                    children[(node, activity)] = child
+                    parents.append(node)
+                    labels.append(activity)
+                node = child
+            case_nodes[case] = node
+
+    # the variant of each reached node is read going up to the root
+    node_variants = {}
+    for node in set(case_nodes.values()):
+        activities = []
+        current = node
+        while current > 0:
+            activities.append(labels[current])
+            current = parents[current]
+        node_variants[node] = ",".join(reversed(activities))
+
+    variants_df = pd.DataFrame({"variant": [node_variants[node] for node in case_nodes.values()]},
+                               index=pd.Index(list(case_nodes), name=case_id_glue))
+    return variants_df.sort_index()
 
 
 def get_events(df, case_id, parameters=None):
@@ -1 +1 @@
-from pm4py.util import lp, versions, constants, points_subset
+from pm4py.util import lp, versions, constants, points_subset, kde
@@ -0,0 +1,159 @@
+import math
+
+import numpy as np
+import pandas as pd
+from scipy.stats import gaussian_kde
+
+# parameter: if True, the density is estimated on a grid (binned KDE); if False, on the raw values (scipy's
+# gaussian_kde); if not specified, the grid is used when there are more than BINNED_THRESHOLD values
+PARAMETER_BINNED = "kde_binned"
+# parameter: number of points of the grid of the binned KDE
+PARAMETER_GRID_SIZE = "kde_grid_size"
+# parameter: if True, the equal values are aggregated (and weighted by their count) before the estimation
+PARAMETER_PRE_AGGREGATION = "kde_pre_aggregation"
+
+BINNED_THRESHOLD = 1000
+DEFAULT_GRID_SIZE = 4096
+# the kernel is truncated at this number of bandwidths
+KERNEL_TRUNCATION = 4.0
+
+
+def get_bandwidth(values, weights):
+    """
+    Gets the bandwidth of the Gaussian kernel with the Scott's rule, as gaussian_kde does; the weights are the
+    number of occurrences of each value
+    """
+    total = np.sum(weights)
+    mean = np.sum(weights * values) / total
+    variance = np.sum(weights * (values - mean) ** 2) / (total - 1.0) if total > 1 else 0.0
+    return math.sqrt(variance) * total ** (-1.0 / 5.0)
+
+
+def get_exact_density(values, xs, weights=None):
+    """
+    Gets the density estimated by gaussian_kde on the values (with the given number of occurrences)
+    """
+    if weights is None:
+        return gaussian_kde(values)(xs)
+    # gaussian_kde considers the weights as reliability weights, hence the bandwidth is given explicitly
+    total = np.sum(weights)
+    mean = np.sum(weights * values) / total
+    squares = np.sum(weights * (values - mean) ** 2)
+    if not squares > 0 or total <= 1:
+        return gaussian_kde(values, weights=weights)(xs)
+    reliability_variance = squares / (total - np.sum(weights ** 2) / total)
+    factor = get_bandwidth(values, weights) / math.sqrt(reliability_variance)
+    return gaussian_kde(values, bw_method=factor, weights=weights)(xs)
+
+
+def get_binned_density(values, xs, weights, grid_size=DEFAULT_GRID_SIZE):
+    """
+    Estimates the density on a regular grid: the (weighted) values are linearly binned on the grid, and the bins
+    are convolved with the Gaussian kernel through the FFT, so the cost is linear in the number of values and
+    O(g log g) in the size of the grid; the density at the requested points is interpolated on the grid
+
+    Parameters
+    -------------
+    values
+        Numpy array of values
+    xs
+        Numpy array of the points at which the density is requested
+    weights
+        Numpy array of the number of occurrences of the values
+    grid_size
+        Number of points of the grid
+
+    Returns
+    -------------
+    density
+        Density at the requested points
+    """
+    bandwidth = get_bandwidth(values, weights)
+    if not bandwidth > 0:
+        # as gaussian_kde, the density of a degenerate distribution cannot be estimated
+        return get_exact_density(values, xs, weights=weights)
+
+    low = min(values.min(), xs.min()) - KERNEL_TRUNCATION * bandwidth
+    high = max(values.max(), xs.max()) + KERNEL_TRUNCATION * bandwidth
+    grid = np.linspace(low, high, grid_size)
+    delta = grid[1] - grid[0]
+
+    # linear binning: each value is split between the two nearest points of the grid
+    positions = (values - low) / delta
+    left = np.minimum(np.floor(positions).astype(np.int64), grid_size - 2)
+    fraction = positions - left
+    bins = np.bincount(left, weights=weights * (1.0 - fraction), minlength=grid_size) + np.bincount(
+        left + 1, weights=weights * fraction, minlength=grid_size)
+
+    half_width = max(1, min(grid_size - 1, int(math.ceil(KERNEL_TRUNCATION * bandwidth / delta))))
+    kernel = np.exp(-0.5 * (np.arange(-half_width, half_width + 1) * delta / bandwidth) ** 2)
+    # the sampled kernel is normalized, so that the density integrates to 1 also on coarse grids
+    kernel = kernel / (np.sum(kernel) * delta)
+
+    fft_size = 1 << int(math.ceil(math.log2(grid_size + 2 * half_width + 1)))
+    convolution = np.fft.irfft(np.fft.rfft(bins, fft_size) * np.fft.rfft(kernel, fft_size), fft_size)
+    density = convolution[half_width:half_width + grid_size] / np.sum(weights)
+
+    return np.interp(xs, grid, np.maximum(density, 0.0))
+
+
+def get_density(values, xs, parameters=None):
+    """
+    Gets the Gaussian KDE estimation of the density of the given values at the given points
+
+    Parameters
+    -------------
+    values
+        Values
+    xs
+        Points at which the density is requested
+    parameters
+        Possible parameters of the algorithm, including:
+            kde_binned -> Use the binned KDE (True), scipy's gaussian_kde on the raw values (False),
+            or decide on the number of values (default)
+            kde_grid_size -> Number of points of the grid of the binned KDE
+            kde_pre_aggregation -> Aggregate the equal values before the estimation
+
+    Returns
+    -------------
+    density
+        Numpy array of the density at the requested points
+    """
+    if parameters is None:
+        parameters = {}
+
+    binned = parameters[PARAMETER_BINNED] if PARAMETER_BINNED in parameters else None
+    grid_size = parameters[PARAMETER_GRID_SIZE] if PARAMETER_GRID_SIZE in parameters else DEFAULT_GRID_SIZE
+    pre_aggregation = parameters[
+        PARAMETER_PRE_AGGREGATION] if PARAMETER_PRE_AGGREGATION in parameters else False
+
+    values = np.asarray(values, dtype=np.float64)
+    xs = np.asarray(xs, dtype=np.float64)
+    if binned is None:
+        binned = len(values) > BINNED_THRESHOLD
+    weights = None
+    if pre_aggregation:
+        values, counts = np.unique(values, return_counts=True)
+        weights = counts.astype(np.float64)
+
+    if not binned:
+        return get_exact_density(values, xs, weights=weights)
+    if weights is None:
+        weights = np.ones(len(values))
+    return get_binned_density(values, xs, weights, grid_size=grid_size)
+
+
+def get_timestamps_seconds(values):
+    """
+    Converts a list of datetimes to the number of seconds from the epoch of their wall time (the timezone
+    is dropped)
+    """
+    values = list(values)
+    try:
+        index = pd.DatetimeIndex(pd.to_datetime(values))
+        if index.tz is not None:
+            index = index.tz_localize(None)
+    except (TypeError, ValueError):
+        # e.g. different UTC offsets
+        index = pd.DatetimeIndex([x.replace(tzinfo=None) for x in values])
+    return np.asarray((index - pd.Timestamp(0)) / pd.Timedelta(seconds=1), dtype=np.float64)
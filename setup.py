@@ -37,13 +37,15 @@ setup(
               'pm4py.algo.filtering.log.cases', 'pm4py.algo.filtering.log.paths', 'pm4py.algo.filtering.log.variants',
               'pm4py.algo.filtering.log.timestamp', 'pm4py.algo.filtering.log.attributes',
               'pm4py.algo.filtering.log.auto_filter', 'pm4py.algo.filtering.log.end_activities',
-              'pm4py.algo.filtering.log.start_activities', 'pm4py.algo.filtering.common',
-              'pm4py.algo.filtering.common.timestamp', 'pm4py.algo.filtering.common.attributes',
-              'pm4py.algo.filtering.common.end_activities', 'pm4py.algo.filtering.common.start_activities',
+              'pm4py.algo.filtering.log.start_activities', 'pm4py.algo.filtering.log.filter_plan',
+              'pm4py.algo.filtering.common', 'pm4py.algo.filtering.common.timestamp',
+              'pm4py.algo.filtering.common.attributes', 'pm4py.algo.filtering.common.end_activities',
+              'pm4py.algo.filtering.common.start_activities', 'pm4py.algo.filtering.common.filter_plan',
               'pm4py.algo.filtering.pandas', 'pm4py.algo.filtering.pandas.cases', 'pm4py.algo.filtering.pandas.paths',
               'pm4py.algo.filtering.pandas.variants', 'pm4py.algo.filtering.pandas.timestamp',
               'pm4py.algo.filtering.pandas.attributes', 'pm4py.algo.filtering.pandas.auto_filter',
               'pm4py.algo.filtering.pandas.end_activities', 'pm4py.algo.filtering.pandas.start_activities',
+              'pm4py.algo.filtering.pandas.filter_plan', 'pm4py.algo.filtering.pandas.case_mask',
               'pm4py.algo.simulation', 'pm4py.algo.simulation.playout', 'pm4py.algo.simulation.playout.versions',
               'pm4py.algo.simulation.playout.data_structures', 'pm4py.algo.simulation.tree_generator',
               'pm4py.algo.simulation.tree_generator.versions', 'pm4py.algo.conformance',
@@ -57,9 +59,11 @@ setup(
               'pm4py.objects.log.exporter.csv', 'pm4py.objects.log.exporter.csv.versions',
               'pm4py.objects.log.exporter.xes', 'pm4py.objects.log.exporter.xes.versions',
               'pm4py.objects.log.exporter.parquet', 'pm4py.objects.log.exporter.parquet.versions',
+              'pm4py.objects.log.exporter.snapshot', 'pm4py.objects.log.exporter.snapshot.versions',
               'pm4py.objects.log.importer', 'pm4py.objects.log.importer.csv', 'pm4py.objects.log.importer.csv.versions',
               'pm4py.objects.log.importer.xes', 'pm4py.objects.log.importer.xes.versions',
               'pm4py.objects.log.importer.parquet', 'pm4py.objects.log.importer.parquet.versions',
+              'pm4py.objects.log.importer.snapshot', 'pm4py.objects.log.importer.snapshot.versions',
               'pm4py.objects.petri', 'pm4py.objects.petri.common', 'pm4py.objects.petri.exporter',
               'pm4py.objects.petri.importer', 'pm4py.objects.conversion', 'pm4py.objects.conversion.log',
               'pm4py.objects.conversion.log.versions', 'pm4py.objects.conversion.process_tree',
@@ -73,6 +77,8 @@ setup(
               'pm4py.evaluation.generalization.versions', 'pm4py.evaluation.replay_fitness',
               'pm4py.evaluation.replay_fitness.versions', 'pm4py.statistics', 'pm4py.statistics.traces',
               'pm4py.statistics.traces.log', 'pm4py.statistics.traces.common', 'pm4py.statistics.traces.pandas',
+              'pm4py.statistics.online', 'pm4py.statistics.attributes', 'pm4py.statistics.attributes.common',
+              'pm4py.statistics.attributes.log', 'pm4py.statistics.attributes.pandas',
               'pm4py.visualization', 'pm4py.visualization.dfg', 'pm4py.visualization.dfg.versions',
               'pm4py.visualization.sna', 'pm4py.visualization.sna.versions', 'pm4py.visualization.common',
               'pm4py.visualization.graphs', 'pm4py.visualization.graphs.util', 'pm4py.visualization.graphs.versions',
@@ -0,0 +1,94 @@
+import os
+import unittest
+
+from pm4py.algo.discovery.alpha import factory as alpha_miner
+from pm4py.algo.discovery.dfg import factory as dfg_factory
+from pm4py.objects.conversion.log import factory as log_conv_fact
+from pm4py.objects.conversion.log.versions import to_event_log, to_event_stream, to_dataframe
+from pm4py.objects.log.adapters.pandas import csv_import_adapter
+from pm4py.objects.log.columnar import ColumnarEventLog
+from pm4py.objects.log.exporter.xes import factory as xes_exporter
+from pm4py.objects.log.importer.parquet import factory as parquet_importer
+from pm4py.objects.log.importer.xes import factory as xes_importer
+from tests.constants import INPUT_DATA_DIR, OUTPUT_DATA_DIR
+
+
+class ColumnarLogTest(unittest.TestCase):
+    def test_columnar_log_equivalence(self):
+        log = xes_importer.import_log(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        columnar_log = log_conv_fact.apply(log, variant=log_conv_fact.TO_COLUMNAR_LOG)
+        self.assertIsInstance(columnar_log, ColumnarEventLog)
+        self.assertEqual(len(log), len(columnar_log))
+        for trace, columnar_trace in zip(log, columnar_log):
+            self.assertEqual(dict(trace.attributes), dict(columnar_trace.attributes))
+            self.assertEqual(len(trace), len(columnar_trace))
+            for event, columnar_event in zip(trace, columnar_trace):
+                self.assertEqual(dict(event), dict(columnar_event))
+                for key in event:
+                    self.assertIs(type(event[key]), type(columnar_event[key]))
+        self.assertEqual(dict(log[-1][-1]), dict(columnar_log[-1][-1]))
+
+    def test_columnar_log_algorithms(self):
+        log = xes_importer.import_log(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        columnar_log = log_conv_fact.apply(log, variant=log_conv_fact.TO_COLUMNAR_LOG)
+        self.assertEqual(dfg_factory.apply(log), dfg_factory.apply(columnar_log))
+        net, im, fm = alpha_miner.apply(columnar_log)
+        del net, im, fm
+        xes_exporter.export_log(columnar_log, os.path.join(OUTPUT_DATA_DIR, "running-example-columnar.xes"))
+        log_imported_after_export = xes_importer.import_log(
+            os.path.join(OUTPUT_DATA_DIR, "running-example-columnar.xes"))
+        self.assertEqual(len(log), len(log_imported_after_export))
+        os.remove(os.path.join(OUTPUT_DATA_DIR, "running-example-columnar.xes"))
+
+    def test_columnar_event_update(self):
+        log = xes_importer.import_log(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        columnar_log = log_conv_fact.apply(log, variant=log_conv_fact.TO_COLUMNAR_LOG)
+        event = columnar_log[0][0]
+        event["concept:name"] = "new activity"
+        event["Costs"] = 10
+        event["new_attribute"] = 1.5
+        del event["org:resource"]
+        self.assertEqual(columnar_log[0][0]["concept:name"], "new activity")
+        self.assertEqual(columnar_log[0][0]["Costs"], 10)
+        self.assertEqual(columnar_log[0][0]["new_attribute"], 1.5)
+        self.assertNotIn("org:resource", columnar_log[0][0])
+        self.assertNotIn("new_attribute", columnar_log[0][1])
+
+    def test_dataframe_conversion(self):
+        df = csv_import_adapter.import_dataframe_from_path(os.path.join(INPUT_DATA_DIR, "reviewing.csv"))
+        log = to_event_log.transform_event_stream_to_event_log(to_event_stream.apply(df))
+        for converted_log in [log_conv_fact.apply(df), log_conv_fact.apply(df, variant=log_conv_fact.TO_COLUMNAR_LOG)]:
+            self.assertEqual(len(log), len(converted_log))
+            for trace, converted_trace in zip(log, converted_log):
+                self.assertEqual(dict(trace.attributes), dict(converted_trace.attributes))
+                self.assertEqual(len(trace), len(converted_trace))
+                for event, converted_event in zip(trace, converted_trace):
+                    self.assertEqual(set(event), set(converted_event))
+                    for key in event:
+                        self.assertIs(type(event[key]), type(converted_event[key]))
+
+    def test_log_to_dataframe_conversion(self):
+        log = xes_importer.import_log(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        df = log_conv_fact.apply(log, variant=log_conv_fact.TO_DATAFRAME,
+                                 parameters={to_dataframe.CATEGORICAL_COLUMNS: ["concept:name"]})
+        self.assertEqual(sum(len(trace) for trace in log), len(df))
+        self.assertEqual(str(df["concept:name"].dtype), "category")
+        self.assertTrue(str(df["time:timestamp"].dtype).startswith("datetime64"))
+        self.assertEqual(list(df["case:concept:name"].unique()), [trace.attributes["concept:name"] for trace in log])
+        columnar_log = log_conv_fact.apply(log, variant=log_conv_fact.TO_COLUMNAR_LOG)
+        df2 = log_conv_fact.apply(columnar_log, variant=log_conv_fact.TO_DATAFRAME)
+        self.assertEqual(set(df.columns), set(df2.columns))
+        self.assertEqual(df["concept:name"].tolist(), df2["concept:name"].tolist())
+        self.assertEqual(df["time:timestamp"].tolist(), df2["time:timestamp"].tolist())
+
+    def test_dataframe_microseconds_conversion(self):
+        # the timestamps read from this Parquet file have microseconds as unit
+        df = parquet_importer.import_log(os.path.join(INPUT_DATA_DIR, "receipt.parquet"))
+        self.assertEqual(str(df["time:timestamp"].dtype), "datetime64[us, UTC]")
+        columnar_log = log_conv_fact.apply(df, variant=log_conv_fact.TO_COLUMNAR_LOG)
+        first_case = df[df["case:concept:name"] == columnar_log[0].attributes["concept:name"]]
+        self.assertEqual([event["time:timestamp"] for event in columnar_log[0]], first_case["time:timestamp"].tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
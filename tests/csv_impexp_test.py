@@ -1,7 +1,11 @@
 import os
+import shutil
 import unittest
 
+import pandas as pd
+
 from pm4py.objects.conversion.log import factory as log_conv_fact
+from pm4py.objects.log import columnar
 from pm4py.objects.log.exporter.csv import factory as csv_exporter
 from pm4py.objects.log.exporter.xes import factory as xes_exporter
 from pm4py.objects.log.importer.csv import factory as csv_importer
@@ -9,6 +13,9 @@ from pm4py.objects.log.importer.xes import factory as xes_importer
 from pm4py.objects.log.importer.parquet import factory as parquet_importer
 from pm4py.objects.log.exporter.parquet import factory as parquet_exporter
 from pm4py.objects.log.util import sampling, sorting, index_attribute
+from pm4py.objects.log.adapters.pandas import csv_import_adapter
+from pm4py.algo.discovery.dfg.adapters.pandas import df_statistics
+from pm4py.statistics.traces.pandas import case_statistics
 from tests.constants import INPUT_DATA_DIR, OUTPUT_DATA_DIR
 
 
@@ -31,6 +38,40 @@ class CsvImportExportTest(unittest.TestCase):
         self.assertEqual(len(log), len(log_imported_after_export))
         os.remove(os.path.join(OUTPUT_DATA_DIR, "running-example-exported.xes"))
 
+    def test_sortingModes(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        event_log = csv_importer.import_event_stream(os.path.join(INPUT_DATA_DIR, "running-example.csv"))
+        for reverse_sort in [False, True]:
+            expected = sorted(event_log, key=lambda x: x["time:timestamp"], reverse=reverse_sort)
+            view = sorting.sort_timestamp(event_log, reverse_sort=reverse_sort, mode=sorting.SORT_VIEW)
+            self.assertEqual([id(x) for x in view], [id(x) for x in expected])
+            copied = sorting.sort_timestamp(event_log, reverse_sort=reverse_sort)
+            self.assertEqual([dict(x) for x in copied], [dict(x) for x in expected])
+        log = log_conv_fact.apply(event_log)
+        copied_log = sorting.sort_timestamp(log)
+        view_log = sorting.sort_timestamp(log, mode=sorting.SORT_VIEW)
+        inplace_log = sorting.sort_timestamp(log, mode=sorting.SORT_INPLACE)
+        self.assertIs(inplace_log, log)
+        self.assertEqual([[dict(x) for x in trace] for trace in copied_log],
+                         [[dict(x) for x in trace] for trace in inplace_log])
+        self.assertEqual([[id(x) for x in trace] for trace in view_log],
+                         [[id(x) for x in trace] for trace in inplace_log])
+        # a columnar log is sorted into a new columnar log, and can not be sorted in place
+        columnar_log = columnar.from_event_log(log)
+        for reverse_sort in [False, True]:
+            sorted_log = sorting.sort_timestamp(log, reverse_sort=reverse_sort)
+            sorted_columnar_log = sorting.sort_timestamp(columnar_log, reverse_sort=reverse_sort)
+            self.assertIsInstance(sorted_columnar_log, columnar.ColumnarEventLog)
+            self.assertEqual([[dict(x) for x in trace] for trace in sorted_columnar_log],
+                             [[dict(x) for x in trace] for trace in sorted_log])
+        self.assertRaises(NotImplementedError, sorting.sort_timestamp, columnar_log, mode=sorting.SORT_INPLACE)
+        # the already sorted values are detected
+        view = sorting.sort_timestamp(event_log, mode=sorting.SORT_VIEW)
+        self.assertIsNone(sorting.get_sorting_order([x["time:timestamp"] for x in view]))
+        self.assertEqual(list(sorting.sort_timestamp(view, mode=sorting.SORT_VIEW)), list(view))
+
     def test_importExportCSVtoCSV(self):
         # to avoid static method warnings in tests,
         # that by construction of the unittest package have to be expressed in such way
@@ -52,7 +93,6 @@ class CsvImportExportTest(unittest.TestCase):
         self.assertEqual(len(log), len(log_imported_after_export))
         os.remove(os.path.join(OUTPUT_DATA_DIR, "running-example-exported.csv"))
 
-
     def test_importExportParquet(self):
         # to avoid static method warnings in tests,
         # that by construction of the unittest package have to be expressed in such way
@@ -63,6 +103,50 @@ class CsvImportExportTest(unittest.TestCase):
         self.assertEqual(len(df1), len(df2))
         os.remove(os.path.join(OUTPUT_DATA_DIR, "running-example.parquet"))
 
+    def test_importExportParquetPartitioned(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        df = csv_import_adapter.import_dataframe_from_path(os.path.join(INPUT_DATA_DIR, "running-example.csv"))
+        path = os.path.join(OUTPUT_DATA_DIR, "running-example-partitioned")
+        parquet_exporter.export_log(df, path, parameters={"partition_by_month": True, "case_buckets": 3})
+        self.assertEqual(len(df), len(parquet_importer.import_log(path)))
+        df2 = parquet_importer.import_log(path, parameters={"case_ids": [1, 3], "activities": ["decide"]})
+        self.assertEqual(len(df[df["case:concept:name"].isin([1, 3]) & (df["concept:name"] == "decide")]),
+                         len(df2))
+        df3 = parquet_importer.import_log(path, parameters={"max_timestamp": "2010-12-31"})
+        self.assertEqual(len(df[df["time:timestamp"] <= pd.Timestamp("2010-12-31", tz="UTC")]), len(df3))
+        shutil.rmtree(path)
+        # some columns of this log (e.g. case:enddate) are null in all the rows of some partitions
+        df = parquet_importer.import_log(os.path.join(INPUT_DATA_DIR, "receipt.parquet"))
+        parquet_exporter.export_log(df, path, parameters={"partition_by_month": True, "case_buckets": 7})
+        self.assertEqual(len(df), len(parquet_importer.import_log(path)))
+        df2 = parquet_importer.import_log(path, parameters={"activities": ["T02 Check confirmation of receipt"]})
+        self.assertEqual(len(df[df["concept:name"] == "T02 Check confirmation of receipt"]), len(df2))
+        shutil.rmtree(path)
+
+    def test_importCSVchunks(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        path = os.path.join(INPUT_DATA_DIR, "running-example.csv")
+        df = csv_import_adapter.import_dataframe_from_path(path)
+        df = df.sort_values("time:timestamp", kind="mergesort")
+        chunks = [df.iloc[i:i + 7] for i in range(0, len(df), 7)]
+        dfg = df_statistics.get_dfg_graph(df)
+        dfg_chunks = df_statistics.get_dfg_graph_from_chunks(chunks)
+        self.assertEqual(dfg, dfg_chunks)
+        variants = df.groupby("case:concept:name")["concept:name"].apply(",".join)
+        variants_chunks = case_statistics.get_variants_df_from_chunks(chunks)
+        self.assertEqual(variants.to_dict(), variants_chunks["variant"].to_dict())
+        df2 = csv_import_adapter.import_dataframe_from_path(path, chunksize=5, usecols=["case:concept:name",
+                                                                                        "concept:name",
+                                                                                        "time:timestamp"],
+                                                             categorical_columns=["concept:name"])
+        self.assertEqual(len(df), len(df2))
+        self.assertEqual(str(df2["concept:name"].dtype), "category")
+        self.assertEqual(dfg, df_statistics.get_dfg_graph(df2))
+
 
 if __name__ == "__main__":
     unittest.main()
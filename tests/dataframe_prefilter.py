@@ -1,14 +1,23 @@
 import os
 import unittest
 
+import pandas as pd
+
 from pm4py.algo.filtering.pandas.attributes import attributes_filter
 from pm4py.algo.filtering.pandas.auto_filter import auto_filter
+from pm4py.algo.filtering.pandas.case_mask import case_mask
 from pm4py.algo.filtering.pandas.cases import case_filter
+from pm4py.algo.filtering.pandas.end_activities import end_activities_filter
+from pm4py.algo.filtering.pandas.filter_plan import filter_plan
 from pm4py.algo.filtering.pandas.paths import paths_filter
+from pm4py.algo.filtering.pandas.start_activities import start_activities_filter
 from pm4py.algo.filtering.pandas.timestamp import timestamp_filter
 from pm4py.algo.filtering.pandas.variants import variants_filter
 from pm4py.objects.log.adapters.pandas import csv_import_adapter as csv_import_adapter
 from pm4py.objects.conversion.log import factory as log_conv_fact
+from pm4py.objects.log.util import case_table
+from pm4py.statistics.attributes.common import attribute_profile
+from pm4py.statistics.attributes.pandas import attributes_profiler
 from pm4py.statistics.traces.pandas import case_statistics
 from tests.constants import INPUT_DATA_DIR
 
@@ -48,6 +57,119 @@ class DataframePrefilteringTest(unittest.TestCase):
         dataframe = variants_filter.apply(dataframe, chosen_variants)
         del dataframe
 
+    def test_variants_df(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        input_log = os.path.join(INPUT_DATA_DIR, "receipt.csv")
+        dataframe = csv_import_adapter.import_dataframe_from_path(input_log, sep=',')
+        variants_df = case_statistics.get_variants_df(dataframe)
+        expected = dataframe.groupby("case:concept:name")["concept:name"].apply(",".join)
+        self.assertTrue(variants_df.index.equals(expected.index))
+        self.assertEqual(list(variants_df["variant"]), list(expected))
+        variants = case_statistics.get_variant_statistics(dataframe)
+        self.assertEqual(variants, case_statistics.get_variant_statistics(dataframe, parameters={
+            "variants_df": variants_df}))
+        self.assertEqual(sum(x["case:concept:name"] for x in variants), len(expected))
+
+    def test_case_table(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        input_log = os.path.join(INPUT_DATA_DIR, "running-example.csv")
+        dataframe = csv_import_adapter.import_dataframe_from_path(input_log, sep=',')
+        parameters = {case_table.PARAMETER_USE_CACHE: True}
+        table = case_table.get_case_table(dataframe, parameters=parameters)
+        self.assertIs(table, case_table.get_case_table(dataframe, parameters=parameters))
+        self.assertIsNot(table, case_table.get_case_table(dataframe))
+        grouped = dataframe.groupby("case:concept:name")
+        self.assertEqual(list(table.table[case_table.SIZE]), list(grouped.size()))
+        self.assertEqual(list(table.table[case_table.START_ACTIVITY]), list(grouped["concept:name"].first()))
+        self.assertEqual(list(table.table[case_table.END_ACTIVITY]), list(grouped["concept:name"].last()))
+        filtered_df = case_filter.filter_on_case_size(dataframe, min_case_size=6, use_cache=True)
+        rebuilt_table = case_table.build_dataframe_case_table(filtered_df, table.keys)
+        self.assertTrue(case_table.get_case_table(filtered_df, parameters=parameters).table.equals(
+            rebuilt_table.table))
+        filtered_df = case_filter.filter_on_case_performance(filtered_df, min_case_performance=0,
+                                                             max_case_performance=800000)
+        self.assertEqual(len(filtered_df), len(case_filter.filter_on_case_performance(
+            filtered_df.copy(), min_case_performance=0, max_case_performance=800000)))
+
+    def test_case_table_in_place_changes(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        input_log = os.path.join(INPUT_DATA_DIR, "running-example.csv")
+        dataframe = csv_import_adapter.import_dataframe_from_path(input_log, sep=',')
+        self.assertEqual(len(start_activities_filter.apply(dataframe, ["register request"])), len(dataframe))
+        # without the cache, the values changed in place are seen by the next filters
+        dataframe.loc[dataframe["concept:name"] == "register request", "concept:name"] = "REG"
+        self.assertEqual(len(start_activities_filter.apply(dataframe, ["REG"])), len(dataframe))
+        parameters = {case_table.PARAMETER_USE_CACHE: True}
+        self.assertEqual(len(start_activities_filter.apply(dataframe, ["REG"], parameters=parameters)),
+                         len(dataframe))
+        dataframe.loc[dataframe["concept:name"] == "REG", "concept:name"] = "register request"
+        case_table.invalidate(dataframe)
+        self.assertEqual(len(start_activities_filter.apply(dataframe, ["register request"], parameters=parameters)),
+                         len(dataframe))
+
+    def test_case_table_mixed_offsets(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        # timestamps with different UTC offsets, that Pandas keeps in an object column
+        dataframe = pd.DataFrame({"case:concept:name": ["1", "1", "2"], "concept:name": ["A", "B", "A"],
+                                  "time:timestamp": [pd.Timestamp("2020-03-28 10:00:00+01:00"),
+                                                     pd.Timestamp("2020-03-29 10:00:00+02:00"),
+                                                     pd.Timestamp("2020-03-28 12:00:00+01:00")]})
+        self.assertEqual(dataframe["time:timestamp"].dtype, object)
+        table = case_table.get_case_table(dataframe)
+        self.assertEqual(list(table.table[case_table.DURATION]), [82800.0, 0.0])
+        cases = case_statistics.get_cases_description(dataframe, parameters={"sort_ascending": True})
+        self.assertEqual(cases["1"]["caseDuration"], 82800)
+        self.assertEqual(cases["1"]["startTime"], 1585386000)
+        self.assertEqual(cases["1"]["endTime"], 1585468800)
+
+    def test_attributes_profiler(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        input_log = os.path.join(INPUT_DATA_DIR, "running-example.csv")
+        dataframe = csv_import_adapter.import_dataframe_from_path(input_log, sep=',')
+        event_profiles, trace_profiles = attributes_profiler.apply(dataframe, parameters={
+            "case_id_glue": "case:concept:name"})
+        self.assertEqual(event_profiles["concept:name"].get_value_counts(),
+                         attributes_filter.get_attribute_values(dataframe, "concept:name"))
+        self.assertEqual(event_profiles["Costs"].get_type(), attribute_profile.TYPE_NUMERIC)
+        self.assertEqual(event_profiles["Costs"].min, dataframe["Costs"].min())
+        self.assertEqual(event_profiles["Costs"].max, dataframe["Costs"].max())
+        self.assertEqual(event_profiles["time:timestamp"].get_type(), attribute_profile.TYPE_DATE)
+        self.assertEqual(event_profiles["concept:name"].traces_count, dataframe["case:concept:name"].nunique())
+        self.assertEqual(trace_profiles["case:concept:name"].get_cardinality(),
+                         dataframe["case:concept:name"].nunique())
+
+    def test_filter_plan(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        input_log = os.path.join(INPUT_DATA_DIR, "roadtraffic100traces.csv")
+        dataframe = csv_import_adapter.import_dataframe_from_path(input_log, sep=',')
+        parameters = {"case_id_glue": "case:concept:name"}
+        plan = filter_plan.FilterPlan(dataframe, parameters=parameters).filter_activities(["Send Fine"], positive=False)
+        plan = plan.filter_variants(["Create Fine,Payment"], positive=False)
+        filtered_df = plan.filter_end_activities(["Payment", "Send for Credit Collection"]).apply()
+        expected_df = attributes_filter.apply_events(dataframe, ["Send Fine"], parameters={"positive": False})
+        expected_df = variants_filter.apply(expected_df, ["Create Fine,Payment"], parameters={
+            "case_id_glue": "case:concept:name", "positive": False})
+        expected_df = end_activities_filter.apply(expected_df, ["Payment", "Send for Credit Collection"],
+                                                  parameters=parameters)
+        self.assertTrue(filtered_df.equals(expected_df))
+        filtered_df = filter_plan.FilterPlan(dataframe, parameters=parameters).filter_activities_auto(
+            ).filter_variants_auto().apply()
+        expected_df = attributes_filter.apply_auto_filter(dataframe, parameters=parameters)
+        expected_df = variants_filter.apply_auto_filter(expected_df, parameters=dict(parameters))
+        self.assertTrue(filtered_df.equals(expected_df))
+
     def test_filtering_attr_events(self):
         # to avoid static method warnings in tests,
         # that by construction of the unittest package have to be expressed in such way
@@ -70,6 +192,22 @@ class DataframePrefilteringTest(unittest.TestCase):
         df3 = paths_filter.apply(dataframe, [("examine casually", "check ticket")], {"positive": True})
         del df3
 
+    def test_filtering_paths_cases(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        # the last event of case 1 and the first of case 2 (consecutive rows) are not a path
+        dataframe = pd.DataFrame({"case:concept:name": ["1", "1", "2", "2", "1"],
+                                  "concept:name": ["A", "B", "C", "D", "C"]})
+        df1 = paths_filter.apply(dataframe, [("B", "C")])
+        self.assertEqual(list(df1.index), [0, 1, 4])
+        df2 = paths_filter.apply(dataframe, [("B", "C"), ("C", "D")], {"positive": False})
+        self.assertEqual(len(df2), 0)
+        df3 = attributes_filter.apply(dataframe, ["D"])
+        self.assertEqual(list(df3.index), [2, 3])
+        df4 = variants_filter.apply(dataframe, ["A,B,C"], parameters={"positive": False})
+        self.assertEqual(list(df4.index), [2, 3])
+
     def test_filtering_timeframe(self):
         # to avoid static method warnings in tests,
         # that by construction of the unittest package have to be expressed in such way
@@ -83,6 +221,54 @@ class DataframePrefilteringTest(unittest.TestCase):
         del df2
         del df3
 
+    def test_filtering_timeframe_index(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        input_log = os.path.join(INPUT_DATA_DIR, "running-example.csv")
+        df = csv_import_adapter.import_dataframe_from_path(input_log, sep=',')
+        timestamps = pd.to_datetime(df["time:timestamp"], utc=True)
+        first = timestamps.groupby(df["case:concept:name"]).transform("first")
+        last = timestamps.groupby(df["case:concept:name"]).transform("last")
+        # windows starting when case 1 starts, and ending when case 5 ends (in UTC)
+        intervals = [("2011-01-03 00:00:00", "2011-01-10 00:00:00"), ("2010-12-30 10:02:00", "2011-01-23 00:00:00"),
+                     ("2010-12-30 10:02:00", "2011-01-07 00:00:00"), ("2011-01-10 00:00:00", "2011-01-24 13:56:00"),
+                     ("2011-01-08 00:00:00", "2011-01-03 00:00:00")]
+        for dt1, dt2 in intervals:
+            t1 = pd.Timestamp(dt1, tz="UTC")
+            t2 = pd.Timestamp(dt2, tz="UTC")
+            df1 = timestamp_filter.apply_events(df, dt1, dt2)
+            self.assertEqual(list(df1.index), list(df[(timestamps > t1) & (timestamps < t2)].index))
+            df2 = timestamp_filter.filter_traces_intersecting(df, dt1, dt2)
+            self.assertEqual(list(df2.index), list(df[((first > t1) & (first < t2)) | ((last > t1) & (last < t2)) | (
+                    (first < t1) & (last > t2))].index))
+            df3 = timestamp_filter.filter_traces_contained(df, dt1, dt2)
+            self.assertEqual(list(df3.index), list(df[(first > t1) & (last < t2)].index))
+
+    def test_filtering_case_masks(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        input_log = os.path.join(INPUT_DATA_DIR, "running-example.csv")
+        df = csv_import_adapter.import_dataframe_from_path(input_log, sep=',')
+        mask1 = end_activities_filter.apply(df, ["pay compensation"], parameters={"mask": True})
+        mask2 = attributes_filter.apply(df, ["examine casually"], parameters={"mask": True})
+        mask3 = attributes_filter.apply_events(df, ["register request", "decide"], parameters={"mask": True})
+        self.assertIsInstance(mask1, case_mask.CaseMask)
+        self.assertEqual(list(mask1.apply(df).index), list(end_activities_filter.apply(df, ["pay compensation"]).index))
+        # the filters keeping whole cases are combined as if they were applied one after the other
+        expected_df = attributes_filter.apply(end_activities_filter.apply(df, ["pay compensation"]),
+                                              ["examine casually"])
+        self.assertEqual(list((mask1 & mask2).apply(df).index), list(expected_df.index))
+        self.assertEqual(sorted((mask1 | ~mask2).get_cases()),
+                         sorted(set(mask1.get_cases()) | (set(df["case:concept:name"]) - set(mask2.get_cases()))))
+        expected_df = attributes_filter.apply_events(end_activities_filter.apply(df, ["pay compensation"]),
+                                                     ["register request", "decide"])
+        self.assertEqual(list((mask1 & mask3).apply(df).index), list(expected_df.index))
+        self.assertEqual(list((~mask3).apply(df).index),
+                         list(attributes_filter.apply_events(df, ["register request", "decide"],
+                                                             parameters={"positive": False}).index))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -31,6 +31,8 @@ if __name__ == "__main__":
     from tests.dataframe_prefilter import DataframePrefilteringTest
     from tests.simple_execution import SimpleExecutionTest
     from tests.graphs_forming import GraphsForming
+    from tests.columnar_log_test import ColumnarLogTest
+    from tests.online_statistics_test import OnlineStatisticsTest
 
     test_rv = RandomVariableTest()
     test1_object = Pm4pyImportPackageTest()
@@ -56,5 +58,7 @@ if __name__ == "__main__":
     prefiltering_test = DataframePrefilteringTest()
     simpleex_test = SimpleExecutionTest()
     graphforming_test = GraphsForming()
+    columnar_log_test = ColumnarLogTest()
+    online_statistics_test = OnlineStatisticsTest()
 
     unittest.main()
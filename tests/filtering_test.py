@@ -1,13 +1,31 @@
 import os
 import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
 
 from pm4py.algo.filtering.log.attributes import attributes_filter
+from pm4py.algo.discovery.dfg import factory as dfg_factory
 from pm4py.algo.filtering.log.cases import case_filter
 from pm4py.algo.filtering.log.end_activities import end_activities_filter
+from pm4py.algo.filtering.log.filter_plan import filter_plan
 from pm4py.algo.filtering.log.paths import paths_filter
 from pm4py.algo.filtering.log.start_activities import start_activities_filter
+from pm4py.algo.filtering.log.timestamp import timestamp_filter
 from pm4py.algo.filtering.log.variants import variants_filter as variants_module
+from pm4py.objects.log import columnar
+from pm4py.objects.log import view as log_view
 from pm4py.objects.log.importer.xes import factory as xes_importer
+from pm4py.objects.log.importer.xes.versions import iterparse_xes
+from pm4py.objects.log.log import Event
+from pm4py.objects.log.util import attributes_index
+from pm4py.objects.log.util import case_table
+from pm4py.objects.log.util import interval_index
+from pm4py.objects.log.util import sampling
+from pm4py.objects.log.util import sorting
+from pm4py.objects.log.util import variants_index
+from pm4py.statistics.attributes.common import attribute_profile
+from pm4py.statistics.attributes.log import attributes_profiler
 from pm4py.statistics.traces.log import case_statistics
 from tests.constants import INPUT_DATA_DIR
 
@@ -73,6 +91,38 @@ class LogFilteringTest(unittest.TestCase):
         del log1
         del log2
 
+    def test_variants_index(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        input_log = os.path.join(INPUT_DATA_DIR, "running-example.xes")
+        log = xes_importer.import_log(input_log)
+        index = variants_index.get_variants_index(log, "concept:name", use_cache=True)
+        self.assertIs(index, variants_index.get_variants_index(log, "concept:name", use_cache=True))
+        self.assertIsNot(index, variants_index.get_variants_index(log, "concept:name"))
+        self.assertEqual(index.variants, variants_module.get_variants_from_log_trace_idx(log))
+        for variant, sequence in index.sequences.items():
+            self.assertEqual(variant, ",".join(index.activities[code] for code in sequence))
+        log.append(log[0])
+        index2 = variants_index.get_variants_index(log, "concept:name", use_cache=True)
+        self.assertIsNot(index, index2)
+        self.assertEqual(sum(index2.get_counts().values()), len(log))
+        # the replacement of an event is detected
+        log[1][0] = Event({"concept:name": "replaced activity"})
+        self.assertIn("replaced activity", variants_index.get_variants_index(log, "concept:name",
+                                                                             use_cache=True).activities)
+        log[0][0]["concept:name"] = "new activity"
+        variants_index.invalidate(log)
+        self.assertIn("new activity", variants_index.get_variants_index(log, "concept:name",
+                                                                        use_cache=True).activities)
+        # without the cache, the activities changed in place are seen at once
+        for trace in log:
+            for event in trace:
+                event["concept:name"] = event["concept:name"].upper()
+        variants = variants_module.get_variants(log)
+        self.assertEqual(set(variants), set(",".join(event["concept:name"] for event in trace) for trace in log))
+        self.assertTrue(all(variant == variant.upper() for variant in variants))
+
     def test_obtaining_variants(self):
         # to avoid static method warnings in tests,
         # that by construction of the unittest package have to be expressed in such way
@@ -100,6 +150,21 @@ class LogFilteringTest(unittest.TestCase):
         cases = case_filter.filter_on_case_size(log, min_case_size=3, max_case_size=5)
         del cases
 
+    def test_casefilter_performance(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        input_log = os.path.join(INPUT_DATA_DIR, "running-example.xes")
+        log = xes_importer.import_log(input_log)
+        self.assertEqual(len(case_filter.filter_on_case_performance(log, 0, 1e7)), len(log))
+        # without the cache, the timestamps changed in place are seen by the next filters
+        for trace in log:
+            trace[-1]["time:timestamp"] = trace[-1]["time:timestamp"] + timedelta(days=365)
+        self.assertEqual(len(case_filter.filter_on_case_performance(log, 0, 1e7)), 0)
+        parameters = {case_table.PARAMETER_USE_CACHE: True}
+        self.assertEqual(len(case_filter.filter_on_case_performance(log, 0, 1e7, parameters=parameters)), 0)
+        self.assertEqual(len(case_filter.filter_on_case_performance(log, 0, 1e8, parameters=parameters)), len(log))
+
     def test_pathsfilter(self):
         # to avoid static method warnings in tests,
         # that by construction of the unittest package have to be expressed in such way
@@ -111,6 +176,238 @@ class LogFilteringTest(unittest.TestCase):
         del log1
         del log2
 
+    def test_sampling_dfg_bounds(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        input_log = os.path.join(INPUT_DATA_DIR, "roadtraffic100traces.xes")
+        log = xes_importer.import_log(input_log)
+        dfg = dfg_factory.apply(log)
+        sampled_log, dfg_bounds = sampling.stratified_sample_log(log, no_traces=20)
+        self.assertEqual(len(sampled_log), 20)
+        # the frequencies are exact also for the edges of the dropped variants
+        self.assertEqual(dfg_bounds, {couple: (count, 0.0) for couple, count in dfg.items()})
+        sampled_log, dfg_bounds = sampling.reservoir_sample_log(iterparse_xes.import_traces(input_log),
+                                                                no_traces=20)
+        self.assertEqual(len(sampled_log), 20)
+        self.assertTrue(set(dfg_bounds).issubset(set(dfg)))
+        sampled_log, dfg_bounds = sampling.reservoir_sample_log(iterparse_xes.import_traces(input_log),
+                                                                no_traces=len(log) + 1)
+        self.assertEqual(set(dfg_bounds), set(dfg))
+        for couple in dfg:
+            self.assertAlmostEqual(dfg_bounds[couple][0], dfg[couple])
+            self.assertEqual(dfg_bounds[couple][1], 0.0)
+
+    def test_attributes_profiler(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        input_log = os.path.join(INPUT_DATA_DIR, "roadtraffic100traces.xes")
+        log = xes_importer.import_log(input_log)
+        event_profiles, trace_profiles = attributes_profiler.apply(log)
+        self.assertEqual(set(event_profiles), attributes_filter.get_all_event_attributes_from_log(log) | {
+            "lifecycle:transition"})
+        for attr in ["concept:name", "amount", "dismissal"]:
+            self.assertEqual(event_profiles[attr].get_value_counts(), attributes_filter.get_attribute_values(log, attr))
+        self.assertEqual(trace_profiles["concept:name"].get_value_counts(),
+                         attributes_filter.get_trace_attribute_values(log, "concept:name"))
+        amounts = sorted(event["amount"] for trace in log for event in trace if "amount" in event)
+        self.assertEqual(event_profiles["amount"].get_type(), attribute_profile.TYPE_NUMERIC)
+        self.assertEqual(event_profiles["amount"].min, amounts[0])
+        self.assertEqual(event_profiles["amount"].max, amounts[-1])
+        self.assertEqual(event_profiles["amount"].get_quantile(0.5), amounts[(len(amounts) - 1) // 2])
+        self.assertEqual(event_profiles["time:timestamp"].get_type(), attribute_profile.TYPE_DATE)
+        self.assertEqual(event_profiles["concept:name"].traces_count, len(log))
+        # above the given number of distinct values, their number is estimated
+        event_profiles, trace_profiles = attributes_profiler.apply(log, parameters={
+            attribute_profile.PARAMETER_MAX_DISTINCT_VALUES: 5})
+        self.assertIsNone(event_profiles["time:timestamp"].get_value_counts())
+        exact = len(set(event["time:timestamp"] for trace in log for event in trace))
+        self.assertLess(abs(event_profiles["time:timestamp"].get_cardinality() - exact), 0.05 * exact)
+        self.assertEqual(event_profiles["dismissal"].get_cardinality(), 3)
+
+    def test_filter_plan(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        input_log = os.path.join(INPUT_DATA_DIR, "roadtraffic100traces.xes")
+        log = xes_importer.import_log(input_log)
+        plan = filter_plan.FilterPlan(log, parameters={variants_index.PARAMETER_USE_CACHE: True})
+        plan = plan.filter_activities(["Send Fine"], positive=False)
+        plan = plan.filter_variants(["Create Fine,Payment"], positive=False)
+        filtered_log = plan.filter_end_activities(["Payment", "Send for Credit Collection"]).apply()
+        expected_log = attributes_filter.apply_events(log, ["Send Fine"], parameters={"positive": False})
+        expected_log = variants_module.apply(expected_log, ["Create Fine,Payment"], parameters={"positive": False})
+        expected_log = end_activities_filter.apply(expected_log, ["Payment", "Send for Credit Collection"])
+        self.assertEqual([[dict(x) for x in trace] for trace in filtered_log],
+                         [[dict(x) for x in trace] for trace in expected_log])
+        # the variants of the filtered log are known by the plan
+        self.assertEqual(variants_index.get_variants_index(filtered_log, "concept:name", use_cache=True).variants,
+                         variants_index.build_variants_index(filtered_log, "concept:name").variants)
+        filtered_log = filter_plan.FilterPlan(log).filter_activities_auto().filter_variants_auto().apply()
+        expected_log = attributes_filter.apply_auto_filter(log)
+        expected_log = variants_module.apply_auto_filter(expected_log)
+        self.assertEqual([[dict(x) for x in trace] for trace in filtered_log],
+                         [[dict(x) for x in trace] for trace in expected_log])
+
+    def test_timestamp_filters(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        intervals = [("2006-01-01 00:00:00", "2007-06-01 00:00:00"), ("2005-12-05 00:00:00", "2005-12-05 00:00:01"),
+                     ("2000-01-01 00:00:00", "2020-01-01 00:00:00"), ("2007-06-01 00:00:00", "2006-01-01 00:00:00")]
+        for log_name, step in [("roadtraffic100traces.xes", 40), ("running-example.xes", 1)]:
+            log = xes_importer.import_log(os.path.join(INPUT_DATA_DIR, log_name))
+            # windows whose bounds are the first or the last timestamp of some traces
+            bounds = sorted(set(trace[i]["time:timestamp"].strftime("%Y-%m-%d %H:%M:%S") for trace in log for i in
+                                [0, -1]))[::step]
+            for dt1, dt2 in intervals + [(dt1, dt2) for dt1 in bounds for dt2 in bounds]:
+                d1 = datetime.strptime(dt1, "%Y-%m-%d %H:%M:%S")
+                d2 = datetime.strptime(dt2, "%Y-%m-%d %H:%M:%S")
+                filtered_log = timestamp_filter.filter_traces_contained(log, dt1, dt2)
+                self.assertEqual(list(filtered_log), [trace for trace in log if timestamp_filter.is_contained(
+                    trace, d1, d2, "time:timestamp")])
+                filtered_log = timestamp_filter.filter_traces_intersecting(log, dt1, dt2)
+                self.assertEqual(list(filtered_log), [trace for trace in log if timestamp_filter.is_intersecting(
+                    trace, d1, d2, "time:timestamp")])
+                filtered_log = timestamp_filter.apply_events(log, dt1, dt2)
+                expected = [[event for event in trace if d1 < event["time:timestamp"].replace(tzinfo=None) < d2] for
+                            trace in log]
+                self.assertEqual([list(trace) for trace in filtered_log], [trace for trace in expected if trace])
+
+    def test_timestamp_filters_cache(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        log = xes_importer.import_log(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        parameters = {case_table.PARAMETER_USE_CACHE: True, interval_index.PARAMETER_USE_CACHE: True}
+        dt1, dt2 = "2010-01-01 00:00:00", "2011-12-31 00:00:00"
+        self.assertEqual(len(timestamp_filter.filter_traces_contained(log, dt1, dt2, parameters=parameters)), len(log))
+        self.assertEqual(len(timestamp_filter.apply_events(log, dt1, dt2, parameters=parameters)), len(log))
+        # without the cache, the timestamps changed in place are seen by the next filters
+        for trace in log:
+            for event in trace:
+                event["time:timestamp"] = event["time:timestamp"] + timedelta(days=365 * 3)
+        self.assertEqual(len(timestamp_filter.filter_traces_contained(log, dt1, dt2)), 0)
+        self.assertEqual(len(timestamp_filter.apply_events(log, dt1, dt2)), 0)
+        case_table.invalidate(log)
+        interval_index.invalidate(log)
+        self.assertEqual(len(timestamp_filter.filter_traces_contained(log, dt1, dt2, parameters=parameters)), 0)
+        self.assertEqual(len(timestamp_filter.apply_events(log, dt1, dt2, parameters=parameters)), 0)
+
+    def test_interval_index(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        random = np.random.RandomState(7)
+        starts = random.randint(0, 10000, size=2000).astype(np.int64)
+        ends = starts + random.exponential(300, size=2000).astype(np.int64)
+        starts[::50] = interval_index.MISSING
+        index = interval_index.CasesTimeIndex(starts, ends)
+        valid = starts != interval_index.MISSING
+        for t1, t2 in [(100, 900), (5000, 5001), (-10, 20000), (7000, 7000)]:
+            self.assertEqual(index.get_contained(t1, t2).tolist(),
+                             np.nonzero(valid & (starts > t1) & (ends < t2))[0].tolist())
+            self.assertEqual(index.get_intersecting(t1, t2).tolist(),
+                             np.nonzero(valid & (starts < t2) & (ends > t1))[0].tolist())
+        self.assertEqual(index.get_contained(3000, 2000).tolist(), [])
+        self.assertEqual(index.get_intersecting(3000, 2000).tolist(), np.nonzero(valid & (
+                ((starts < 3000) & (ends > 3000)) | ((starts < 2000) & (ends > 2000))))[0].tolist())
+        tree = interval_index.IntervalTree(starts[valid], ends[valid], np.nonzero(valid)[0])
+        for instant in [0, 4321, 9999, 20000]:
+            self.assertEqual(sorted(tree.stab(instant).tolist()),
+                             np.nonzero(valid & (starts <= instant) & (ends >= instant))[0].tolist())
+
+    def test_log_views(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        input_log = os.path.join(INPUT_DATA_DIR, "running-example.xes")
+        log = xes_importer.import_log(input_log)
+        activities = ["register request", "examine casually", "check ticket", "decide"]
+        view = attributes_filter.apply_events(log, activities, parameters={"view": True})
+        filtered_log = attributes_filter.apply_events(log, activities)
+        self.assertIsInstance(view, log_view.EventLogView)
+        self.assertEqual([list(trace) for trace in view], [list(trace) for trace in filtered_log])
+        self.assertEqual([dict(trace.attributes) for trace in view], [dict(trace.attributes) for trace in filtered_log])
+        # the view of a view refers the original log
+        view = paths_filter.apply(view, [("register request", "examine casually")], parameters={"view": True})
+        filtered_log = paths_filter.apply(filtered_log, [("register request", "examine casually")])
+        self.assertIs(view.parent, log)
+        self.assertEqual([list(trace) for trace in view], [list(trace) for trace in filtered_log])
+        self.assertEqual(dfg_factory.apply(view), dfg_factory.apply(filtered_log))
+        materialized = log_view.materialize(view)
+        self.assertNotIsInstance(materialized, log_view.EventLogView)
+        self.assertEqual([list(trace) for trace in materialized], [list(trace) for trace in filtered_log])
+        view = variants_module.apply(log, ["register request,examine thoroughly,check ticket,decide,reject request"],
+                                     parameters={"view": True})
+        self.assertIs(view[0], log[2])
+        self.assertRaises(NotImplementedError, view.append, log[0])
+
+    def test_sort_log_views(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        input_log = os.path.join(INPUT_DATA_DIR, "running-example.xes")
+        log = xes_importer.import_log(input_log)
+        # a view keeping the traces in reverse order: the in-place sort would reorder the traces of the view but
+        # not its positions
+        view = log_view.get_view(log, list(range(len(log)))[::-1])
+        self.assertRaises(NotImplementedError, sorting.sort_timestamp, view, mode=sorting.SORT_INPLACE)
+        self.assertIs(view[0], log[-1])
+        filtered_view = case_filter.filter_on_case_size(view, 9, parameters={"view": True})
+        self.assertEqual(list(filtered_view), [trace for trace in view if len(trace) >= 9])
+        sorted_view = sorting.sort_timestamp(view, mode=sorting.SORT_VIEW)
+        self.assertEqual([trace.attributes["concept:name"] for trace in sorted_view],
+                         [trace.attributes["concept:name"] for trace in sorting.sort_timestamp(view)])
+        # a view whose traces keep some events, in the wrong order
+        log[0]._list = log[0]._list[::-1]
+        view = attributes_filter.apply_events(log, ["register request", "check ticket", "decide"],
+                                              parameters={"view": True})
+        self.assertIsInstance(view[0], log_view.TraceView)
+        self.assertRaises(NotImplementedError, sorting.sort_timestamp, view, mode=sorting.SORT_INPLACE)
+        self.assertRaises(NotImplementedError, sorting.sort_timestamp, view[0], mode=sorting.SORT_INPLACE)
+        self.assertEqual(list(sorting.sort_timestamp_trace(view[0])), list(view[0])[::-1])
+        for trace in sorting.sort_timestamp(view, mode=sorting.SORT_VIEW):
+            self.assertEqual([x["time:timestamp"] for x in trace], sorted(x["time:timestamp"] for x in trace))
+
+    def test_attributes_index(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        input_log = os.path.join(INPUT_DATA_DIR, "running-example.xes")
+        log = xes_importer.import_log(input_log)
+        index = attributes_index.get_attributes_index(log, "org:resource")
+        self.assertIs(attributes_index.get_attributes_index(log, "org:resource"), index)
+        self.assertEqual(index.traces["Sue"].tolist(), [2, 4])
+        self.assertEqual(index.get_traces_mask(["Sue", "Sean"]).tolist(), [True, True, True, False, True, True])
+        parameters = {attributes_filter.PARAMETER_CONSTANT_ATTRIBUTE_KEY: "org:resource",
+                      attributes_index.PARAMETER_USE_INDEX: True}
+        for columnar_log in [log, columnar.from_event_log(log)]:
+            counts = attributes_filter.get_attribute_values(columnar_log, "org:resource", parameters=parameters)
+            self.assertEqual(counts, attributes_filter.get_attribute_values(columnar_log, "org:resource"))
+            self.assertEqual(list(counts), ["Pete", "Mike", "Ellen", "Sara", "Sean", "Sue"])
+            self.assertEqual(sum(counts.values()), 42)
+            for positive in [True, False]:
+                filtered_log = attributes_filter.apply(columnar_log, ["Sue"], parameters=dict(
+                    parameters, positive=positive))
+                self.assertEqual(len(filtered_log), 2 if positive else 4)
+                self.assertEqual(list(filtered_log), list(attributes_filter.apply(columnar_log, ["Sue"], parameters={
+                    attributes_filter.PARAMETER_CONSTANT_ATTRIBUTE_KEY: "org:resource", "positive": positive})))
+        # the index is computed again after a mutation of the log
+        log.append(log[4])
+        filtered_log = attributes_filter.apply(log, ["Sue"], parameters=parameters)
+        self.assertEqual(len(filtered_log), 3)
+        self.assertIsNot(attributes_index.get_attributes_index(log, "org:resource"), index)
+        # and after the replacement of an event, keeping the length of the trace
+        log[0][0] = Event({"org:resource": "Anne"})
+        self.assertEqual(attributes_filter.get_attribute_values(log, "org:resource", parameters=parameters)["Anne"], 1)
+        # the in-place modification of a value is detected only after invalidate
+        log[1][0]["org:resource"] = "Bob"
+        attributes_index.invalidate(log)
+        self.assertEqual(attributes_filter.get_attribute_values(log, "org:resource", parameters=parameters),
+                         attributes_filter.get_attribute_values(log, "org:resource"))
+
 
 if __name__ == "__main__":
     unittest.main()
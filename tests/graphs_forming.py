@@ -41,6 +41,21 @@ class GraphsForming(unittest.TestCase):
         json = pd_attributes_filter.get_kde_numeric_attribute_json(df, "amount")
         del json
 
+    def test_binnedKde(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+
+        df = csv_import_adapter.import_dataframe_from_path(os.path.join("input_data", "roadtraffic100traces.csv"))
+        x1, y1 = pd_attributes_filter.get_kde_numeric_attribute(df, "amount", parameters={"kde_binned": False})
+        x2, y2 = pd_attributes_filter.get_kde_numeric_attribute(df, "amount", parameters={"kde_binned": True})
+        x3, y3 = pd_attributes_filter.get_kde_numeric_attribute(df, "amount", parameters={
+            "kde_binned": True, "kde_pre_aggregation": True})
+        self.assertEqual(x1, x2)
+        for i in range(len(x1)):
+            self.assertAlmostEqual(y1[i] / max(y1), y2[i] / max(y1), places=2)
+            self.assertAlmostEqual(y2[i] / max(y1), y3[i] / max(y1), places=6)
+
     def test_logNumericAttribute(self):
         # to avoid static method warnings in tests,
         # that by construction of the unittest package have to be expressed in such way
@@ -0,0 +1,58 @@
+import os
+import pickle
+import unittest
+
+from pm4py.algo.discovery.dfg import factory as dfg_factory
+from pm4py.algo.filtering.log.end_activities import end_activities_filter
+from pm4py.algo.filtering.log.start_activities import start_activities_filter
+from pm4py.algo.filtering.log.variants import variants_filter
+from pm4py.objects.conversion.log import factory as log_conv_fact
+from pm4py.objects.log.importer.xes import factory as xes_importer
+from pm4py.statistics.online.online_statistics import OnlineStatistics
+from pm4py.statistics.traces.log import case_statistics
+from tests.constants import INPUT_DATA_DIR
+
+
+class OnlineStatisticsTest(unittest.TestCase):
+    def test_online_statistics_equivalence(self):
+        log = xes_importer.import_log(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        stream = log_conv_fact.apply(log, variant=log_conv_fact.TO_EVENT_STREAM)
+        stream = sorted(stream, key=lambda event: event["time:timestamp"])
+        statistics = OnlineStatistics()
+        statistics.add_event_stream(stream)
+        self.assertEqual(statistics.events_count, len(stream))
+        self.assertEqual(statistics.get_dfg(), dict(dfg_factory.apply(log)))
+        dfg_performance = dfg_factory.apply(log, variant=dfg_factory.DFG_PERFORMANCE)
+        online_dfg_performance = statistics.get_dfg(measure="performance")
+        self.assertEqual(set(online_dfg_performance), set(dfg_performance))
+        for couple in dfg_performance:
+            self.assertAlmostEqual(online_dfg_performance[couple], dfg_performance[couple])
+        self.assertEqual(statistics.get_start_activities(), start_activities_filter.get_start_activities(log))
+        self.assertEqual(statistics.get_end_activities(), end_activities_filter.get_end_activities(log))
+        self.assertEqual(statistics.get_variants_count(),
+                         {variant: len(traces) for variant, traces in variants_filter.get_variants(log).items()})
+        self.assertEqual(statistics.get_all_casedurations(), case_statistics.get_all_casedurations(log))
+
+    def test_online_statistics_merge(self):
+        log = xes_importer.import_log(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        stream = log_conv_fact.apply(log, variant=log_conv_fact.TO_EVENT_STREAM)
+        stream = sorted(stream, key=lambda event: event["time:timestamp"])
+        statistics = OnlineStatistics()
+        statistics.add_event_stream(stream)
+        # the two halves of the stream share some cases
+        first_half = OnlineStatistics()
+        first_half.add_event_stream(stream[:len(stream) // 2])
+        snapshot = pickle.loads(pickle.dumps(first_half.snapshot()))
+        second_half = OnlineStatistics()
+        second_half.add_event_stream(stream[len(stream) // 2:])
+        snapshot.merge(second_half)
+        self.assertEqual(snapshot.get_dfg(measure="both"), statistics.get_dfg(measure="both"))
+        self.assertEqual(snapshot.get_start_activities(), statistics.get_start_activities())
+        self.assertEqual(snapshot.get_end_activities(), statistics.get_end_activities())
+        self.assertEqual(snapshot.get_variants_count(), statistics.get_variants_count())
+        self.assertEqual(snapshot.get_case_durations(), statistics.get_case_durations())
+        self.assertEqual(first_half.events_count, len(stream) // 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
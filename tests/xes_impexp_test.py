@@ -2,7 +2,11 @@ from pm4py.objects.log.importer.xes import factory as xes_importer
 from pm4py.objects.log.exporter.xes import factory as xes_exporter
 from pm4py.objects.log.importer.csv import factory as csv_importer
 from pm4py.objects.log.exporter.csv import factory as csv_exporter
+from pm4py.objects.log.importer.snapshot import factory as snapshot_importer
+from pm4py.objects.log.exporter.snapshot import factory as snapshot_exporter
 from pm4py.objects.conversion.log import factory as log_conv_fact
+from pm4py.algo.discovery.dfg import factory as dfg_factory
+from pm4py.objects.log.log import EventLog, Trace
 from tests.constants import INPUT_DATA_DIR, OUTPUT_DATA_DIR, PROBLEMATIC_XES_DIR, COMPRESSED_INPUT_DATA
 import logging
 import unittest
@@ -60,6 +64,65 @@ class XesImportExportTest(unittest.TestCase):
                                 parameters={"compress": True})
         os.remove(os.path.join(OUTPUT_DATA_DIR, "01-running-example.xes.gz"))
 
+    def test_importExportXESbz2xz(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        log = xes_importer.import_log(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        for extension in ["bz2", "xz"]:
+            output_log_path = os.path.join(OUTPUT_DATA_DIR, "running-example.xes." + extension)
+            xes_exporter.export_log(log, output_log_path)
+            log_imported_after_export = xes_importer.import_log(output_log_path)
+            self.assertEqual(len(log), len(log_imported_after_export))
+            os.remove(output_log_path)
+
+    def test_importExportXESstream(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        log = xes_importer.import_log(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        output_log_path = os.path.join(OUTPUT_DATA_DIR, "running-example-stream.xes.gz")
+        header = EventLog()
+        traces = xes_importer.import_traces(os.path.join(INPUT_DATA_DIR, "running-example.xes"), log=header)
+        xes_exporter.export_log(traces, output_log_path, variant="stream", parameters={"log_header": header})
+        log_imported_after_export = xes_importer.import_log(output_log_path)
+        self.assertEqual(len(log), len(log_imported_after_export))
+        self.assertEqual(log.classifiers, log_imported_after_export.classifiers)
+        self.assertEqual(dfg_factory.apply(log), dfg_factory.apply(log_imported_after_export))
+        os.remove(output_log_path)
+
+    def test_importExportSnapshot(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        log = xes_importer.import_log(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        output_log_path = os.path.join(OUTPUT_DATA_DIR, "running-example.snapshot")
+        snapshot_exporter.export_log(log, output_log_path)
+        for parameters in [{}, {"memory_map": True}]:
+            log_imported_after_export = snapshot_importer.import_log(output_log_path, parameters=parameters)
+            self.assertEqual(len(log), len(log_imported_after_export))
+            self.assertEqual(log.classifiers, log_imported_after_export.classifiers)
+            for trace, trace_imported in zip(log, log_imported_after_export):
+                self.assertEqual(trace.attributes, dict(trace_imported.attributes))
+                self.assertEqual([dict(event) for event in trace], [dict(event) for event in trace_imported])
+            del log_imported_after_export
+        os.remove(output_log_path)
+
+    def test_exportSnapshotWithoutTraceAttributes(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        log = xes_importer.import_log(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        log = EventLog([Trace(list(trace)) for trace in log])
+        output_log_path = os.path.join(OUTPUT_DATA_DIR, "running-example-no-trace-attributes.snapshot")
+        snapshot_exporter.export_log(log, output_log_path)
+        for parameters in [{}, {"memory_map": True}]:
+            log_imported_after_export = snapshot_importer.import_log(output_log_path, parameters=parameters)
+            self.assertEqual([len(trace) for trace in log], [len(trace) for trace in log_imported_after_export])
+            self.assertEqual([dict(trace.attributes) for trace in log_imported_after_export], [{}] * len(log))
+            del log_imported_after_export
+        os.remove(output_log_path)
+
     def test_importXESfromGZIP_imp2(self):
         # to avoid static method warnings in tests,
         # that by construction of the unittest package have to be expressed in such way
@@ -67,6 +130,32 @@ class XesImportExportTest(unittest.TestCase):
         log = xes_importer.import_log(os.path.join(COMPRESSED_INPUT_DATA, "01_running-example.xes.gz"))
         del log
 
+    def test_importXEStraces(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        log = xes_importer.import_log(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        header = EventLog()
+        traces = xes_importer.import_traces(os.path.join(INPUT_DATA_DIR, "running-example.xes"), log=header)
+        self.assertEqual(dfg_factory.apply(log), dfg_factory.apply(traces))
+        self.assertEqual(log.classifiers, header.classifiers)
+        self.assertEqual(len(header), 0)
+        traces = xes_importer.import_traces(os.path.join(INPUT_DATA_DIR, "running-example.xes"),
+                                            parameters={"max_no_traces_to_import": 2})
+        self.assertEqual(len(list(traces)), 2)
+
+    def test_importXESparallel(self):
+        # to avoid static method warnings in tests,
+        # that by construction of the unittest package have to be expressed in such way
+        self.dummy_variable = "dummy_value"
+        log = xes_importer.import_log(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        log_parallel = xes_importer.import_log(os.path.join(INPUT_DATA_DIR, "running-example.xes"),
+                                               variant="parallel",
+                                               parameters={"max_no_workers": 2, "min_chunk_size": 1})
+        self.assertEqual(len(log), len(log_parallel))
+        self.assertEqual(log.classifiers, log_parallel.classifiers)
+        self.assertEqual(dfg_factory.apply(log), dfg_factory.apply(log_parallel))
+
 
 if __name__ == "__main__":
     unittest.main()